@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Benchmark how long the Scribe-Data CLI takes to import with ``python -X importtime``.
+
+Imports the CLI in fresh interpreters, reports the fastest cumulative import time and
+the slowest modules, and fails if the import takes longer than a budget or imports a
+module that only some subcommands need.
+
+The first import is made before timing so that the parsed metadata is cached as it is
+for every run of the CLI after the first.
+
+Examples
+--------
+>>> python3 benchmarks/cli_import_time.py
+>>> python3 benchmarks/cli_import_time.py --budget-ms 250 --repeat 10
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+
+CLI_MODULE = "scribe_data.cli.main"
+
+# Dependencies of single subcommands that the CLI must not import to start.
+LAZY_MODULES = [
+    "mwparserfromhell",
+    "orjson",
+    "prompt_toolkit",
+    "questionary",
+    "requests",
+    "SPARQLWrapper",
+    "tqdm",
+    "yaml",
+]
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """
+    Import a module in a fresh interpreter and return the import time of each module.
+
+    Parameters
+    ----------
+    module : str
+        The module to import.
+
+    Returns
+    -------
+    dict[str, tuple[int, int]]
+        The own and cumulative import time of each imported module in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if self_us.strip().isdigit():
+            times[name.strip()] = (int(self_us), int(cumulative_us))
+
+    return times
+
+
+def main() -> None:
+    """
+    Run the import time benchmark, print the results as JSON and enforce the budget.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default=CLI_MODULE)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    import_times(args.module)
+    runs = [import_times(args.module) for _ in range(args.repeat)]
+    fastest = min(runs, key=lambda times: times[args.module][1])
+
+    total_ms = fastest[args.module][1] / 1000
+    slowest = sorted(fastest.items(), key=lambda item: item[1][0], reverse=True)
+    eager = [name for name in LAZY_MODULES if name in fastest]
+
+    print(
+        json.dumps(
+            {
+                "host": {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                },
+                "module": args.module,
+                "import_ms": round(total_ms, 1),
+                "budget_ms": args.budget_ms,
+                "slowest_modules_ms": {
+                    name: round(self_us / 1000, 1)
+                    for name, (self_us, _) in slowest[: args.top]
+                },
+                "eagerly_imported": eager,
+            },
+            indent=2,
+        )
+    )
+
+    if eager:
+        sys.exit(f"{args.module} imports {', '.join(eager)} on startup.")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        sys.exit(
+            f"{args.module} took {total_ms:.1f} ms to import, over the budget of {args.budget_ms:.0f} ms."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Benchmark writing merged query results to SQLite with and without a JSON export.
+
+Before ``lexeme_table_writer``, ``get`` exported the merged results of a language and
+data type to JSON, read the JSON back to convert it to SQLite and then removed it. The
+pipeline passes the merged results to the SQLite writer directly. Both databases are
+checked to hold the same rows.
+
+Examples
+--------
+>>> python3 benchmarks/get_pipeline.py
+>>> python3 benchmarks/get_pipeline.py --lexemes 200000 --output get_pipeline.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from scribe_data.cli.convert.to_sqlite import (
+    lexeme_table_to_sqlite,
+    lexeme_table_to_sqlite_file,
+)
+from scribe_data.utils import write_json
+from scribe_data.wikidata.lexeme_merge import LexemeMerger
+from scribe_data.wikidata.lexeme_table import LexemeTable
+
+FORMS = [f"form{n}" for n in range(40)]
+
+
+def merged_verbs(lexemes: int) -> LexemeMerger:
+    """
+    Build merged results shaped like those of a verbs query.
+
+    Parameters
+    ----------
+    lexemes : int
+        The number of verbs.
+
+    Returns
+    -------
+    LexemeMerger
+        The merged forms of each verb.
+    """
+    merged = LexemeMerger()
+    for i in range(lexemes):
+        merged.add(
+            f"L{i}",
+            "2025-01-01T00:00:00Z",
+            [(form, f"verbe{i}-{n}") for n, form in enumerate(FORMS)],
+        )
+
+    return merged
+
+
+def through_json(merged: LexemeMerger, output_dir: Path) -> None:
+    """
+    Export the results to JSON, convert the JSON to SQLite and remove it.
+
+    Parameters
+    ----------
+    merged : LexemeMerger
+        The merged results.
+
+    output_dir : Path
+        The directory of the JSON export and the database.
+    """
+    json_path = output_dir / "verbs.json"
+    write_json(json_path, merged.entries(), indent=0, trailing_newline=True)
+
+    db_file = output_dir / "ENLanguageData.sqlite"
+    with contextlib.closing(sqlite3.connect(db_file)) as connection:
+        lexeme_table_to_sqlite(
+            connection.cursor(), LexemeTable.read_json(json_path), "verbs"
+        )
+        connection.commit()
+
+    os.remove(json_path)
+
+
+def pipeline(merged: LexemeMerger, output_dir: Path) -> None:
+    """
+    Write the results to SQLite directly.
+
+    Parameters
+    ----------
+    merged : LexemeMerger
+        The merged results.
+
+    output_dir : Path
+        The directory of the database.
+    """
+    lexeme_table_to_sqlite_file(
+        "English", "verbs", merged.table(), output_dir=output_dir, overwrite=True
+    )
+
+
+def best_seconds(
+    write: Callable[[LexemeMerger, Path], None],
+    merged: LexemeMerger,
+    output_dir: Path,
+    repeat: int,
+) -> float:
+    """
+    Return the fastest time of writing the results to a new database.
+
+    Parameters
+    ----------
+    write : Callable[[LexemeMerger, Path], None]
+        Writes the results.
+
+    merged : LexemeMerger
+        The merged results.
+
+    output_dir : Path
+        The directory to write to.
+
+    repeat : int
+        Times to write the results.
+
+    Returns
+    -------
+    float
+        The fastest write in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        (output_dir / "ENLanguageData.sqlite").unlink(missing_ok=True)
+        start = time.perf_counter()
+        write(merged, output_dir)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def table_rows(output_dir: Path) -> list[tuple]:
+    """
+    Return the rows of the verbs table of a database.
+
+    Parameters
+    ----------
+    output_dir : Path
+        The directory of the database.
+
+    Returns
+    -------
+    list[tuple]
+        The rows sorted by lexeme ID.
+    """
+    db_file = output_dir / "ENLanguageData.sqlite"
+    with contextlib.closing(sqlite3.connect(db_file)) as connection:
+        return connection.execute("SELECT * FROM verbs ORDER BY wdLexemeId").fetchall()
+
+
+def main() -> None:
+    """
+    Run the pipeline benchmark and print the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lexemes", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    merged = merged_verbs(args.lexemes)
+    with tempfile.TemporaryDirectory() as tmp:
+        before_dir, after_dir = Path(tmp) / "before", Path(tmp) / "after"
+        before_dir.mkdir()
+        after_dir.mkdir()
+        before_s = best_seconds(through_json, merged, before_dir, args.repeat)
+        after_s = best_seconds(pipeline, merged, after_dir, args.repeat)
+        identical = table_rows(before_dir) == table_rows(after_dir)
+
+    report = json.dumps(
+        {
+            "host": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "lexemes": args.lexemes,
+            "forms_per_lexeme": len(FORMS) + 1,
+            "through_json_s": round(before_s, 3),
+            "pipeline_s": round(after_s, 3),
+            "speedup": round(before_s / after_s, 2),
+            "identical": identical,
+        },
+        indent=2,
+    )
+    if args.output:
+        args.output.write_text(report + "\n", encoding="utf-8")
+
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
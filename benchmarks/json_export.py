@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Benchmark writing exported data with ``scribe_data.utils.write_json``.
+
+Writes a synthetic verbs export with ``json.dump``, which is how the exports were
+written before, and with ``write_json``, checking that both files are identical.
+
+Examples
+--------
+>>> python3 benchmarks/json_export.py
+>>> python3 benchmarks/json_export.py --lexemes 200000 --output json_export.json
+"""
+
+import argparse
+import json
+import platform
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from scribe_data.utils import write_json
+
+# Forms of each synthetic verb, roughly as many as a verbs export of a large language.
+FORMS = [
+    f"{mood}{person}{number}{tense}"
+    for mood in ("indicative", "subjunctive")
+    for tense in ("Present", "Preterite", "Imperfect", "Future")
+    for person in ("FirstPerson", "SecondPerson", "ThirdPerson")
+    for number in ("Singular", "Plural")
+]
+
+
+def verbs_export(lexemes: int) -> dict[str, dict[str, str]]:
+    """
+    Build data shaped like a formatted verbs export.
+
+    Parameters
+    ----------
+    lexemes : int
+        The number of verbs.
+
+    Returns
+    -------
+    dict[str, dict[str, str]]
+        Verbs keyed by lexeme ID.
+    """
+    return {
+        f"L{i}": {
+            "lexemeID": f"L{i}",
+            "lastModified": "2025-01-01T00:00:00Z",
+            "infinitive": f"verbe{i}",
+            **{form: f"forme{i}é{n}" for n, form in enumerate(FORMS)},
+        }
+        for i in range(lexemes)
+    }
+
+
+def best_seconds(write: Callable[[Path], None], path: Path, repeat: int) -> float:
+    """
+    Return the fastest time of writing a file.
+
+    Parameters
+    ----------
+    write : Callable[[Path], None]
+        Writes the file.
+
+    path : Path
+        The file to write.
+
+    repeat : int
+        Times to write the file.
+
+    Returns
+    -------
+    float
+        The fastest write in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        write(path)
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def json_dump(data: dict, indent: int) -> Callable[[Path], None]:
+    """
+    Return a writer that uses ``json.dump`` as the exports did before ``write_json``.
+
+    Parameters
+    ----------
+    data : dict
+        The data to write.
+
+    indent : int
+        Spaces per level of indentation.
+
+    Returns
+    -------
+    Callable[[Path], None]
+        Writes the data to a path.
+    """
+
+    def write(path: Path) -> None:
+        """
+        Write the data with ``json.dump``.
+
+        Parameters
+        ----------
+        path : Path
+            The file to write.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, indent=indent)
+
+    return write
+
+
+def main() -> None:
+    """
+    Run the export benchmark and print the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lexemes", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    data = verbs_export(args.lexemes)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        before, after = Path(tmp) / "before.json", Path(tmp) / "after.json"
+        for indent in (0, 2):
+            dump_s = best_seconds(json_dump(data, indent), before, args.repeat)
+            write_s = best_seconds(
+                lambda path: write_json(path, data, indent=indent), after, args.repeat
+            )
+            results[f"indent_{indent}"] = {
+                "megabytes": round(after.stat().st_size / 1e6, 1),
+                "json_dump_s": round(dump_s, 3),
+                "write_json_s": round(write_s, 3),
+                "speedup": round(dump_s / write_s, 2),
+                "identical": before.read_bytes() == after.read_bytes(),
+            }
+
+    report = json.dumps(
+        {
+            "host": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "lexemes": args.lexemes,
+            "forms_per_lexeme": len(FORMS) + 3,
+            "writes": results,
+        },
+        indent=2,
+    )
+    if args.output:
+        args.output.write_text(report + "\n", encoding="utf-8")
+
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
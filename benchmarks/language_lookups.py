@@ -0,0 +1,182 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Benchmark the language lookup helpers of ``scribe_data.utils``.
+
+Times each helper over every language, sub-language and ISO code in the language
+metadata and compares it to a linear scan of the metadata, which is how the helpers
+looked languages up before ``LanguageRegistry`` indexed them.
+
+Examples
+--------
+>>> python3 benchmarks/language_lookups.py
+>>> python3 benchmarks/language_lookups.py --number 200 --output language_lookups.json
+"""
+
+import argparse
+import json
+import platform
+import timeit
+from pathlib import Path
+from typing import Callable, Iterator
+
+from scribe_data.utils import (
+    format_sublanguage_name,
+    get_language_from_iso,
+    get_language_iso,
+    language_metadata,
+    language_registry,
+    resolve_lang_iso,
+)
+from scribe_data.wiktionary.parse_translations import _get_output_subdir
+
+
+def linear_entries() -> Iterator[tuple[str, dict, str | None]]:
+    """
+    Walk the language metadata as the helpers did before it was indexed.
+
+    Yields
+    ------
+    tuple[str, dict, str | None]
+        Each language and sub-language with its metadata and main language.
+    """
+    for lang, data in language_metadata.items():
+        yield lang, data, None
+        for sub, sub_data in data.get("sub_languages", {}).items():
+            yield sub, sub_data, lang
+
+
+def linear_iso(language: str) -> str | None:
+    """
+    Find the ISO code of a language with a linear scan.
+
+    Parameters
+    ----------
+    language : str
+        The language name.
+
+    Returns
+    -------
+    str | None
+        The ISO code.
+    """
+    return next((d.get("iso") for n, d, _ in linear_entries() if n == language), None)
+
+
+def linear_from_iso(iso: str) -> str | None:
+    """
+    Find the language of an ISO code with a linear scan.
+
+    Parameters
+    ----------
+    iso : str
+        The ISO code.
+
+    Returns
+    -------
+    str | None
+        The language name.
+    """
+    return next((n for n, d, _ in linear_entries() if d.get("iso") == iso), None)
+
+
+def linear_parent(language: str) -> str | None:
+    """
+    Find the main language of a sub-language with a linear scan.
+
+    Parameters
+    ----------
+    language : str
+        The sub-language name.
+
+    Returns
+    -------
+    str | None
+        The main language name.
+    """
+    return next((p for n, _, p in linear_entries() if n == language and p), None)
+
+
+def time_per_call(
+    lookup: Callable[[str], object], keys: list[str], number: int
+) -> float:
+    """
+    Return the mean time of a lookup over all keys in nanoseconds.
+
+    Parameters
+    ----------
+    lookup : Callable[[str], object]
+        The lookup to time.
+
+    keys : list[str]
+        The keys to look up.
+
+    number : int
+        Times to look up every key.
+
+    Returns
+    -------
+    float
+        Nanoseconds per lookup.
+    """
+    seconds = timeit.timeit(lambda: [lookup(k) for k in keys], number=number)
+    return round(seconds / (number * len(keys)) * 1e9, 1)
+
+
+def main() -> None:
+    """
+    Run the lookup benchmark and print the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=500)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    queryable = [
+        name
+        for name in language_registry.entries
+        if name not in language_registry.sub_languages
+    ]
+    isos = list(language_registry.iso_to_name)
+    subs = list(language_registry.parents)
+
+    lookups = {
+        "get_language_iso": (get_language_iso, linear_iso, queryable),
+        "get_language_from_iso": (get_language_from_iso, linear_from_iso, isos),
+        "resolve_lang_iso": (resolve_lang_iso, linear_iso, queryable),
+        "format_sublanguage_name": (format_sublanguage_name, linear_parent, subs),
+        "_get_output_subdir": (
+            lambda lang: _get_output_subdir(lang, language_metadata),
+            linear_parent,
+            queryable,
+        ),
+    }
+
+    results = {}
+    for name, (helper, linear, keys) in lookups.items():
+        helper_ns = time_per_call(helper, keys, args.number)
+        linear_ns = time_per_call(linear, keys, args.number)
+        results[name] = {
+            "keys": len(keys),
+            "helper_ns": helper_ns,
+            "linear_scan_ns": linear_ns,
+            "speedup": round(linear_ns / helper_ns, 2),
+        }
+
+    report = json.dumps(
+        {
+            "host": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "lookups": results,
+        },
+        indent=2,
+    )
+    if args.output:
+        args.output.write_text(report + "\n", encoding="utf-8")
+
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
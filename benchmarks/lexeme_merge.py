@@ -0,0 +1,200 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Benchmark merging WDQS result rows into one entry per lexeme with ``LexemeMerger``.
+
+Merges synthetic rows of a query whose lexemes each return several rows, as when a
+lexeme has more than one value for some forms, and compares ``merge_lexeme_rows`` and
+``LexemeMerger.entries`` to how rows were merged and sorted for export before, which
+split, sorted and joined a field's values for every further row of its lexeme.
+
+Examples
+--------
+>>> python3 benchmarks/lexeme_merge.py
+>>> python3 benchmarks/lexeme_merge.py --lexemes 100000 --output lexeme_merge.json
+"""
+
+import argparse
+import collections
+import json
+import platform
+import time
+from pathlib import Path
+from typing import Callable
+
+from scribe_data.wikidata.format_data import merge_lexeme_rows
+
+FORMS = [f"form{n}" for n in range(20)]
+
+
+def query_rows(lexemes: int, rows_per_lexeme: int) -> list[dict[str, str]]:
+    """
+    Build rows shaped like the results of a query, with several rows per lexeme.
+
+    Parameters
+    ----------
+    lexemes : int
+        The number of lexemes.
+
+    rows_per_lexeme : int
+        The rows returned for each lexeme, every one of which has a differing value for
+        a few of the forms.
+
+    Returns
+    -------
+    list[dict[str, str]]
+        The result rows.
+    """
+    return [
+        {
+            "lexemeID": f"L{i}",
+            "lastModified": "2025-01-01T00:00:00Z",
+            **{
+                form: f"{form}-{i}-{row if n % 5 == 0 else 0}"
+                for n, form in enumerate(FORMS)
+            },
+        }
+        for row in range(rows_per_lexeme)
+        for i in range(lexemes)
+    ]
+
+
+def merge_before(rows: list[dict[str, str]]) -> tuple[dict, bool]:
+    """
+    Merge and sort rows as ``merge_lexeme_rows`` and ``format_data`` did before.
+
+    Parameters
+    ----------
+    rows : list[dict[str, str]]
+        The result rows.
+
+    Returns
+    -------
+    tuple[dict, bool]
+        The sorted entries and whether any field has several values.
+    """
+    data_formatted: dict[str, dict] = {}
+    for data_vals in rows:
+        lexeme_id = data_vals["lexemeID"]
+        entry = data_formatted.get(lexeme_id)
+        if entry is None:
+            data_formatted[lexeme_id] = {
+                "lastModified": data_vals["lastModified"],
+                **{
+                    key: value
+                    for key, value in data_vals.items()
+                    if key not in ["lexemeID", "lastModified"]
+                },
+            }
+            continue
+
+        for field, value in data_vals.items():
+            if field in ["lexemeID", "lastModified"] or not value:
+                continue
+
+            if existing := entry.get(field):
+                entry[field] = " | ".join(sorted(set(existing.split(" | ")) | {value}))
+
+            else:
+                entry[field] = value
+
+    data_formatted = collections.OrderedDict(sorted(data_formatted.items()))
+    has_multiple_forms = any(
+        isinstance(value, str) and " | " in value
+        for lexeme_data in data_formatted.values()
+        for value in lexeme_data.values()
+    )
+    return data_formatted, has_multiple_forms
+
+
+def merge_after(rows: list[dict[str, str]]) -> tuple[dict, bool]:
+    """
+    Merge and sort rows with ``LexemeMerger``.
+
+    Parameters
+    ----------
+    rows : list[dict[str, str]]
+        The result rows.
+
+    Returns
+    -------
+    tuple[dict, bool]
+        The sorted entries and whether any field has several values.
+    """
+    merged = merge_lexeme_rows(rows)
+    return merged.entries(), merged.has_multiple_forms
+
+
+def best_seconds(
+    merge: Callable[[list], tuple[dict, bool]], rows: list, repeat: int
+) -> tuple[float, tuple[dict, bool]]:
+    """
+    Return the fastest time of merging the rows and the merged entries.
+
+    Parameters
+    ----------
+    merge : Callable[[list], tuple[dict, bool]]
+        Merges the rows.
+
+    rows : list
+        The result rows.
+
+    repeat : int
+        Times to merge the rows.
+
+    Returns
+    -------
+    tuple[float, tuple[dict, bool]]
+        The fastest merge in seconds and its result.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = merge(rows)
+        best = min(best, time.perf_counter() - start)
+
+    return best, result
+
+
+def main() -> None:
+    """
+    Run the merge benchmark and print the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lexemes", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    results = {}
+    for rows_per_lexeme in (1, 2, 4, 8):
+        rows = query_rows(args.lexemes, rows_per_lexeme)
+        before_s, before = best_seconds(merge_before, rows, args.repeat)
+        after_s, after = best_seconds(merge_after, rows, args.repeat)
+        results[f"{rows_per_lexeme}_rows_per_lexeme"] = {
+            "rows": len(rows),
+            "before_s": round(before_s, 3),
+            "lexeme_merger_s": round(after_s, 3),
+            "speedup": round(before_s / after_s, 2),
+            "identical": before == after and list(before[0]) == list(after[0]),
+        }
+
+    report = json.dumps(
+        {
+            "host": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "lexemes": args.lexemes,
+            "forms_per_lexeme": len(FORMS),
+            "merges": results,
+        },
+        indent=2,
+    )
+    if args.output:
+        args.output.write_text(report + "\n", encoding="utf-8")
+
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Benchmark loading lexeme tables into a new language database with ``bulk_load``.
+
+Builds a database with a table for each of several data types, once inserting each row
+with ``table_insert`` under the default journal and syncing as ``convert_to_sqlite`` did
+before, and once with ``table_insert_many`` inside ``bulk_load``, which is how
+databases are built now. Both databases are checked to hold the same rows.
+
+Examples
+--------
+>>> python3 benchmarks/sqlite_bulk_load.py
+>>> python3 benchmarks/sqlite_bulk_load.py --lexemes 200000 --output sqlite_bulk_load.json
+"""
+
+import argparse
+import contextlib
+import json
+import platform
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from scribe_data.cli.convert.to_sqlite import (
+    bulk_load,
+    create_table,
+    lexeme_table_to_sqlite,
+    table_insert,
+)
+from scribe_data.wikidata.lexeme_table import LexemeTable
+
+DATA_TYPES = {"nouns": 6, "verbs": 40, "adjectives": 12}
+
+
+def lexeme_tables(lexemes: int) -> dict[str, LexemeTable]:
+    """
+    Build a table of lexemes for each data type.
+
+    Parameters
+    ----------
+    lexemes : int
+        The number of lexemes of each data type.
+
+    Returns
+    -------
+    dict[str, LexemeTable]
+        The lexemes keyed by data type.
+    """
+    strings: dict[str, str] = {}
+    return {
+        data_type: LexemeTable.from_entries(
+            {
+                f"L{i}": {
+                    "lastModified": "2025-01-01T00:00:00Z",
+                    **{f"form{n}": f"{data_type}{i}-{n}" for n in range(n_forms)},
+                }
+                for i in range(lexemes)
+            },
+            strings,
+        )
+        for data_type, n_forms in DATA_TYPES.items()
+    }
+
+
+def load_per_row(connection: sqlite3.Connection, tables: dict) -> None:
+    """
+    Insert each row with ``table_insert`` and commit each table as before.
+
+    Parameters
+    ----------
+    connection : sqlite3.Connection
+        The connection to the new database.
+
+    tables : dict
+        The lexemes keyed by data type.
+    """
+    cursor = connection.cursor()
+    for data_type, table in tables.items():
+        cols = ["wdLexemeId", *table.columns]
+        create_table(cursor, "camel", data_type=data_type, cols=cols)
+        for row in table.rows(cols[1:]):
+            table_insert(cursor, data_type=data_type, keys=list(row))
+
+        connection.commit()
+
+
+def load_bulk(connection: sqlite3.Connection, tables: dict) -> None:
+    """
+    Load every table in one transaction inside ``bulk_load``.
+
+    Parameters
+    ----------
+    connection : sqlite3.Connection
+        The connection to the new database.
+
+    tables : dict
+        The lexemes keyed by data type.
+    """
+    with bulk_load(connection):
+        cursor = connection.cursor()
+        for data_type, table in tables.items():
+            lexeme_table_to_sqlite(cursor, table, data_type=data_type)
+
+        connection.commit()
+
+
+def best_seconds(
+    load: Callable[[sqlite3.Connection, dict], None],
+    tables: dict,
+    db_file: Path,
+    repeat: int,
+) -> float:
+    """
+    Return the fastest time of building a new database.
+
+    Parameters
+    ----------
+    load : Callable[[sqlite3.Connection, dict], None]
+        Loads the tables.
+
+    tables : dict
+        The lexemes keyed by data type.
+
+    db_file : Path
+        The database to build.
+
+    repeat : int
+        Times to build the database.
+
+    Returns
+    -------
+    float
+        The fastest build in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        db_file.unlink(missing_ok=True)
+        start = time.perf_counter()
+        with contextlib.closing(sqlite3.connect(db_file)) as connection:
+            load(connection, tables)
+
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def database_rows(db_file: Path) -> dict[str, list[tuple]]:
+    """
+    Return the rows of each data type's table of a database.
+
+    Parameters
+    ----------
+    db_file : Path
+        The database.
+
+    Returns
+    -------
+    dict[str, list[tuple]]
+        The rows sorted by lexeme ID keyed by data type.
+    """
+    with contextlib.closing(sqlite3.connect(db_file)) as connection:
+        return {
+            data_type: connection.execute(
+                f"SELECT * FROM [{data_type}] ORDER BY wdLexemeId"
+            ).fetchall()
+            for data_type in DATA_TYPES
+        }
+
+
+def main() -> None:
+    """
+    Run the bulk load benchmark and print the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lexemes", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    tables = lexeme_tables(args.lexemes)
+    with tempfile.TemporaryDirectory() as tmp:
+        before, after = Path(tmp) / "before.sqlite", Path(tmp) / "after.sqlite"
+        per_row_s = best_seconds(load_per_row, tables, before, args.repeat)
+        bulk_s = best_seconds(load_bulk, tables, after, args.repeat)
+        identical = database_rows(before) == database_rows(after)
+
+    report = json.dumps(
+        {
+            "host": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "sqlite": sqlite3.sqlite_version,
+            },
+            "lexemes_per_data_type": args.lexemes,
+            "forms_per_data_type": DATA_TYPES,
+            "per_row_s": round(per_row_s, 3),
+            "bulk_load_s": round(bulk_s, 3),
+            "speedup": round(per_row_s / bulk_s, 2),
+            "identical": identical,
+        },
+        indent=2,
+    )
+    if args.output:
+        args.output.write_text(report + "\n", encoding="utf-8")
+
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Benchmark refreshing a language database incrementally rather than rebuilding it.
+
+Converts synthetic JSON exports of several data types to SQLite, then changes a share
+of the lexemes as a nightly refresh would: some are modified, some added and some
+removed. The refreshed exports are converted once by rebuilding the database and once
+with ``incremental=True``, which only writes the lexemes that changed. Both databases
+are checked to hold the same rows.
+
+Examples
+--------
+>>> python3 benchmarks/sqlite_incremental_sync.py
+>>> python3 benchmarks/sqlite_incremental_sync.py --lexemes 200000 --changed 0.05
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import shutil
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from scribe_data.cli.convert.to_sqlite import convert_to_sqlite
+from scribe_data.utils import write_json
+
+DATA_TYPES = {"nouns": 6, "verbs": 40, "adjectives": 12}
+
+
+def lexeme_entries(data_type: str, lexemes: int, changed: float) -> dict:
+    """
+    Return the entries of a data type, with a share of them changed.
+
+    Parameters
+    ----------
+    data_type : str
+        The data type of the entries.
+
+    lexemes : int
+        The number of lexemes.
+
+    changed : float
+        The share of lexemes to modify, with as many added and as many removed.
+
+    Returns
+    -------
+    dict
+        The entries keyed by lexeme ID.
+    """
+    n_forms = DATA_TYPES[data_type]
+    step = round(1 / changed) if changed else 0
+    entries = {}
+    for i in range(lexemes):
+        if step and i % step == 1:
+            continue  # removed
+
+        modified = bool(step) and i % step == 0
+        entries[f"L{i}"] = {
+            "lastModified": "2025-02-01T00:00:00Z"
+            if modified
+            else "2025-01-01T00:00:00Z",
+            **{
+                f"form{n}": f"{data_type}{i}-{n}{'*' if modified else ''}"
+                for n in range(n_forms)
+            },
+        }
+
+    # Added lexemes.
+    for i in range(lexemes, lexemes + (lexemes // step if step else 0)):
+        entries[f"L{i}"] = {
+            "lastModified": "2025-02-01T00:00:00Z",
+            **{f"form{n}": f"{data_type}{i}-{n}" for n in range(n_forms)},
+        }
+
+    return entries
+
+
+def write_exports(input_dir: Path, lexemes: int, changed: float) -> None:
+    """
+    Write a JSON export of each data type.
+
+    Parameters
+    ----------
+    input_dir : Path
+        The JSON export directory.
+
+    lexemes : int
+        The number of lexemes of each data type.
+
+    changed : float
+        The share of lexemes to modify, add and remove.
+    """
+    for data_type in DATA_TYPES:
+        write_json(
+            input_dir / "english" / f"{data_type}.json",
+            lexeme_entries(data_type, lexemes, changed),
+            indent=0,
+        )
+
+
+def convert(input_dir: Path, output_dir: Path, incremental: bool) -> float:
+    """
+    Convert the JSON exports to a database and return the seconds taken.
+
+    Parameters
+    ----------
+    input_dir : Path
+        The JSON export directory.
+
+    output_dir : Path
+        The SQLite export directory.
+
+    incremental : bool
+        Whether to update an existing database rather than rebuild it.
+
+    Returns
+    -------
+    float
+        The seconds taken by the conversion.
+    """
+    start = time.perf_counter()
+    # The conversion prints the progress of every table.
+    with contextlib.redirect_stdout(io.StringIO()):
+        convert_to_sqlite(
+            languages=["english"],
+            specific_tables=list(DATA_TYPES),
+            input_file=input_dir,
+            output_file=output_dir,
+            overwrite=True,
+            incremental=incremental,
+        )
+
+    return time.perf_counter() - start
+
+
+def database_rows(db_file: Path) -> dict[str, list[tuple]]:
+    """
+    Return the rows of each data type's table of a database.
+
+    Parameters
+    ----------
+    db_file : Path
+        The database.
+
+    Returns
+    -------
+    dict[str, list[tuple]]
+        The rows sorted by lexeme ID keyed by data type.
+    """
+    with contextlib.closing(sqlite3.connect(db_file)) as connection:
+        return {
+            data_type: connection.execute(
+                f"SELECT * FROM [{data_type}] ORDER BY wdLexemeId"
+            ).fetchall()
+            for data_type in DATA_TYPES
+        }
+
+
+def main() -> None:
+    """
+    Run the incremental sync benchmark and print the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lexemes", type=int, default=50_000)
+    parser.add_argument("--changed", type=float, default=0.01)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_dir, rebuild_dir, sync_dir = (
+            Path(tmp) / name for name in ("base", "rebuild", "sync")
+        )
+        input_dir = Path(tmp) / "json"
+        (input_dir / "english").mkdir(parents=True)
+        write_exports(input_dir, args.lexemes, changed=0)
+        convert(input_dir, base_dir, incremental=False)
+
+        write_exports(input_dir, args.lexemes, args.changed)
+        rebuild_s = min(
+            convert(input_dir, rebuild_dir, incremental=False)
+            for _ in range(args.repeat)
+        )
+
+        sync_times = []
+        for _ in range(args.repeat):
+            shutil.rmtree(sync_dir, ignore_errors=True)
+            shutil.copytree(base_dir, sync_dir)
+            sync_times.append(convert(input_dir, sync_dir, incremental=True))
+
+        db_name = "ENLanguageData.sqlite"
+        identical = database_rows(rebuild_dir / db_name) == database_rows(
+            sync_dir / db_name
+        )
+
+    report = json.dumps(
+        {
+            "host": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "sqlite": sqlite3.sqlite_version,
+            },
+            "lexemes_per_data_type": args.lexemes,
+            "forms_per_data_type": DATA_TYPES,
+            "changed_share": args.changed,
+            "rebuild_s": round(rebuild_s, 3),
+            "incremental_s": round(min(sync_times), 3),
+            "speedup": round(rebuild_s / min(sync_times), 2),
+            "identical": identical,
+        },
+        indent=2,
+    )
+    if args.output:
+        args.output.write_text(report + "\n", encoding="utf-8")
+
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
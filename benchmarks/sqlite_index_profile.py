@@ -0,0 +1,246 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Benchmark query latency of language databases built with each index profile.
+
+Builds a database of synthetic nouns and verbs without indexes and with the "lookup"
+and "autocomplete" profiles, then times the lookups made by the keyboards: the plural
+of a noun, the singular of a plural, case insensitive and prefix searches of lemmas and
+searches within words. Searches within words use the trigram FTS5 table of the
+autocomplete profile and ``LIKE '%infix%'`` otherwise.
+
+Examples
+--------
+>>> python3 benchmarks/sqlite_index_profile.py
+>>> python3 benchmarks/sqlite_index_profile.py --lexemes 200000 --queries 500
+"""
+
+import argparse
+import contextlib
+import json
+import platform
+import random
+import sqlite3
+import statistics
+import string
+import tempfile
+import time
+from pathlib import Path
+
+from scribe_data.cli.convert.sqlite_indexes import apply_index_profile
+from scribe_data.cli.convert.to_sqlite import bulk_load, lexeme_table_to_sqlite
+from scribe_data.wikidata.lexeme_table import LexemeTable
+
+PROFILES = (None, "lookup", "autocomplete")
+
+QUERIES = {
+    "plural_of_singular": "SELECT plural FROM nouns WHERE singular = ?",
+    "singular_of_plural": "SELECT singular FROM nouns WHERE plural = ?",
+    "nocase_lemma": "SELECT * FROM nouns WHERE singular = ? COLLATE NOCASE",
+    "prefix": "SELECT singular FROM nouns WHERE singular LIKE ? LIMIT 10",
+    "infix": "SELECT singular FROM nouns WHERE singular LIKE ? LIMIT 10",
+    "infix_fts": (
+        "SELECT word FROM autocomplete_lexicon_fts "
+        "WHERE autocomplete_lexicon_fts MATCH ? LIMIT 10"
+    ),
+}
+
+
+def random_words(count: int, rng: random.Random) -> list[str]:
+    """
+    Return unique random words.
+
+    Parameters
+    ----------
+    count : int
+        The number of words.
+
+    rng : random.Random
+        The random number generator.
+
+    Returns
+    -------
+    list[str]
+        The words, capitalized like nouns in some languages.
+    """
+    words: set[str] = set()
+    while len(words) < count:
+        length = rng.randint(5, 12)
+        words.add("".join(rng.choices(string.ascii_lowercase, k=length)).capitalize())
+
+    return sorted(words)
+
+
+def build_database(db_file: Path, nouns: list[str], profile: str | None) -> float:
+    """
+    Build a language database with nouns and verbs tables.
+
+    Parameters
+    ----------
+    db_file : Path
+        The database to build.
+
+    nouns : list[str]
+        The singular of each noun.
+
+    profile : str | None
+        The index profile of the database.
+
+    Returns
+    -------
+    float
+        The seconds taken to build the database.
+    """
+    start = time.perf_counter()
+    with contextlib.closing(sqlite3.connect(db_file)) as connection:
+        with bulk_load(connection):
+            cursor = connection.cursor()
+            lexeme_table_to_sqlite(
+                cursor,
+                LexemeTable.from_entries(
+                    {
+                        f"L{i}": {
+                            "lastModified": "2025-01-01T00:00:00Z",
+                            "singular": noun,
+                            "plural": f"{noun}en",
+                            "gender": "feminine" if i % 2 else "masculine",
+                        }
+                        for i, noun in enumerate(nouns)
+                    }
+                ),
+                "nouns",
+            )
+            lexeme_table_to_sqlite(
+                cursor,
+                LexemeTable.from_entries(
+                    {
+                        f"L{i}": {
+                            "lastModified": "2025-01-01T00:00:00Z",
+                            "infinitive": noun.lower() + "ieren",
+                            **{f"form{n}": f"{noun.lower()}{n}" for n in range(10)},
+                        }
+                        for i, noun in enumerate(nouns)
+                    }
+                ),
+                "verbs",
+            )
+            apply_index_profile(cursor, profile)
+            connection.commit()
+
+    return time.perf_counter() - start
+
+
+def query_params(nouns: list[str], count: int, rng: random.Random) -> dict[str, list]:
+    """
+    Return the parameters of each query.
+
+    Parameters
+    ----------
+    nouns : list[str]
+        The singular of each noun.
+
+    count : int
+        The number of times to run each query.
+
+    rng : random.Random
+        The random number generator.
+
+    Returns
+    -------
+    dict[str, list]
+        The parameters keyed by query.
+    """
+    sample = rng.sample(nouns, count)
+    return {
+        "plural_of_singular": [(noun,) for noun in sample],
+        "singular_of_plural": [(f"{noun}en",) for noun in sample],
+        "nocase_lemma": [(noun.upper(),) for noun in sample],
+        "prefix": [(f"{noun[:3].lower()}%",) for noun in sample],
+        "infix": [(f"%{noun[1:4]}%",) for noun in sample],
+        "infix_fts": [(f'"{noun[1:4]}"',) for noun in sample],
+    }
+
+
+def median_ms(cursor: sqlite3.Cursor, sql: str, params: list) -> float:
+    """
+    Return the median latency of a query.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+        A cursor of the database.
+
+    sql : str
+        The query.
+
+    params : list
+        The parameters of each run of the query.
+
+    Returns
+    -------
+    float
+        The median milliseconds to fetch the results of the query.
+    """
+    timings = []
+    for param in params:
+        start = time.perf_counter()
+        cursor.execute(sql, param).fetchall()
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    """
+    Run the index profile benchmark and print the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lexemes", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    nouns = random_words(args.lexemes, rng)
+    params = query_params(nouns, args.queries, rng)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for profile in PROFILES:
+            name = profile or "none"
+            db_file = Path(tmp) / f"{name}.sqlite"
+            build_s = build_database(db_file, nouns, profile)
+            with contextlib.closing(sqlite3.connect(db_file)) as connection:
+                cursor = connection.cursor()
+                latency = {
+                    query: round(median_ms(cursor, sql, params[query]), 4)
+                    for query, sql in QUERIES.items()
+                    if query != "infix_fts" or profile == "autocomplete"
+                }
+
+            results[name] = {
+                "build_s": round(build_s, 3),
+                "size_mb": round(db_file.stat().st_size / 1_000_000, 2),
+                "median_ms": latency,
+            }
+
+    report = json.dumps(
+        {
+            "host": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "sqlite": sqlite3.sqlite_version,
+            },
+            "lexemes_per_data_type": args.lexemes,
+            "queries": args.queries,
+            "profiles": results,
+        },
+        indent=2,
+    )
+    if args.output:
+        args.output.write_text(report + "\n", encoding="utf-8")
+
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
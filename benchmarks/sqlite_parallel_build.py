@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Benchmark building language databases in parallel with ``convert_to_sqlite``.
+
+Writes synthetic JSON exports for several languages and converts them to SQLite with an
+increasing number of workers, reporting the total time and the time taken to build the
+database of each language.
+
+Examples
+--------
+>>> python3 benchmarks/sqlite_parallel_build.py
+>>> python3 benchmarks/sqlite_parallel_build.py --lexemes 100000 --workers 1 2 4 8
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import tempfile
+import time
+from pathlib import Path
+
+from scribe_data.cli.convert.to_sqlite import convert_to_sqlite
+from scribe_data.utils import write_json
+
+LANGUAGES = [
+    "english",
+    "french",
+    "german",
+    "italian",
+    "portuguese",
+    "russian",
+    "spanish",
+    "swedish",
+]
+DATA_TYPES = {"nouns": 6, "verbs": 40, "adjectives": 12}
+
+
+def write_exports(input_dir: Path, lexemes: int) -> None:
+    """
+    Write a JSON export of each data type for each language.
+
+    Parameters
+    ----------
+    input_dir : Path
+        The JSON export directory.
+
+    lexemes : int
+        The number of lexemes of each data type.
+    """
+    for lang in LANGUAGES:
+        for data_type, n_forms in DATA_TYPES.items():
+            write_json(
+                input_dir / lang / f"{data_type}.json",
+                {
+                    f"L{i}": {
+                        "lastModified": "2025-01-01T00:00:00Z",
+                        **{f"form{n}": f"{lang}{i}-{n}" for n in range(n_forms)},
+                    }
+                    for i in range(lexemes)
+                },
+                indent=0,
+            )
+
+
+def main() -> None:
+    """
+    Run the parallel build benchmark and print the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lexemes", type=int, default=30_000)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1]
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        input_dir = Path(tmp) / "json"
+        for lang in LANGUAGES:
+            (input_dir / lang).mkdir(parents=True)
+
+        write_exports(input_dir, args.lexemes)
+        for workers in sorted(set(args.workers)):
+            start = time.perf_counter()
+            # The conversion prints the progress of every table.
+            with contextlib.redirect_stdout(io.StringIO()):
+                timings = convert_to_sqlite(
+                    languages=LANGUAGES,
+                    specific_tables=list(DATA_TYPES),
+                    input_file=input_dir,
+                    output_file=Path(tmp) / f"sqlite_{workers}",
+                    overwrite=True,
+                    workers=workers,
+                )
+
+            results[f"{workers}_workers"] = {
+                "total_s": round(time.perf_counter() - start, 3),
+                "language_s": {lang: round(s, 3) for lang, s in timings.items()},
+            }
+
+    serial_s = results.get("1_workers", {}).get("total_s")
+    if serial_s:
+        for result in results.values():
+            result["speedup"] = round(serial_s / result["total_s"], 2)
+
+    report = json.dumps(
+        {
+            "host": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "languages": len(LANGUAGES),
+            "lexemes_per_data_type": args.lexemes,
+            "forms_per_data_type": DATA_TYPES,
+            "builds": results,
+        },
+        indent=2,
+    )
+    if args.output:
+        args.output.write_text(report + "\n", encoding="utf-8")
+
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,421 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Benchmark the JSON, TSV and CSV result formats of the Wikidata Query Service.
+
+Replays recorded WDQS responses from a local HTTP server and measures, for each result
+format, the bytes transferred and the end-to-end time to request the results with
+SPARQLWrapper, stream their rows and merge them into one entry per lexeme as
+``query_data`` does. The merged entries of every format are checked against those of
+the JSON results.
+
+Responses are recorded with ``--record``, which runs a query against WDQS once in each
+format and saves the bodies as ``<name>.json``, ``<name>.tsv`` and ``<name>.csv`` in
+the fixture directory. Without recorded fixtures a synthetic verbs response is used.
+
+Examples
+--------
+>>> python3 benchmarks/wdqs_result_formats.py --record src/scribe_data/wikidata/queries_all_data/german/verbs/query_verbs_1.sparql
+>>> python3 benchmarks/wdqs_result_formats.py --repeat 5
+>>> python3 benchmarks/wdqs_result_formats.py --lexemes 2000 --compare benchmarks/baselines/wdqs_result_formats.json
+"""
+
+import argparse
+import csv
+import io
+import json
+import platform
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from SPARQLWrapper import POST, SPARQLWrapper
+
+from scribe_data.wikidata.format_data import merge_lexeme_rows
+from scribe_data.wikidata.sparql_results import RESULT_ROW_READERS, iter_result_rows
+from scribe_data.wikidata.wdqs_executor import WDQS_ENDPOINT
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "wdqs"
+BASELINE_PATH = Path(__file__).parent / "baselines" / "wdqs_result_formats.json"
+
+CONTENT_TYPES = {
+    "json": "application/sparql-results+json",
+    "tsv": "text/tab-separated-values",
+    "csv": "text/csv",
+}
+
+XSD_DATE_TIME = "http://www.w3.org/2001/XMLSchema#dateTime"
+VERB_FORMS = [
+    "presentFPS",
+    "presentSPS",
+    "presentTPS",
+    "presentFPP",
+    "presentSPP",
+    "presentTPP",
+    "pastParticiple",
+    "auxiliaryVerb",
+]
+TSV_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", '"': '\\"'}
+)
+
+
+def synthetic_results(n_lexemes: int) -> dict:
+    """
+    Return a JSON results document like that of a WDQS verbs query.
+
+    Each lexeme has two rows with differing forms, and some forms are unbound.
+
+    Parameters
+    ----------
+    n_lexemes : int
+        Number of lexemes in the results.
+
+    Returns
+    -------
+    dict
+        The results document.
+    """
+    bindings = []
+    for i in range(n_lexemes):
+        for variant in ["", "e"]:
+            binding = {
+                "lexemeID": {
+                    "type": "uri",
+                    "value": f"http://www.wikidata.org/entity/L{1000 + i}",
+                },
+                "lastModified": {
+                    "datatype": XSD_DATE_TIME,
+                    "type": "literal",
+                    "value": f"2024-0{1 + i % 9}-1{i % 10}T12:00:00Z",
+                },
+                "infinitive": {
+                    "xml:lang": "de",
+                    "type": "literal",
+                    "value": f"verbtest{i}en",
+                },
+            }
+            for j, form in enumerate(VERB_FORMS):
+                if (i + j) % 5:
+                    binding[form] = {
+                        "xml:lang": "de",
+                        "type": "literal",
+                        "value": f"verbtest{i}{form[-3:].lower()}{variant}",
+                    }
+
+            bindings.append(binding)
+
+    return {
+        "head": {"vars": ["lexemeID", "lastModified", "infinitive", *VERB_FORMS]},
+        "results": {"bindings": bindings},
+    }
+
+
+def tsv_term(term: dict) -> str:
+    """
+    Write a JSON results term as in SPARQL TSV results.
+
+    Parameters
+    ----------
+    term : dict
+        A term such as ``{"type": "uri", "value": "http://..."}``.
+
+    Returns
+    -------
+    str
+        The term in TSV results syntax.
+    """
+    if term["type"] == "uri":
+        return f"<{term['value']}>"
+
+    if term["type"] == "bnode":
+        return f"_:{term['value']}"
+
+    literal = f'"{term["value"].translate(TSV_ESCAPES)}"'
+    if "xml:lang" in term:
+        return f"{literal}@{term['xml:lang']}"
+
+    if "datatype" in term:
+        return f"{literal}^^<{term['datatype']}>"
+
+    return literal
+
+
+def render_fixtures(results: dict) -> dict[str, bytes]:
+    """
+    Write a JSON results document in each result format as WDQS would.
+
+    Parameters
+    ----------
+    results : dict
+        A JSON results document.
+
+    Returns
+    -------
+    dict[str, bytes]
+        The response body of each result format.
+    """
+    variables = results["head"]["vars"]
+    bindings = results["results"]["bindings"]
+
+    tsv_lines = ["\t".join(f"?{var}" for var in variables)]
+    tsv_lines += [
+        "\t".join(tsv_term(b[var]) if var in b else "" for var in variables)
+        for b in bindings
+    ]
+
+    csv_text = io.StringIO()
+    writer = csv.writer(csv_text, lineterminator="\r\n")
+    writer.writerow(variables)
+    writer.writerows(
+        [b[var]["value"] if var in b else "" for var in variables] for b in bindings
+    )
+
+    return {
+        "json": json.dumps(results, indent=2, ensure_ascii=False).encode(),
+        "tsv": ("\n".join(tsv_lines) + "\n").encode(),
+        "csv": csv_text.getvalue().encode(),
+    }
+
+
+def record_fixtures(query_path: Path, fixture_dir: Path) -> None:
+    """
+    Run a query against WDQS in each result format and save the response bodies.
+
+    Parameters
+    ----------
+    query_path : Path
+        The SPARQL file to run.
+
+    fixture_dir : Path
+        Where to save the bodies as ``<query name>.<format>``.
+    """
+    fixture_dir.mkdir(parents=True, exist_ok=True)
+    for result_format in RESULT_ROW_READERS:
+        client = SPARQLWrapper(WDQS_ENDPOINT)
+        client.setMethod(POST)
+        client.setReturnFormat(result_format)
+        client.setQuery(query_path.read_text(encoding="utf-8"))
+        body = client.query().response.read()
+        (fixture_dir / f"{query_path.stem}.{result_format}").write_bytes(body)
+        print(f"Recorded {len(body)} bytes of {result_format} results.")
+
+
+def load_fixtures(fixture_dir: Path) -> dict[str, dict[str, bytes]]:
+    """
+    Load the recorded responses that exist in every result format.
+
+    Parameters
+    ----------
+    fixture_dir : Path
+        The directory of recorded responses.
+
+    Returns
+    -------
+    dict[str, dict[str, bytes]]
+        The response body of each format keyed by query name.
+    """
+    fixtures = {}
+    for json_path in sorted(fixture_dir.glob("*.json")):
+        paths = {fmt: json_path.with_suffix(f".{fmt}") for fmt in RESULT_ROW_READERS}
+        if all(path.exists() for path in paths.values()):
+            fixtures[json_path.stem] = {
+                fmt: path.read_bytes() for fmt, path in paths.items()
+            }
+
+    return fixtures
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """
+    Answer each query with the recorded body of the requested result format.
+    """
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        accept = self.headers.get("Accept", "")
+        result_format = next(
+            (fmt for fmt, ctype in CONTENT_TYPES.items() if ctype in accept), "json"
+        )
+        body = self.server.bodies[result_format]
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPES[result_format])
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def measure_format(endpoint: str, result_format: str, repeat: int) -> tuple:
+    """
+    Query the replay server and merge the rows, keeping the fastest of several runs.
+
+    Parameters
+    ----------
+    endpoint : str
+        The URL of the replay server.
+
+    result_format : str
+        The result format to request.
+
+    repeat : int
+        Number of runs.
+
+    Returns
+    -------
+    tuple
+        The fastest time in seconds, the bytes received, the rows read and the merged
+        entries.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        client = SPARQLWrapper(endpoint)
+        client.setMethod(POST)
+        client.setReturnFormat(result_format)
+        client.setQuery("SELECT * WHERE { }")
+
+        start = time.perf_counter()
+        response = client.query().response
+        rows = list(iter_result_rows(response, result_format))
+        merged = merge_lexeme_rows(rows)
+        best = min(best, time.perf_counter() - start)
+
+    return best, int(response.headers["Content-Length"]), len(rows), merged
+
+
+def measure_fixture(bodies: dict[str, bytes], repeat: int) -> dict:
+    """
+    Measure every result format of a recorded response.
+
+    Parameters
+    ----------
+    bodies : dict[str, bytes]
+        The response body of each result format.
+
+    repeat : int
+        Number of runs per format.
+
+    Returns
+    -------
+    dict
+        Bytes, seconds and rows of each format and their ratios to JSON.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ReplayHandler)
+    server.bodies = bodies
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    endpoint = f"http://127.0.0.1:{server.server_port}/sparql"
+
+    try:
+        measured = {
+            fmt: measure_format(endpoint, fmt, repeat) for fmt in RESULT_ROW_READERS
+        }
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    json_seconds, json_bytes, _, json_merged = measured["json"]
+    return {
+        fmt: {
+            "bytes": n_bytes,
+            "rows": n_rows,
+            "seconds": round(seconds, 4),
+            "bytes_vs_json": round(n_bytes / json_bytes, 3),
+            "speedup_vs_json": round(json_seconds / seconds, 2),
+            "matches_json": merged == json_merged,
+        }
+        for fmt, (seconds, n_bytes, n_rows, merged) in measured.items()
+    }
+
+
+def compare_to_baseline(results: dict, baseline: dict) -> list[dict]:
+    """
+    Compare the bytes and speedups of each format to a baseline.
+
+    Parameters
+    ----------
+    results : dict
+        The results of this run.
+
+    baseline : dict
+        The results of an earlier run.
+
+    Returns
+    -------
+    list[dict]
+        The change of each measurement that is in both runs.
+    """
+    comparison = []
+    for name, formats in results["fixtures"].items():
+        for fmt, run in formats.items():
+            base = baseline.get("fixtures", {}).get(name, {}).get(fmt)
+            if base is None:
+                continue
+
+            comparison.append(
+                {
+                    "fixture": name,
+                    "format": fmt,
+                    "bytes_vs_json": [base["bytes_vs_json"], run["bytes_vs_json"]],
+                    "speedup_vs_json": [
+                        base["speedup_vs_json"],
+                        run["speedup_vs_json"],
+                    ],
+                }
+            )
+
+    return comparison
+
+
+def main() -> None:
+    """
+    Run the result format benchmark and print the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fixtures", type=Path, default=FIXTURE_DIR)
+    parser.add_argument("--record", type=Path, default=None)
+    parser.add_argument("--lexemes", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures(args.record, args.fixtures)
+        return
+
+    fixtures = load_fixtures(args.fixtures) if args.fixtures.is_dir() else {}
+    if not fixtures:
+        fixtures = {
+            f"synthetic_verbs_{args.lexemes}": render_fixtures(
+                synthetic_results(args.lexemes)
+            )
+        }
+
+    results: dict = {
+        "host": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "fixtures": {
+            name: measure_fixture(bodies, args.repeat)
+            for name, bodies in fixtures.items()
+        },
+    }
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        results["comparison"] = compare_to_baseline(results, baseline)
+
+    report = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(report + "\n", encoding="utf-8")
+
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Benchmark the Wiktionary dump page readers against a synthetic pages-articles dump.
+
+Compares the previous ElementTree ``iterparse`` reader with the byte-level ``<page>``
+splitter that ``parse_xml_dump`` now uses in the parent process.
+
+Examples
+--------
+>>> python3 benchmarks/wiktionary_dump_reader.py --size-mb 2048
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from scribe_data.wiktionary.parse_translations import (
+    _extract_page_title,
+    _iter_dump_page_blobs,
+    _iter_dump_pages,
+)
+
+PAGE_TEMPLATE = """  <page>
+    <title>{title}</title>
+    <ns>0</ns>
+    <id>{page_id}</id>
+    <revision>
+      <id>{page_id}</id>
+      <timestamp>2024-01-01T00:00:00Z</timestamp>
+      <comment>added translation</comment>
+      <model>wikitext</model>
+      <format>text/x-wiki</format>
+      <text bytes="{n_bytes}" xml:space="preserve">{text}</text>
+      <sha1>0000000000000000000000000000000</sha1>
+    </revision>
+  </page>
+"""
+
+WIKITEXT = """==English==
+===Noun===
+# A word &amp; its [[meaning]] number {i}.
+====Translations====
+{{{{trans-top|a word number {i}}}}}
+* German: {{{{t+|de|Wort{i}|n}}}}, {{{{t|de|Begriff|m}}}}
+* French: {{{{t+|fr|mot{i}|m}}}}
+* Spanish: {{{{t|es|palabra|f}}}}
+{{{{trans-bottom}}}}
+"""
+
+
+def write_synthetic_dump(path: Path, size_mb: int) -> int:
+    """
+    Write an uncompressed synthetic dump of roughly the given size.
+
+    Parameters
+    ----------
+    path : Path
+        Where the XML file should be written.
+
+    size_mb : int
+        The approximate size of the dump in megabytes.
+
+    Returns
+    -------
+    int
+        The number of pages written.
+    """
+    target = size_mb * 1024 * 1024
+    written = 0
+    i = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<mediawiki xmlns="http://www.mediawiki.org/xml/export-0.11/">\n')
+        while written < target:
+            text = WIKITEXT.format(i=i)
+            page = PAGE_TEMPLATE.format(
+                title=f"word{i}", page_id=i, n_bytes=len(text), text=text
+            )
+            written += f.write(page)
+            i += 1
+
+        f.write("</mediawiki>\n")
+
+    return i
+
+
+def iter_pages_iterparse(path: Path):
+    """
+    Yield ``(title, text)`` pairs with the previous ElementTree reader.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the XML dump.
+
+    Yields
+    ------
+    tuple[str, str]
+        The title and wikitext of each page.
+    """
+    with open(path, "rb") as f:
+        context = iter(ET.iterparse(f, events=("start", "end")))
+        _, root = next(context)
+        for event, elem in context:
+            if event != "end":
+                continue
+
+            tag = elem.tag
+            ns = tag[: tag.rfind("}") + 1] if "}" in tag else ""
+            tag_name = tag[tag.rfind("}") + 1 :] if "}" in tag else tag
+            if tag_name != "page":
+                continue
+
+            yield (
+                elem.findtext(f"{ns}title", default=""),
+                elem.findtext(f"{ns}revision/{ns}text", default=""),
+            )
+
+            elem.clear()
+            root.clear()
+
+
+def iter_titles_blobs(path: Path):
+    """
+    Yield ``(title, page_xml)`` pairs as the parent process now sees them.
+
+    Parameters
+    ----------
+    path : Path
+        The path to the XML dump.
+
+    Yields
+    ------
+    tuple[str, bytes]
+        The title and raw XML of each page.
+    """
+    for page_xml in _iter_dump_page_blobs(path):
+        yield _extract_page_title(page_xml), page_xml
+
+
+def time_reader(name: str, reader, path: Path) -> dict:
+    """
+    Time a full pass of a page reader over the dump.
+
+    Parameters
+    ----------
+    name : str
+        A label for the reader.
+
+    reader : Callable
+        A generator function that takes the dump path.
+
+    path : Path
+        The path to the XML dump.
+
+    Returns
+    -------
+    dict
+        The reader name, page count, seconds and MB/s throughput.
+    """
+    start = time.perf_counter()
+    pages = sum(1 for _ in reader(path))
+    seconds = time.perf_counter() - start
+    size_mb = path.stat().st_size / (1024 * 1024)
+    return {
+        "reader": name,
+        "pages": pages,
+        "seconds": round(seconds, 3),
+        "mb_per_s": round(size_mb / seconds, 1),
+    }
+
+
+def main() -> None:
+    """
+    Run the reader benchmark and print the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument("--dump-path", type=Path, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.dump_path or Path(tmp_dir) / "enwiktionary-synthetic.xml"
+        if not path.exists():
+            write_synthetic_dump(path, args.size_mb)
+
+        results = [
+            time_reader("iterparse", iter_pages_iterparse, path),
+            time_reader("page_blobs_decoded", _iter_dump_pages, path),
+            time_reader("page_blobs_parent", iter_titles_blobs, path),
+        ]
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
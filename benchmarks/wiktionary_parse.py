@@ -0,0 +1,578 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Benchmark Wiktionary translation parsing for every supported source edition.
+
+Synthesizes bz2-compressed pages-articles dumps offline for each edition config, runs
+``parse_xml_dump`` on them at several ``num_workers`` settings and reports the
+throughput, CPU time, IPC bytes and peak RSS of each run as JSON. The CPU time of the
+parsing engines in ``_ENGINES`` is measured separately by parsing the page texts
+directly in a single process.
+
+Each run is made in a fresh interpreter so that peak RSS values don't carry over.
+
+Examples
+--------
+>>> python3 benchmarks/wiktionary_parse.py --pages 2000 --workers 1,2,4
+>>> python3 benchmarks/wiktionary_parse.py --compare benchmarks/baselines/wiktionary_parse.json
+"""
+
+import argparse
+import bz2
+import html
+import json
+import os
+import pickle
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from scribe_data.wiktionary.parse_constants import get_wiktionary_config
+from scribe_data.wiktionary.parse_translations import (
+    _parse_page_translations,
+    parse_xml_dump,
+)
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "wiktionary_parse.json"
+
+TARGET_LANGS = ["de", "en", "es", "fr", "ru", "sv"]
+
+PAGE_TEMPLATE = """  <page>
+    <title>{title}</title>
+    <ns>{ns}</ns>
+    <id>{page_id}</id>
+    <revision>
+      <id>{page_id}</id>
+      <timestamp>2024-01-01T00:00:00Z</timestamp>
+      <model>wikitext</model>
+      <format>text/x-wiki</format>
+      <text bytes="{n_bytes}" xml:space="preserve">{text}</text>
+      <sha1>0000000000000000000000000000000</sha1>
+    </revision>
+  </page>
+"""
+
+# Definitions and examples that pad pages to a realistic size and template density.
+FILLER = "\n".join(
+    f"# Sense {k} of @W@, see [[@W@{k}]] and {{{{lb|@L@|rare}}}} ''usage'' {k}.\n"
+    f"#: {{{{ux|@L@|An example sentence for @W@ number {k}.}}}}"
+    for k in range(1, 6)
+)
+
+# Page wikitext per source edition, with @W@ replaced by the page title and @L@ by
+# the edition's ISO code. Each page has two translation blocks.
+EDITION_PAGES = {
+    "en": """==English==
+===Etymology===
+From {{inh|en|enm|@W@e}}.
+===Noun===
+{{en-noun}}
+@FILLER@
+====Translations====
+{{trans-top|a thing called @W@}}
+* German: {{t+|de|@W@wort|n}}, {{t|de|@W@begriff|m}}
+* French: {{t+|fr|@W@mot|m}}
+* Spanish: {{t|es|@W@palabra|f}}
+* Russian: {{t|ru|@W@слово|n}}
+{{trans-bottom}}
+===Verb===
+# To use @W@.
+====Translations====
+{{trans-top|to use @W@}}
+* German: {{t|de|@W@en}}
+* Swedish: {{t|sv|@W@a}}
+{{trans-bottom}}
+""",
+    "de": """== @W@ ({{Sprache|Deutsch}}) ==
+=== {{Wortart|Substantiv|Deutsch}}, {{n}} ===
+{{Bedeutungen}}
+@FILLER@
+==== {{Übersetzungen}} ====
+{{Ü-Tabelle|Ü-Liste=
+*{{en}}: [1] {{Ü|en|@W@word}}, {{Ü|en|@W@term}}
+*{{fr}}: [1] {{Ü|fr|@W@mot}} {{m}}
+*{{es}}: [1] {{Ü|es|@W@palabra}} {{f}}
+*{{sv}}: [1] {{Ü|sv|@W@ord}}
+}}
+=== {{Wortart|Verb|Deutsch}} ===
+{{Ü-Tabelle|Ü-Liste=
+*{{en}}: [1] {{Ü|en|to @W@}}
+}}
+""",
+    "fr": """== {{langue|fr}} ==
+=== {{S|étymologie}} ===
+: Du latin ''@W@us''.
+=== {{S|nom|fr}} ===
+@FILLER@
+==== {{S|traductions}} ====
+{{trad-début|Chose appelée @W@}}
+* {{T|en}} : {{trad+|en|@W@word}}
+* {{T|de}} : {{trad+|de|@W@Wort|n}}
+* {{T|es}} : {{trad-|es|@W@palabra|f}}
+{{trad-fin}}
+=== {{S|verbe|fr}} ===
+{{trad-début|Utiliser @W@}}
+* {{T|en}} : {{trad+|en|to @W@}}
+{{trad-fin}}
+""",
+    "es": """== {{lengua|es}} ==
+{{pron-graf}}
+==== {{sustantivo masculino|es}} ====
+@FILLER@
+==== Traducciones ====
+{{trad-arriba}}
+{{t|en|a1=1|t1=@W@book|a2=2|t2=@W@tome}}
+{{t|de|a1=1|t1=@W@Buch|g1=n}}
+{{t|fr|a1=1|t1=@W@livre|g1=m}}
+{{trad-abajo}}
+==== {{verbo transitivo|es}} ====
+{{trad-arriba|usar}}
+{{t|en|a1=1|t1=to @W@}}
+{{trad-abajo}}
+""",
+    "it": """== {{-it-}} ==
+{{-sost-|it}}
+@FILLER@
+{{-trad-}}
+{{Trad1|oggetto @W@}}
+:* {{en}}: [[@W@book]], [[@W@tome]]
+:* {{de}}: [[@W@Buch]]
+:* {{fr}}: [[@W@livre]]
+{{Trad2}}
+{{Trad1|uso di @W@}}
+:* {{en}}: [[@W@use]]
+{{Trad2}}
+""",
+    "pt": """={{-pt-}}=
+==Substantivo==
+@FILLER@
+===Tradução===
+{{tradini|objeto @W@}}
+* {{trad|en|@W@book}}
+* {{t|de|@W@Buch|n}}
+* {{t|es|@W@libro|m}}
+{{tradfim}}
+==Verbo==
+{{tradini|usar @W@}}
+* {{trad|en|to @W@}}
+{{tradfim}}
+""",
+    "ru": """= {{-ru-}} =
+=== существительное ===
+{{сущ ru n a 1a}}
+@FILLER@
+==== Перевод ====
+{{trans-top|предмет @W@}}
+* английский: {{t|en|@W@book}}
+* немецкий: {{t|de|@W@Buch|n}}
+* французский: {{t|fr|@W@livre|m}}
+{{trans-bottom}}
+=== глагол ===
+{{trans-top|использовать @W@}}
+* английский: {{t|en|to @W@}}
+{{trans-bottom}}
+""",
+    "sv": """==Svenska==
+===Substantiv===
+{{sv-subst-n-oböjl}}
+@FILLER@
+====Översättningar====
+{{ö-topp|sak som kallas @W@}}
+*engelska: {{ö+|en|@W@book}}
+*tyska: {{ö+|de|@W@Buch|n}}
+*franska: {{ö|fr|@W@livre|m}}
+{{ö-botten}}
+===Verb===
+{{ö-topp|använda @W@}}
+*engelska: {{ö|en|to @W@}}
+{{ö-botten}}
+""",
+    "id": """== {{bahasa|id}} ==
+{{-n-}}
+@FILLER@
+{{t-atas|benda @W@}}
+* Inggris: {{t|en|@W@book}}
+* Jerman: {{t|de|@W@Buch|n}}
+* Prancis: {{t|fr|@W@livre|m}}
+{{t-bawah}}
+{{-v-}}
+{{t-atas|memakai @W@}}
+* Inggris: {{t|en|to @W@}}
+{{t-bawah}}
+""",
+    "bn": """== {{ভাষা|bn}} ==
+===বিশেষ্য===
+@FILLER@
+{{trans-top|@W@ নামের বস্তু}}
+* ইংরেজি: {{t|en|@W@book}}
+* জার্মান: {{t|de|@W@Buch|n}}
+* ফরাসি: {{t|fr|@W@livre|m}}
+{{trans-bottom}}
+===ক্রিয়াপদ===
+{{trans-top|@W@ ব্যবহার করা}}
+* ইংরেজি: {{t|en|to @W@}}
+{{trans-bottom}}
+""",
+}
+
+
+def build_page_text(source_iso: str, word: str) -> str:
+    """
+    Return the wikitext of a synthetic page for a source edition.
+
+    Parameters
+    ----------
+    source_iso : str
+        ISO code of the source Wiktionary edition.
+
+    word : str
+        The page title.
+
+    Returns
+    -------
+    str
+        Unescaped wikitext with two translation blocks.
+    """
+    text = EDITION_PAGES[source_iso].replace("@FILLER@", FILLER)
+    return text.replace("@W@", word).replace("@L@", source_iso)
+
+
+def iter_synthetic_pages(source_iso: str, n_pages: int):
+    """
+    Yield the title, namespace and wikitext of each synthetic page.
+
+    Every fourth page has no translations and every tenth is a talk page, so that the
+    prefilters and namespace checks are exercised as in real dumps.
+
+    Parameters
+    ----------
+    source_iso : str
+        ISO code of the source Wiktionary edition.
+
+    n_pages : int
+        Number of pages to generate.
+
+    Yields
+    ------
+    tuple[str, int, str]
+        The title, namespace and wikitext of a page.
+    """
+    for i in range(n_pages):
+        word = f"w{i}"
+        if i % 10 == 9:
+            yield f"Talk:{word}", 1, f"Discussion of [[{word}]]."
+
+        elif i % 4 == 3:
+            header = build_page_text(source_iso, word).split("\n", 1)[0]
+            yield word, 0, f"{header}\n{FILLER.replace('@W@', word)}\n"
+
+        else:
+            yield word, 0, build_page_text(source_iso, word)
+
+
+def write_synthetic_dump(path: Path, source_iso: str, n_pages: int) -> int:
+    """
+    Write a bz2-compressed synthetic pages-articles dump for a source edition.
+
+    Parameters
+    ----------
+    path : Path
+        Where the ``*.xml.bz2`` file should be written.
+
+    source_iso : str
+        ISO code of the source Wiktionary edition.
+
+    n_pages : int
+        Number of pages to write.
+
+    Returns
+    -------
+    int
+        The size of the uncompressed XML in bytes.
+    """
+    written = 0
+    with bz2.open(path, "wt", encoding="utf-8") as f:
+        written += f.write(
+            '<mediawiki xmlns="http://www.mediawiki.org/xml/export-0.11/">\n'
+        )
+        for page_id, (title, ns, text) in enumerate(
+            iter_synthetic_pages(source_iso, n_pages)
+        ):
+            written += f.write(
+                PAGE_TEMPLATE.format(
+                    title=html.escape(title, quote=False),
+                    ns=ns,
+                    page_id=page_id,
+                    n_bytes=len(text.encode("utf-8")),
+                    text=html.escape(text, quote=False),
+                )
+            )
+
+        written += f.write("</mediawiki>\n")
+
+    return written
+
+
+def measure_engine(source_iso: str, n_pages: int) -> dict:
+    """
+    Measure the CPU time of an edition's parsing engine without any dump I/O.
+
+    Parameters
+    ----------
+    source_iso : str
+        ISO code of the source Wiktionary edition.
+
+    n_pages : int
+        Number of synthetic pages to parse.
+
+    Returns
+    -------
+    dict
+        The engine name, pages parsed, CPU seconds, pages/s and the pickled size of
+        the results that workers would send back to the parent.
+    """
+    config = get_wiktionary_config(source_iso=source_iso)
+    target_langs = frozenset(TARGET_LANGS)
+    pages = [
+        (title, text)
+        for title, ns, text in iter_synthetic_pages(source_iso, n_pages)
+        if ns == 0
+    ]
+
+    result_bytes = 0
+    translated = 0
+    started = time.process_time()
+    for title, text in pages:
+        if parsed := _parse_page_translations(config, target_langs, text, title):
+            translated += 1
+            result_bytes += len(pickle.dumps((title, parsed)))
+
+    cpu_seconds = time.process_time() - started
+    return {
+        "engine": config.get("engine", "ast_trans_top"),
+        "pages": len(pages),
+        "pages_with_translations": translated,
+        "cpu_seconds": round(cpu_seconds, 3),
+        "pages_per_s": round(len(pages) / cpu_seconds, 1) if cpu_seconds else None,
+        "result_bytes": result_bytes,
+    }
+
+
+def measure_parse(dump_path: Path, source_iso: str, num_workers: int) -> dict:
+    """
+    Run ``parse_xml_dump`` once and measure it, meant to run in a fresh interpreter.
+
+    Parameters
+    ----------
+    dump_path : Path
+        The synthetic dump to parse.
+
+    source_iso : str
+        ISO code of the source Wiktionary edition.
+
+    num_workers : int
+        Number of worker processes.
+
+    Returns
+    -------
+    dict
+        Throughput, CPU time, IPC bytes and peak RSS of the run.
+    """
+    metrics: dict = {}
+    started = time.perf_counter()
+    output = parse_xml_dump(
+        dump_path,
+        TARGET_LANGS,
+        source_iso=source_iso,
+        progress=False,
+        num_workers=num_workers,
+        metrics=metrics,
+    )
+    seconds = time.perf_counter() - started
+
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    words = len({word for words in output.values() for word in words})
+    return {
+        "source_iso": source_iso,
+        "num_workers": num_workers,
+        "seconds": round(seconds, 3),
+        "pages": metrics["pages"],
+        "pages_per_s": round(metrics["pages"] / seconds, 1),
+        "words": words,
+        "cpu_seconds": round(
+            own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime, 3
+        ),
+        "ipc_bytes_in": metrics["input_bytes"] if num_workers > 1 else 0,
+        "worker_utilization": metrics["worker_utilization"],
+        "max_queue_depth": metrics["max_queue_depth"],
+        # ru_maxrss is in kilobytes on Linux.
+        "peak_rss_mb": round(own.ru_maxrss / 1024, 1),
+        "worker_peak_rss_mb": round(children.ru_maxrss / 1024, 1),
+    }
+
+
+def run_isolated(dump_path: Path, source_iso: str, num_workers: int) -> dict:
+    """
+    Run ``measure_parse`` in a fresh interpreter and return its results.
+
+    Parameters
+    ----------
+    dump_path : Path
+        The synthetic dump to parse.
+
+    source_iso : str
+        ISO code of the source Wiktionary edition.
+
+    num_workers : int
+        Number of worker processes.
+
+    Returns
+    -------
+    dict
+        The results printed by the child process.
+    """
+    completed = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--measure",
+            str(dump_path),
+            source_iso,
+            str(num_workers),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def summarize_engines(engines: dict) -> dict:
+    """
+    Sum the per-edition engine measurements by parsing engine.
+
+    Parameters
+    ----------
+    engines : dict
+        Results of ``measure_engine`` keyed by source edition.
+
+    Returns
+    -------
+    dict
+        Pages, CPU seconds and pages/s for each engine.
+    """
+    totals: dict = {}
+    for result in engines.values():
+        total = totals.setdefault(result["engine"], {"pages": 0, "cpu_seconds": 0.0})
+        total["pages"] += result["pages"]
+        total["cpu_seconds"] += result["cpu_seconds"]
+
+    for total in totals.values():
+        total["cpu_seconds"] = round(total["cpu_seconds"], 3)
+        total["pages_per_s"] = round(total["pages"] / total["cpu_seconds"], 1)
+
+    return totals
+
+
+def compare_to_baseline(results: dict, baseline: dict) -> list[dict]:
+    """
+    Compare the throughput of each run to a baseline.
+
+    Parameters
+    ----------
+    results : dict
+        Results of this benchmark run.
+
+    baseline : dict
+        Results of a previous run, e.g. the checked-in baseline.
+
+    Returns
+    -------
+    list[dict]
+        The pages/s of each matching run and its ratio to the baseline.
+    """
+    previous = {
+        (run["source_iso"], run["num_workers"]): run["pages_per_s"]
+        for run in baseline["runs"]
+    }
+    comparisons = []
+    for run in results["runs"]:
+        key = (run["source_iso"], run["num_workers"])
+        if key in previous:
+            comparisons.append(
+                {
+                    "source_iso": key[0],
+                    "num_workers": key[1],
+                    "pages_per_s": run["pages_per_s"],
+                    "baseline_pages_per_s": previous[key],
+                    "ratio": round(run["pages_per_s"] / previous[key], 2),
+                }
+            )
+
+    return comparisons
+
+
+def main() -> None:
+    """
+    Run the parse benchmark and print the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--editions", default=",".join(EDITION_PAGES))
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    parser.add_argument("--measure", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        dump_path, source_iso, num_workers = args.measure
+        print(json.dumps(measure_parse(Path(dump_path), source_iso, int(num_workers))))
+        return
+
+    editions = args.editions.split(",")
+    workers = [int(w) for w in args.workers.split(",")]
+    results: dict = {
+        "host": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "pages_per_edition": args.pages,
+        "target_langs": TARGET_LANGS,
+        "engines": {},
+        "runs": [],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for source_iso in editions:
+            dump_path = (
+                Path(tmp_dir)
+                / f"{source_iso}wiktionary-synthetic-pages-articles.xml.bz2"
+            )
+            xml_bytes = write_synthetic_dump(dump_path, source_iso, args.pages)
+            results["engines"][source_iso] = measure_engine(source_iso, args.pages)
+            for num_workers in workers:
+                run = run_isolated(dump_path, source_iso, num_workers)
+                run["xml_mb_per_s"] = round(xml_bytes / 1024**2 / run["seconds"], 2)
+                results["runs"].append(run)
+
+    results["engine_totals"] = summarize_engines(results["engines"])
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        results["comparison"] = compare_to_baseline(results, baseline)
+
+    report = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(report + "\n", encoding="utf-8")
+
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
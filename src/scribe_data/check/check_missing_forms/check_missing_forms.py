@@ -20,9 +20,14 @@ from scribe_data.utils import (
     WIKIDATA_QUERIES_ALL_DATA_DIR,
     data_type_metadata,
     language_metadata,
+    language_registry,
     lexeme_form_metadata,
     sub_languages,
 )
+from scribe_data.wikidata.sparql_options import (
+    add_sparql_cache_arguments,
+    configure_sparql_cache_from_args,
+)
 from scribe_data.wikidata.wikidata_utils import sparql
 
 DEFAULT_COMPLEX_DATA_TYPE_FREQUENCY = 50
@@ -276,6 +281,25 @@ def get_forms_from_sparql_service(
     return form_combinations
 
 
+def _language_qids() -> dict[str, str]:
+    """
+    Map the QID of each language and sub-language to its name.
+
+    Languages that share a QID, such as the sub-languages of Punjabi, are listed under
+    the last of them in the metadata.
+
+    Returns
+    -------
+    dict[str, str]
+        The name of each language keyed by its QID.
+    """
+    return {
+        data["qid"]: name
+        for name, data in language_registry.entries.items()
+        if data.get("qid")
+    }
+
+
 def get_forms_from_sparql_service_all_languages(
     frequency_threshold: int = 0, max_results: int = 1000
 ) -> dict:
@@ -299,22 +323,15 @@ def get_forms_from_sparql_service_all_languages(
     result_sparql_service = defaultdict(lambda: defaultdict(list))
 
     # Get all language QIDs and track parent QIDs for sub-languages.
-    language_qids = {}
-    # Maps sub-language QID to parent QID for fallback.
-    parent_qids = {}
-
-    for lang, lang_data in language_metadata.items():
-        if "qid" in lang_data:
-            language_qids[lang_data["qid"]] = lang
-        if "sub_languages" in lang_data:
-            parent_qid = lang_data.get("qid")  # get parent QID if exists
-            for sub_lang, sub_data in lang_data["sub_languages"].items():
-                if "qid" in sub_data:
-                    sub_lang_qid = sub_data["qid"]
-                    language_qids[sub_lang_qid] = sub_lang
-                    # Store parent QID for fallback (only if parent exists and differs from sub-language).
-                    if parent_qid and parent_qid != sub_lang_qid:
-                        parent_qids[sub_lang_qid] = parent_qid
+    language_qids = _language_qids()
+    # Maps sub-language QID to parent QID for fallback (only if parent exists and differs from sub-language).
+    parent_qids = {
+        qid: parent_qid
+        for qid, lang in language_qids.items()
+        if (parent := language_registry.parents.get(lang))
+        and (parent_qid := language_registry.entries[parent].get("qid"))
+        and parent_qid != qid
+    }
 
     data_type_qids = {
         qid: data_type
@@ -556,7 +573,10 @@ def main() -> None:
         help="Path to the query directory (optional, defaults to the queries directory in the wikidata folder)",
     )
 
+    add_sparql_cache_arguments(parser)
+
     args = parser.parse_args()
+    configure_sparql_cache_from_args(args)
 
     # Use queries directory by default.
     if args.query_dir:
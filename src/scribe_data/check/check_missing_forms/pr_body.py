@@ -8,7 +8,7 @@ import sys
 
 from scribe_data.utils import (
     data_type_metadata,
-    language_metadata,
+    language_registry,
 )
 
 
@@ -49,20 +49,9 @@ def pr_body(missing_features: dict) -> str:
     # Iterate over the missing features to populate the table.
     for entity, features in missing_features.items():
         # Check for sub-languages.
-        language_name = None
-        for name, data in language_metadata.items():
-            if data.get("qid") == entity:
-                language_name = name
-                break
-
-            if "sub_languages" in data:
-                for sub_name, sub_data in data["sub_languages"].items():
-                    if sub_data.get("qid") == entity:
-                        language_name = f"{name} ({sub_name})"
-                        break
-
-            if language_name:
-                break
+        language_name = language_registry.qid_to_name.get(entity)
+        if parent := language_registry.parents.get(language_name):
+            language_name = f"{parent} ({language_name})"
 
         # Default to entity if no name is found.
         language_name = language_name or entity
@@ -14,7 +14,7 @@ from pathlib import Path
 from scribe_data.utils import (
     WIKIDATA_QUERIES_ALL_DATA_DIR,
     data_type_metadata,
-    language_metadata,
+    language_registry,
 )
 
 
@@ -41,20 +41,12 @@ def is_valid_language(query_file: Path, lang_qid: str) -> bool:
     True
     """
     lang_directory_name = query_file.parent.parent.name.lower()
-    language_entry = language_metadata.get(lang_directory_name)
+    language_entry = language_registry.entries.get(lang_directory_name)
     parent_qid = None
 
-    if not language_entry:
-        # Look for sub-languages.
-        for lang, details in language_metadata.items():
-            if "sub_languages" in details:
-                if sub_language_entry := details["sub_languages"].get(
-                    lang_directory_name
-                ):
-                    language_entry = sub_language_entry
-                    # Store parent QID if it exists.
-                    parent_qid = details.get("qid")
-                    break
+    # Store the parent QID of sub-languages if it exists.
+    if parent := language_registry.parents.get(lang_directory_name):
+        parent_qid = language_registry.entries[parent].get("qid")
 
     if not language_entry:
         return False
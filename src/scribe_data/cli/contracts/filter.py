@@ -16,6 +16,7 @@ from scribe_data.utils import (
     DEFAULT_FILTERED_JSON_EXPORT_DIR,
     DEFAULT_JSON_EXPORT_DIR,
     get_language_from_iso,
+    write_json,
 )
 
 # MARK: Filter Metadata
@@ -326,8 +327,7 @@ def export_data_filtered_by_contracts(
                     / matched_language.lower().replace(" ", "_")
                     / f"{data_type}.json"
                 )
-                with open(output_file, "w", encoding="utf-8") as f:
-                    json.dump(filtered_data, f, ensure_ascii=False, indent=2)
+                write_json(output_file, filtered_data)
 
                 print(
                     f"Exported {matched_language} {data_type} with {len(filtered_data)} entries"
@@ -0,0 +1,306 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Index profiles that add lookup indexes and autocomplete tables to language databases.
+"""
+
+import sqlite3
+
+from scribe_data.utils import data_type_metadata
+from scribe_data.wikidata.lexeme_merge import MULTIPLE_VALUES_SEPARATOR
+
+# Profiles from the fewest to the most indexes, each including those before it.
+INDEX_PROFILES = ("lookup", "autocomplete")
+
+# Forms besides the lemma that are looked up, e.g. to find the singular of a plural.
+LOOKUP_FORM_COLUMNS = (
+    "singular",
+    "plural",
+    "nominativeSingular",
+    "nominativePlural",
+    "infinitive",
+)
+
+# Columns that hold the lemma when there's none named after the data type.
+_LEMMA_COLUMNS = ("lemma", "singular", "nominativeSingular", "infinitive", "nominative")
+
+_ROW_ID_COLUMNS = ("wdlexemeid", "lastmodified")
+
+
+def _normalize(column: str) -> str:
+    """
+    Return a column name without case or underscores to compare camel and snake case.
+
+    Parameters
+    ----------
+    column : str
+        The column name.
+
+    Returns
+    -------
+    str
+        The lower case name without underscores.
+    """
+    return column.replace("_", "").lower()
+
+
+def lemma_column(data_type: str, columns: list[str]) -> str | None:
+    """
+    Return the column of a lexeme table that holds the lemma of each lexeme.
+
+    Parameters
+    ----------
+    data_type : str
+        The data type of the table, e.g. "proper_nouns".
+
+    columns : list[str]
+        The columns of the table in either identifier case.
+
+    Returns
+    -------
+    str | None
+        The column named after the data type, such as "properNoun", else the first of
+        the usual lemma columns or forms, or None if the table only has row IDs.
+    """
+    by_name = {_normalize(col): col for col in columns}
+    for candidate in (data_type[:-1], *_LEMMA_COLUMNS):
+        if (col := by_name.get(_normalize(candidate))) is not None:
+            return col
+
+    return next(
+        (col for col in columns if _normalize(col) not in _ROW_ID_COLUMNS), None
+    )
+
+
+def lexeme_tables(cursor: sqlite3.Cursor) -> dict[str, list[str]]:
+    """
+    Return the columns of each lexeme table of a language database.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+        A cursor of the language database.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        The columns keyed by the data type of each table.
+    """
+    data_types = set(data_type_metadata) - {"translations", "emoji_keywords"}
+    tables = [
+        name
+        for (name,) in cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name"
+        )
+        if name in data_types
+    ]
+    return {
+        table: [
+            info[1]
+            for info in cursor.execute(f"PRAGMA table_info([{table}])").fetchall()
+        ]
+        for table in tables
+    }
+
+
+def create_lookup_indexes(
+    cursor: sqlite3.Cursor, data_type: str, columns: list[str]
+) -> list[str]:
+    """
+    Index the lemma and looked up forms of a lexeme table.
+
+    Exact lookups of the lemma and of the forms in ``LOOKUP_FORM_COLUMNS`` use B-tree
+    indexes, and a ``COLLATE NOCASE`` index of the lemma serves case insensitive lookups
+    and prefix searches with ``LIKE 'prefix%'``.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+        A cursor of the language database.
+
+    data_type : str
+        The data type of the table.
+
+    columns : list[str]
+        The columns of the table.
+
+    Returns
+    -------
+    list[str]
+        The names of the indexes created.
+    """
+    if (lemma := lemma_column(data_type, columns)) is None:
+        return []
+
+    lookup_forms = {_normalize(col) for col in LOOKUP_FORM_COLUMNS}
+    indexed = [lemma] + [
+        col for col in columns if col != lemma and _normalize(col) in lookup_forms
+    ]
+
+    indexes = []
+    for col in indexed:
+        index = f"{data_type}_{col}_idx"
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS [{index}] ON [{data_type}] ([{col}])"
+        )
+        indexes.append(index)
+
+    index = f"{data_type}_{lemma}_nocase_idx"
+    cursor.execute(
+        f"CREATE INDEX IF NOT EXISTS [{index}] ON [{data_type}] ([{lemma}] COLLATE NOCASE)"
+    )
+    indexes.append(index)
+
+    return indexes
+
+
+def create_autocomplete_lexicon(
+    cursor: sqlite3.Cursor, tables: dict[str, list[str]]
+) -> int:
+    """
+    Create the autocomplete_lexicon table of the lemmas of every lexeme table.
+
+    Words are unique regardless of case and indexed with ``COLLATE NOCASE`` for prefix
+    searches. A trigram FTS5 table, autocomplete_lexicon_fts, indexes the words for
+    searches within words if the SQLite library supports it.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+        A cursor of the language database.
+
+    tables : dict[str, list[str]]
+        The columns keyed by the data type of each lexeme table.
+
+    Returns
+    -------
+    int
+        The number of words in the lexicon.
+    """
+    cursor.execute("DROP TABLE IF EXISTS autocomplete_lexicon_fts")
+    cursor.execute("DROP TABLE IF EXISTS autocomplete_lexicon")
+    cursor.execute(
+        "CREATE TABLE autocomplete_lexicon (word Text COLLATE NOCASE UNIQUE)"
+    )
+    for data_type, columns in tables.items():
+        if (lemma := lemma_column(data_type, columns)) is None:
+            continue
+
+        # Lemmas that hold several values aren't words to suggest.
+        cursor.execute(
+            f"INSERT OR IGNORE INTO autocomplete_lexicon (word) "
+            f"SELECT [{lemma}] FROM [{data_type}] "
+            f"WHERE [{lemma}] != '' AND instr([{lemma}], ?) = 0 "
+            f"ORDER BY [{lemma}] COLLATE NOCASE",
+            (MULTIPLE_VALUES_SEPARATOR,),
+        )
+
+    try:
+        cursor.execute(
+            "CREATE VIRTUAL TABLE autocomplete_lexicon_fts USING fts5("
+            "word, content='autocomplete_lexicon', content_rowid='rowid', "
+            "tokenize='trigram')"
+        )
+        cursor.execute(
+            "INSERT INTO autocomplete_lexicon_fts (autocomplete_lexicon_fts) "
+            "VALUES ('rebuild')"
+        )
+
+    except sqlite3.OperationalError as e:
+        print(
+            f"Skipping the autocomplete_lexicon_fts table as FTS5 trigram search isn't "
+            f"available in SQLite {sqlite3.sqlite_version}: {e}"
+        )
+
+    return cursor.execute("SELECT count(*) FROM autocomplete_lexicon").fetchone()[0]
+
+
+def check_index_profile(profile: str | None) -> None:
+    """
+    Check that an index profile is supported.
+
+    Parameters
+    ----------
+    profile : str | None
+        The index profile, with None for no profile.
+
+    Raises
+    ------
+    ValueError
+        If the profile isn't one of ``INDEX_PROFILES``.
+    """
+    if profile is not None and profile not in INDEX_PROFILES:
+        raise ValueError(
+            f"Unsupported index profile '{profile}'. Must be one of: {', '.join(INDEX_PROFILES)}."
+        )
+
+
+def detect_index_profile(cursor: sqlite3.Cursor) -> str | None:
+    """
+    Return the index profile that a language database was built with.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+        A cursor of the language database.
+
+    Returns
+    -------
+    str | None
+        "autocomplete" if the database has an autocomplete_lexicon table, "lookup" if
+        it has lookup indexes and otherwise None.
+    """
+    names = {
+        row[0]
+        for row in cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'index')"
+        )
+    }
+    if "autocomplete_lexicon" in names:
+        return "autocomplete"
+
+    if any(name.endswith("_nocase_idx") for name in names):
+        return "lookup"
+
+    return None
+
+
+def apply_index_profile(
+    cursor: sqlite3.Cursor, profile: str | None, rebuild_lexicon: bool = True
+) -> None:
+    """
+    Add the indexes and tables of an index profile to a language database.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+        A cursor of the language database.
+
+    profile : str | None
+        One of ``INDEX_PROFILES``: "lookup" indexes the lemma and looked up forms of
+        each lexeme table, and "autocomplete" also creates the autocomplete_lexicon
+        table. None adds nothing.
+
+    rebuild_lexicon : bool, default=True
+        Whether to rebuild an existing autocomplete_lexicon table, which isn't needed
+        if no lexemes changed.
+
+    Raises
+    ------
+    ValueError
+        If the profile isn't one of ``INDEX_PROFILES``.
+    """
+    check_index_profile(profile)
+    if profile is None:
+        return
+
+    tables = lexeme_tables(cursor)
+    for data_type, columns in tables.items():
+        create_lookup_indexes(cursor, data_type, columns)
+
+    if profile == "autocomplete" and (
+        rebuild_lexicon
+        or not cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'autocomplete_lexicon'"
+        ).fetchone()
+    ):
+        create_autocomplete_lexicon(cursor, tables)
@@ -6,6 +6,7 @@ Functions to convert data returned from the Scribe-Data CLI to CSV or TSV files.
 import csv
 import json
 from pathlib import Path
+from typing import Any
 
 from scribe_data.utils import (
     DEFAULT_CSV_EXPORT_DIR,
@@ -14,10 +15,91 @@ from scribe_data.utils import (
     camel_to_snake,
     check_index_exists,
 )
+from scribe_data.wikidata.lexeme_table import LexemeTable
 
 # MARK: CSV or TSV
 
 
+def write_lexeme_table(
+    writer: Any, table: LexemeTable, dtype: str, identifier_case: str = "camel"
+) -> None:
+    """
+    Write the lexemes of a lexeme table as rows with a column for each form.
+
+    Parameters
+    ----------
+    writer : csv.writer
+        The writer of the CSV or TSV file.
+
+    table : LexemeTable
+        The lexemes of the data type.
+
+    dtype : str
+        The data type, whose singular form names the column of lexeme IDs.
+
+    identifier_case : str
+        The case format for identifiers. Default is "camel".
+    """
+    columns = sorted(table.columns)
+    header = [dtype[:-1], *columns]
+    writer.writerow(
+        [camel_to_snake(col) for col in header]
+        if identifier_case == "snake"
+        else header
+    )
+    writer.writerows(table.rows(columns))
+
+
+def lexeme_table_to_csv_or_tsv(
+    language: str,
+    data_type: str,
+    table: LexemeTable,
+    output_dir: Path,
+    output_type: str,
+    overwrite: bool = False,
+    identifier_case: str = "camel",
+) -> None:
+    """
+    Write the lexemes of a language and data type to a CSV/TSV file.
+
+    Parameters
+    ----------
+    language : str
+        The language of the lexemes.
+
+    data_type : str
+        The data type of the lexemes.
+
+    table : LexemeTable
+        The lexemes to write.
+
+    output_dir : Path
+        The output directory path for results.
+
+    output_type : str
+        The output format, should be "csv" or "tsv".
+
+    overwrite : bool
+        Whether to overwrite existing files.
+
+    identifier_case : str
+        The case format for identifiers. Default is "camel".
+    """
+    final_output_dir = Path(output_dir) / language.capitalize()
+    final_output_dir.mkdir(parents=True, exist_ok=True)
+
+    output_file = final_output_dir / f"{data_type}.{output_type}"
+    if check_index_exists(output_file, overwrite):
+        print(f"Skipping {data_type}")
+        return
+
+    with output_file.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file, delimiter="," if output_type == "csv" else "\t")
+        write_lexeme_table(writer, table, data_type, identifier_case)
+
+    print(f"Data for {language.capitalize()} {data_type} written to '{output_file}'")
+
+
 def convert_to_csv_or_tsv(
     language: str,
     data_types: str | list[str],
@@ -112,21 +194,12 @@ def convert_to_csv_or_tsv(
                     first_val = next(iter(data.values())) if data else None
                     if isinstance(first_val, dict):
                         # Handle case: { key: { value1: ..., value2: ... } }.
-                        columns = sorted(first_val.keys())
-                        header = [
-                            camel_to_snake(dtype[:-1])
-                            if identifier_case == "snake"
-                            else dtype[:-1]
-                        ]
-                        header += [
-                            camel_to_snake(col) if identifier_case == "snake" else col
-                            for col in columns
-                        ]
-                        writer.writerow(header)
-
-                        for key, value in data.items():
-                            row = [key] + [value.get(col, "") for col in columns]
-                            writer.writerow(row)
+                        write_lexeme_table(
+                            writer,
+                            LexemeTable.from_entries(data),
+                            dtype,
+                            identifier_case,
+                        )
 
                     elif isinstance(data[first_key], list):
                         if all(isinstance(item, dict) for item in data[first_key]):
@@ -4,13 +4,13 @@ Functions to convert data returned from the Scribe-Data CLI to JSON files.
 """
 
 import csv
-import json
 from pathlib import Path
 
 from scribe_data.utils import (
     DEFAULT_JSON_EXPORT_DIR,
     camel_to_snake,
     check_index_exists,
+    write_json,
 )
 
 # MARK: JSON
@@ -162,8 +162,7 @@ def convert_to_json(
             continue
 
         try:
-            with output_file.open("w", encoding="utf-8") as file:
-                json.dump(data, file, ensure_ascii=False, indent=2)
+            write_json(output_file, data)
 
         except IOError as e:
             print(f"Error writing to '{output_file}': {e}")
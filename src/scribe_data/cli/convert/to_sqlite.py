@@ -3,15 +3,26 @@
 Converts all or desired JSON data generated by Scribe-Data into SQLite databases.
 """
 
-import json
+import contextlib
 import os
 import re
 import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import batched, chain
 from pathlib import Path
+from typing import Generator, Iterable, Iterator, Mapping, Sequence
 
+import orjson
 import questionary
 from tqdm.auto import tqdm
 
+from scribe_data.cli.convert.sqlite_indexes import (
+    apply_index_profile,
+    check_index_profile,
+    detect_index_profile,
+)
 from scribe_data.utils import (
     DEFAULT_JSON_EXPORT_DIR,
     DEFAULT_SQLITE_EXPORT_DIR,
@@ -21,27 +32,36 @@ from scribe_data.utils import (
     language_metadata,
     list_all_languages,
 )
+from scribe_data.wikidata.lexeme_table import LexemeTable
+from scribe_data.wiktionary.translations_sqlite import write_translation_table
 
+# Rows inserted by each executemany call of a bulk load.
+SQLITE_INSERT_BATCH_SIZE = 10_000
 
-def create_table(
-    cursor: sqlite3.Cursor, identifier_case: str, data_type: str, cols: list[str]
-) -> None:
+# Page cache of a bulk load in KiB, as SQLite reads negative cache sizes.
+_BULK_LOAD_CACHE_SIZE = -256_000
+
+# The modification date of lexemes that aren't in a table, which differs from any date.
+_NOT_IN_TABLE = object()
+
+
+def _column_names(identifier_case: str, cols: list[str]) -> list[str]:
     """
-    Create a table in the language database.
+    Return the names that ``create_table`` gives the columns of a table.
 
     Parameters
     ----------
-    cursor : sqlite3.Cursor
-        A sqlite3 cursor.
-
     identifier_case : str
         Either "camel" or "snake" to determine column naming.
 
-    data_type : str
-        The name of the table to be created.
-
     cols : list of str
-        The names of columns for the new table.
+        The names of columns for the table.
+
+    Returns
+    -------
+    list[str]
+        The column names in the identifier case, with a suffix for names that only
+        differ from an earlier one by case.
     """
     processed_cols = []
     seen_cols = set()
@@ -58,7 +78,30 @@ def create_table(
         seen_cols.add(col_lower)
         processed_cols.append(col_name)
 
-    quoted_cols = [f"[{c}]" for c in processed_cols]
+    return processed_cols
+
+
+def create_table(
+    cursor: sqlite3.Cursor, identifier_case: str, data_type: str, cols: list[str]
+) -> None:
+    """
+    Create a table in the language database.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+        A sqlite3 cursor.
+
+    identifier_case : str
+        Either "camel" or "snake" to determine column naming.
+
+    data_type : str
+        The name of the table to be created.
+
+    cols : list of str
+        The names of columns for the new table.
+    """
+    quoted_cols = [f"[{c}]" for c in _column_names(identifier_case, cols)]
 
     sql_statement = (
         f"CREATE TABLE IF NOT EXISTS [{data_type}] "
@@ -87,6 +130,435 @@ def table_insert(cursor: sqlite3.Cursor, data_type: str, keys: list) -> None:
     cursor.execute(sql_statement, keys)
 
 
+def table_insert_many(
+    cursor: sqlite3.Cursor,
+    data_type: str,
+    rows: Iterable[Sequence],
+    n_cols: int,
+    batch_size: int = SQLITE_INSERT_BATCH_SIZE,
+) -> int:
+    """
+    Insert rows into a language database table with one statement.
+
+    The statement is prepared once and run over chunks of rows with ``executemany``,
+    so rows can be streamed from a generator without being held in memory at once.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+        A sqlite3 cursor.
+
+    data_type : str
+        The name of the table to be inserted into.
+
+    rows : Iterable[Sequence]
+        The values of each row to be inserted.
+
+    n_cols : int
+        The number of columns of the table.
+
+    batch_size : int, default=SQLITE_INSERT_BATCH_SIZE
+        The rows inserted by each ``executemany`` call.
+
+    Returns
+    -------
+    int
+        The number of rows inserted, which excludes rows ignored as duplicates.
+    """
+    insert_placeholders = ", ".join(["?"] * n_cols)
+    sql_statement = f"INSERT OR IGNORE INTO [{data_type}] VALUES({insert_placeholders})"
+
+    inserted = 0
+    for batch in batched(rows, batch_size):
+        cursor.executemany(sql_statement, batch)
+        inserted += cursor.rowcount
+
+    return inserted
+
+
+@contextlib.contextmanager
+def bulk_load(
+    connection: sqlite3.Connection, journal_mode: str = "OFF"
+) -> Generator[sqlite3.Connection, None, None]:
+    """
+    Relax the durability settings of a database while tables are loaded into it.
+
+    The journal and syncing to disk are turned off and the page cache enlarged for the
+    load. Afterwards rows that weren't committed are rolled back, the default journal
+    and syncing are restored, statistics for the query planner are gathered with
+    ``ANALYZE`` and the database is vacuumed if tables were dropped or emptied.
+
+    Parameters
+    ----------
+    connection : sqlite3.Connection
+        The connection to the database.
+
+    journal_mode : str, default="OFF"
+        The journal mode of the load. "OFF" is fastest but a load that fails can leave
+        the database corrupt, so it's for databases that are being created, with "WAL"
+        for loading tables into a database that has other tables.
+
+    Yields
+    ------
+    sqlite3.Connection
+        The connection to load tables with, which are committed by the caller.
+    """
+    connection.execute(f"PRAGMA journal_mode = {journal_mode}")
+    connection.execute("PRAGMA synchronous = OFF")
+    connection.execute(f"PRAGMA cache_size = {_BULK_LOAD_CACHE_SIZE}")
+    connection.execute("PRAGMA temp_store = MEMORY")
+    try:
+        yield connection
+
+    finally:
+        if connection.in_transaction:
+            connection.rollback()
+
+        with contextlib.suppress(sqlite3.OperationalError):
+            # Readers that are connected keep a WAL database in WAL mode.
+            connection.execute("PRAGMA journal_mode = DELETE")
+
+        connection.execute("PRAGMA synchronous = FULL")
+
+    connection.execute("ANALYZE")
+    if connection.execute("PRAGMA freelist_count").fetchone()[0]:
+        connection.execute("VACUUM")
+
+
+@contextlib.contextmanager
+def incremental_sync(
+    connection: sqlite3.Connection,
+) -> Generator[sqlite3.Connection, None, None]:
+    """
+    Update a database in place while other connections keep reading it.
+
+    The database is switched to write-ahead logging, so readers see the data that was
+    last committed until the changes of a sync are committed in one transaction.
+    Afterwards changes that weren't committed are rolled back, statistics for the query
+    planner are refreshed with ``PRAGMA optimize`` and the log is written back to the
+    database, which returns to the default journal unless other connections have it
+    open.
+
+    Parameters
+    ----------
+    connection : sqlite3.Connection
+        The connection to the database.
+
+    Yields
+    ------
+    sqlite3.Connection
+        The connection to update tables with, which are committed by the caller.
+    """
+    with contextlib.suppress(sqlite3.OperationalError):
+        # Readers in a transaction keep the rollback journal, which blocks them only
+        # while the changes are committed.
+        connection.execute("PRAGMA journal_mode = WAL")
+
+    connection.execute("PRAGMA synchronous = NORMAL")
+    try:
+        yield connection
+
+    finally:
+        if connection.in_transaction:
+            connection.rollback()
+
+    connection.execute("PRAGMA optimize")
+    connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    with contextlib.suppress(sqlite3.OperationalError):
+        # Readers that are connected keep the database in WAL mode.
+        connection.execute("PRAGMA journal_mode = DELETE")
+
+    connection.execute("PRAGMA synchronous = FULL")
+
+
+def lexeme_table_to_sqlite(
+    cursor: sqlite3.Cursor,
+    table: LexemeTable,
+    data_type: str,
+    identifier_case: str = "camel",
+    add_scribe_row: bool = False,
+) -> None:
+    """
+    Replace the rows of a data type's table with the lexemes of a lexeme table.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+        A sqlite3 cursor.
+
+    table : LexemeTable
+        The lexemes of the data type.
+
+    data_type : str
+        The name of the table to be created.
+
+    identifier_case : str, optional, default='camel'
+        Either "camel" or "snake" to determine column naming.
+
+    add_scribe_row : bool, optional
+        Whether to add the "L0" row with the word "Scribe" that the Scribe apps use.
+    """
+    cols = ["wdLexemeId", *table.columns]
+    create_table(cursor, identifier_case, data_type=data_type, cols=cols)
+    cursor.execute(f"DELETE FROM [{data_type}]")  # clear existing data
+
+    table_insert_many(cursor, data_type, table.rows(cols[1:]), n_cols=len(cols))
+
+    if add_scribe_row:
+        table_insert(
+            cursor,
+            data_type=data_type,
+            keys=["L0", "Scribe"] + [""] * (len(cols) - 2),
+        )
+
+
+@dataclass
+class TableSync:
+    """
+    The changes that ``sync_lexeme_table`` made to a data type's table.
+
+    Attributes
+    ----------
+    inserted : int
+        Lexemes that were added to the table.
+
+    updated : int
+        Lexemes whose modification date changed, which were replaced.
+
+    deleted : int
+        Lexemes that are no longer in the data, which were removed.
+
+    unchanged : int
+        Lexemes with the same modification date, which were kept.
+
+    rebuilt : bool
+        Whether the table was rewritten, e.g. as the columns of the data changed.
+    """
+
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    rebuilt: bool = False
+
+    @property
+    def changed(self) -> bool:
+        """
+        Whether any rows of the table were changed.
+
+        Returns
+        -------
+        bool
+            True if the table was rewritten or lexemes were added, updated or removed.
+        """
+        return self.rebuilt or bool(self.inserted or self.updated or self.deleted)
+
+
+def sync_lexeme_table(
+    cursor: sqlite3.Cursor,
+    entries: Mapping[str, Mapping[str, str]],
+    data_type: str,
+    identifier_case: str = "camel",
+    add_scribe_row: bool = False,
+) -> TableSync:
+    """
+    Update the rows of a data type's table to match exported lexemes with few changes.
+
+    Lexemes are compared by ID and modification date, so only the forms of lexemes that
+    are new or were modified are read into rows and upserted. Lexemes that are no longer
+    in the data are deleted and the rest are kept as they are. The table is rewritten
+    with ``lexeme_table_to_sqlite`` if it doesn't exist, its columns differ from the
+    forms of the lexemes or the lexemes don't have modification dates.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+        A sqlite3 cursor.
+
+    entries : Mapping[str, Mapping[str, str]]
+        The forms of each lexeme keyed by lexeme ID, as they are exported to JSON.
+
+    data_type : str
+        The name of the table to be updated.
+
+    identifier_case : str, optional, default='camel'
+        Either "camel" or "snake" to determine column naming.
+
+    add_scribe_row : bool, optional
+        Whether the table has the "L0" row with the word "Scribe" that the Scribe apps
+        use, which is kept.
+
+    Returns
+    -------
+    TableSync
+        The number of lexemes that were inserted, updated, deleted or kept.
+    """
+    source_cols = ["wdLexemeId", *dict.fromkeys(chain.from_iterable(entries.values()))]
+    sources = dict(zip(_column_names(identifier_case, source_cols), source_cols))
+    cols = [info[1] for info in cursor.execute(f"PRAGMA table_info([{data_type}])")]
+    if (
+        "lastModified" not in source_cols
+        or set(cols) != set(sources)
+        or sources[cols[0]] != "wdLexemeId"
+    ):
+        cursor.execute(f"DROP TABLE IF EXISTS [{data_type}]")
+        lexeme_table_to_sqlite(
+            cursor,
+            LexemeTable.from_entries(entries),
+            data_type,
+            identifier_case,
+            add_scribe_row=add_scribe_row,
+        )
+        return TableSync(inserted=len(entries), rebuilt=True)
+
+    # Rows are built in the order of the table's columns, which can differ from the data.
+    forms = [sources[col] for col in cols[1:]]
+    date_col = cols[forms.index("lastModified") + 1]
+    modified = dict(
+        cursor.execute(f"SELECT [{cols[0]}], [{date_col}] FROM [{data_type}]")
+    )
+    if add_scribe_row:
+        modified.pop("L0", None)
+
+    changed = LexemeTable.from_entries(
+        {
+            lexeme_id: entry
+            for lexeme_id, entry in entries.items()
+            if modified.get(lexeme_id, _NOT_IN_TABLE) != entry.get("lastModified")
+        }
+    )
+    deleted = modified.keys() - entries.keys()
+    sync = TableSync(deleted=len(deleted), unchanged=len(entries) - len(changed))
+    sync.inserted = sum(lexeme_id not in modified for lexeme_id in changed.lexeme_ids)
+    sync.updated = len(changed) - sync.inserted
+
+    upsert = (
+        f"INSERT INTO [{data_type}] VALUES({', '.join(['?'] * len(cols))}) "
+        f"ON CONFLICT([{cols[0]}]) DO UPDATE SET "
+        + ", ".join(f"[{col}] = excluded.[{col}]" for col in cols[1:])
+    )
+    cursor.executemany(upsert, changed.rows(forms))
+    cursor.executemany(
+        f"DELETE FROM [{data_type}] WHERE [{cols[0]}] = ?",
+        ((lexeme_id,) for lexeme_id in deleted),
+    )
+
+    if add_scribe_row:
+        table_insert(
+            cursor,
+            data_type=data_type,
+            keys=["L0", "Scribe"] + [""] * (len(cols) - 2),
+        )
+
+    return sync
+
+
+def lexeme_table_to_sqlite_file(
+    language: str,
+    data_type: str,
+    table: LexemeTable,
+    output_dir: Path = DEFAULT_SQLITE_EXPORT_DIR,
+    overwrite: bool = False,
+    identifier_case: str = "camel",
+) -> None:
+    """
+    Write the lexemes of a language and data type to a table of the language's database.
+
+    Only the data type's table is replaced, so the tables of other data types are kept.
+
+    Parameters
+    ----------
+    language : str
+        The language of the lexemes.
+
+    data_type : str
+        The data type of the lexemes, which names the table.
+
+    table : LexemeTable
+        The lexemes to write.
+
+    output_dir : Path, optional, default=DEFAULT_SQLITE_EXPORT_DIR
+        The output SQLite export directory.
+
+    overwrite : bool, optional
+        If set to True, an existing table will be overwritten without prompting.
+
+    identifier_case : str, optional, default='camel'
+        Format of the identifiers ("camel" or "snake").
+    """
+    language = language.capitalize()
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    db_file = (
+        output_dir / f"{get_language_iso(language.lower()).upper()}LanguageData.sqlite"
+    )
+
+    with contextlib.closing(sqlite3.connect(db_file)) as connection:
+        cursor = connection.cursor()
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (data_type,),
+        ).fetchone()
+        if (
+            exists
+            and not overwrite
+            and not questionary.confirm(
+                f"The {data_type} table of {db_file} already exists.\nDo you want to overwrite it?"
+            ).ask()
+        ):
+            print(
+                f"Skipping {language} {data_type} table as user chose not to overwrite."
+            )
+            return
+
+        # The database can have the tables of other data types, so it keeps a journal.
+        with bulk_load(connection, journal_mode="WAL"):
+            # Statements that change the schema don't start a transaction, so the old
+            # table is only dropped if the new one is committed.
+            cursor.execute("BEGIN")
+            cursor.execute(f"DROP TABLE IF EXISTS [{data_type}]")
+            lexeme_table_to_sqlite(
+                cursor,
+                table,
+                data_type=data_type,
+                identifier_case=identifier_case,
+                add_scribe_row=data_type == "nouns" and language != "Russian",
+            )
+            connection.commit()
+
+    print(f"Wrote the {data_type} table of {db_file} with {len(table):,} {data_type}.")
+
+
+def _translation_rows(
+    json_data: dict, target_cols: list[str]
+) -> Iterator[list[str | None]]:
+    """
+    Flatten exported translations into rows of a translations table.
+
+    Parameters
+    ----------
+    json_data : dict
+        ``{lexeme_id: {"lastModified": ..., word: {iso: translation}}}``.
+
+    target_cols : list[str]
+        The ISO codes of the target language columns.
+
+    Yields
+    ------
+    list[str | None]
+        The lexeme ID, modification date and word followed by a translation per target.
+    """
+    for lexeme_id, entry in json_data.items():
+        word = next(key for key in entry.keys() if key != "lastModified")
+        translations = entry[word]
+        yield [
+            lexeme_id,
+            entry["lastModified"],
+            word,
+            *(translations.get(target_lang) for target_lang in target_cols),
+        ]
+
+
 def translations_to_sqlite(
     language_data_type_dict: dict,
     current_languages: list,
@@ -136,45 +608,43 @@ def translations_to_sqlite(
 
     print(f"Database for translations {maybe_over}written and connection made.")
 
-    for lang in tqdm(
-        language_data_type_dict,
-        desc="Tables added",
-        unit="tables",
-    ):
-        print(f"Creating/Updating {lang} translations table...")
-        json_file_path = Path(input_file) / lang / "translations.json"
+    # Define columns: lexeme_id, lastModified, word, and language columns
+    target_cols = [get_language_iso(language) for language in current_languages]
+    cols = ["lexeme_id", "lastModified", "word"] + target_cols
 
-        if not json_file_path.exists():
-            print(
-                f"Skipping {lang} translations table creation as JSON file not found."
+    with bulk_load(connection):
+        for lang in tqdm(
+            language_data_type_dict,
+            desc="Tables added",
+            unit="tables",
+        ):
+            print(f"Creating/Updating {lang} translations table...")
+            json_file_path = Path(input_file) / lang / "translations.json"
+
+            if not json_file_path.exists():
+                print(
+                    f"Skipping {lang} translations table creation as JSON file not found."
+                )
+                continue
+
+            with open(json_file_path, "rb") as f:
+                json_data = orjson.loads(f.read())
+
+            create_table(cursor, identifier_case, data_type=lang, cols=cols)
+            cursor.execute(f"DELETE FROM [{lang}]")  # clear existing data
+            table_insert_many(
+                cursor,
+                data_type=lang,
+                rows=_translation_rows(json_data, target_cols),
+                n_cols=len(cols),
             )
-            continue
-
-        with open(json_file_path, "r", encoding="utf-8") as f:
-            json_data = json.load(f)
-
-        # Define columns: lexeme_id, lastModified, word, and language columns
-        target_cols = [get_language_iso(language) for language in current_languages]
-        cols = ["lexeme_id", "lastModified", "word"] + target_cols
 
-        create_table(cursor, identifier_case, data_type=lang, cols=cols)
-        cursor.execute(f"DELETE FROM [{lang}]")  # clear existing data
-
-        for lexeme_id, entry in json_data.items():
-            word = next(key for key in entry.keys() if key != "lastModified")
-            translations = entry[word]
-
-            keys = [lexeme_id, entry["lastModified"], word]
-            # Add translations for each target language.
-            keys.extend(translations.get(target_lang) for target_lang in target_cols)
-            table_insert(cursor, data_type=lang, keys=keys)
-
-        try:
-            connection.commit()
-            print(f"{lang} translations table created/updated successfully.\n")
+            try:
+                connection.commit()
+                print(f"{lang} translations table created/updated successfully.\n")
 
-        except sqlite3.Error as e:
-            print(f"Error creating/updating {lang} translations table: {e}")
+            except sqlite3.Error as e:
+                print(f"Error creating/updating {lang} translations table: {e}")
 
     connection.close()
     print("Translations database processing completed.\n")
@@ -236,58 +706,359 @@ def wiktionary_translations_to_sqlite(
     connection = sqlite3.connect(db_path)
     cursor = connection.cursor()
 
-    for json_path in translation_files:
-        # Derive the table name from the filename (e.g. "ar_translations_from_en").
-        table_name = json_path.stem
+    # The database has the tables of other languages, so it keeps a journal.
+    with bulk_load(connection, journal_mode="WAL"):
+        for json_path in translation_files:
+            # Derive the table name from the filename (e.g. "ar_translations_from_en").
+            table_name = json_path.stem
 
-        print(f"Creating/Updating {language} {table_name} table...")
+            print(f"Creating/Updating {language} {table_name} table...")
 
-        if json_path.stat().st_size == 0:
-            print(f"Warning: {json_path.name} is empty. Skipping.")
-            continue
+            if json_path.stat().st_size == 0:
+                print(f"Warning: {json_path.name} is empty. Skipping.")
+                continue
 
-        with open(json_path, "r", encoding="utf-8") as f:
-            json_data = json.load(f)
+            with open(json_path, "rb") as f:
+                json_data = orjson.loads(f.read())
 
-        # Define columns.
-        cols = ["word", "word_type", "word_order", "description", "translation"]
-        if identifier_case == "camel":
-            cols = ["word", "wordType", "wordOrder", "description", "translation"]
+            try:
+                # Statements that change the schema don't start a transaction, so the
+                # old table is only dropped if the new one is committed.
+                cursor.execute("BEGIN")
+                write_translation_table(cursor, table_name, json_data, identifier_case)
+                connection.commit()
+                print(f"{table_name} table created/updated successfully.")
 
-        # Create table (unique on word + word_type + order combination).
-        col_defs = ", ".join(f"{c} Text" for c in cols)
-        cursor.execute(
-            f"CREATE TABLE IF NOT EXISTS [{table_name}] "
-            f"({col_defs}, UNIQUE(word, {cols[1]}, {cols[2]}))"
-        )
-        cursor.execute(f"DELETE FROM [{table_name}]")  # clear existing data
+            except sqlite3.Error as e:
+                connection.rollback()
+                print(f"Error creating/updating {table_name} table: {e}")
 
-        # Flatten the nested JSON and insert rows.
-        insert_sql = (
-            f"INSERT OR IGNORE INTO [{table_name}] "
-            f"VALUES ({', '.join(['?'] * len(cols))})"
-        )
-        for word, word_types in json_data.items():
-            for word_type, senses in word_types.items():
-                for order, entry in senses.items():
-                    row = (
-                        word,
-                        word_type,
-                        order,
-                        entry.get("description", ""),
-                        entry.get("translation", ""),
+    connection.close()
+    print(f"Wiktionary translation tables for {language} processed successfully.\n")
+
+
+def _emoji_keyword_rows(json_data: dict, n_emojis: int) -> Iterator[list[str]]:
+    """
+    Flatten exported emoji keywords into rows of an emoji keywords table.
+
+    Parameters
+    ----------
+    json_data : dict
+        ``{word: [{"emoji": ...}, ...]}``.
+
+    n_emojis : int
+        The emoji columns of the table, with empty strings for words with fewer emojis.
+
+    Yields
+    ------
+    list[str]
+        The word followed by its emojis.
+    """
+    for word, emojis in json_data.items():
+        keys = [word, *(emoji["emoji"] for emoji in emojis[:n_emojis])]
+        keys += [""] * (n_emojis + 1 - len(keys))
+        yield keys
+
+
+def _emoji_keywords_to_sqlite(
+    cursor: sqlite3.Cursor, json_file_path: Path, identifier_case: str = "camel"
+) -> None:
+    """
+    Replace the rows of the emoji keywords table with those of a JSON export.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+        A sqlite3 cursor.
+
+    json_file_path : Path
+        The exported emoji keywords.
+
+    identifier_case : str, optional, default='camel'
+        Either "camel" or "snake" to determine column naming.
+    """
+    with open(json_file_path, "rb") as f:
+        json_data = orjson.loads(f.read())
+
+    cols = ["word"] + [f"emoji_keyword_{i}" for i in range(3)]
+    create_table(cursor, identifier_case, data_type="emoji_keywords", cols=cols)
+    cursor.execute("DELETE FROM [emoji_keywords]")
+    table_insert_many(
+        cursor,
+        data_type="emoji_keywords",
+        rows=_emoji_keyword_rows(json_data, len(cols) - 1),
+        n_cols=len(cols),
+    )
+
+
+def _lexeme_data_types() -> set[str]:
+    """
+    Return the data types whose JSON exports are keyed by lexeme ID.
+
+    Returns
+    -------
+    set[str]
+        The data types other than translations and emoji keywords.
+    """
+    return {
+        key
+        for key in data_type_metadata.keys()
+        if key not in ["translations", "emoji_keywords"]
+    }
+
+
+def _sync_language_database(
+    lang: str,
+    data_types: list[str],
+    db_file: Path,
+    input_file: Path,
+    identifier_case: str = "camel",
+    index_profile: str | None = None,
+) -> float:
+    """
+    Update the existing database of a language from its JSON data in one transaction.
+
+    The table of each data type is updated with ``sync_lexeme_table`` inside
+    ``incremental_sync``, so connections reading the database see the previous data
+    until all changes are committed. Tables of data types that aren't given are kept.
+
+    Parameters
+    ----------
+    lang : str
+        The language of the database.
+
+    data_types : list[str]
+        The data types to update tables for.
+
+    db_file : Path
+        The database to update.
+
+    input_file : Path
+        The input JSON export directory.
+
+    identifier_case : str, optional, default='camel'
+        Format of the identifiers ("camel" or "snake").
+
+    index_profile : str, optional
+        The index profile to add to the database, one of ``INDEX_PROFILES``, with the
+        profile that the database was built with used if None. An existing
+        autocomplete_lexicon table is only rebuilt if lexemes changed.
+
+    Returns
+    -------
+    float
+        The seconds taken to update the database.
+    """
+    start = time.perf_counter()
+    lexeme_data_types = _lexeme_data_types()
+
+    with contextlib.closing(sqlite3.connect(db_file)) as connection:
+        with incremental_sync(connection):
+            cursor = connection.cursor()
+            # Other writers are turned away before any table is read.
+            cursor.execute("BEGIN IMMEDIATE")
+            # The database keeps the profile that it was built with if none is passed.
+            index_profile = index_profile or detect_index_profile(cursor)
+            changed = False
+            for dt in data_types:
+                json_file_path = Path(input_file) / lang / f"{dt}.json"
+                if not json_file_path.exists():
+                    print(f"Skipping {lang} {dt} table update as JSON file not found.")
+                    continue
+
+                if dt in lexeme_data_types:
+                    sync = sync_lexeme_table(
+                        cursor,
+                        orjson.loads(json_file_path.read_bytes()),
+                        data_type=dt,
+                        identifier_case=identifier_case,
+                        add_scribe_row=dt == "nouns" and lang != "Russian",
+                    )
+                    changed = changed or sync.changed
+                    print(
+                        f"Synced {lang} {dt} table: {sync.inserted:,} inserted, "
+                        f"{sync.updated:,} updated, {sync.deleted:,} deleted and "
+                        f"{sync.unchanged:,} unchanged."
                     )
-                    cursor.execute(insert_sql, row)
 
-        try:
+                elif dt in ["emoji_keywords"]:
+                    _emoji_keywords_to_sqlite(cursor, json_file_path, identifier_case)
+
+            # Indexes of rewritten tables are recreated, while an existing lexicon
+            # only needs to be rebuilt if lexemes changed.
+            apply_index_profile(cursor, index_profile, rebuild_lexicon=changed)
+
             connection.commit()
-            print(f"{table_name} table created/updated successfully.")
 
-        except sqlite3.Error as e:
-            print(f"Error creating/updating {table_name} table: {e}")
+    return time.perf_counter() - start
+
+
+def _build_language_database(
+    lang: str,
+    data_types: list[str],
+    db_file: Path,
+    input_file: Path,
+    identifier_case: str = "camel",
+    index_profile: str | None = None,
+    incremental: bool = False,
+) -> float:
+    """
+    Build the database of a language from its JSON data.
+
+    The database is written to a temporary file next to ``db_file`` that then replaces
+    it, so an existing database is kept until the new one is complete. An existing
+    database is instead updated in place if ``incremental`` is set.
+
+    Parameters
+    ----------
+    lang : str
+        The language of the database.
+
+    data_types : list[str]
+        The data types to create tables for.
+
+    db_file : Path
+        The database to build.
+
+    input_file : Path
+        The input JSON export directory.
+
+    identifier_case : str, optional, default='camel'
+        Format of the identifiers ("camel" or "snake").
+
+    index_profile : str, optional
+        The index profile to add to the database, one of ``INDEX_PROFILES``.
+
+    incremental : bool, optional
+        Whether to update an existing database with ``_sync_language_database``.
+
+    Returns
+    -------
+    float
+        The seconds taken to build the database.
+    """
+    if incremental and db_file.exists():
+        return _sync_language_database(
+            lang, data_types, db_file, input_file, identifier_case, index_profile
+        )
+
+    start = time.perf_counter()
+    lexeme_data_types = _lexeme_data_types()
+    tmp_file = db_file.with_name(f"{db_file.name}.tmp")
+    tmp_file.unlink(missing_ok=True)
+
+    # Values such as genders and dates are shared by the tables of a language.
+    strings: dict[str, str] = {}
+
+    try:
+        with contextlib.closing(sqlite3.connect(tmp_file)) as connection:
+            cursor = connection.cursor()
+            # The database is new, so its tables are loaded in one transaction without
+            # a journal.
+            with bulk_load(connection):
+                for dt in data_types:
+                    print(f"Creating/Updating {lang} {dt} table...")
+                    json_file_path = Path(input_file) / lang / f"{dt}.json"
+
+                    if not json_file_path.exists():
+                        print(
+                            f"Skipping {lang} {dt} table creation as JSON file not found."
+                        )
+                        continue
+
+                    if dt in lexeme_data_types:
+                        lexeme_table_to_sqlite(
+                            cursor,
+                            LexemeTable.read_json(json_file_path, strings),
+                            data_type=dt,
+                            identifier_case=identifier_case,
+                            add_scribe_row=dt == "nouns" and lang != "Russian",
+                        )
+
+                    elif dt in ["emoji_keywords"]:
+                        _emoji_keywords_to_sqlite(
+                            cursor, json_file_path, identifier_case
+                        )
+
+                apply_index_profile(cursor, index_profile)
+                connection.commit()
+
+        os.replace(tmp_file, db_file)
+
+    finally:
+        tmp_file.unlink(missing_ok=True)
+
+    return time.perf_counter() - start
+
+
+def _run_database_builds(
+    builds: dict[str, tuple], workers: int = 1
+) -> Iterator[tuple[str, float]]:
+    """
+    Build language databases, in a pool of processes if more than one worker is used.
+
+    Parameters
+    ----------
+    builds : dict[str, tuple]
+        The arguments of ``_build_language_database`` keyed by language.
+
+    workers : int, default=1
+        The number of databases to build at once.
+
+    Yields
+    ------
+    tuple[str, float]
+        The language and build time in seconds of each database as it's completed.
+    """
+    if workers <= 1 or len(builds) <= 1:
+        for lang, args in builds.items():
+            yield lang, _build_language_database(*args)
+
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(builds))) as executor:
+        futures = {
+            executor.submit(_build_language_database, *args): lang
+            for lang, args in builds.items()
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
 
-    connection.close()
-    print(f"Wiktionary translation tables for {language} processed successfully.\n")
+
+def _requested_tables(
+    specific_tables: str | list[str] | None, index_profile: str | None
+) -> tuple[list[str] | None, str | None]:
+    """
+    Return the requested tables as a list and the index profile to build them with.
+
+    The autocomplete_lexicon table is built with the "autocomplete" index profile. It
+    holds the lemmas of the data types' tables, so requesting only the lexicon builds
+    the tables of all data types.
+
+    Parameters
+    ----------
+    specific_tables : str | list[str] | None
+        The requested table or tables, or None for all tables.
+
+    index_profile : str | None
+        The requested index profile.
+
+    Returns
+    -------
+    tuple[list[str] | None, str | None]
+        The tables to build, or None for all tables, and the index profile.
+    """
+    if isinstance(specific_tables, str):
+        specific_tables = [specific_tables] if specific_tables else None
+
+    if not specific_tables or "autocomplete_lexicon" not in specific_tables:
+        return specific_tables, index_profile
+
+    tables = [table for table in specific_tables if table != "autocomplete_lexicon"]
+    return (
+        tables or [dt for dt in data_type_metadata if dt != "translations"],
+        "autocomplete",
+    )
 
 
 def convert_to_sqlite(
@@ -297,7 +1068,10 @@ def convert_to_sqlite(
     input_file: Path = DEFAULT_JSON_EXPORT_DIR,
     output_file: Path = DEFAULT_SQLITE_EXPORT_DIR,
     overwrite: bool = False,
-) -> None:
+    workers: int = 1,
+    index_profile: str | None = None,
+    incremental: bool = False,
+) -> dict[str, float] | None:
     """
     Create SQLite databases from JSON data.
 
@@ -307,7 +1081,8 @@ def convert_to_sqlite(
         The languages to process. If None, use all available languages.
 
     specific_tables : Optional[Union[str, List[str]]]
-        The specific tables to process. If None, process all tables.
+        The specific tables to process. If None, process all tables. Including
+        "autocomplete_lexicon" builds the tables with the "autocomplete" index profile.
 
     identifier_case : str, optional, default='camel'
         Format of the identifiers ("camel" or "snake"). Defaults to "camel".
@@ -320,12 +1095,27 @@ def convert_to_sqlite(
 
     overwrite : bool, optional
         If set to True, existing SQLite files will be overwritten without prompting.
+
+    workers : int, optional, default=1
+        The number of language databases to build at once in separate processes.
+
+    index_profile : str, optional
+        Adds lookup indexes to the language databases with "lookup" and also an
+        autocomplete_lexicon table with "autocomplete". No indexes are added if None.
+
+    incremental : bool, optional
+        If set to True, existing language databases are updated in place with the
+        lexemes that were added, modified or removed rather than rebuilt, without
+        prompting.
+
+    Returns
+    -------
+    dict[str, float] | None
+        The seconds taken to build the database of each language, or None if no
+        language databases were requested.
     """
-    specific_tables = (
-        [specific_tables]
-        if specific_tables and isinstance(specific_tables, str)
-        else specific_tables
-    )
+    check_index_profile(index_profile)
+    specific_tables, index_profile = _requested_tables(specific_tables, index_profile)
 
     # Ensure the SQLite export directory exists before creating the database.
     sqlite_export_dir = Path(output_file)
@@ -411,11 +1201,6 @@ def convert_to_sqlite(
     ):
         return
 
-    if specific_tables and "autocomplete_lexicon" in specific_tables:
-        for lang in language_data_type_dict:
-            if "autocomplete_lexicon" not in language_data_type_dict[lang]:
-                language_data_type_dict[lang].append("autocomplete_lexicon")
-
     languages_capitalized = [lang.capitalize() for lang in languages]
     print(
         f"Creating/Updating SQLite databases for the following languages: {', '.join(languages_capitalized)}"
@@ -423,103 +1208,50 @@ def convert_to_sqlite(
     if specific_tables:
         print(f"Updating only the following tables: {', '.join(specific_tables)}")
 
-    for lang in tqdm(
-        language_data_type_dict,
-        desc="Databases created",
-        unit="dbs",
-    ):
-        if language_data_type_dict[lang] != []:
-            maybe_over = ""
-            db_file = (
-                Path(output_file)
-                / f"{get_language_iso(lang).upper()}LanguageData.sqlite"
+    # Existing databases are asked about first, as the databases can be built at once.
+    builds: dict[str, tuple] = {}
+    for lang, lang_data_types in language_data_type_dict.items():
+        if not lang_data_types:
+            print(
+                f"Skipping {lang.capitalize()} database creation/update as no related JSON data files were found."
             )
-            if db_file.exists():
-                if not overwrite:
-                    answer = questionary.confirm(
-                        f"SQLite file {db_file} already exists.\nDo you want to overwrite it?"
-                    ).ask()
-                    if not answer:
-                        print(
-                            f"Skipping {lang} database creation/update as user chose not to overwrite."
-                        )
-                        continue
-                os.remove(db_file)
-                maybe_over = "over"
-
-            connection = sqlite3.connect(db_file)
-            cursor = connection.cursor()
-            print(f"Database for {lang} {maybe_over}written and connection made.")
-
-            for dt in language_data_type_dict[lang]:
-                print(f"Creating/Updating {lang} {dt} table...")
-                json_file_path = Path(input_file) / lang / f"{dt}.json"
-
-                if not json_file_path.exists():
-                    print(
-                        f"Skipping {lang} {dt} table creation as JSON file not found."
-                    )
-                    continue
-
-                with open(json_file_path, "r", encoding="utf-8") as f:
-                    json_data = json.load(f)
-
-                if dt in [
-                    key
-                    for key in data_type_metadata.keys()
-                    if key not in ["translations", "emoji_keywords"]
-                ]:
-                    cols = ["wdLexemeId"]
-
-                    all_elem_keys = [
-                        json_data[k].keys() for k in list(json_data.keys())
-                    ]
-                    all_keys_flat = list({k for ks in all_elem_keys for k in ks})
-
-                    cols += all_keys_flat
-                    create_table(cursor, identifier_case, data_type=dt, cols=cols)
-                    cursor.execute(f"DELETE FROM [{dt}]")  # clear existing data
-
-                    for row in json_data:
-                        keys = [row]
-                        keys += [
-                            json_data[row][col_name]
-                            if col_name in json_data[row]
-                            else None
-                            for col_name in cols[1:]
-                        ]
-                        table_insert(cursor, data_type=dt, keys=keys)
-
-                    if dt == "nouns" and lang != "Russian":
-                        table_insert(
-                            cursor,
-                            data_type=dt,
-                            keys=["L0", "Scribe"] + [""] * (len(cols) - 2),
-                        )
-
-                    connection.commit()
-
-                elif dt in ["emoji_keywords"]:
-                    cols = ["word"] + [f"{dt[:-1]}_{i}" for i in range(3)]
-                    create_table(cursor, identifier_case, data_type=dt, cols=cols)
-                    cursor.execute(f"DELETE FROM [{dt}]")  # clear existing data
-                    for row in json_data:
-                        keys = [row]
-                        keys += [
-                            json_data[row][i]["emoji"]
-                            for i in range(min(len(json_data[row]), len(cols) - 1))
-                        ]
-                        keys += [""] * (len(cols) - len(keys))
-                        table_insert(cursor, data_type=dt, keys=keys)
-
-                connection.commit()
-
-            connection.close()
-            print(f"{lang.capitalize()} database processing completed.")
+            continue
 
-        else:
+        db_file = (
+            Path(output_file) / f"{get_language_iso(lang).upper()}LanguageData.sqlite"
+        )
+        if (
+            db_file.exists()
+            and not overwrite
+            and not incremental
+            and not questionary.confirm(
+                f"SQLite file {db_file} already exists.\nDo you want to overwrite it?"
+            ).ask()
+        ):
             print(
-                f"Skipping {lang.capitalize()} database creation/update as no related JSON data files were found."
+                f"Skipping {lang} database creation/update as user chose not to overwrite."
             )
+            continue
+
+        builds[lang] = (
+            lang,
+            lang_data_types,
+            db_file,
+            input_file,
+            identifier_case,
+            index_profile,
+            incremental,
+        )
+
+    timings: dict[str, float] = {}
+    for lang, seconds in tqdm(
+        _run_database_builds(builds, workers),
+        total=len(builds),
+        desc="Databases created",
+        unit="dbs",
+    ):
+        timings[lang] = seconds
+        print(f"{lang.capitalize()} database processing completed in {seconds:.2f}s.")
 
     print("Database creation/update process completed.\n")
+    return timings
@@ -3,11 +3,18 @@
 Wrapper function to convert data returned from the Scribe-Data CLI to other file types.
 """
 
+from functools import partial
 from pathlib import Path
 
-from scribe_data.cli.convert.to_csv_or_tsv import convert_to_csv_or_tsv
+from scribe_data.cli.convert.to_csv_or_tsv import (
+    convert_to_csv_or_tsv,
+    lexeme_table_to_csv_or_tsv,
+)
 from scribe_data.cli.convert.to_json import convert_to_json
-from scribe_data.cli.convert.to_sqlite import convert_to_sqlite
+from scribe_data.cli.convert.to_sqlite import (
+    convert_to_sqlite,
+    lexeme_table_to_sqlite_file,
+)
 from scribe_data.utils import (
     DEFAULT_CSV_EXPORT_DIR,
     DEFAULT_JSON_EXPORT_DIR,
@@ -15,6 +22,7 @@ from scribe_data.utils import (
     DEFAULT_TSV_EXPORT_DIR,
     DEFAULT_WIKTIONARY_JSON_EXPORT_DIR,
 )
+from scribe_data.wikidata.lexeme_table import LexemeTableWriter
 
 # MARK: Wrapper
 
@@ -28,6 +36,9 @@ def convert_wrapper(
     overwrite: bool = False,
     identifier_case: str = "camel",
     all: bool = False,
+    workers: int = 1,
+    index_profile: str | None = None,
+    incremental: bool = False,
 ) -> None:
     """
     Convert data to the specified output type: JSON, CSV/TSV, or SQLite.
@@ -58,6 +69,15 @@ def convert_wrapper(
     all : bool, optional, default=False
         Convert all languages and data types.
 
+    workers : int, optional, default=1
+        The number of language databases to build at once when converting to SQLite.
+
+    index_profile : str, optional
+        The lookup indexes and autocomplete tables to add when converting to SQLite.
+
+    incremental : bool, optional, default=False
+        Update existing SQLite databases with the lexemes that changed.
+
     Returns
     -------
     None
@@ -113,9 +133,65 @@ def convert_wrapper(
             input_file=input_path,
             output_file=output_dir,
             overwrite=overwrite,
+            workers=workers,
+            index_profile=index_profile,
+            incremental=incremental,
         )
 
     else:
         raise ValueError(
             f"Unsupported output type '{output_type}'. Must be 'json', 'csv', 'tsv' or 'sqlite'."
         )
+
+
+def lexeme_table_writer(
+    output_type: str,
+    output_dir: Path,
+    overwrite: bool = False,
+    identifier_case: str = "camel",
+) -> LexemeTableWriter:
+    """
+    Return a writer of query or dump results straight to CSV/TSV files or SQLite.
+
+    Results passed to the writer are written without first being exported to JSON,
+    which would then need to be read again and removed.
+
+    Parameters
+    ----------
+    output_type : str
+        The desired output format. Can be 'csv', 'tsv', or 'sqlite'.
+
+    output_dir : Path
+        The output directory where converted files will be stored.
+
+    overwrite : bool, optional, default=False
+        Whether to overwrite existing output files.
+
+    identifier_case : str, optional, default='camel'
+        The case format for identifiers.
+
+    Returns
+    -------
+    LexemeTableWriter
+        Writes the table of a language and data type.
+    """
+    if output_type in {"csv", "tsv"}:
+        return partial(
+            lexeme_table_to_csv_or_tsv,
+            output_dir=output_dir,
+            output_type=output_type,
+            overwrite=overwrite,
+            identifier_case=identifier_case,
+        )
+
+    if output_type == "sqlite":
+        return partial(
+            lexeme_table_to_sqlite_file,
+            output_dir=output_dir,
+            overwrite=overwrite,
+            identifier_case=identifier_case,
+        )
+
+    raise ValueError(
+        f"Unsupported output type '{output_type}'. Must be 'csv', 'tsv' or 'sqlite'."
+    )
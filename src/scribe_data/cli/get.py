@@ -4,7 +4,6 @@ Functions for getting languages-data types packs for the Scribe-Data CLI.
 """
 
 import json
-import os
 import urllib.error
 from http.client import IncompleteRead
 from pathlib import Path
@@ -14,7 +13,7 @@ import questionary
 from rich import print as rprint
 from SPARQLWrapper.SPARQLExceptions import EndPointInternalError
 
-from scribe_data.cli.convert.wrapper import convert_wrapper
+from scribe_data.cli.convert.wrapper import lexeme_table_writer
 from scribe_data.unicode.generate_emoji_keywords import generate_emoji
 from scribe_data.utils import (
     DEFAULT_CSV_EXPORT_DIR,
@@ -41,6 +40,9 @@ def get_data(
     identifier_case: str = "camel",
     wikidata_dump_path: Path | None = None,
     wiktionary_dump: str | None = None,
+    wiktionary_parse_cache: Path | None = None,
+    query_concurrency: int = 1,
+    query_format: str = "json",
 ) -> dict[str, bool] | None:
     """
     Function for controlling the data get process for the CLI.
@@ -81,6 +83,15 @@ def get_data(
         Path to enwiktionary-*-pages-articles.xml.bz2 for translations.
         Use "enwiktionary" to search output directory.
 
+    wiktionary_parse_cache : Path
+        SQLite file for caching parsed Wiktionary pages between translation runs.
+
+    query_concurrency : int, default=1
+        Number of WDQS queries to run at once, e.g. for the parts of split queries.
+
+    query_format : str, default="json"
+        The format of WDQS results: one of "json", "tsv" or "csv".
+
     Returns
     -------
     Dict[str, bool] | None
@@ -90,7 +101,9 @@ def get_data(
 
     if output_dir is None:
         if data_types == ["translations"]:
-            output_dir = DEFAULT_WIKTIONARY_JSON_EXPORT_DIR
+            output_dir = {"sqlite": DEFAULT_SQLITE_EXPORT_DIR}.get(
+                output_type, DEFAULT_WIKTIONARY_JSON_EXPORT_DIR
+            )
 
         else:
             output_dir = {
@@ -105,6 +118,18 @@ def get_data(
     )
     type_or_types = "type" if data_types and len(data_types) == 1 else "types"
 
+    # Forms for other output types are written directly rather than converted from JSON.
+    write_output = (
+        None
+        if output_type in (None, "json")
+        else lexeme_table_writer(
+            output_type=output_type,
+            output_dir=output_dir,
+            overwrite=overwrite,
+            identifier_case=identifier_case,
+        )
+    )
+
     # MARK: Get All
 
     def prompt_user_download_all() -> bool:
@@ -132,6 +157,7 @@ def get_data(
                     data_types=["all"],
                     output_dir=output_dir,
                     overwrite=overwrite,
+                    write_output=write_output,
                 )
                 print(
                     f"Query completed for all data types for language {language.title()}."
@@ -145,6 +171,7 @@ def get_data(
                     output_dir=output_dir,
                     wikidata_dump_path=wikidata_dump_path,
                     overwrite_all=overwrite,
+                    write_output=write_output,
                 )
 
         elif data_types:
@@ -156,6 +183,7 @@ def get_data(
                     data_types=data_types,
                     output_dir=output_dir,
                     overwrite=overwrite,
+                    write_output=write_output,
                 )
                 print(f"Query completed for all languages for data type: {data_type}")
 
@@ -167,6 +195,7 @@ def get_data(
                     output_dir=output_dir,
                     wikidata_dump_path=wikidata_dump_path,
                     overwrite_all=overwrite,
+                    write_output=write_output,
                 )
 
         else:
@@ -181,6 +210,7 @@ def get_data(
                 output_dir=output_dir,
                 wikidata_dump_path=wikidata_dump_path,
                 overwrite_all=overwrite,
+                write_output=write_output,
             )
 
     # MARK: Emojis
@@ -208,6 +238,9 @@ def get_data(
             wiktionary_dump_path=wiktionary_dump,
             output_dir=output_dir,
             overwrite=overwrite,
+            parse_cache_path=wiktionary_parse_cache,
+            output_type=output_type,
+            identifier_case=identifier_case,
         )
         return
 
@@ -225,6 +258,7 @@ def get_data(
             output_dir=output_dir,
             wikidata_dump_path=wikidata_dump_path,
             overwrite_all=overwrite,
+            write_output=write_output,
         )
         return
 
@@ -238,8 +272,9 @@ def get_data(
             f"{', '.join([t.capitalize() for t in data_types])}"
         )
 
+        # Writers for other output types check for existing data themselves.
         json_path = Path(output_dir) / language_or_sub_language / f"{data_type}.json"
-        if not overwrite and check_index_exists(json_path):
+        if write_output is None and not overwrite and check_index_exists(json_path):
             print(
                 f"Skipping update for {language_or_sub_language.title()} {data_type}."
             )
@@ -265,6 +300,9 @@ def get_data(
                 output_dir=output_dir,
                 overwrite=overwrite,
                 interactive=interactive,
+                max_concurrency=query_concurrency,
+                result_format=query_format,
+                write_output=write_output,
             )
 
             # Only print this line if no exception was raised.
@@ -294,24 +332,6 @@ def get_data(
                 f"[bold red]Error: Network or data transfer issue occurred: {str(e)}[/bold red]"
             )
 
-        # MARK: Output Conversion
-
-        json_input_path = (
-            Path(output_dir) / f"{language_or_sub_language}/{data_type}.json"
-        )
-
-        if output_type and output_type != "json" and json_input_path.exists():
-            convert_wrapper(
-                languages=[language_or_sub_language],
-                data_types=data_types,
-                input_path=json_input_path,
-                output_dir=output_dir,
-                output_type=output_type,
-                overwrite=overwrite,
-                identifier_case=identifier_case,
-            )
-            os.remove(json_input_path)
-
     else:
         raise ValueError(
             "You must provide at least one --language (-l) and one --data-type (-dt). You can also use --all (-a) for all combinations or all data types using --all (-a) in place of --data-type (-dt)."
@@ -5,36 +5,172 @@ Setup and commands for the Scribe-Data command line interface.
 
 #!/usr/bin/env python3
 import argparse
+from importlib import import_module
 from pathlib import Path
+from typing import Any, Callable
 
-from questionary import select, text
-from rich import print as rprint
-
-from scribe_data.cli.cli_utils import validate_language_and_data_type
-from scribe_data.cli.contracts.check import check_contracts
-from scribe_data.cli.contracts.export import export_contracts
-from scribe_data.cli.contracts.filter import export_data_filtered_by_contracts
-from scribe_data.cli.convert.wrapper import convert_wrapper
-from scribe_data.cli.download.wikidata_lexeme_dump import (
-    wd_lexeme_dump_download_wrapper,
-)
-from scribe_data.cli.download.wiktionary_dump import (
-    download_wiktionary_dumps,
-)
-from scribe_data.cli.get import get_data
-from scribe_data.cli.interactive.run import run_interactive_mode
-from scribe_data.cli.list.wrapper import list_wrapper
-from scribe_data.cli.total.wrapper import total_wrapper
-from scribe_data.cli.upgrade import upgrade_cli
-from scribe_data.cli.version import get_version_message
 from scribe_data.utils import (
     DEFAULT_CONTRACTS_EXPORT_DIR,
     DEFAULT_CSV_EXPORT_DIR,
     DEFAULT_JSON_EXPORT_DIR,
     DEFAULT_WIKIDATA_DUMP_EXPORT_DIR,
     DEFAULT_WIKTIONARY_DUMP_EXPORT_DIR,
+    DEFAULT_WIKTIONARY_PARSE_CACHE_PATH,
+)
+from scribe_data.wikidata.sparql_options import (
+    DEFAULT_MAX_CONCURRENCY,
+    RESULT_FORMATS,
+    add_sparql_cache_arguments,
+    configure_sparql_cache_from_args,
 )
 
+
+def _lazy(module: str, name: str) -> Callable[..., Any]:
+    """
+    Return a function that imports a module and calls one of its functions when used.
+
+    Subcommands and their dependencies are only imported by the command that is run,
+    so that e.g. ``scribe-data list`` doesn't import the SPARQL and prompt libraries.
+
+    Parameters
+    ----------
+    module : str
+        The module of the function.
+
+    name : str
+        The name of the function.
+
+    Returns
+    -------
+    Callable[..., Any]
+        Calls the function with the arguments it is given.
+    """
+
+    def call(*args: Any, **kwargs: Any) -> Any:
+        """
+        Call the function after importing its module.
+
+        Parameters
+        ----------
+        *args : Any
+            Positional arguments of the function.
+
+        **kwargs : Any
+            Keyword arguments of the function.
+
+        Returns
+        -------
+        Any
+            What the function returns.
+        """
+        return getattr(import_module(module), name)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    return call
+
+
+rprint = _lazy("rich", "print")
+select = _lazy("questionary", "select")
+text = _lazy("questionary", "text")
+
+validate_language_and_data_type = _lazy(
+    "scribe_data.cli.cli_utils", "validate_language_and_data_type"
+)
+check_contracts = _lazy("scribe_data.cli.contracts.check", "check_contracts")
+export_contracts = _lazy("scribe_data.cli.contracts.export", "export_contracts")
+export_data_filtered_by_contracts = _lazy(
+    "scribe_data.cli.contracts.filter", "export_data_filtered_by_contracts"
+)
+convert_wrapper = _lazy("scribe_data.cli.convert.wrapper", "convert_wrapper")
+wd_lexeme_dump_download_wrapper = _lazy(
+    "scribe_data.cli.download.wikidata_lexeme_dump", "wd_lexeme_dump_download_wrapper"
+)
+download_wiktionary_dumps = _lazy(
+    "scribe_data.cli.download.wiktionary_dump", "download_wiktionary_dumps"
+)
+get_data = _lazy("scribe_data.cli.get", "get_data")
+run_interactive_mode = _lazy("scribe_data.cli.interactive.run", "run_interactive_mode")
+list_wrapper = _lazy("scribe_data.cli.list.wrapper", "list_wrapper")
+total_wrapper = _lazy("scribe_data.cli.total.wrapper", "total_wrapper")
+upgrade_cli = _lazy("scribe_data.cli.upgrade", "upgrade_cli")
+get_version_message = _lazy("scribe_data.cli.version", "get_version_message")
+
+
+class _VersionAction(argparse.Action):
+    """
+    Print the version message, which is only looked up when the option is used.
+
+    The message compares the installed version to the latest release on GitHub, so it
+    isn't requested while the parser is built as with ``action="version"``.
+
+    Parameters
+    ----------
+    option_strings : list[str]
+        The flags of the option.
+
+    dest : str, default=argparse.SUPPRESS
+        Where the option would be stored, which it isn't.
+
+    help : str, optional
+        The help message of the option.
+    """
+
+    def __init__(
+        self,
+        option_strings: list[str],
+        dest: str = argparse.SUPPRESS,
+        help: str | None = None,
+    ) -> None:
+        """
+        Register the option as a flag without a value.
+
+        Parameters
+        ----------
+        option_strings : list[str]
+            The flags of the option.
+
+        dest : str, default=argparse.SUPPRESS
+            Where the option would be stored, which it isn't.
+
+        help : str, optional
+            The help message of the option.
+        """
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=argparse.SUPPRESS,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> None:
+        """
+        Print the version message and exit.
+
+        Parameters
+        ----------
+        parser : argparse.ArgumentParser
+            The parser of the CLI.
+
+        namespace : argparse.Namespace
+            The parsed arguments.
+
+        values : Any
+            Unused as the option takes no value.
+
+        option_string : str, optional
+            The flag that was used.
+        """
+        print(get_version_message())
+        parser.exit()
+
+
 LIST_DESCRIPTION = "List languages, data types and combinations of each that Scribe-Data can be used for."
 GET_DESCRIPTION = (
     "Get data from Wikidata and other sources for the given languages and data types."
@@ -67,8 +203,7 @@ def main() -> None:
     parser.add_argument(
         "-v",
         "--version",
-        action="version",
-        version=get_version_message(),
+        action=_VersionAction,
         help="Show the version of the Scribe-Data CLI.",
     )
     parser.add_argument(
@@ -198,6 +333,28 @@ def main() -> None:
         const=DEFAULT_WIKTIONARY_DUMP_EXPORT_DIR,
         help=f"Path to download *wiktionary-*-pages-articles.xml.bz2 Wiktionary dumps for translations. Uses default directory ./{DEFAULT_WIKTIONARY_DUMP_EXPORT_DIR} if no path provided.",
     )
+    get_parser.add_argument(
+        "-wpc",
+        "--wiktionary-parse-cache",
+        nargs="?",
+        const=DEFAULT_WIKTIONARY_PARSE_CACHE_PATH,
+        help=f"Cache parsed Wiktionary pages so re-runs only parse changed pages. Uses ./{DEFAULT_WIKTIONARY_PARSE_CACHE_PATH} if no path provided.",
+    )
+    get_parser.add_argument(
+        "-qc",
+        "--query-concurrency",
+        type=int,
+        default=1,
+        help=f"Number of Wikidata Query Service queries to run at once (default: 1, at most {DEFAULT_MAX_CONCURRENCY} recommended).",
+    )
+    get_parser.add_argument(
+        "-qf",
+        "--query-format",
+        choices=RESULT_FORMATS,
+        default="json",
+        help="Format of Wikidata Query Service results, with tsv and csv being smaller to transfer and faster to parse (default: json).",
+    )
+    add_sparql_cache_arguments(get_parser)
 
     # MARK: Total
 
@@ -237,6 +394,7 @@ def main() -> None:
         const=True,
         help=f"Path to a local Wikidata lexemes dump for running with '--all'. Uses default directory ./{DEFAULT_WIKIDATA_DUMP_EXPORT_DIR} if no path provided.",
     )
+    add_sparql_cache_arguments(total_parser)
 
     # MARK: Convert
 
@@ -317,6 +475,26 @@ def main() -> None:
         action=argparse.BooleanOptionalAction,
         help="Convert all languages and data types.",
     )
+    convert_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of language databases to build at once when converting to SQLite (default: 1).",
+    )
+    convert_parser.add_argument(
+        "-ip",
+        "--index-profile",
+        choices=["lookup", "autocomplete"],
+        default=None,
+        help="Indexes to add when converting to SQLite: 'lookup' for lemma and form lookups, 'autocomplete' to also add an autocomplete_lexicon table (default: none).",
+    )
+    convert_parser.add_argument(
+        "-inc",
+        "--incremental",
+        action="store_true",
+        help="Update existing SQLite databases with the lexemes that were added, modified or removed rather than rebuilding them.",
+    )
     convert_parser.add_argument(
         "-i", "--interactive", action="store_true", help="Run in interactive mode"
     )
@@ -467,6 +645,8 @@ def main() -> None:
         parser.print_help()
         return
 
+    configure_sparql_cache_from_args(args)
+
     try:
         # Only validate language and data_type for relevant commands.
         if args.command in ["list", "l", "get", "g", "total", "t", "convert", "c"]:
@@ -533,6 +713,9 @@ def main() -> None:
                             identifier_case=args.identifier_case,
                             wikidata_dump_path=args.wikidata_dump_path,
                             wiktionary_dump=args.wiktionary_dump_path,
+                            wiktionary_parse_cache=args.wiktionary_parse_cache,
+                            query_concurrency=args.query_concurrency,
+                            query_format=args.query_format,
                         )
 
                     else:
@@ -549,6 +732,9 @@ def main() -> None:
                                     identifier_case=args.identifier_case,
                                     wikidata_dump_path=args.wikidata_dump_path,
                                     wiktionary_dump=args.wiktionary_dump_path,
+                                    wiktionary_parse_cache=args.wiktionary_parse_cache,
+                                    query_concurrency=args.query_concurrency,
+                                    query_format=args.query_format,
                                 )
 
                 else:
@@ -564,6 +750,9 @@ def main() -> None:
                         identifier_case=args.identifier_case,
                         wikidata_dump_path=args.wikidata_dump_path,
                         wiktionary_dump=args.wiktionary_dump_path,
+                        wiktionary_parse_cache=args.wiktionary_parse_cache,
+                        query_concurrency=args.query_concurrency,
+                        query_format=args.query_format,
                     )
 
         elif args.command in ["total", "t"]:
@@ -613,6 +802,9 @@ def main() -> None:
                 overwrite=args.overwrite,
                 identifier_case=args.identifier_case,
                 all=args.all,
+                workers=args.workers,
+                index_profile=args.index_profile,
+                incremental=args.incremental,
             )
 
         elif args.command in ["download", "d"]:
@@ -7,14 +7,16 @@ import contextlib
 import json
 import os
 import re
+import tempfile
+from dataclasses import dataclass
 from datetime import datetime
-from importlib import metadata, resources
+from functools import cache
+from importlib import import_module
+from io import TextIOWrapper
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
-import questionary
-import requests
-import yaml
 from rich import print as rprint
 
 # MARK: Utils Variables
@@ -28,16 +30,17 @@ DEFAULT_TSV_EXPORT_DIR = Path("scribe_data_tsv_export")
 DEFAULT_SQLITE_EXPORT_DIR = Path("scribe_data_sqlite_export")
 
 DEFAULT_WIKIDATA_DUMP_EXPORT_DIR = Path("scribe_data_wikidata_dumps_export")
+DEFAULT_SPARQL_CACHE_DIR = Path("scribe_data_sparql_cache")
 
 DEFAULT_WIKTIONARY_JSON_EXPORT_DIR = Path("scribe_data_wiktionary_json_export")
 DEFAULT_WIKTIONARY_DUMP_EXPORT_DIR = Path("scribe_data_wiktionary_dumps_export")
+DEFAULT_WIKTIONARY_PARSE_CACHE_PATH = (
+    DEFAULT_WIKTIONARY_DUMP_EXPORT_DIR / "wiktionary_parse_cache.sqlite"
+)
 
 DEFAULT_CONTRACTS_EXPORT_DIR = Path("scribe_data_contracts")
 DEFAULT_DATA_CONTRACTS_DIR = Path(__file__).parent / "resources" / "data_contracts"
 
-project_homepage = metadata.metadata("scribe-data").get("Home-page")
-WMF_HEADERS = {"User-Agent": f"{PROJECT_ROOT} ({project_homepage})"}
-
 WIKIDATA_QUERIES_ALL_DATA_DIR = Path(__file__).parent / "wikidata" / "queries_all_data"
 WIKIDATA_QUERIES_SCRIBE_APPS_DIR = (
     Path(__file__).parent / "wikidata" / "queries_scribe_apps"
@@ -54,34 +57,257 @@ WIKIDATA_QIDS_PIDS_FILE = (
     Path(__file__).parent / "resources" / "wikidata_qids_pids.yaml"
 )
 
-try:
-    with LANGUAGE_METADATA_FILE.open("r", encoding="utf-8") as file:
-        language_metadata = yaml.safe_load(file)
+METADATA_CACHE_VERSION = 2
+METADATA_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "scribe-data"
+    / "metadata.json"
+)
+
+# Marks a mapping whose keys aren't all strings in the metadata cache, e.g. the integer
+# keys of the lexeme form metadata, as JSON objects only have string keys.
+_METADATA_CACHE_ITEMS = "__items__"
+
+# The metadata files and how they're named in errors.
+METADATA_FILES = {
+    LANGUAGE_METADATA_FILE: "language metadata",
+    DATA_TYPE_METADATA_FILE: "data type metadata",
+    LEXEME_FORM_METADATA_FILE: "lexeme form metadata",
+    WIKIDATA_QIDS_PIDS_FILE: "wikidata QIDs/PIDs metadata",
+}
+
+# Imported when first used as they are slow to import and only some commands use them.
+_LAZY_MODULES = {"questionary", "requests"}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import rarely used dependencies and look up the package homepage when first used.
+
+    Parameters
+    ----------
+    name : str
+        The attribute of the module.
+
+    Returns
+    -------
+    Any
+        The module or value of the attribute.
+
+    Raises
+    ------
+    AttributeError
+        If the module has no such attribute.
+    """
+    if name in _LAZY_MODULES:
+        return import_module(name)
+
+    if name == "project_homepage":
+        return _project_homepage()
+
+    if name == "WMF_HEADERS":
+        return {"User-Agent": f"{PROJECT_ROOT} ({_project_homepage()})"}
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@cache
+def _project_homepage() -> str | None:
+    """
+    Return the homepage of the installed package.
+
+    Returns
+    -------
+    str | None
+        The homepage given in the package metadata.
+    """
+    from importlib import metadata
+
+    return metadata.metadata("scribe-data").get("Home-page")
+
+
+def _metadata_cache_key(paths: list[Path]) -> list:
+    """
+    Return what the cached metadata is only valid for.
+
+    Parameters
+    ----------
+    paths : list[Path]
+        The YAML metadata files.
+
+    Returns
+    -------
+    list
+        The cache format and the path, modification time and size of each file.
+    """
+    stats = [(str(path), path.stat()) for path in paths]
+    return [
+        METADATA_CACHE_VERSION,
+        *([path, stat.st_mtime_ns, stat.st_size] for path, stat in stats),
+    ]
+
+
+def _encode_metadata(value: Any) -> Any:
+    """
+    Return parsed metadata in a form that keeps its keys when saved as JSON.
+
+    Parameters
+    ----------
+    value : Any
+        Parsed YAML metadata.
+
+    Returns
+    -------
+    Any
+        The metadata with each mapping whose keys aren't all strings as a list of items.
+    """
+    if isinstance(value, list):
+        return [_encode_metadata(item) for item in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    encoded = {key: _encode_metadata(item) for key, item in value.items()}
+    if all(isinstance(key, str) for key in encoded):
+        return encoded
+
+    return {_METADATA_CACHE_ITEMS: [[key, item] for key, item in encoded.items()]}
+
+
+def _decode_metadata_object(obj: dict[str, Any]) -> dict[Any, Any]:
+    """
+    Restore a mapping saved by ``_encode_metadata`` as a list of items.
+
+    Parameters
+    ----------
+    obj : dict[str, Any]
+        A JSON object of the metadata cache.
+
+    Returns
+    -------
+    dict[Any, Any]
+        The mapping with its original keys.
+    """
+    if list(obj) == [_METADATA_CACHE_ITEMS]:
+        return {key: item for key, item in obj[_METADATA_CACHE_ITEMS]}
+
+    return obj
+
+
+def _write_metadata_cache(
+    cache_path: Path, key: list, metadata: dict[str, Any]
+) -> None:
+    """
+    Save parsed metadata as JSON, leaving no partial file behind if this fails.
+
+    Parameters
+    ----------
+    cache_path : Path
+        Where to keep the cache.
+
+    key : list
+        The key from ``_metadata_cache_key`` that the metadata is valid for.
+
+    metadata : dict[str, Any]
+        The contents of each metadata file keyed by file name.
+    """
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_path.parent, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_path = tmp.name
+            json.dump({"key": key, "metadata": _encode_metadata(metadata)}, tmp)
+
+        os.replace(tmp_path, cache_path)
+
+    # The metadata is still used if it can't be cached, e.g. as it isn't valid JSON.
+    except Exception:
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+
+def _parse_yaml_metadata(paths: dict[Path, str]) -> tuple[dict[str, Any], bool]:
+    """
+    Parse YAML metadata files, reporting those that can't be read.
+
+    Parameters
+    ----------
+    paths : dict[Path, str]
+        The files and how they're named in errors.
 
-except (IOError, yaml.YAMLError) as e:
-    print(f"Error reading language metadata: {e}")
+    Returns
+    -------
+    tuple[dict[str, Any], bool]
+        The contents of each file that could be read keyed by file name, and whether
+        every file could be read.
+    """
+    import yaml
 
+    parsed = {}
+    for path, label in paths.items():
+        try:
+            with path.open("r", encoding="utf-8") as file:
+                parsed[path.name] = yaml.safe_load(file)
 
-try:
-    with DATA_TYPE_METADATA_FILE.open("r", encoding="utf-8") as file:
-        data_type_metadata = yaml.safe_load(file)
+        except (IOError, yaml.YAMLError) as e:
+            print(f"Error reading {label}: {e}")
 
-except (IOError, yaml.YAMLError) as e:
-    print(f"Error reading data type metadata: {e}")
+    return parsed, len(parsed) == len(paths)
 
-try:
-    with LEXEME_FORM_METADATA_FILE.open("r", encoding="utf-8") as file:
-        lexeme_form_metadata = yaml.safe_load(file)
 
-except (IOError, yaml.YAMLError) as e:
-    print(f"Error reading lexeme form metadata: {e}")
+def load_metadata(
+    paths: dict[Path, str] = METADATA_FILES,
+    cache_path: Path | None = METADATA_CACHE_PATH,
+) -> dict[str, Any]:
+    """
+    Load the YAML metadata files, using a JSON cache of them while they are unchanged.
 
-try:
-    with WIKIDATA_QIDS_PIDS_FILE.open("r", encoding="utf-8") as file:
-        wikidata_qids_pids = yaml.safe_load(file)
+    Parsing the YAML files takes far longer than loading a JSON copy of them. The cache
+    is rebuilt whenever a file's modification time or size changes.
 
-except (IOError, yaml.YAMLError) as e:
-    print(f"Error reading wikidata QIDs/PIDs metadata: {e}")
+    Parameters
+    ----------
+    paths : dict[Path, str], default=METADATA_FILES
+        The files and how they're named in errors.
+
+    cache_path : Path, default=METADATA_CACHE_PATH
+        Where to keep the JSON cache, or None to always parse the files.
+
+    Returns
+    -------
+    dict[str, Any]
+        The contents of each file that could be read keyed by file name.
+    """
+    try:
+        key = _metadata_cache_key(list(paths))
+
+    except OSError:
+        key = None
+
+    if cache_path is not None and key is not None:
+        with contextlib.suppress(Exception):
+            cached = json.loads(
+                cache_path.read_text(encoding="utf-8"),
+                object_hook=_decode_metadata_object,
+            )
+            if cached["key"] == key:
+                return cached["metadata"]
+
+    parsed, complete = _parse_yaml_metadata(paths)
+    if cache_path is not None and key is not None and complete:
+        _write_metadata_cache(cache_path, key, parsed)
+
+    return parsed
+
+
+_metadata = load_metadata()
+language_metadata = _metadata.get(LANGUAGE_METADATA_FILE.name, {})
+data_type_metadata = _metadata.get(DATA_TYPE_METADATA_FILE.name, {})
+lexeme_form_metadata = _metadata.get(LEXEME_FORM_METADATA_FILE.name, {})
+wikidata_qids_pids = _metadata.get(WIKIDATA_QIDS_PIDS_FILE.name, {})
 
 
 language_map = {}
@@ -141,6 +367,10 @@ def _load_json(package_path: str, file_name: str) -> Any:
     Any
         A python entity representing the file content.
     """
+    from importlib import resources
+
+    import yaml
+
     data_file = resources.files(package_path).joinpath(file_name)
     with data_file.open(encoding="utf-8") as in_stream:
         if file_name.endswith((".yaml", ".yml")):
@@ -149,9 +379,133 @@ def _load_json(package_path: str, file_name: str) -> Any:
         return json.load(in_stream)
 
 
-_languages = _load_json(
-    package_path="scribe_data.resources", file_name="language_metadata.yaml"
-)
+# The language metadata that is used by default, which was read with the other files.
+_languages = language_metadata
+
+
+# MARK: Language Registry
+
+
+@dataclass(frozen=True)
+class LanguageRegistry:
+    """
+    Constant time lookups of languages and sub-languages in the language metadata.
+
+    Attributes
+    ----------
+    entries : Mapping[str, dict]
+        The metadata of each language and sub-language keyed by name.
+
+    sub_languages : Mapping[str, tuple[str, ...]]
+        The sub-languages of each language that has them.
+
+    parents : Mapping[str, str]
+        The main language of each sub-language.
+
+    iso_to_name : Mapping[str, str]
+        The name of the language of each ISO code.
+
+    qid_to_name : Mapping[str, str]
+        The name of the first language listed with each Wikidata QID.
+
+    output_paths : Mapping[str, str]
+        Where the exports of each language go relative to an export directory, e.g.
+        ``"chinese/mandarin"`` for a sub-language.
+    """
+
+    entries: Mapping[str, dict]
+    sub_languages: Mapping[str, tuple[str, ...]]
+    parents: Mapping[str, str]
+    iso_to_name: Mapping[str, str]
+    qid_to_name: Mapping[str, str]
+    output_paths: Mapping[str, str]
+
+    @classmethod
+    def from_metadata(cls, language_metadata: dict) -> "LanguageRegistry":
+        """
+        Index the language metadata in one pass.
+
+        Parameters
+        ----------
+        language_metadata : dict
+            The metadata that Scribe-Data uses to provide information on languages.
+
+        Returns
+        -------
+        LanguageRegistry
+            The lookups of the metadata.
+        """
+        entries, sub_languages, parents, output_paths = {}, {}, {}, {}
+        iso_to_name: dict[str, str] = {}
+        qid_to_name: dict[str, str] = {}
+
+        for lang, lang_data in language_metadata.items():
+            subs = lang_data.get("sub_languages", {})
+            named = [(lang, lang_data, lang)]
+            named += [
+                (sub, sub_data, f"{lang}/{sub}") for sub, sub_data in subs.items()
+            ]
+            if subs:
+                sub_languages[lang] = tuple(subs)
+                parents.update(dict.fromkeys(subs, lang))
+
+            for name, data, output_path in named:
+                entries.setdefault(name, data)
+                output_paths.setdefault(name.lower(), output_path.replace(" ", "_"))
+                if iso := data.get("iso"):
+                    iso_to_name.setdefault(iso, name)
+
+                if qid := data.get("qid"):
+                    qid_to_name.setdefault(qid, name)
+
+        return cls(
+            entries=MappingProxyType(entries),
+            sub_languages=MappingProxyType(sub_languages),
+            parents=MappingProxyType(parents),
+            iso_to_name=MappingProxyType(iso_to_name),
+            qid_to_name=MappingProxyType(qid_to_name),
+            output_paths=MappingProxyType(output_paths),
+        )
+
+    @classmethod
+    def for_metadata(cls, metadata: dict) -> "LanguageRegistry":
+        """
+        Return the shared registry for the loaded metadata or index other metadata.
+
+        Parameters
+        ----------
+        metadata : dict
+            The metadata that Scribe-Data uses to provide information on languages.
+
+        Returns
+        -------
+        LanguageRegistry
+            The lookups of the metadata.
+        """
+        if metadata is _languages or metadata is language_metadata:
+            return language_registry
+
+        return cls.from_metadata(metadata)
+
+    def output_subdir(self, lang: str) -> str:
+        """
+        Return where the exports of a language go relative to an export directory.
+
+        Parameters
+        ----------
+        lang : str
+            The name of a language or sub-language in any case.
+
+        Returns
+        -------
+        str
+            The output subdirectory, e.g. ``"german"`` or ``"chinese/mandarin"``.
+        """
+        lang = lang.lower()
+        return self.output_paths.get(lang, lang.replace(" ", "_"))
+
+
+language_registry = LanguageRegistry.from_metadata(_languages)
 
 
 def _find(source_key: str, source_value: str, target_key: str, error_msg: str) -> Any:
@@ -184,27 +538,15 @@ def _find(source_key: str, source_value: str, target_key: str, error_msg: str) -
     ValueError
         When a source_value is not supported or the language only has sub-languages.
     """
-    # Check if we're searching by language name.
     if source_key == "language":
-        # First, check the main language entries (e.g., mandarin, french, etc.).
-        for language, entry in _languages.items():
-            # If the language name matches the top-level key, return the target value.
-            if language == source_value:
-                if "sub_languages" in entry:
-                    sub_languages = entry["sub_languages"].keys()
-                    sub_languages = ", ".join(
-                        lang.capitalize() for lang in sub_languages
-                    )
-                    raise ValueError(
-                        f"'{language.capitalize()}' has sub-languages, but is not queryable directly. Available sub-languages: {sub_languages}"
-                    )
-                return entry.get(target_key)
-
-            # If there are sub-languages, check them too.
-            if "sub_languages" in entry:
-                for sub_language, sub_entry in entry["sub_languages"].items():
-                    if sub_language == source_value:
-                        return sub_entry.get(target_key)
+        if subs := language_registry.sub_languages.get(source_value):
+            sub_languages = ", ".join(lang.capitalize() for lang in subs)
+            raise ValueError(
+                f"'{source_value.capitalize()}' has sub-languages, but is not queryable directly. Available sub-languages: {sub_languages}"
+            )
+
+        if (entry := language_registry.entries.get(source_value)) is not None:
+            return entry.get(target_key)
 
     # If no match was found, raise an error.
     raise ValueError(error_msg)
@@ -269,17 +611,8 @@ def get_language_from_iso(iso: str) -> str:
     str
         The name for the language which has an ISO value of iso.
     """
-    # Iterate over the languages and their properties.
-    for language, properties in _languages.items():
-        # Check if the current language's ISO matches the provided ISO.
-        if properties.get("iso") == iso:
-            return language.capitalize()
-
-        # If there are sub-languages, check those as well.
-        if "sub_languages" in properties:
-            for sub_lang, sub_properties in properties["sub_languages"].items():
-                if sub_properties.get("iso") == iso:
-                    return sub_lang.capitalize()
+    if language := language_registry.iso_to_name.get(iso):
+        return language.capitalize()
 
     # If no match is found, raise a ValueError.
     raise ValueError(f"{iso.upper()} is currently not a supported ISO language.")
@@ -372,6 +705,163 @@ def remove_queried_data(dir_path: Path, language: str, data_type: str) -> None:
         os.remove(data_path)
 
 
+# MARK: JSON Export
+
+# Entries of a top-level dict that are serialized at once when writing it to a file.
+JSON_WRITE_BATCH_SIZE = 1_000
+
+_JSON_INDENTATION = re.compile(rb"\n +")
+
+
+@cache
+def _orjson() -> Any:
+    """
+    Import orjson if it's installed.
+
+    orjson isn't imported with this module so that the CLI starts without it.
+
+    Returns
+    -------
+    module or None
+        The orjson module, or None if it isn't installed.
+    """
+    try:
+        import orjson
+
+    except ImportError:
+        return None
+
+    return orjson
+
+
+def _dumps_orjson(data: Any, indent: int, sort_keys: bool) -> bytes:
+    """
+    Serialize data with orjson as ``json.dumps(data, ensure_ascii=False)`` would.
+
+    orjson can only indent by two spaces, so for an indent of zero the indentation that
+    starts each line is removed, which can't change a string as JSON strings never
+    contain a raw newline.
+
+    Parameters
+    ----------
+    data : Any
+        The data to serialize.
+
+    indent : int
+        Spaces per level of indentation, either 0 or 2.
+
+    sort_keys : bool
+        Whether to sort the keys of dicts.
+
+    Returns
+    -------
+    bytes
+        The UTF-8 encoded JSON.
+    """
+    orjson = _orjson()
+    option = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+    dumped = orjson.dumps(data, option=option)
+
+    return _JSON_INDENTATION.sub(b"\n", dumped) if indent == 0 else dumped
+
+
+def _write_orjson(
+    file: Any, data: Any, indent: int, sort_keys: bool, batch_size: int
+) -> None:
+    """
+    Write JSON with orjson, serializing large top-level dicts in batches of entries.
+
+    Parameters
+    ----------
+    file : binary file
+        The file to write to.
+
+    data : Any
+        The data to serialize.
+
+    indent : int
+        Spaces per level of indentation, either 0 or 2.
+
+    sort_keys : bool
+        Whether to sort the keys of dicts.
+
+    batch_size : int
+        Entries of a top-level dict that are serialized at once.
+    """
+    if not isinstance(data, dict) or len(data) <= batch_size:
+        file.write(_dumps_orjson(data, indent, sort_keys))
+        return
+
+    keys = sorted(data) if sort_keys else list(data)
+    file.write(b"{\n")
+    for start in range(0, len(keys), batch_size):
+        if start:
+            file.write(b",\n")
+
+        batch = {k: data[k] for k in keys[start : start + batch_size]}
+        # Drop the braces around the batch to leave its entries as they are in data.
+        file.write(_dumps_orjson(batch, indent, sort_keys)[2:-2])
+
+    file.write(b"\n}")
+
+
+def write_json(
+    path: str | Path,
+    data: Any,
+    indent: int = 2,
+    sort_keys: bool = False,
+    trailing_newline: bool = False,
+    batch_size: int = JSON_WRITE_BATCH_SIZE,
+) -> None:
+    """
+    Write data to a JSON file byte for byte as ``json.dump(ensure_ascii=False)`` would.
+
+    orjson is used if it's installed and the indent is 0 or 2, with the standard library
+    writing the file otherwise or if orjson can't serialize the data.
+
+    Parameters
+    ----------
+    path : str | Path
+        The file to write.
+
+    data : Any
+        The data to serialize.
+
+    indent : int, default=2
+        Spaces per level of indentation.
+
+    sort_keys : bool, default=False
+        Whether to sort the keys of dicts.
+
+    trailing_newline : bool, default=False
+        Whether to end the file with a newline.
+
+    batch_size : int, default=JSON_WRITE_BATCH_SIZE
+        Entries of a top-level dict that are serialized at once, so that the JSON of a
+        large dict is never held in memory all at once.
+    """
+    with open(path, "wb") as file:
+        written = False
+        if _orjson() is not None and indent in (0, 2):
+            try:
+                _write_orjson(file, data, indent, sort_keys, batch_size)
+                written = True
+
+            except TypeError:  # orjson.JSONEncodeError, e.g. for an unsupported type
+                file.seek(0)
+                file.truncate()
+
+        if not written:
+            text = TextIOWrapper(file, encoding="utf-8", newline="")
+            json.dump(
+                data, text, ensure_ascii=False, indent=indent, sort_keys=sort_keys
+            )
+            text.detach()
+
+        if trailing_newline:
+            file.write(b"\n")
+
+
 def export_formatted_data(
     dir_path: Path,
     formatted_data: dict,
@@ -407,9 +897,7 @@ def export_formatted_data(
     )
     export_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(export_path, "w", encoding="utf-8") as file:
-        json.dump(formatted_data, file, ensure_ascii=False, indent=0)
-        file.write("\n")
+    write_json(export_path, formatted_data, indent=0, trailing_newline=True)
 
     print(
         f"Wrote file {language.lower()}/{data_type.replace('-', '_')}.json with {len(formatted_data):,} {data_type}."
@@ -454,19 +942,19 @@ def format_sublanguage_name(lang: str, language_metadata: dict = _languages) ->
     if (lang.startswith("Q") or lang.startswith("q")) and lang[1:].isdigit():
         return lang
 
-    for main_lang, lang_data in language_metadata.items():
-        # If it's not a sub-language, return the original name.
-        if main_lang == lang:
-            return lang
+    registry = LanguageRegistry.for_metadata(language_metadata)
 
-        # Check if the main language has sub-languages.
-        lang = lang.split(" ")[0]
-        if "sub_languages" in lang_data:
-            # Check if the provided language is a sub-language.
-            for sub_lang in lang_data["sub_languages"]:
-                if lang == sub_lang:
-                    # Return the formatted name SUB_LANG MAIN_LANG.
-                    return f"{sub_lang} {main_lang}"
+    # If it's not a sub-language, return the original name.
+    if lang in registry.entries and lang not in registry.parents:
+        return lang
+
+    lang = lang.split(" ")[0]
+    if lang in registry.parents:
+        # Return the formatted name SUB_LANG MAIN_LANG.
+        return f"{lang} {registry.parents[lang]}"
+
+    if lang in registry.entries:
+        return lang
 
     # Raise ValueError if no match is found.
     raise ValueError(f"{lang.capitalize()} is not a valid language or sub-language.")
@@ -589,6 +1077,8 @@ def check_lexeme_dump_prompt_download(output_dir: Path) -> bool | Path | None:
     None
         The user is prompted to download a new Wikidata lexeme dump after the existence of one is checked.
     """
+    import questionary
+
     existing_dumps = list(Path(output_dir).glob("*.json.bz2"))
     if existing_dumps:
         rprint("[bold yellow]Existing dump files found:[/bold yellow]")
@@ -684,6 +1174,8 @@ def check_index_exists(index_path: Path, overwrite_all: bool = False) -> bool:
     Returns True if user chooses to skip (i.e., we do NOT proceed).
     Returns False if the file doesn't exist or user chooses to overwrite (i.e., we DO proceed).
     """
+    import questionary
+
     if index_path.exists():
         if overwrite_all:
             return False
@@ -720,6 +1212,8 @@ def check_qid_is_language(qid: str) -> str:
     ValueError
         An invalid QID that's not a language has been passed.
     """
+    import requests
+
     api_endpoint = "https://www.wikidata.org/w/rest.php/wikibase/v0"
     request_string = f"{api_endpoint}/entities/items/{qid}"
 
@@ -760,6 +1254,7 @@ def get_language_iso_code(qid: str) -> str:
     KeyError
         The ISO code for the language is not available.
     """
+    import requests
 
     api_endpoint = f"https://www.wikidata.org/w/api.php?action=wbgetentities&ids={qid}&props=claims&format=json"
     response = requests.get(api_endpoint)
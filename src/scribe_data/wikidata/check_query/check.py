@@ -17,6 +17,10 @@ from tqdm.auto import tqdm
 
 from scribe_data.wikidata.check_query.query import QueryExecutionException, QueryFile
 from scribe_data.wikidata.check_query.sparql import execute, sparql_context
+from scribe_data.wikidata.sparql_options import (
+    add_sparql_cache_arguments,
+    configure_sparql_cache_from_args,
+)
 
 EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
@@ -285,7 +289,10 @@ def main(argv: list[str] | None = None) -> int:
         help="increase output verbosity",
     )
 
+    add_sparql_cache_arguments(cli)
+
     args = cli.parse_args(argv)
+    configure_sparql_cache_from_args(args)
 
     endpoint = args.endpoint
 
@@ -12,9 +12,10 @@ import SPARQLWrapper as SPARQL
 from SPARQLWrapper import SPARQLExceptions
 
 from scribe_data.wikidata.check_query.query import QueryExecutionException, QueryFile
+from scribe_data.wikidata.sparql_cache import CachingSPARQLWrapper
 
 
-def sparql_context(url: str) -> SPARQL.SPARQLWrapper:
+def sparql_context(url: str) -> CachingSPARQLWrapper:
     """
     Configure a SPARQL context.
 
@@ -27,10 +28,10 @@ def sparql_context(url: str) -> SPARQL.SPARQLWrapper:
 
     Returns
     -------
-    SPARQLWrapper
-        The context.
+    CachingSPARQLWrapper
+        The context, which shares the SPARQL response cache.
     """
-    context = SPARQL.SPARQLWrapper(url)
+    context = CachingSPARQLWrapper(url)
     context.setReturnFormat(SPARQL.JSON)
     context.setMethod(SPARQL.POST)
 
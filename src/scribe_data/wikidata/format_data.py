@@ -4,8 +4,8 @@ Formats the data queried from Wikidata using query_verbs.sparql.
 """
 
 import argparse
-import collections
 from pathlib import Path
+from typing import Iterable, Mapping
 
 from rich import print as rprint
 
@@ -14,9 +14,48 @@ from scribe_data.utils import (
     load_queried_data,
     remove_queried_data,
 )
+from scribe_data.wikidata.lexeme_merge import LexemeMerger
+from scribe_data.wikidata.lexeme_table import LexemeTableWriter
 
 
-def format_data(dir_path: Path, language: str, data_type: str) -> None:
+def merge_lexeme_rows(
+    rows: Iterable[dict], data_formatted: LexemeMerger | None = None
+) -> LexemeMerger:
+    """
+    Merge the result rows of each lexeme into a single entry.
+
+    Rows are consumed one at a time, so a stream of query results only needs memory
+    for the merged entries rather than for every returned row.
+
+    Parameters
+    ----------
+    rows : Iterable[dict]
+        The result rows of a query with one value per variable.
+
+    data_formatted : LexemeMerger, optional
+        Entries from earlier rows, e.g. other parts of a split query, to merge into.
+
+    Returns
+    -------
+    LexemeMerger
+        Entries keyed by lexeme ID, with differing values of a field joined by " | ".
+    """
+    if data_formatted is None:
+        data_formatted = LexemeMerger()
+
+    for data_vals in rows:
+        data_formatted.add_row(data_vals)
+
+    return data_formatted
+
+
+def format_data(
+    dir_path: Path,
+    language: str,
+    data_type: str,
+    data_formatted: Mapping[str, dict] | None = None,
+    write_output: LexemeTableWriter | None = None,
+) -> None:
     """
     Format data queried from the Wikidata Query Service.
 
@@ -31,76 +70,41 @@ def format_data(dir_path: Path, language: str, data_type: str) -> None:
     data_type : str
         The type of data being loaded (e.g. 'nouns', 'verbs').
 
+    data_formatted : Mapping[str, dict], optional
+        The queried rows merged with ``merge_lexeme_rows``. Loaded and merged from the
+        ``{data_type}.json`` file in ``dir_path`` if not passed, as when this module is
+        run as a script.
+
+    write_output : LexemeTableWriter, optional
+        Writes the formatted data to another output type, e.g. SQLite, in place of
+        exporting it to JSON.
+
     Returns
     -------
     None
         Saves and formatted data file for the given language and data type.
     """
-    data_list, data_path = load_queried_data(
-        dir_path=dir_path, language=language, data_type=data_type
-    )
+    if data_formatted is None:
+        data_list, _ = load_queried_data(
+            dir_path=dir_path, language=language, data_type=data_type
+        )
+        data_formatted = merge_lexeme_rows(data_list)
 
-    data_formatted = {}
-    has_multiple_forms = False
-
-    for data_vals in data_list:
-        lexeme_id = data_vals["lexemeID"]
-
-        # Initialize a new entry if this lexeme hasn't been seen yet.
-        if lexeme_id not in data_formatted:
-            data_formatted[lexeme_id] = {
-                "lastModified": data_vals["lastModified"],
-                **{
-                    key: value
-                    for key, value in data_vals.items()
-                    if key not in ["lexemeID", "lastModified"]
-                },
-            }
-
-        else:
-            # Merge fields for an existing lexeme.
-            for field, value in data_vals.items():
-                if field in ["lexemeID", "lastModified"]:
-                    continue
-
-                if value:  # Only process non-empty values.
-                    if (
-                        field in data_formatted[lexeme_id]
-                        and data_formatted[lexeme_id][field]
-                    ):
-                        # Merge field values into a comma-separated string using a set for uniqueness.
-                        existing_values = set(
-                            data_formatted[lexeme_id][field].split(" | ")
-                        )
-                        existing_values.add(value)
-                        data_formatted[lexeme_id][field] = " | ".join(
-                            sorted(existing_values)
-                        )
-
-                    else:
-                        data_formatted[lexeme_id][field] = value
-
-    # Convert the dictionary to an ordered dictionary for consistent output.
-    data_formatted = collections.OrderedDict(sorted(data_formatted.items()))
-
-    # Check if any values contain pipe separator before exporting.
-    for lexeme_data in data_formatted.values():
-        for value in lexeme_data.values():
-            if isinstance(value, str) and " | " in value:
-                has_multiple_forms = True
-                break
-
-        if has_multiple_forms:
-            break
-
-    export_formatted_data(
-        dir_path=dir_path,
-        formatted_data=data_formatted,
-        language=language,
-        data_type=data_type,
-    )
+    if not isinstance(data_formatted, LexemeMerger):
+        data_formatted = LexemeMerger(data_formatted)
+
+    if write_output is not None:
+        write_output(language, data_type, data_formatted.table())
+
+    else:
+        export_formatted_data(
+            dir_path=dir_path,
+            formatted_data=data_formatted.entries(),
+            language=language,
+            data_type=data_type,
+        )
 
-    if has_multiple_forms:
+    if data_formatted.has_multiple_forms:
         rprint(
             "[bold yellow]Note: Multiple versions of forms have been returned. These have been combined with '|' in the resulting data fields.[/bold yellow]"
         )
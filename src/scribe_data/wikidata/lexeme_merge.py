@@ -0,0 +1,271 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Merging of the forms of each lexeme into one entry for WDQS results and lexeme dumps.
+"""
+
+from collections.abc import MutableMapping
+from typing import Iterable, Iterator, Mapping, cast
+
+from scribe_data.wikidata.lexeme_table import LexemeTable
+
+# Joins the differing values of a field of a lexeme in exported data.
+MULTIPLE_VALUES_SEPARATOR = " | "
+
+# Variables of a WDQS result row that identify the lexeme rather than being a form.
+_ROW_ID_FIELDS = ("lexemeID", "lastModified")
+
+
+class LexemeMerger(MutableMapping):
+    """
+    Merge the values of each field of each lexeme, emitting entries sorted by lexeme ID.
+
+    A field holds its value as a string until a differing value is added, and then holds
+    a set of its values, so values are never split, sorted and joined again as each
+    further value is merged. Whether any field has several values is tracked as values
+    are added. Looking up a lexeme returns its entry with the values of each field
+    sorted and joined by " | ", which is a copy, so entries are changed by adding or
+    setting them rather than by editing a returned entry.
+
+    Parameters
+    ----------
+    entries : Mapping[str, Mapping[str, str]], optional
+        Exported entries keyed by lexeme ID to merge further values into, such as the
+        saved results of an earlier run.
+    """
+
+    def __init__(self, entries: Mapping[str, Mapping[str, str]] | None = None) -> None:
+        """
+        Create a merger, starting from exported entries if passed.
+
+        Parameters
+        ----------
+        entries : Mapping[str, Mapping[str, str]], optional
+            Exported entries keyed by lexeme ID to merge further values into, such as
+            the saved results of an earlier run.
+        """
+        self._entries: dict[str, dict[str, str | set[str]]] = {}
+        # Lexemes with a field that has several values, as only they need joining.
+        self._multiple_valued: set[str] = set()
+        self.has_multiple_forms = False
+        if entries:
+            self.update(entries)
+
+    def __getitem__(self, lexeme_id: str) -> dict[str, str]:
+        """
+        Return the entry of a lexeme with the values of each field joined.
+
+        Parameters
+        ----------
+        lexeme_id : str
+            The ID of the lexeme.
+
+        Returns
+        -------
+        dict[str, str]
+            The entry of the lexeme.
+        """
+        fields = self._entries[lexeme_id]
+        if lexeme_id not in self._multiple_valued:
+            # Only the fields of lexemes with several values of a field hold sets.
+            return cast(dict[str, str], dict(fields))
+
+        return {
+            field: MULTIPLE_VALUES_SEPARATOR.join(sorted(value))
+            if isinstance(value, set)
+            else value
+            for field, value in fields.items()
+        }
+
+    def __setitem__(self, lexeme_id: str, entry: Mapping[str, str]) -> None:
+        """
+        Set the entry of a lexeme from an exported entry.
+
+        Parameters
+        ----------
+        lexeme_id : str
+            The ID of the lexeme.
+
+        entry : Mapping[str, str]
+            The entry, with several values of a field joined by " | ".
+        """
+        self._multiple_valued.discard(lexeme_id)
+        fields: dict[str, str | set[str]] = {}
+        for field, value in entry.items():
+            if isinstance(value, str) and MULTIPLE_VALUES_SEPARATOR in value:
+                self.has_multiple_forms = True
+                self._multiple_valued.add(lexeme_id)
+                fields[field] = set(value.split(MULTIPLE_VALUES_SEPARATOR))
+
+            else:
+                fields[field] = value
+
+        self._entries[lexeme_id] = fields
+
+    def __delitem__(self, lexeme_id: str) -> None:
+        """
+        Remove the entry of a lexeme.
+
+        Parameters
+        ----------
+        lexeme_id : str
+            The ID of the lexeme.
+        """
+        del self._entries[lexeme_id]
+        self._multiple_valued.discard(lexeme_id)
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the lexeme IDs in the order that they were added.
+
+        Returns
+        -------
+        Iterator[str]
+            The lexeme IDs.
+        """
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        """
+        Return the number of lexemes.
+
+        Returns
+        -------
+        int
+            The number of lexemes.
+        """
+        return len(self._entries)
+
+    def _add_value(
+        self, lexeme_id: str, fields: dict[str, str | set[str]], field: str, value: str
+    ) -> None:
+        """
+        Add a value to a field of an entry.
+
+        Parameters
+        ----------
+        lexeme_id : str
+            The ID of the lexeme.
+
+        fields : dict[str, str | set[str]]
+            The fields of the entry.
+
+        field : str
+            The field to add the value to.
+
+        value : str
+            The value, which is ignored if empty.
+        """
+        if not value:
+            return
+
+        existing = fields.get(field)
+        if not existing:
+            fields[field] = value
+
+        elif isinstance(existing, set):
+            existing.add(value)
+
+        elif existing != value:
+            fields[field] = {existing, value}
+            self._multiple_valued.add(lexeme_id)
+            self.has_multiple_forms = True
+
+    def add(
+        self,
+        lexeme_id: str,
+        last_modified: str,
+        forms: Iterable[tuple[str, str]] = (),
+    ) -> None:
+        """
+        Add forms of a lexeme, creating its entry if the lexeme is new.
+
+        Parameters
+        ----------
+        lexeme_id : str
+            The ID of the lexeme.
+
+        last_modified : str
+            When the lexeme was last modified, which is kept from its first forms.
+
+        forms : Iterable[tuple[str, str]], optional
+            The name and value of each form, where empty values are ignored.
+        """
+        fields: dict[str, str | set[str]] | None = self._entries.get(lexeme_id)
+        if fields is None:
+            fields = self._entries[lexeme_id] = {"lastModified": last_modified}
+
+        for field, value in forms:
+            self._add_value(lexeme_id, fields, field, value)
+
+    def add_row(self, row: Mapping[str, str]) -> None:
+        """
+        Add a WDQS result row, which has one value for each variable of the query.
+
+        The first row of a lexeme sets the fields of its entry, including those that are
+        empty, with further rows only adding values that aren't empty.
+
+        Parameters
+        ----------
+        row : Mapping[str, str]
+            The result row, including the lexemeID and lastModified of the lexeme.
+        """
+        lexeme_id = row["lexemeID"]
+        fields: dict[str, str | set[str]] | None = self._entries.get(lexeme_id)
+        if fields is None:
+            self._entries[lexeme_id] = {
+                "lastModified": row["lastModified"],
+                **{k: v for k, v in row.items() if k not in _ROW_ID_FIELDS},
+            }
+            return
+
+        # The merge of _add_value is inlined as this runs for every field of every row.
+        for field, value in row.items():
+            if not value or field in _ROW_ID_FIELDS:
+                continue
+
+            existing = fields.get(field)
+            if existing == value:
+                continue
+
+            if not existing:
+                fields[field] = value
+
+            elif isinstance(existing, set):
+                existing.add(value)
+
+            else:
+                fields[field] = {existing, value}
+                self._multiple_valued.add(lexeme_id)
+                self.has_multiple_forms = True
+
+    def entries(self) -> dict[str, dict[str, str]]:
+        """
+        Return every entry sorted by lexeme ID, as they are exported.
+
+        Returns
+        -------
+        dict[str, dict[str, str]]
+            Entries keyed by lexeme ID, with differing values of a field joined by " | ".
+        """
+        return {lexeme_id: self[lexeme_id] for lexeme_id in sorted(self._entries)}
+
+    def table(self, strings: dict[str, str] | None = None) -> LexemeTable:
+        """
+        Return every entry sorted by lexeme ID as a columnar table.
+
+        Parameters
+        ----------
+        strings : dict[str, str], optional
+            A pool of strings to intern values in, e.g. one shared by the tables of a
+            language.
+
+        Returns
+        -------
+        LexemeTable
+            The merged forms as a column of values for each form.
+        """
+        table = LexemeTable(strings)
+        for lexeme_id in sorted(self._entries):
+            table.append(lexeme_id, self[lexeme_id])
+
+        return table
@@ -0,0 +1,188 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+A columnar table of the forms of lexemes that queries, dumps and converters share.
+"""
+
+from pathlib import Path
+from typing import Callable, Iterator, Mapping
+
+import orjson
+
+
+class LexemeTable:
+    """
+    The lexemes of a language and data type as a column of values for each form.
+
+    Lexeme IDs are held in a list and each form in a list of the same length, with None
+    for lexemes that don't have the form. Values are interned in a pool of strings that
+    tables can share, so values that are common to many lexemes, such as genders or
+    modification dates, are only held once.
+
+    Parameters
+    ----------
+    strings : dict[str, str], optional
+        A pool of strings to intern values in, e.g. one shared by the tables of a
+        language.
+    """
+
+    def __init__(self, strings: dict[str, str] | None = None) -> None:
+        """
+        Create an empty table.
+
+        Parameters
+        ----------
+        strings : dict[str, str], optional
+            A pool of strings to intern values in, e.g. one shared by the tables of a
+            language.
+        """
+        self.lexeme_ids: list[str] = []
+        self.columns: dict[str, list[str | None]] = {}
+        self.strings = {} if strings is None else strings
+
+    def __len__(self) -> int:
+        """
+        Return the number of lexemes.
+
+        Returns
+        -------
+        int
+            The number of lexemes.
+        """
+        return len(self.lexeme_ids)
+
+    def _intern(self, value: str) -> str:
+        """
+        Return the pooled string equal to a value, adding the value if it's new.
+
+        Parameters
+        ----------
+        value : str
+            The value to intern.
+
+        Returns
+        -------
+        str
+            The pooled string, or the value itself if it isn't a string.
+        """
+        if not isinstance(value, str):
+            return value
+
+        return self.strings.setdefault(value, value)
+
+    def append(self, lexeme_id: str, entry: Mapping[str, str]) -> None:
+        """
+        Add a lexeme as a row of the table.
+
+        Parameters
+        ----------
+        lexeme_id : str
+            The ID of the lexeme.
+
+        entry : Mapping[str, str]
+            The value of each form of the lexeme.
+        """
+        row = len(self.lexeme_ids)
+        self.lexeme_ids.append(lexeme_id)
+        for name, value in entry.items():
+            if (column := self.columns.get(name)) is None:
+                column = self.columns[self._intern(name)] = [None] * row
+
+            column.append(self._intern(value))
+
+        # Fill the forms that the lexeme doesn't have.
+        if len(entry) < len(self.columns):
+            for column in self.columns.values():
+                if len(column) == row:
+                    column.append(None)
+
+    @classmethod
+    def from_entries(
+        cls,
+        entries: Mapping[str, Mapping[str, str]],
+        strings: dict[str, str] | None = None,
+    ) -> "LexemeTable":
+        """
+        Build a table from entries keyed by lexeme ID, as they are exported to JSON.
+
+        Parameters
+        ----------
+        entries : Mapping[str, Mapping[str, str]]
+            The value of each form keyed by lexeme ID.
+
+        strings : dict[str, str], optional
+            A pool of strings to intern values in.
+
+        Returns
+        -------
+        LexemeTable
+            The lexemes in the order of the entries.
+        """
+        table = cls(strings)
+        for lexeme_id, entry in entries.items():
+            table.append(lexeme_id, entry)
+
+        return table
+
+    @classmethod
+    def read_json(
+        cls, path: str | Path, strings: dict[str, str] | None = None
+    ) -> "LexemeTable":
+        """
+        Read a table from an exported JSON file of a language and data type.
+
+        Parameters
+        ----------
+        path : str | Path
+            The JSON file with entries keyed by lexeme ID.
+
+        strings : dict[str, str], optional
+            A pool of strings to intern values in.
+
+        Returns
+        -------
+        LexemeTable
+            The lexemes in the order of the file.
+        """
+        return cls.from_entries(orjson.loads(Path(path).read_bytes()), strings)
+
+    def rows(self, columns: list[str]) -> Iterator[tuple[str, *tuple[str | None, ...]]]:
+        """
+        Iterate over the lexemes as a lexeme ID followed by the value of each column.
+
+        Parameters
+        ----------
+        columns : list[str]
+            The forms to return the values of, with None for a form not in the table.
+
+        Returns
+        -------
+        Iterator[tuple[str, *tuple[str | None, ...]]]
+            A row for each lexeme.
+        """
+        missing = [None] * len(self.lexeme_ids)
+        return zip(
+            self.lexeme_ids, *(self.columns.get(name, missing) for name in columns)
+        )
+
+    def entries(self) -> dict[str, dict[str, str]]:
+        """
+        Return the lexemes as entries keyed by lexeme ID, as they are exported to JSON.
+
+        Returns
+        -------
+        dict[str, dict[str, str]]
+            The forms that each lexeme has keyed by lexeme ID.
+        """
+        names = list(self.columns)
+        return {
+            lexeme_id: {
+                name: value
+                for name, value in zip(names, values, strict=True)
+                if value is not None
+            }
+            for lexeme_id, *values in self.rows(names)
+        }
+
+
+# Writes the table of a language and data type, e.g. to a CSV file or SQLite database.
+LexemeTableWriter = Callable[[str, str, LexemeTable], None]
@@ -21,10 +21,13 @@ from scribe_data.utils import (
     check_qid_is_language,
     data_type_metadata,
     get_language_iso_code,
-    language_metadata,
+    language_registry,
     lexeme_form_metadata,
     wikidata_qids_pids,
+    write_json,
 )
+from scribe_data.wikidata.lexeme_merge import LexemeMerger
+from scribe_data.wikidata.lexeme_table import LexemeTableWriter
 
 
 class LexemeProcessor:
@@ -82,9 +85,9 @@ class LexemeProcessor:
         self.iso_to_name = self._build_iso_mapping()
         self.valid_iso_codes = set(self.iso_to_name.keys())
 
-        # Separate data structures.
-        self.forms_index: dict[str, dict[str, dict[str, Any]]] = defaultdict(
-            lambda: defaultdict(list)
+        # Merged forms of each language ISO and data type.
+        self.forms_index: dict[tuple[str, str], LexemeMerger] = defaultdict(
+            LexemeMerger
         )
 
         # Stats.
@@ -115,7 +118,7 @@ class LexemeProcessor:
 
     def _build_iso_mapping(self) -> dict:
         """
-        Build mapping of ISO codes to language names based on language_metadata.
+        Build mapping of ISO codes to language names based on the language registry.
 
         Returns
         -------
@@ -126,24 +129,11 @@ class LexemeProcessor:
         -----
         If self.target_lang is non-null, only include those iso codes.
         """
-        iso_mapping = {}
-        for lang_name, data in language_metadata.items():
-            # Handle sub-languages if they exist.
-            if "sub_languages" in data:
-                for sub_lang, sub_data in data["sub_languages"].items():
-                    if self.target_lang and sub_lang not in self.target_lang:
-                        continue
-
-                    if iso_code := sub_data.get("iso"):
-                        iso_mapping[iso_code] = sub_lang
-                continue  # skip main language if it only has sub-languages
-
-            # Handle main languages.
-            if self.target_lang and lang_name not in self.target_lang:
-                continue
-
-            if iso_code := data.get("iso"):
-                iso_mapping[iso_code] = lang_name
+        iso_mapping = {
+            iso_code: lang_name
+            for iso_code, lang_name in language_registry.iso_to_name.items()
+            if not self.target_lang or lang_name in self.target_lang
+        }
 
         for language in self.target_lang:
             if language.lower().startswith("q") and language[1:].isdigit():
@@ -234,21 +224,14 @@ class LexemeProcessor:
 
         Notes
         -----
-        Uses pipe-separated strings for form values to maintain uniqueness.
+        Forms are merged with a ``LexemeMerger`` for the language and data type, which
+        joins differing values of a form with " | ".
         """
-        lexeme_id = lexeme["id"]
         language_qid = lexeme["language"]
         lexicalCategory = lexeme["lexicalCategory"]
-        lastModified = lexeme["modified"]
         gender_pid = wikidata_qids_pids.get("gender")
 
-        forms_data = {}
-
-        # Pre-compute form data structure
-        forms_dict = forms_data.setdefault(lexeme_id, {})
-        lang_dict = forms_dict.setdefault(lang_iso, {})
-        cat_dict = lang_dict.setdefault(dt_name, {})
-
+        forms: list[tuple[str, str]] = []
         for form in lexeme.get("forms", []):
             if not (representations := form.get("representations")):
                 continue
@@ -286,64 +269,22 @@ class LexemeProcessor:
                             self._form_label_cache[features_tuple] = form_label_result
 
                         if form_name := self._form_label_cache[features_tuple]:
-                            # If this form name already exists, merge values using comma separation.
-                            if form_name in cat_dict:
-                                existing_values = set(cat_dict[form_name].split(" | "))
-                                existing_values.add(form_value)
-                                cat_dict[form_name] = " | ".join(
-                                    sorted(existing_values)
-                                )
-                            else:
-                                cat_dict[form_name] = form_value
+                            forms.append((form_name, form_value))
 
         # Add gender feature if gender property exists in claims.
         if gender_pid and "claims" in lexeme and gender_pid in lexeme.get("claims", {}):
-            if claims := lexeme["claims"][gender_pid]:
-                values = []
-                for gender in claims:
-                    if gender.get("mainsnak", {}).get("snaktype") == "value":
-                        gender_id = gender["mainsnak"]["datavalue"]["value"]["id"]
-                        if gender_id in self._feature_label_cache:
-                            _, gender_label = self._feature_label_cache[gender_id]
-                            values.append(gender_label)
-
-                if values:
-                    cat_dict["gender"] = " | ".join(sorted(values))
-
-        if forms_data:
-            for lexeme_id, new_lang_data in forms_data.items():
-                if lexeme_id not in self.forms_index:
-                    self.forms_index[lexeme_id] = {}
-
-                for lang, new_cat_data in new_lang_data.items():
-                    if lang not in self.forms_index[lexeme_id]:
-                        self.forms_index[lexeme_id][lang] = {}
-
-                    for cat, new_form_data in new_cat_data.items():
-                        # If category already exists, merge the form data.
-                        if cat in self.forms_index[lexeme_id][lang]:
-                            existing_data = self.forms_index[lexeme_id][lang][cat]
-
-                            # Merge form values.
-                            for form_name, form_value in new_form_data.items():
-                                if form_name in existing_data:
-                                    existing_values = set(
-                                        existing_data[form_name].split(" | ")
-                                    )
-                                    existing_values.add(form_value)
-                                    existing_data[form_name] = " | ".join(
-                                        sorted(existing_values)
-                                    )
-                                else:
-                                    existing_data[form_name] = form_value
-                        else:
-                            # Store new forms and modified date.
-                            self.forms_index[lexeme_id][lang][cat] = {
-                                "lastModified": lastModified,
-                                **new_form_data,
-                            }
-
-            self.forms_counts[lang_iso][dt_name] += len(forms_data)
+            for gender in lexeme["claims"][gender_pid] or []:
+                if gender.get("mainsnak", {}).get("snaktype") == "value":
+                    gender_id = gender["mainsnak"]["datavalue"]["value"]["id"]
+                    if gender_id in self._feature_label_cache:
+                        _, gender_label = self._feature_label_cache[gender_id]
+                        forms.append(("gender", gender_label))
+
+        # Differing values of a form are merged into a " | " separated string.
+        self.forms_index[(lang_iso, dt_name)].add(
+            lexeme["id"], lexeme["modified"], forms
+        )
+        self.forms_counts[lang_iso][dt_name] += 1
 
     def _process_totals(self, lexeme: dict, lang_iso: str, dt_name: str) -> None:
         """
@@ -481,7 +422,7 @@ class LexemeProcessor:
 
         # Update stats.
         self.stats["processing_time"] = time.time() - start_time
-        self.stats["unique_words"] = len(self.forms_index)
+        self.stats["unique_words"] = len(set().union(*self.forms_index.values()))
 
         # Print summary if "total" was requested.
         if "total" in self.parse_type:
@@ -528,6 +469,7 @@ class LexemeProcessor:
         filepath: str,
         language_iso: str = "",
         data_type: str = "",
+        write_output: LexemeTableWriter | None = None,
     ) -> None:
         """
         Export grammatical forms to a JSON file with readable feature labels.
@@ -543,6 +485,10 @@ class LexemeProcessor:
         data_type : str, optional
             Category of forms to export (e.g., "nouns", "verbs"). If None, exports all types.
 
+        write_output : LexemeTableWriter, optional
+            Writes the forms to another output type, e.g. SQLite, in place of exporting
+            them to JSON.
+
         Notes
         -----
         Creates a directory structure: <filepath>/<language_name>/<data_type>.json
@@ -553,42 +499,21 @@ class LexemeProcessor:
                 print(f"Warning: ISO {language_iso} unknown, skipping forms export...")
                 return
 
-            filtered = {}
-            has_multiple_forms = False
-
-            # Process each lexeme in the forms_index.
-            for lexeme_id, lang_data in self.forms_index.items():
-                # Check if this lexeme has data for our target language.
-                if language_iso in lang_data and data_type in lang_data[language_iso]:
-                    # Get the form data for this language and data type.
-                    form_data = lang_data[language_iso][data_type]
-                    filtered[lexeme_id] = form_data
-
-                    # Check if any values contain pipe separator
-                    if not has_multiple_forms:
-                        for form_values in form_data.values():
-                            if isinstance(form_values, str) and " | " in form_values:
-                                has_multiple_forms = True
-                                break
-
+            merged = self.forms_index.get((language_iso, data_type), LexemeMerger())
             lang_name = self.iso_to_name[language_iso]
 
-            if not filtered:
+            if not merged:
                 print(
                     f"No forms found for {lang_name.capitalize()} {data_type}, skipping export..."
                 )
                 return
 
+            if write_output is not None:
+                write_output(lang_name, data_type, merged.table())
+                return
+
             # Create the output directory structure.
-            main_lang = None
-            for lang, data in language_metadata.items():
-                if "sub_languages" in data:
-                    for sub_lang, sub_data in data["sub_languages"].items():
-                        if sub_lang == lang_name:
-                            main_lang = lang
-                            break
-                    if main_lang:
-                        break
+            main_lang = language_registry.parents.get(lang_name)
 
             # If it's a sub-language, create path like: parent/chinese/mandarin/.
             if main_lang:
@@ -601,14 +526,13 @@ class LexemeProcessor:
 
             # Save the filtered data.
             try:
-                with open(output_file, "wb") as f:
-                    f.write(orjson.dumps(filtered, option=orjson.OPT_INDENT_2))
+                write_json(output_file, merged.entries())
 
                 print(
                     f"Successfully exported forms for {lang_name.capitalize()} {data_type} to {output_file}"
                 )
 
-                if has_multiple_forms:
+                if merged.has_multiple_forms:
                     rprint(
                         "[bold yellow]Note: Multiple versions of forms have been returned. These have been combined with '|' in the resulting data fields.[/bold yellow]"
                     )
@@ -622,6 +546,75 @@ class LexemeProcessor:
 # MARK: Parse Dump
 
 
+def _language_list(languages: str | list[str]) -> list[str]:
+    """
+    Return the requested languages as a list.
+
+    Parameters
+    ----------
+    languages : str or list of str
+        A language, which is none if empty, or a list of languages.
+
+    Returns
+    -------
+    list[str]
+        The requested languages.
+    """
+    if isinstance(languages, str):
+        return [languages] if languages else []
+
+    return languages
+
+
+def _forms_to_export(
+    languages: list[str],
+    data_types: list[str],
+    output_dir: Path,
+    overwrite_all: bool = False,
+) -> tuple[list[str], list[str]]:
+    """
+    Find the languages and data types whose JSON exports of forms are to be written.
+
+    Parameters
+    ----------
+    languages : list of str
+        The requested languages.
+
+    data_types : list of str
+        The requested data types.
+
+    output_dir : Path
+        The directory of the JSON exports.
+
+    overwrite_all : bool, default=False
+        If True, automatically overwrite existing files without prompting.
+
+    Returns
+    -------
+    tuple[list[str], list[str]]
+        The languages and data types with at least one export that isn't skipped.
+    """
+    languages_to_process = []
+    data_types_to_process = set()
+
+    for lang in languages:
+        # Sub-languages are exported within the directory of their main language.
+        main_lang = language_registry.parents.get(lang)
+        lang_dir = f"{main_lang}/{lang}" if main_lang else lang
+
+        for data_type in data_types:
+            index_path = output_dir / lang_dir / f"{data_type}.json"
+            if check_index_exists(index_path, overwrite_all):
+                print(f"Skipping {lang_dir}/{data_type}.json - already exists")
+                continue
+
+            data_types_to_process.add(data_type)
+            if lang not in languages_to_process:
+                languages_to_process.append(lang)
+
+    return languages_to_process, list(data_types_to_process)
+
+
 def parse_dump(
     languages: str | list[str] = "",
     parse_type: list[str] = [""],
@@ -629,6 +622,7 @@ def parse_dump(
     file_path: Path = Path("latest-lexemes.json.bz2"),
     output_dir: Path | None = DEFAULT_WIKIDATA_DUMP_EXPORT_DIR,
     overwrite_all: bool = False,
+    write_output: LexemeTableWriter | None = None,
 ) -> None:
     """
     Parse a Wikidata lexeme dump file and extract linguistic data.
@@ -656,6 +650,10 @@ def parse_dump(
     overwrite_all : bool, default=False
         If True, automatically overwrite existing files without prompting.
 
+    write_output : LexemeTableWriter, optional
+        Writes the forms of each language and data type to another output type, e.g.
+        SQLite, in place of exporting them to JSON.
+
     Notes
     -----
     The function processes a Wikidata lexeme dump and extracts linguistic data based on
@@ -674,54 +672,12 @@ def parse_dump(
     data_types = data_types or []
 
     if "total" not in parse_type:
-        # For forms, check each language/data_type combination.
-        if "form" in parse_type:
-            languages_to_process = []
-            data_types_to_process = set()
-
-            for lang in languages:
-                needs_processing = False
-                # Check if this is a sub-language
-                main_lang = None
-                for lang_name, data in language_metadata.items():
-                    if "sub_languages" in data:
-                        for sub_lang in data["sub_languages"]:
-                            if sub_lang == lang:
-                                main_lang = lang_name
-                                break
-
-                    if main_lang:
-                        break
-
-                for data_type in data_types:
-                    # Create appropriate path based on whether it's a sub-language.
-                    if main_lang:
-                        index_path = (
-                            Path(output_dir) / main_lang / lang / f"{data_type}.json"
-                        )
-
-                    else:
-                        index_path = Path(output_dir) / lang / f"{data_type}.json"
-
-                    if not check_index_exists(index_path, overwrite_all):
-                        needs_processing = True
-                        data_types_to_process.add(data_type)
-
-                    else:
-                        # Update path display in skip message.
-                        skip_path = (
-                            f"{main_lang}/{lang}/{data_type}.json"
-                            if main_lang
-                            else f"{lang}/{data_type}.json"
-                        )
-                        print(f"Skipping {skip_path} - already exists")
-
-                if needs_processing:
-                    languages_to_process.append(lang)
-
-            # Update both lists.
-            languages = languages_to_process
-            data_types = list(data_types_to_process)
+        # For forms, check each language/data_type combination. Writers of other output
+        # types check for existing data themselves.
+        if "form" in parse_type and write_output is None:
+            languages, data_types = _forms_to_export(
+                _language_list(languages), data_types, Path(output_dir), overwrite_all
+            )
 
         if not data_types or not languages:
             print("No data types or languages provided. Nothing to process.")
@@ -739,12 +695,13 @@ def parse_dump(
         # For each data_type, we create a separate file, e.g. nouns.json.
         for dt in data_types:
             index_path = Path(output_dir) / f"{dt}.json"
-            iso_codes = set()
-            for word_data in processor.forms_index.values():
-                iso_codes.update(word_data.keys())
+            iso_codes = {iso_code for iso_code, _ in processor.forms_index}
 
             for iso_code in iso_codes:
                 if iso_code in processor.iso_to_name:
                     processor.export_forms_json(
-                        filepath=str(index_path), language_iso=iso_code, data_type=dt
+                        filepath=str(index_path),
+                        language_iso=iso_code,
+                        data_type=dt,
+                        write_output=write_output,
                     )
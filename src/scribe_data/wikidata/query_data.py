@@ -3,15 +3,17 @@
 Updates data for Scribe by running all or desired WDQS queries and formatting scripts.
 """
 
-import json
 import os
 import re
 import subprocess
 import sys
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Any, cast
-from urllib.error import HTTPError
+from typing import Any, Iterable, Iterator
 
+from SPARQLWrapper import JSON
+from SPARQLWrapper.Wrapper import QueryResult
 from tqdm.auto import tqdm
 
 from scribe_data.utils import (
@@ -21,6 +23,18 @@ from scribe_data.utils import (
     language_metadata,
     list_all_languages,
 )
+from scribe_data.wikidata.format_data import format_data, merge_lexeme_rows
+from scribe_data.wikidata.lexeme_table import LexemeTableWriter
+from scribe_data.wikidata.query_scheduler import (
+    DEFAULT_RETRY_BACKOFF_SECONDS,
+    QueryGroup,
+    QueryScheduler,
+    ShardJob,
+)
+from scribe_data.wikidata.sparql_cache import discard_cached_response
+from scribe_data.wikidata.sparql_options import DEFAULT_MAX_CONCURRENCY
+from scribe_data.wikidata.sparql_results import iter_result_rows
+from scribe_data.wikidata.wdqs_executor import WDQSExecutor
 from scribe_data.wikidata.wikidata_utils import sparql
 
 
@@ -28,6 +42,9 @@ def execute_formatting_script(output_dir: Path, language: str, data_type: str) -
     """
     Execute a formatting script given a filepath and output directory for the process.
 
+    ``query_data`` formats results in process with ``format_data``. This runs the same
+    formatting in a separate interpreter on a ``{data_type}.json`` file of queried rows.
+
     Parameters
     ----------
     output_dir : Path
@@ -80,12 +97,454 @@ def execute_formatting_script(output_dir: Path, language: str, data_type: str) -
         print(f"Error: The formatting script failed with exit status {e.returncode}.")
 
 
+def _query_files(query: Path, max_query_interval: int) -> list[Path]:
+    """
+    Return the files that make up a query, including all parts of a split query.
+
+    Parameters
+    ----------
+    query : Path
+        The query path with any ``_1``, ``_2``... part suffix removed.
+
+    max_query_interval : int
+        The largest part number of any split query.
+
+    Returns
+    -------
+    list[Path]
+        The query file, or each part of the query in order.
+    """
+    if query.exists():
+        return [query]
+
+    parts = (
+        query.with_name(query.name.replace(".sparql", f"_{i}.sparql"))
+        for i in range(1, max_query_interval + 1)
+    )
+    return [part for part in parts if part.exists()]
+
+
+def _prefetch_query_results(
+    group: QueryGroup,
+    groups: list[QueryGroup],
+    prefetched: dict[Path, Any],
+    max_concurrency: int,
+    result_format: str = JSON,
+) -> None:
+    """
+    Run the next query files of a group and the groups after it concurrently.
+
+    Only as many query files as are sent to WDQS at once are run ahead so that few
+    results are held before they are merged, and files whose results were saved by an
+    earlier run are skipped.
+
+    Parameters
+    ----------
+    group : QueryGroup
+        The language and data type whose query files are about to be run.
+
+    groups : list[QueryGroup]
+        Every group in the order that they are run.
+
+    prefetched : dict[Path, Any]
+        Results that have not been used yet, which the new results are added to.
+
+    max_concurrency : int
+        Number of queries to send to WDQS at once.
+
+    result_format : str, default=JSON
+        The format to request results in: one of "json", "tsv" or "csv".
+    """
+    if max_concurrency <= 1:
+        return
+
+    start = next(i for i, g in enumerate(groups) if g is group)
+    pending = (
+        job.path
+        for g in groups[start:]
+        for job in g.shards
+        if job.state == "pending" and job.path not in prefetched
+    )
+    queries = {
+        path: path.read_text(encoding="utf-8")
+        for path in islice(pending, max_concurrency)
+    }
+    prefetched.update(_query_executor(max_concurrency, result_format).run(queries))
+
+
+def _query_executor(max_concurrency: int, result_format: str = JSON) -> WDQSExecutor:
+    """
+    Create an executor that reads the rows of each response as soon as it arrives.
+
+    Parameters
+    ----------
+    max_concurrency : int
+        Number of queries to send to WDQS at once.
+
+    result_format : str, default=JSON
+        The format to request results in: one of "json", "tsv" or "csv".
+
+    Returns
+    -------
+    WDQSExecutor
+        An executor for the endpoint and User-Agent of the shared client.
+    """
+    return WDQSExecutor(
+        endpoint=sparql.endpoint,
+        max_concurrency=max_concurrency,
+        agent=sparql.agent,
+        reader=partial(_read_result_rows, result_format=result_format),
+        return_format=result_format,
+    )
+
+
+def _fan_out_shards(
+    group: QueryGroup,
+    prefetched: dict[Path, Any],
+    shard_concurrency: int,
+    result_format: str = JSON,
+) -> None:
+    """
+    Run the parts of a split query concurrently before their rows are merged.
+
+    The rows of each part are held separately in ``prefetched`` so that the scheduler
+    still merges them in part order. Parts that fail are run again by the scheduler.
+
+    Parameters
+    ----------
+    group : QueryGroup
+        The language and data type whose query files are about to be run.
+
+    prefetched : dict[Path, Any]
+        Results that have not been used yet, which the parts' results are added to.
+
+    shard_concurrency : int
+        Number of parts of the query to send to WDQS at once.
+
+    result_format : str, default=JSON
+        The format to request results in: one of "json", "tsv" or "csv".
+    """
+    queries: dict[Path, str] = {
+        job.path: job.path.read_text(encoding="utf-8")
+        for job in group.shards
+        if job.state == "pending" and job.path not in prefetched
+    }
+    if shard_concurrency <= 1 or len(queries) <= 1:
+        return
+
+    prefetched.update(
+        _query_executor(min(shard_concurrency, len(queries)), result_format).run(
+            queries
+        )
+    )
+
+
+def _start_group(
+    group: QueryGroup,
+    groups: list[QueryGroup],
+    prefetched: dict[Path, Any],
+    max_concurrency: int,
+    shard_concurrency: int,
+    result_format: str = JSON,
+) -> None:
+    """
+    Run the query files of a group ahead of merging their rows.
+
+    Parameters
+    ----------
+    group : QueryGroup
+        The language and data type whose query files are about to be run.
+
+    groups : list[QueryGroup]
+        Every group in the order that they are run.
+
+    prefetched : dict[Path, Any]
+        Results that have not been used yet, which the new results are added to.
+
+    max_concurrency : int
+        Number of queries of this and the following groups to send to WDQS at once.
+
+    shard_concurrency : int
+        Number of parts of the query to send to WDQS at once.
+
+    result_format : str, default=JSON
+        The format to request results in: one of "json", "tsv" or "csv".
+    """
+    _prefetch_query_results(group, groups, prefetched, max_concurrency, result_format)
+    _fan_out_shards(group, prefetched, shard_concurrency, result_format)
+
+
+def _read_result_rows(
+    result: QueryResult, result_format: str = JSON
+) -> list[dict[str, str]] | None:
+    """
+    Read the rows of a prefetched response so that its connection can be released.
+
+    Parameters
+    ----------
+    result : QueryResult
+        The response to a query sent by ``WDQSExecutor``.
+
+    result_format : str, default=JSON
+        The format of the results: one of "json", "tsv" or "csv".
+
+    Returns
+    -------
+    list[dict[str, str]] | None
+        The values of each result row, or None if WDQS returned no results.
+    """
+    rows = iter_result_rows(result.response, result_format)
+    return None if rows is None else list(rows)
+
+
+def _discard_on_error(
+    rows: Iterator[dict[str, str]], response: Any
+) -> Iterator[dict[str, str]]:
+    """
+    Stream result rows, deleting the cached response if it can't be read to the end.
+
+    Parameters
+    ----------
+    rows : Iterator[dict[str, str]]
+        The rows of the response.
+
+    response : Any
+        The response body, which may have been read from the SPARQL response cache.
+
+    Yields
+    ------
+    dict[str, str]
+        The values of each result row.
+    """
+    try:
+        yield from rows
+
+    except Exception:
+        discard_cached_response(response)
+        raise
+
+
+def _run_query(
+    query_path: Path,
+    prefetched: dict[Path, Any],
+    result_format: str = JSON,
+    refresh: bool = False,
+) -> Iterable[dict[str, str]] | None:
+    """
+    Return the result rows of a query file, using prefetched results on the first run.
+
+    Parameters
+    ----------
+    query_path : Path
+        The SPARQL file to run.
+
+    prefetched : dict[Path, Any]
+        Results from ``_prefetch_query_results`` that have not been used yet.
+
+    result_format : str, default=JSON
+        The format to request results in: one of "json", "tsv" or "csv".
+
+    refresh : bool, default=False
+        Whether to query WDQS rather than use a cached response, as when retrying.
+
+    Returns
+    -------
+    Iterable[dict[str, str]] | None
+        The values of each result row, streamed from the response if the query was not
+        prefetched, or None if WDQS returned no results.
+    """
+    if query_path in prefetched:
+        result = prefetched.pop(query_path)
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    sparql.setQuery(query_path.read_text(encoding="utf-8"))
+    sparql.setReturnFormat(result_format)
+    try:
+        response = sparql.query(refresh=refresh).response
+
+    finally:
+        # Other users of the shared client expect JSON results.
+        sparql.setReturnFormat(JSON)
+
+    try:
+        rows = iter_result_rows(response, result_format)
+
+    except Exception:
+        discard_cached_response(response)
+        raise
+
+    return None if rows is None else _discard_on_error(rows, response)
+
+
+def _with_auxiliary_verb(rows: Iterable[dict[str, str]]) -> Iterator[dict[str, str]]:
+    """
+    Make sure that each row has an auxiliary verb, even if it is empty.
+
+    German verb queries are split by auxiliary verb, and each row needs the field so
+    that both the sein and haben forms are combined when merging.
+
+    Parameters
+    ----------
+    rows : Iterable[dict[str, str]]
+        The result rows of a part of a split query.
+
+    Yields
+    ------
+    dict[str, str]
+        Each row with an ``auxiliaryVerb`` value.
+    """
+    for row in rows:
+        row.setdefault("auxiliaryVerb", "")
+        yield row
+
+
+def _query_group(
+    query: Path, partial_dir: Path | None, max_query_interval: int
+) -> QueryGroup:
+    """
+    Create the group of query files of a language and data type.
+
+    Results that were saved by an earlier run that didn't finish are loaded.
+
+    Parameters
+    ----------
+    query : Path
+        The query path with any ``_1``, ``_2``... part suffix removed.
+
+    partial_dir : Path | None
+        The JSON export directory, where the partial results of each language are saved.
+
+    max_query_interval : int
+        The largest part number of any split query.
+
+    Returns
+    -------
+    QueryGroup
+        The query files to run and the results of those that are already done.
+    """
+    lang = format_sublanguage_name(query.parent.parent.name, language_metadata)
+
+    updated_path = (
+        Path(str(partial_dir)[2:]) if str(partial_dir).startswith("./") else partial_dir
+    )
+    export_dir = (updated_path or DEFAULT_JSON_EXPORT_DIR) / lang.replace(" ", "_")
+
+    group = QueryGroup(
+        language=lang,
+        data_type=query.parent.name,
+        export_dir=export_dir,
+        shards=[ShardJob(path) for path in _query_files(query, max_query_interval)],
+    )
+    if resumed := group.load_partial():
+        print(
+            f"Resuming {lang.title()} {group.data_type} with the results of "
+            f"{resumed} of {len(group.shards)} queries from an earlier run."
+        )
+
+    return group
+
+
+def _run_shard(
+    group: QueryGroup,
+    job: ShardJob,
+    prefetched: dict[Path, Any],
+    result_format: str = JSON,
+) -> bool:
+    """
+    Run a query file and merge its rows into the results of its group.
+
+    Parameters
+    ----------
+    group : QueryGroup
+        The language and data type of the query file.
+
+    job : ShardJob
+        The query file to run.
+
+    prefetched : dict[Path, Any]
+        Results from ``_prefetch_query_results`` that have not been used yet.
+
+    result_format : str, default=JSON
+        The format to request results in: one of "json", "tsv" or "csv".
+
+    Returns
+    -------
+    bool
+        Whether WDQS returned results.
+    """
+    # Retries don't use the cache in case the earlier response was cut short.
+    rows = _run_query(job.path, prefetched, result_format, refresh=job.attempts > 1)
+    if rows is None:
+        return False
+
+    # Note: The following is so we have a breakdown of queries for German later.
+    # Note: We need auxiliary verbs to be present as we loop to get both sein and haben forms.
+    if group.language == "German" and job is not group.shards[0]:
+        rows = _with_auxiliary_verb(rows)
+
+    # Merge rows as they are streamed so only one entry per lexeme is held.
+    merge_lexeme_rows(rows, group.data_formatted)
+    return True
+
+
+def _finish_group(
+    group: QueryGroup,
+    output_dir: Path | None,
+    write_output: LexemeTableWriter | None = None,
+) -> None:
+    """
+    Format the merged results of a group once all of its query files have run.
+
+    Results are formatted if any query file succeeded. The saved partial results are
+    kept if a query file failed so that a later run only needs to rerun that file.
+
+    Parameters
+    ----------
+    group : QueryGroup
+        The language and data type whose query files have run.
+
+    output_dir : Path | None
+        The output directory path for results.
+
+    write_output : LexemeTableWriter, optional
+        Writes the results to another output type in place of exporting them to JSON.
+    """
+    done = [job for job in group.shards if job.state == "done"]
+    if not done:
+        return
+
+    # MARK: Save Results
+
+    format_data(
+        dir_path=output_dir or DEFAULT_JSON_EXPORT_DIR,
+        language=group.language,
+        data_type=group.data_type,
+        data_formatted=group.data_formatted,
+        write_output=write_output,
+    )
+
+    if len(done) == len(group.shards):
+        group.remove_partial()
+
+    print(
+        f"Successfully queried and formatted data for {group.language.title()} {group.data_type}."
+    )
+
+
 def query_data(
     languages: list[str] = [""],
     data_types: list[str] = [""],
     output_dir: Path | None = None,
     overwrite: bool = False,
     interactive: bool = False,
+    max_concurrency: int = 1,
+    result_format: str = JSON,
+    retry_backoff_seconds: float = DEFAULT_RETRY_BACKOFF_SECONDS,
+    shard_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    write_output: LexemeTableWriter | None = None,
 ) -> dict[str, bool] | None:
     """
     Query language data from the Wikidata lexicographical data.
@@ -107,10 +566,31 @@ def query_data(
     interactive : bool, default=False
         Whether the function is being ran via interactive mode.
 
+    max_concurrency : int, default=1
+        Number of queries to send to WDQS at once. Above 1 the next queries are run
+        concurrently with ``WDQSExecutor`` as each language and data type is started,
+        and their results are then saved and formatted in order.
+
+    result_format : str, default=JSON
+        The format to request results in: one of "json", "tsv" or "csv". TSV and CSV
+        results are smaller than JSON results and are faster to parse.
+
+    retry_backoff_seconds : float, default=DEFAULT_RETRY_BACKOFF_SECONDS
+        Wait before retrying a query file that failed, which doubles for each retry.
+
+    shard_concurrency : int, default=DEFAULT_MAX_CONCURRENCY
+        Number of parts of a split query to send to WDQS at once when queries are not
+        all prefetched, so that a split query takes about as long as its slowest part.
+
+    write_output : LexemeTableWriter, optional
+        Writes the results of each language and data type to another output type, e.g.
+        SQLite, in place of exporting them to JSON.
+
     Returns
     -------
-    None
-        Formatted data from Wikidata saved in the output directory.
+    dict[str, bool] | None
+        Formatted data from Wikidata saved in the output directory, or a failure status
+        if a query file failed every attempt.
     """
     current_languages = list_all_languages(language_metadata)
     current_data_type = ["nouns", "verbs", "prepositions"]
@@ -151,141 +631,38 @@ def query_data(
     }
     queries_to_run = sorted(queries_to_run)
 
+    # Partial results are kept with JSON exports rather than in the export directory of
+    # another output type.
+    partial_dir = output_dir if write_output is None else DEFAULT_JSON_EXPORT_DIR
+    groups = [_query_group(q, partial_dir, max_query_interval) for q in queries_to_run]
+    prefetched: dict[Path, Any] = {}
+
     # MARK: Run Queries
 
-    for q in tqdm(
-        queries_to_run,
+    scheduler = QueryScheduler(
+        run_shard=partial(
+            _run_shard, prefetched=prefetched, result_format=result_format
+        ),
+        finish_group=partial(
+            _finish_group, output_dir=output_dir, write_output=write_output
+        ),
+        backoff_seconds=retry_backoff_seconds,
+        start_group=partial(
+            _start_group,
+            groups=groups,
+            prefetched=prefetched,
+            max_concurrency=max_concurrency,
+            shard_concurrency=shard_concurrency,
+            result_format=result_format,
+        ),
+    )
+    with tqdm(
+        total=len(groups),
         desc="Data updated",
         unit="process",
         disable=interactive,
-    ):
-        lang = format_sublanguage_name(q.parent.parent.name, language_metadata)
-        target_type = q.parent.name
-
-        updated_path = (
-            Path(str(output_dir)[2:])
-            if str(output_dir).startswith("./")
-            else output_dir
-        )
-        export_dir = (updated_path or DEFAULT_JSON_EXPORT_DIR) / lang.replace(" ", "_")
-        export_dir.mkdir(parents=True, exist_ok=True)
-
-        file_name = f"{target_type}.json"
-        file_path = export_dir / file_name
-
-        print(f"Querying and formatting {lang.title()} {target_type}")
-
-        # Mark the query as the first in a set of queries if needed.
-        if not q.exists():
-            q = Path(str(q).replace(".sparql", "_1.sparql"))
-
-        # First format the lines into a multi-line string and then pass this to SPARQLWrapper.
-        with open(q, encoding="utf-8") as file:
-            query_lines = file.readlines()
-
-        sparql.setQuery("".join(query_lines))
-
-        results = sparql.query().convert()
-
-        if results is None:
-            print(f"Nothing returned by the WDQS server for {q}")
-
-            # Allow for a query to be reran up to two times.
-            if queries_to_run.count(q) < 3:
-                print("The query will be retried.")
-                queries_to_run.append(q)
-            else:
-                print("Max retries reached. Skipping this query.")
-                return {"success": False, "skipped": False}
-
-        else:
-            # Subset the returned JSON and the individual results before saving.
-            res_dict = cast(dict[str, Any], results)
-            query_results = res_dict.get("results", {}).get("bindings", [])
-
-            results_final = []
-
-            for r in query_results:  # query_results is also a list
-                r_dict = {k: r[k]["value"] for k in r.keys()}
-
-                results_final.append(r_dict)
-
-            with open(
-                export_dir / f"{target_type}_queried.json",
-                "w",
-                encoding="utf-8",
-            ) as f:
-                json.dump(results_final, f, ensure_ascii=False, indent=0)
-
-            if "_1" in q.name:
-                # Note: Only the first query was ran, so we need to run the second and append the json.
-                for i in range(max_query_interval + 1)[2:]:
-                    suffix = f"_{i}"
-                    q = Path(str(q).replace(f"_{i - 1}", suffix))
-
-                    if q.exists():
-                        with open(q, encoding="utf-8") as file:
-                            query_lines = file.readlines()
-                            sparql.setQuery("".join(query_lines))
-
-                            results = None
-                            try:
-                                results = sparql.query().convert()
-
-                            except HTTPError as err:
-                                print(f"HTTPError with {q}: {err}")
-
-                            if results is None:
-                                print(f"Nothing returned by the WDQS server for {q}")
-
-                                # Allow for a query to be reran up to two times.
-                                if queries_to_run.count(q) < 3:
-                                    queries_to_run.append(q)
-
-                            else:
-                                # Subset the returned JSON and the individual results before saving.
-                                res_dict = cast(dict[str, Any], results)
-                                query_results = res_dict.get("results", {}).get(
-                                    "bindings", []
-                                )
-
-                                # Note: Don't rewrite results_final as we want to extend the json and combine in formatting.
-                                for r in query_results:  # query_results is also a list
-                                    r_dict = {k: r[k]["value"] for k in r.keys()}
-
-                                    # Note: The following is so we have a breakdown of queries for German later.
-                                    # Note: We need auxiliary verbs to be present as we loop to get both sein and haben forms.
-                                    if lang == "German":
-                                        r_dict_keys = list(r_dict.keys())
-                                        if "auxiliaryVerb" not in r_dict_keys:
-                                            r_dict["auxiliaryVerb"] = ""
-
-                                    results_final.append(r_dict)
-
-                                with open(
-                                    export_dir / f"{target_type}_queried.json",
-                                    "w",
-                                    encoding="utf-8",
-                                ) as f:
-                                    json.dump(
-                                        results_final,
-                                        f,
-                                        ensure_ascii=False,
-                                        indent=0,
-                                    )
-
-            # MARK: Save Results
-
-            with open(file_path, "w", encoding="utf-8") as json_file:
-                json.dump(results_final, json_file, ensure_ascii=False, indent=0)
-
-            # Call the formatting script.
-            execute_formatting_script(
-                output_dir=output_dir or DEFAULT_JSON_EXPORT_DIR,
-                language=lang,
-                data_type=target_type,
-            )
-
-            print(
-                f"Successfully queried and formatted data for {lang.title()} {target_type}."
-            )
+    ) as progress:
+        failed = scheduler.run(groups, on_finished=progress.update)
+
+    if failed:
+        return {"success": False, "skipped": False}
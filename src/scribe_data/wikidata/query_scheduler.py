@@ -0,0 +1,407 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Scheduling of the SPARQL query files of each language and data type as retryable jobs.
+"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from http.client import IncompleteRead
+from pathlib import Path
+from typing import Callable
+from urllib.error import URLError
+
+import orjson
+
+from scribe_data.wikidata.lexeme_merge import LexemeMerger
+
+# Errors of a query that may not happen again when it is retried.
+RETRYABLE_QUERY_ERRORS = (URLError, IncompleteRead, json.JSONDecodeError)
+
+DEFAULT_MAX_QUERY_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF_SECONDS = 5.0
+
+
+@dataclass
+class ShardJob:
+    """
+    A single SPARQL file of a query, which may be one part of a split query.
+
+    Attributes
+    ----------
+    path : Path
+        The SPARQL file to run.
+
+    state : str
+        One of "pending", "waiting" for a retry, "done" or "failed".
+
+    attempts : int
+        Number of times the query has been run.
+
+    error : str, optional
+        Why the latest attempt failed.
+    """
+
+    path: Path
+    state: str = "pending"
+    attempts: int = 0
+    error: str | None = None
+
+    def digest(self) -> str:
+        """
+        Return a hash of the query so that saved results are only reused for it.
+
+        Returns
+        -------
+        str
+            A hex digest of the SPARQL file.
+        """
+        return hashlib.sha256(self.path.read_bytes()).hexdigest()
+
+
+@dataclass
+class QueryGroup:
+    """
+    The query files of a language and data type, whose results are merged in order.
+
+    Attributes
+    ----------
+    language : str
+        The language being queried.
+
+    data_type : str
+        The data type being queried.
+
+    export_dir : Path
+        The directory of the language's results, where partial results are saved.
+
+    shards : list[ShardJob]
+        The query files, which are run one after another.
+
+    data_formatted : LexemeMerger
+        The results of the finished shards merged with ``merge_lexeme_rows``.
+
+    ready_at : float
+        When the next shard may be run.
+
+    started : bool
+        Whether a shard has been run.
+    """
+
+    language: str
+    data_type: str
+    export_dir: Path
+    shards: list[ShardJob]
+    data_formatted: LexemeMerger = field(default_factory=LexemeMerger)
+    ready_at: float = 0.0
+    started: bool = False
+
+    @property
+    def partial_path(self) -> Path:
+        """
+        Return the file that the results of finished shards are saved to.
+
+        Returns
+        -------
+        Path
+            The partial results file.
+        """
+        return self.export_dir / f"{self.data_type}_partial.json"
+
+    def next_shard(self) -> ShardJob | None:
+        """
+        Return the first shard that still needs to be run.
+
+        Returns
+        -------
+        ShardJob | None
+            The shard, or None if every shard is done or has failed.
+        """
+        return next(
+            (job for job in self.shards if job.state in ("pending", "waiting")), None
+        )
+
+    def failed(self) -> bool:
+        """
+        Return whether a shard failed every attempt.
+
+        Returns
+        -------
+        bool
+            Whether the results of the group are incomplete.
+        """
+        return any(job.state == "failed" for job in self.shards)
+
+    def save_partial(self) -> None:
+        """
+        Save the merged results and the shards that they come from.
+        """
+        done = {
+            job.path.name: job.digest() for job in self.shards if job.state == "done"
+        }
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        self.partial_path.write_bytes(
+            orjson.dumps({"shards": done, "data": dict(self.data_formatted)})
+        )
+
+    def load_partial(self) -> int:
+        """
+        Resume from the results saved by an earlier run that didn't finish.
+
+        Saved results are only used if the queries that they come from are unchanged.
+
+        Returns
+        -------
+        int
+            The number of shards that don't need to be run again.
+        """
+        try:
+            saved = orjson.loads(self.partial_path.read_bytes())
+
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return 0
+
+        jobs = {job.path.name: job for job in self.shards}
+        if any(
+            name not in jobs or jobs[name].digest() != digest
+            for name, digest in saved["shards"].items()
+        ):
+            return 0
+
+        for name in saved["shards"]:
+            jobs[name].state = "done"
+
+        self.data_formatted = LexemeMerger(saved["data"])
+        return len(saved["shards"])
+
+    def remove_partial(self) -> None:
+        """
+        Delete the saved partial results.
+        """
+        self.partial_path.unlink(missing_ok=True)
+
+
+class QueryScheduler:
+    """
+    Run the shards of several query groups with per-shard retries and backoff.
+
+    The earliest group with a shard that is ready is always run next, so groups are
+    finished one at a time unless a group is waiting to retry a shard, in which case the
+    next groups make progress in the meantime. A shard that fails every attempt is
+    skipped so that the rest of its group and all other groups are still run.
+
+    Parameters
+    ----------
+    run_shard : Callable[[QueryGroup, ShardJob], bool]
+        Runs a shard and merges its results into the group, returning False if the
+        server returned nothing.
+
+    finish_group : Callable[[QueryGroup], None]
+        Called once every shard of a group is done or has failed.
+
+    max_attempts : int, default=DEFAULT_MAX_QUERY_ATTEMPTS
+        Times that a shard is run before it is skipped.
+
+    backoff_seconds : float, default=DEFAULT_RETRY_BACKOFF_SECONDS
+        Wait before the first retry of a shard, which doubles for each further retry.
+
+    clock : Callable[[], float], default=time.monotonic
+        Returns the current time in seconds.
+
+    sleep : Callable[[float], None], default=time.sleep
+        Waits for the given number of seconds.
+
+    start_group : Callable[[QueryGroup], None], optional
+        Called before the first shard of a group is run, e.g. to fetch its shards
+        concurrently.
+    """
+
+    def __init__(
+        self,
+        run_shard: Callable[[QueryGroup, ShardJob], bool],
+        finish_group: Callable[[QueryGroup], None],
+        max_attempts: int = DEFAULT_MAX_QUERY_ATTEMPTS,
+        backoff_seconds: float = DEFAULT_RETRY_BACKOFF_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        start_group: Callable[[QueryGroup], None] | None = None,
+    ) -> None:
+        """
+        Store the callbacks and retry settings.
+
+        Parameters
+        ----------
+        run_shard : Callable[[QueryGroup, ShardJob], bool]
+            Runs a shard and merges its results into the group, returning False if the
+            server returned nothing.
+
+        finish_group : Callable[[QueryGroup], None]
+            Called once every shard of a group is done or has failed.
+
+        max_attempts : int, default=DEFAULT_MAX_QUERY_ATTEMPTS
+            Times that a shard is run before it is skipped.
+
+        backoff_seconds : float, default=DEFAULT_RETRY_BACKOFF_SECONDS
+            Wait before the first retry of a shard, which doubles for each further retry.
+
+        clock : Callable[[], float], default=time.monotonic
+            Returns the current time in seconds.
+
+        sleep : Callable[[float], None], default=time.sleep
+            Waits for the given number of seconds.
+
+        start_group : Callable[[QueryGroup], None], optional
+            Called before the first shard of a group is run, e.g. to fetch its shards
+            concurrently.
+        """
+        self.run_shard = run_shard
+        self.finish_group = finish_group
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self.start_group = start_group
+
+    def _attempt(self, group: QueryGroup, job: ShardJob) -> bool:
+        """
+        Run a shard once, reporting why it failed if it did.
+
+        Parameters
+        ----------
+        group : QueryGroup
+            The group of the shard.
+
+        job : ShardJob
+            The shard to run.
+
+        Returns
+        -------
+        bool
+            Whether the shard's results were merged into the group.
+        """
+        if not group.started:
+            group.started = True
+            print(f"Querying and formatting {group.language.title()} {group.data_type}")
+            if self.start_group is not None:
+                self.start_group(group)
+
+        job.attempts += 1
+        try:
+            if self.run_shard(group, job):
+                return True
+
+            job.error = "nothing returned"
+            print(f"Nothing returned by the WDQS server for {job.path}")
+
+        except RETRYABLE_QUERY_ERRORS as err:
+            job.error = f"{type(err).__name__}: {err}"
+            print(f"{type(err).__name__} with {job.path}: {err}")
+
+        return False
+
+    def _step(self, group: QueryGroup, job: ShardJob) -> None:
+        """
+        Run a shard and update its state and the time that its group is ready again.
+
+        Parameters
+        ----------
+        group : QueryGroup
+            The group of the shard.
+
+        job : ShardJob
+            The shard to run.
+        """
+        if self._attempt(group, job):
+            job.state = "done"
+
+        elif job.attempts < self.max_attempts:
+            job.state = "waiting"
+            group.ready_at = self._clock() + self.backoff_seconds * 2 ** (
+                job.attempts - 1
+            )
+            print("The query will be retried.")
+
+        else:
+            job.state = "failed"
+            print("Max retries reached. Skipping this query.")
+
+    def _next_group(self, active: list[QueryGroup]) -> QueryGroup:
+        """
+        Return the earliest group that is ready, waiting for one if none are.
+
+        Parameters
+        ----------
+        active : list[QueryGroup]
+            The groups with shards that still need to be run.
+
+        Returns
+        -------
+        QueryGroup
+            The group to run a shard of next.
+        """
+        now = self._clock()
+        group = min(active, key=lambda g: (g.ready_at > now, g.ready_at))
+        if group.ready_at > now:
+            self._sleep(group.ready_at - now)
+
+        return group
+
+    def _finish(self, group: QueryGroup) -> None:
+        """
+        Finish a group, keeping its partial results if a shard failed.
+
+        Parameters
+        ----------
+        group : QueryGroup
+            The group whose shards have all run.
+        """
+        if group.failed():
+            group.save_partial()
+
+        self.finish_group(group)
+
+    def run(
+        self, groups: list[QueryGroup], on_finished: Callable[[], None] = lambda: None
+    ) -> list[QueryGroup]:
+        """
+        Run every shard of the groups and finish each group once its shards have run.
+
+        The results of unfinished groups are saved if the run is interrupted, so that a
+        later run can resume from them.
+
+        Parameters
+        ----------
+        groups : list[QueryGroup]
+            The groups to run in order of priority.
+
+        on_finished : Callable[[], None], optional
+            Called after each group is finished, e.g. to update a progress bar.
+
+        Returns
+        -------
+        list[QueryGroup]
+            The groups with a shard that failed every attempt.
+        """
+        active = list(groups)
+        try:
+            while active:
+                group = self._next_group(active)
+                if (job := group.next_shard()) is not None:
+                    self._step(group, job)
+
+                if group.next_shard() is None:
+                    active.remove(group)
+                    self._finish(group)
+                    on_finished()
+
+        except BaseException:
+            # Merging rows again gives the same entries, so the results of a shard
+            # that was cut short are saved as well and the shard is run again.
+            for group in active:
+                if group.started:
+                    group.save_partial()
+
+            raise
+
+        return [g for g in groups if g.failed()]
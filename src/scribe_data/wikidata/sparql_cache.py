@@ -0,0 +1,478 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+On-disk cache of SPARQL query responses shared by every query to the Wikidata Query Service.
+"""
+
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import time
+from http.client import HTTPResponse
+from pathlib import Path
+from typing import Callable, cast
+
+from SPARQLWrapper import SPARQLWrapper
+from SPARQLWrapper.Wrapper import QueryResult
+
+from scribe_data.utils import DEFAULT_SPARQL_CACHE_DIR
+from scribe_data.wikidata.sparql_options import DEFAULT_SPARQL_CACHE_TTL_SECONDS
+
+# Bump when the layout of cached responses changes so that old entries are not reused.
+SPARQL_CACHE_FORMAT_VERSION = 1
+
+DEFAULT_SPARQL_CACHE_MAX_BYTES = 2 * 1024**3
+
+_RESPONSE_SUFFIX = ".response"
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a SPARQL query so that layout changes don't change its cache key.
+
+    Leading and trailing whitespace, blank lines and whole-line comments are removed.
+    Whitespace within lines is kept as it may be part of a string literal.
+
+    Parameters
+    ----------
+    query : str
+        The SPARQL query.
+
+    Returns
+    -------
+    str
+        The normalized query.
+    """
+    lines = (line.strip() for line in query.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("#"))
+
+
+def cache_key(endpoint: str, query: str, return_format: str, method: str) -> str:
+    """
+    Return the cache key of a SPARQL request.
+
+    Parameters
+    ----------
+    endpoint : str
+        The SPARQL endpoint.
+
+    query : str
+        The SPARQL query, which is normalized with ``normalize_query``.
+
+    return_format : str
+        The requested result format, e.g. "json" or "tsv".
+
+    method : str
+        The HTTP method of the request.
+
+    Returns
+    -------
+    str
+        A hex digest of the request.
+    """
+    request = "\0".join(
+        [
+            str(SPARQL_CACHE_FORMAT_VERSION),
+            endpoint,
+            method,
+            return_format,
+            normalize_query(query),
+        ]
+    )
+    return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+
+class CachedResponse(io.BufferedReader):
+    """
+    A cached response body that can be used in place of an HTTP response.
+
+    Parameters
+    ----------
+    path : Path
+        The cache file, whose first line is the Content-Type of the response.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Open the cache file and read the Content-Type before the body.
+
+        Parameters
+        ----------
+        path : Path
+            The cache file, whose first line is the Content-Type of the response.
+        """
+        super().__init__(io.FileIO(path))
+        self.path = path
+        self.headers = {"Content-Type": self.readline().decode("utf-8").strip()}
+
+    def info(self) -> dict[str, str]:
+        """
+        Return the headers of the response as ``HTTPResponse.info`` does.
+
+        Returns
+        -------
+        dict[str, str]
+            The Content-Type of the response.
+        """
+        return self.headers
+
+    def geturl(self) -> str:
+        """
+        Return the URL of the cache file.
+
+        Returns
+        -------
+        str
+            A file URL.
+        """
+        return self.path.as_uri()
+
+    def discard(self) -> None:
+        """
+        Close the response and delete it from the cache as its body couldn't be read.
+        """
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+def discard_cached_response(response: object) -> None:
+    """
+    Delete a response from the cache if it was read from it.
+
+    Responses are saved before their body is read, so one that was cut short or is
+    otherwise unreadable is deleted rather than returned again by the cache.
+
+    Parameters
+    ----------
+    response : object
+        The response of a query, e.g. ``sparql.query().response``.
+    """
+    if isinstance(response, CachedResponse):
+        response.discard()
+
+
+class SparqlCache:
+    """
+    Content-addressed store of SPARQL responses keyed by endpoint and query.
+
+    Each response is saved to its own file, so bodies are streamed to and from disk
+    rather than held in memory. Entries expire ``ttl_seconds`` after they were saved,
+    and the least recently used entries are deleted once the cache is over
+    ``max_bytes``.
+
+    Parameters
+    ----------
+    directory : str | Path
+        The directory to save responses in.
+
+    ttl_seconds : float, default=DEFAULT_SPARQL_CACHE_TTL_SECONDS
+        How long a saved response is used for.
+
+    max_bytes : int, default=DEFAULT_SPARQL_CACHE_MAX_BYTES
+        The size that ``evict`` trims the cache down to.
+
+    refresh : bool, default=False
+        Whether to ignore saved responses and replace them with new ones.
+
+    clock : Callable[[], float], default=time.time
+        Returns the current time in seconds since the epoch.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        ttl_seconds: float = DEFAULT_SPARQL_CACHE_TTL_SECONDS,
+        max_bytes: int = DEFAULT_SPARQL_CACHE_MAX_BYTES,
+        refresh: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Store the cache settings. The directory is created when a response is saved.
+
+        Parameters
+        ----------
+        directory : str | Path
+            The directory to save responses in.
+
+        ttl_seconds : float, default=DEFAULT_SPARQL_CACHE_TTL_SECONDS
+            How long a saved response is used for.
+
+        max_bytes : int, default=DEFAULT_SPARQL_CACHE_MAX_BYTES
+            The size that ``evict`` trims the cache down to.
+
+        refresh : bool, default=False
+            Whether to ignore saved responses and replace them with new ones.
+
+        clock : Callable[[], float], default=time.time
+            Returns the current time in seconds since the epoch.
+        """
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self._clock = clock
+
+    def _path(self, key: str) -> Path:
+        """
+        Return the file that the response of a key is saved in.
+
+        Parameters
+        ----------
+        key : str
+            A key from ``cache_key``.
+
+        Returns
+        -------
+        Path
+            The cache file.
+        """
+        return self.directory / key[:2] / f"{key}{_RESPONSE_SUFFIX}"
+
+    def has(self, key: str) -> bool:
+        """
+        Return whether ``get`` would return a saved response for a key.
+
+        Parameters
+        ----------
+        key : str
+            A key from ``cache_key``.
+
+        Returns
+        -------
+        bool
+            Whether there is an unexpired response and the cache isn't being refreshed.
+        """
+        if self.refresh:
+            return False
+
+        try:
+            saved_at = self._path(key).stat().st_mtime
+
+        except FileNotFoundError:
+            return False
+
+        return self._clock() - saved_at <= self.ttl_seconds
+
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Open the saved response of a key and mark it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            A key from ``cache_key``.
+
+        Returns
+        -------
+        CachedResponse | None
+            The response, or None if there is no unexpired response or the cache is
+            being refreshed.
+        """
+        if self.refresh:
+            return None
+
+        path = self._path(key)
+        try:
+            saved_at = path.stat().st_mtime
+            if self._clock() - saved_at > self.ttl_seconds:
+                return None
+
+            # Keep the modification time as the save time and use the access time for LRU.
+            os.utime(path, (self._clock(), saved_at))
+            return CachedResponse(path)
+
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, response: HTTPResponse) -> CachedResponse:
+        """
+        Stream a response into the cache and return the saved copy.
+
+        Parameters
+        ----------
+        key : str
+            A key from ``cache_key``.
+
+        response : HTTPResponse
+            The HTTP response, which is read to the end.
+
+        Returns
+        -------
+        CachedResponse
+            The saved response, to be read instead of ``response``.
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        content_type = response.headers.get("Content-Type", "")
+
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, suffix=".tmp", delete=False
+        ) as tmp:
+            try:
+                tmp.write(f"{content_type}\n".encode("utf-8"))
+                shutil.copyfileobj(response, tmp)
+
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+
+        os.replace(tmp.name, path)
+        self.evict()
+        return CachedResponse(path)
+
+    def evict(self) -> int:
+        """
+        Delete expired responses and then the least recently used ones over ``max_bytes``.
+
+        Returns
+        -------
+        int
+            The number of responses deleted.
+        """
+        entries = []
+        for path in self.directory.glob(f"*/*{_RESPONSE_SUFFIX}"):
+            try:
+                entries.append((path.stat(), path))
+
+            except FileNotFoundError:
+                continue
+
+        now = self._clock()
+        expired = [p for st, p in entries if now - st.st_mtime > self.ttl_seconds]
+        entries = [
+            (st, p) for st, p in entries if now - st.st_mtime <= self.ttl_seconds
+        ]
+
+        total = sum(st.st_size for st, _ in entries)
+        unused_first = sorted(entries, key=lambda entry: entry[0].st_atime)
+        over = []
+        for st, path in unused_first:
+            if total <= self.max_bytes:
+                break
+
+            over.append(path)
+            total -= st.st_size
+
+        for path in expired + over:
+            path.unlink(missing_ok=True)
+
+        return len(expired) + len(over)
+
+
+_sparql_cache: SparqlCache | None = None
+
+
+def configure_sparql_cache(
+    directory: str | Path | None = DEFAULT_SPARQL_CACHE_DIR,
+    ttl_seconds: float = DEFAULT_SPARQL_CACHE_TTL_SECONDS,
+    max_bytes: int = DEFAULT_SPARQL_CACHE_MAX_BYTES,
+    refresh: bool = False,
+) -> SparqlCache | None:
+    """
+    Set the cache that every ``CachingSPARQLWrapper`` uses.
+
+    Parameters
+    ----------
+    directory : str | Path | None, default=DEFAULT_SPARQL_CACHE_DIR
+        The directory to save responses in, or None to turn caching off.
+
+    ttl_seconds : float, default=DEFAULT_SPARQL_CACHE_TTL_SECONDS
+        How long a saved response is used for.
+
+    max_bytes : int, default=DEFAULT_SPARQL_CACHE_MAX_BYTES
+        The size that the cache is trimmed down to.
+
+    refresh : bool, default=False
+        Whether to ignore saved responses and replace them with new ones.
+
+    Returns
+    -------
+    SparqlCache | None
+        The cache that is now in use.
+    """
+    global _sparql_cache
+
+    _sparql_cache = (
+        None
+        if directory is None
+        else SparqlCache(directory, ttl_seconds, max_bytes, refresh)
+    )
+    return _sparql_cache
+
+
+def get_sparql_cache() -> SparqlCache | None:
+    """
+    Return the cache set with ``configure_sparql_cache``.
+
+    Returns
+    -------
+    SparqlCache | None
+        The cache, or None if caching is off, as it is unless configured.
+    """
+    return _sparql_cache
+
+
+class CachingSPARQLWrapper(SPARQLWrapper):
+    """
+    A ``SPARQLWrapper`` that answers queries from the shared cache when it can.
+
+    Successful responses are saved to the cache and then read back from it, so that
+    callers stream the body from disk as they would from the endpoint. Callers that
+    can't read the body should pass the response to ``discard_cached_response``.
+    """
+
+    def _cache_key(self) -> str:
+        """
+        Return the key of the current request in a ``SparqlCache``.
+
+        Returns
+        -------
+        str
+            A hex digest of the endpoint, method, format and query.
+        """
+        return cache_key(
+            self.endpoint, self.queryString, self.returnFormat, self.method
+        )
+
+    def has_cached_response(self) -> bool:
+        """
+        Return whether the current query would be answered from the cache.
+
+        Returns
+        -------
+        bool
+            Whether an unexpired response to the query is saved in the shared cache.
+        """
+        cache = get_sparql_cache()
+        return cache is not None and cache.has(self._cache_key())
+
+    def query(self, refresh: bool = False) -> QueryResult:
+        """
+        Run the query, or return its cached response.
+
+        Parameters
+        ----------
+        refresh : bool, default=False
+            Whether to run the query and replace its cached response, e.g. when the
+            query is retried because its response couldn't be read.
+
+        Returns
+        -------
+        QueryResult
+            The result of the query.
+        """
+        cache = get_sparql_cache()
+        if cache is None:
+            return super().query()
+
+        key = self._cache_key()
+        response = None if refresh else cache.get(key)
+        if response is None:
+            http_response, _ = self._query()
+            with http_response:
+                response = cache.put(key, http_response)
+
+        # CachedResponse provides the parts of an HTTPResponse that QueryResult reads.
+        return QueryResult((cast(HTTPResponse, response), self.returnFormat))
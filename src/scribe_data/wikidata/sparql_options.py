@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Options of the commands that query the Wikidata Query Service.
+
+Only the standard library is imported so that the CLI can add these options without
+importing SPARQLWrapper, which is only needed by the command that is run.
+"""
+
+import argparse
+from typing import TYPE_CHECKING
+
+from scribe_data.utils import DEFAULT_SPARQL_CACHE_DIR
+
+if TYPE_CHECKING:
+    from scribe_data.wikidata.sparql_cache import SparqlCache
+
+# WDQS allows a handful of parallel queries per client before throttling.
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Formats that WDQS results can be requested in, as named by SPARQLWrapper.
+RESULT_FORMATS = ("json", "tsv", "csv")
+
+DEFAULT_SPARQL_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def add_sparql_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the options that control the SPARQL response cache to a parser.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        The parser of a command that runs SPARQL queries.
+    """
+    parser.add_argument(
+        "-nc",
+        "--no-cache",
+        action="store_true",
+        help=f"Always query the Wikidata Query Service rather than using responses cached in ./{DEFAULT_SPARQL_CACHE_DIR}.",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Query the Wikidata Query Service again and replace the cached responses.",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        metavar="HOURS",
+        default=DEFAULT_SPARQL_CACHE_TTL_SECONDS / 3600,
+        help=f"Hours that cached query responses are used for (default: {DEFAULT_SPARQL_CACHE_TTL_SECONDS // 3600}).",
+    )
+
+
+def configure_sparql_cache_from_args(
+    args: argparse.Namespace,
+) -> "SparqlCache | None":
+    """
+    Set the shared cache from the options of ``add_sparql_cache_arguments``.
+
+    The cache module is only imported by commands that have the cache options.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The parsed arguments. The cache is left as it is if the command that they are
+        for doesn't have the cache options.
+
+    Returns
+    -------
+    SparqlCache | None
+        The cache that is now in use, or None if the cache was left as it is.
+    """
+    if not hasattr(args, "no_cache"):
+        return None
+
+    from scribe_data.wikidata.sparql_cache import configure_sparql_cache
+
+    return configure_sparql_cache(
+        directory=None if args.no_cache else DEFAULT_SPARQL_CACHE_DIR,
+        ttl_seconds=args.cache_ttl * 3600,
+        refresh=args.refresh,
+    )
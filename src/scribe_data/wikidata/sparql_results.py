@@ -0,0 +1,349 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Streaming readers for SPARQL query results returned by the Wikidata Query Service.
+"""
+
+import codecs
+import csv
+import io
+import json
+import re
+from typing import BinaryIO, Callable, Iterator
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Escape sequences of the literals in SPARQL TSV results.
+_TSV_ESCAPES = {
+    "t": "\t",
+    "b": "\b",
+    "n": "\n",
+    "r": "\r",
+    "f": "\f",
+    '"': '"',
+    "'": "'",
+    "\\": "\\",
+}
+_TSV_ESCAPE = re.compile(r"\\(u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|.)")
+
+_BINDINGS_START = re.compile(r'"bindings"\s*:\s*\[')
+_BETWEEN_BINDINGS = re.compile(r"[\s,]*")
+_DECODER = json.JSONDecoder()
+
+
+class _TextChunks:
+    """
+    Decode a binary stream into text one chunk at a time.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        The response body.
+
+    chunk_size : int
+        Bytes to read at a time.
+    """
+
+    def __init__(self, stream: BinaryIO, chunk_size: int) -> None:
+        """
+        Wrap the stream with an incremental UTF-8 decoder.
+
+        Parameters
+        ----------
+        stream : BinaryIO
+            The response body.
+
+        chunk_size : int
+            Bytes to read at a time.
+        """
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.exhausted = False
+
+    def read(self) -> str:
+        """
+        Return the next chunk of text, which is empty once the stream is exhausted.
+
+        Returns
+        -------
+        str
+            Decoded text of the next chunk.
+        """
+        text = ""
+        # A chunk that ends inside a multibyte character may not decode to any text.
+        while not text and not self.exhausted:
+            chunk = self.stream.read(self.chunk_size)
+            self.exhausted = not chunk
+            text = self.decoder.decode(chunk, final=self.exhausted)
+
+        return text
+
+
+def _iter_bindings_from(chunks: _TextChunks, buffer: str, pos: int) -> Iterator[dict]:
+    """
+    Yield the binding objects of a results array that starts at ``pos``.
+
+    Parameters
+    ----------
+    chunks : _TextChunks
+        The rest of the response body.
+
+    buffer : str
+        Text read so far.
+
+    pos : int
+        Position in ``buffer`` just after the opening ``[`` of the bindings.
+
+    Yields
+    ------
+    dict
+        Each binding, e.g. ``{"lexemeID": {"type": "literal", "value": "L1"}}``.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the response ends before the bindings array is closed.
+
+    ValueError
+        If the text between two bindings can't be read.
+    """
+    while True:
+        if (between := _BETWEEN_BINDINGS.match(buffer, pos)) is None:
+            raise ValueError(
+                f"Unexpected SPARQL results response body at position {pos}."
+            )
+
+        pos = between.end()
+        if pos < len(buffer) and buffer[pos] == "]":
+            return
+
+        try:
+            binding, end = _DECODER.raw_decode(buffer, pos)
+
+        except json.JSONDecodeError:
+            # The next binding is incomplete, so drop what has been used and read on.
+            text = chunks.read()
+            if not text:
+                raise json.JSONDecodeError(
+                    "Unterminated SPARQL results bindings", buffer, pos
+                ) from None
+
+            buffer, pos = buffer[pos:] + text, 0
+            continue
+
+        yield binding
+        pos = end
+
+
+def iter_json_bindings(
+    stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[dict] | None:
+    """
+    Stream the bindings of a SPARQL JSON results document without loading all of it.
+
+    Only one chunk of the response and the binding being decoded are held in memory,
+    so responses with hundreds of thousands of bindings can be processed row by row.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        The response body, e.g. ``sparql.query().response``.
+
+    chunk_size : int, default=DEFAULT_CHUNK_SIZE
+        Bytes to read from the stream at a time.
+
+    Returns
+    -------
+    Iterator[dict] | None
+        An iterator over the bindings, or None if the response has no bindings array.
+    """
+    chunks = _TextChunks(stream, chunk_size)
+    buffer = ""
+    searched = 0
+    while True:
+        text = chunks.read()
+        buffer += text
+        if match := _BINDINGS_START.search(buffer, max(0, searched - 32)):
+            return _iter_bindings_from(chunks, buffer, match.end())
+
+        if not text:
+            return None
+
+        searched = len(buffer)
+
+
+def binding_values(binding: dict) -> dict[str, str]:
+    """
+    Reduce a SPARQL JSON binding to the value of each variable.
+
+    Parameters
+    ----------
+    binding : dict
+        A binding such as ``{"lexemeID": {"type": "literal", "value": "L1"}}``.
+
+    Returns
+    -------
+    dict[str, str]
+        The values keyed by variable, e.g. ``{"lexemeID": "L1"}``.
+    """
+    return {var: term["value"] for var, term in binding.items()}
+
+
+def iter_json_rows(
+    stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[dict[str, str]] | None:
+    """
+    Stream the rows of a SPARQL JSON results document as variable to value dicts.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        The response body, e.g. ``sparql.query().response``.
+
+    chunk_size : int, default=DEFAULT_CHUNK_SIZE
+        Bytes to read from the stream at a time.
+
+    Returns
+    -------
+    Iterator[dict[str, str]] | None
+        An iterator over the rows, or None if the response has no bindings array.
+    """
+    bindings = iter_json_bindings(stream, chunk_size)
+    return None if bindings is None else map(binding_values, bindings)
+
+
+def _unescape_tsv(match: re.Match) -> str:
+    """
+    Return the character for an escape sequence in a TSV literal.
+
+    Parameters
+    ----------
+    match : re.Match
+        A match of ``_TSV_ESCAPE``.
+
+    Returns
+    -------
+    str
+        The escaped character.
+    """
+    escape = match[1]
+    if len(escape) > 1:
+        return chr(int(escape[1:], 16))
+
+    return _TSV_ESCAPES.get(escape, escape)
+
+
+def tsv_term_value(term: str) -> str:
+    """
+    Return the value of an RDF term as written in SPARQL TSV results.
+
+    Parameters
+    ----------
+    term : str
+        An IRI such as ``<http://www.wikidata.org/entity/L1>``, a literal such as
+        ``"gehen"@de`` or ``"2024-01-01T00:00:00Z"^^<...#dateTime>``, a bare number or
+        boolean, or a blank node.
+
+    Returns
+    -------
+    str
+        The value that the JSON results would give for the term.
+    """
+    first = term[0]
+    if first == '"':
+        value = term[1 : term.rindex('"')]
+        return _TSV_ESCAPE.sub(_unescape_tsv, value) if "\\" in value else value
+
+    if first == "<":
+        return term[1:-1]
+
+    return term[2:] if term.startswith("_:") else term
+
+
+def iter_tsv_rows(stream: BinaryIO) -> Iterator[dict[str, str]] | None:
+    """
+    Stream the rows of SPARQL TSV results as variable to value dicts.
+
+    Unbound variables are left out of a row as they are in the JSON results.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        The response body, e.g. ``sparql.query().response``.
+
+    Returns
+    -------
+    Iterator[dict[str, str]] | None
+        An iterator over the rows, or None if the response has no header.
+    """
+    lines = io.TextIOWrapper(stream, encoding="utf-8", newline="\n")
+    header = lines.readline().rstrip("\r\n")
+    if not header:
+        return None
+
+    variables = [var.lstrip("?$") for var in header.split("\t")]
+    return (
+        {
+            var: tsv_term_value(term)
+            for var, term in zip(variables, line.rstrip("\r\n").split("\t"))
+            if term
+        }
+        for line in lines
+    )
+
+
+def iter_csv_rows(stream: BinaryIO) -> Iterator[dict[str, str]] | None:
+    """
+    Stream the rows of SPARQL CSV results as variable to value dicts.
+
+    CSV results hold plain values, but they don't distinguish unbound variables from
+    empty literals. Empty cells are therefore left out as unbound variables.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        The response body, e.g. ``sparql.query().response``.
+
+    Returns
+    -------
+    Iterator[dict[str, str]] | None
+        An iterator over the rows, or None if the response has no header.
+    """
+    reader = csv.reader(io.TextIOWrapper(stream, encoding="utf-8", newline=""))
+    variables = next(reader, None)
+    if not variables:
+        return None
+
+    return (
+        {var: value for var, value in zip(variables, row) if value} for row in reader
+    )
+
+
+# Readers of each result format that WDQS can return, keyed by SPARQLWrapper format.
+RESULT_ROW_READERS: dict[str, Callable[[BinaryIO], Iterator[dict] | None]] = {
+    "json": iter_json_rows,
+    "tsv": iter_tsv_rows,
+    "csv": iter_csv_rows,
+}
+
+
+def iter_result_rows(
+    stream: BinaryIO, result_format: str = "json"
+) -> Iterator[dict[str, str]] | None:
+    """
+    Stream the rows of SPARQL results in any of the ``RESULT_ROW_READERS`` formats.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        The response body, e.g. ``sparql.query().response``.
+
+    result_format : str, default="json"
+        The format of the results: one of "json", "tsv" or "csv".
+
+    Returns
+    -------
+    Iterator[dict[str, str]] | None
+        An iterator over the rows, or None if the response holds no results.
+    """
+    return RESULT_ROW_READERS[result_format](stream)
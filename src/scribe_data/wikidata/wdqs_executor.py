@@ -0,0 +1,329 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Concurrent and rate limited execution of SPARQL queries against the Wikidata Query Service.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Mapping, TypeVar
+from urllib.error import HTTPError
+
+from SPARQLWrapper import JSON, POST
+from SPARQLWrapper.Wrapper import QueryResult
+
+from scribe_data.wikidata.sparql_cache import (
+    CachingSPARQLWrapper,
+    discard_cached_response,
+)
+from scribe_data.wikidata.sparql_options import DEFAULT_MAX_CONCURRENCY
+
+WDQS_ENDPOINT = "https://query.wikidata.org/sparql"
+
+DEFAULT_QUERIES_PER_SECOND = 2.0
+
+# Responses that WDQS sends when a client should slow down.
+RETRYABLE_STATUS_CODES = {429, 503}
+MAX_RETRY_AFTER_SECONDS = 300.0
+
+K = TypeVar("K")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that limits how often queries are started.
+
+    Parameters
+    ----------
+    rate : float
+        Tokens added per second.
+
+    capacity : float, optional
+        Largest number of tokens that can be saved up. Defaults to ``max(rate, 1)``.
+
+    clock : Callable[[], float], default=time.monotonic
+        Returns the current time in seconds.
+
+    sleep : Callable[[float], None], default=time.sleep
+        Waits for the given number of seconds.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Create a full bucket.
+
+        Parameters
+        ----------
+        rate : float
+            Tokens added per second.
+
+        capacity : float, optional
+            Largest number of tokens that can be saved up. Defaults to ``max(rate, 1)``.
+
+        clock : Callable[[], float], default=time.monotonic
+            Returns the current time in seconds.
+
+        sleep : Callable[[float], None], default=time.sleep
+            Waits for the given number of seconds.
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Take a token, possibly ahead of time, and return how long to wait for it.
+
+        Returns
+        -------
+        float
+            Seconds until the reserved token becomes available.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """
+        Wait until a token is available and take it.
+        """
+        if (wait := self._reserve()) > 0:
+            self._sleep(wait)
+
+
+def _retry_after_seconds(error: HTTPError, default: float) -> float:
+    """
+    Return how long the server asked the client to wait before retrying.
+
+    Parameters
+    ----------
+    error : HTTPError
+        The throttling response.
+
+    default : float
+        Seconds to wait if the response has no usable ``Retry-After`` header.
+
+    Returns
+    -------
+    float
+        Seconds to wait, capped at ``MAX_RETRY_AFTER_SECONDS``.
+    """
+    value = error.headers.get("Retry-After") if error.headers else None
+    if value is None:
+        return default
+
+    try:
+        seconds = float(value)
+
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+
+        except (TypeError, ValueError):
+            return default
+
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+class WDQSExecutor:
+    """
+    Run SPARQL queries concurrently while staying within the WDQS usage limits.
+
+    Each query waits for a token from a shared ``TokenBucket`` before it is sent, at
+    most ``max_concurrency`` queries are in flight at once, and throttled queries are
+    retried after the delay the server asks for in its ``Retry-After`` header.
+
+    Parameters
+    ----------
+    endpoint : str, default=WDQS_ENDPOINT
+        The SPARQL endpoint to query.
+
+    max_concurrency : int, default=DEFAULT_MAX_CONCURRENCY
+        Largest number of queries in flight at once.
+
+    queries_per_second : float, default=DEFAULT_QUERIES_PER_SECOND
+        Rate at which new queries, including retries, may be started.
+
+    max_retries : int, default=3
+        Times a throttled query is retried before its error is returned.
+
+    backoff_seconds : float, default=5.0
+        Wait before retrying a throttled query that has no ``Retry-After`` header.
+
+    agent : str, optional
+        The User-Agent to send with queries. Defaults to that of SPARQLWrapper.
+
+    reader : Callable[[QueryResult], Any], optional
+        Reads the results from the response. Defaults to ``QueryResult.convert``.
+
+    return_format : str, default=JSON
+        The SPARQLWrapper format to request results in, e.g. JSON, TSV or CSV.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = WDQS_ENDPOINT,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        queries_per_second: float = DEFAULT_QUERIES_PER_SECOND,
+        max_retries: int = 3,
+        backoff_seconds: float = 5.0,
+        agent: str | None = None,
+        reader: Callable[[QueryResult], Any] | None = None,
+        return_format: str = JSON,
+    ) -> None:
+        """
+        Store the endpoint and limits.
+
+        Parameters
+        ----------
+        endpoint : str, default=WDQS_ENDPOINT
+            The SPARQL endpoint to query.
+
+        max_concurrency : int, default=DEFAULT_MAX_CONCURRENCY
+            Largest number of queries in flight at once.
+
+        queries_per_second : float, default=DEFAULT_QUERIES_PER_SECOND
+            Rate at which new queries, including retries, may be started.
+
+        max_retries : int, default=3
+            Times a throttled query is retried before its error is returned.
+
+        backoff_seconds : float, default=5.0
+            Wait before retrying a throttled query that has no ``Retry-After`` header.
+
+        agent : str, optional
+            The User-Agent to send with queries. Defaults to that of SPARQLWrapper.
+
+        reader : Callable[[QueryResult], Any], optional
+            Reads the results from the response. Defaults to ``QueryResult.convert``.
+
+        return_format : str, default=JSON
+            The SPARQLWrapper format to request results in, e.g. JSON, TSV or CSV.
+        """
+        self.endpoint = endpoint
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.agent = agent
+        self.reader = reader or QueryResult.convert
+        self.return_format = return_format
+        self.bucket = TokenBucket(queries_per_second, capacity=self.max_concurrency)
+
+    def _client(self, query: str) -> CachingSPARQLWrapper:
+        """
+        Return a client of its own for a query, as clients are not thread-safe.
+
+        Parameters
+        ----------
+        query : str
+            The SPARQL query.
+
+        Returns
+        -------
+        CachingSPARQLWrapper
+            The client, which shares the SPARQL response cache.
+        """
+        client = CachingSPARQLWrapper(self.endpoint)
+        if self.agent:
+            client.agent = self.agent
+
+        client.setReturnFormat(self.return_format)
+        client.setMethod(POST)
+        client.setQuery(query)
+        return client
+
+    def query(self, query: str) -> Any:
+        """
+        Run a query, waiting out rate limits and throttling responses.
+
+        Queries answered from the SPARQL response cache are not rate limited.
+
+        Parameters
+        ----------
+        query : str
+            The SPARQL query.
+
+        Returns
+        -------
+        Any
+            The results as read by ``reader``.
+
+        Raises
+        ------
+        HTTPError
+            If the query fails for a reason other than throttling or is still
+            throttled after ``max_retries`` retries.
+        """
+        for attempt in range(self.max_retries + 1):
+            client = self._client(query)
+            if not client.has_cached_response():
+                self.bucket.acquire()
+
+            try:
+                result = client.query()
+
+            except HTTPError as err:
+                if (
+                    err.code not in RETRYABLE_STATUS_CODES
+                    or attempt == self.max_retries
+                ):
+                    raise
+
+                time.sleep(_retry_after_seconds(err, self.backoff_seconds))
+                continue
+
+            try:
+                return self.reader(result)
+
+            except Exception:
+                discard_cached_response(result.response)
+                raise
+
+    def run(self, queries: Mapping[K, str]) -> dict[K, Any]:
+        """
+        Run several queries concurrently.
+
+        Parameters
+        ----------
+        queries : Mapping[K, str]
+            SPARQL queries keyed by an identifier such as their file path.
+
+        Returns
+        -------
+        dict[K, Any]
+            The results of each query, or the exception it raised, under its key.
+        """
+        if not queries:
+            return {}
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(queries)),
+            thread_name_prefix="wdqs",
+        ) as pool:
+            futures = {key: pool.submit(self.query, q) for key, q in queries.items()}
+
+        results: dict[K, Any] = {}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+
+            except Exception as err:
+                results[key] = err
+
+        return results
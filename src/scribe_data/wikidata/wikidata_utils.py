@@ -6,7 +6,7 @@ Utility functions for accessing data from Wikidata.
 from pathlib import Path
 
 from rich import print as rprint
-from SPARQLWrapper import JSON, POST, SPARQLWrapper
+from SPARQLWrapper import JSON, POST
 
 from scribe_data.cli.download.wikidata_lexeme_dump import (
     wd_lexeme_dump_download_wrapper,
@@ -16,9 +16,11 @@ from scribe_data.utils import (
     data_type_metadata,
     language_metadata,
 )
+from scribe_data.wikidata.lexeme_table import LexemeTableWriter
 from scribe_data.wikidata.parse_dump import parse_dump
+from scribe_data.wikidata.sparql_cache import CachingSPARQLWrapper
 
-sparql = SPARQLWrapper("https://query.wikidata.org/sparql")
+sparql = CachingSPARQLWrapper("https://query.wikidata.org/sparql")
 sparql.setReturnFormat(JSON)
 sparql.setMethod(POST)
 
@@ -31,6 +33,7 @@ def parse_wd_lexeme_dump(
     wikidata_dump_path: Path | None = DEFAULT_WIKIDATA_DUMP_EXPORT_DIR,
     overwrite_all: bool = False,
     interactive_mode: bool = False,
+    write_output: LexemeTableWriter | None = None,
 ) -> None:
     """
     Check for the existence of a Wikidata lexeme dump and parses it if possible.
@@ -58,6 +61,10 @@ def parse_wd_lexeme_dump(
     interactive_mode : bool, default=False
         Whether the function is being ran via interactive mode.
 
+    write_output : LexemeTableWriter, optional
+        Writes the parsed forms to another output type, e.g. SQLite, in place of
+        exporting them to JSON.
+
     Returns
     -------
     None
@@ -122,6 +129,7 @@ def parse_wd_lexeme_dump(
                 file_path=file_path,
                 output_dir=output_dir,
                 overwrite_all=overwrite_all,
+                write_output=write_output,
             )
 
         return
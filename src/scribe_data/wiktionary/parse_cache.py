@@ -0,0 +1,233 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+On-disk cache of parsed Wiktionary pages so that re-runs only parse changed pages.
+"""
+
+import hashlib
+import sqlite3
+import time
+from importlib import metadata
+from pathlib import Path
+
+import orjson
+
+# Bump when the output of the page parsers changes so that old entries are not reused.
+PARSE_CACHE_FORMAT_VERSION = 1
+
+DEFAULT_PARSE_CACHE_MAX_BYTES = 2 * 1024**3
+
+
+def parse_cache_context(*parts) -> str:
+    """
+    Fingerprint everything other than page content that parsed results depend on.
+
+    Parameters
+    ----------
+    *parts : Any
+        Values with a stable ``repr`` such as the source ISO, target languages and config.
+
+    Returns
+    -------
+    str
+        A hex digest that is mixed into every cache key.
+    """
+    try:
+        package_version = metadata.version("scribe-data")
+
+    except metadata.PackageNotFoundError:
+        package_version = "unknown"
+
+    fingerprint = repr((PARSE_CACHE_FORMAT_VERSION, package_version, *parts))
+    return hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class PageParseCache:
+    """
+    SQLite store of parsed page translations keyed by page title and content hash.
+
+    Lookups and writes are buffered so that worker processes can share one cache file,
+    with each call to ``flush`` committing a single short transaction. Keys include a
+    context fingerprint so that several source editions can share the same file.
+
+    Parameters
+    ----------
+    path : str | Path
+        The SQLite file to store parsed pages in.
+
+    max_bytes : int, default=DEFAULT_PARSE_CACHE_MAX_BYTES
+        The size that ``evict`` trims stored results down to.
+
+    run_stamp : int, optional
+        Marks entries used in the current run. Defaults to the current time.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int = DEFAULT_PARSE_CACHE_MAX_BYTES,
+        run_stamp: int | None = None,
+    ) -> None:
+        """
+        Open the cache file and create its table if needed.
+
+        Parameters
+        ----------
+        path : str | Path
+            The SQLite file to store parsed pages in.
+
+        max_bytes : int, default=DEFAULT_PARSE_CACHE_MAX_BYTES
+            The size that ``evict`` trims stored results down to.
+
+        run_stamp : int, optional
+            Marks entries used in the current run. Defaults to the current time.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.run_stamp = run_stamp if run_stamp is not None else int(time.time())
+        self._pending: list[tuple[bytes, bytes, int, int]] = []
+        self._touched: list[tuple[int, bytes]] = []
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, timeout=60)
+        # Must be set before the first table is created to take effect.
+        self.connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                key BLOB PRIMARY KEY,
+                parsed BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_used INTEGER NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self.connection.commit()
+
+    def key(self, context: str, title: str, content: bytes) -> bytes:
+        """
+        Return the cache key for a page.
+
+        Parameters
+        ----------
+        context : str
+            Fingerprint from ``parse_cache_context`` for the edition and target languages.
+
+        title : str
+            The page title, which keeps translation subpages apart from their base page.
+
+        content : bytes
+            The page content that the parsed result depends on.
+
+        Returns
+        -------
+        bytes
+            A digest of the cache context, title and content.
+        """
+        digest = hashlib.blake2b(context.encode("utf-8"), digest_size=16)
+        digest.update(b"\0")
+        digest.update(title.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(content)
+        return digest.digest()
+
+    def get(self, key: bytes) -> dict | None:
+        """
+        Return the cached result for a key and mark it as used in this run.
+
+        Parameters
+        ----------
+        key : bytes
+            A key from ``key``.
+
+        Returns
+        -------
+        dict | None
+            The parsed translations, which may be empty, or None on a cache miss.
+        """
+        row = self.connection.execute(
+            "SELECT parsed, last_used FROM pages WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        if row[1] < self.run_stamp:
+            self._touched.append((self.run_stamp, key))
+
+        return orjson.loads(row[0])
+
+    def put(self, key: bytes, parsed: dict) -> None:
+        """
+        Buffer a parsed result to be written on the next ``flush``.
+
+        Parameters
+        ----------
+        key : bytes
+            A key from ``key``.
+
+        parsed : dict
+            The parsed translations of the page, empty if it has none.
+        """
+        blob = orjson.dumps(parsed)
+        self._pending.append((key, blob, len(key) + len(blob), self.run_stamp))
+
+    def flush(self) -> None:
+        """
+        Write buffered results and usage marks in a single transaction.
+        """
+        if not self._pending and not self._touched:
+            return
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)", self._pending
+            )
+            self.connection.executemany(
+                "UPDATE pages SET last_used = ? WHERE key = ?", self._touched
+            )
+
+        self._pending.clear()
+        self._touched.clear()
+
+    def evict(self) -> int:
+        """
+        Delete the least recently used entries until the cache fits in ``max_bytes``.
+
+        Returns
+        -------
+        int
+            The number of entries deleted.
+        """
+        self.flush()
+        total = self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM pages"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        with self.connection:
+            deleted = self.connection.execute(
+                """
+                DELETE FROM pages WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, size, SUM(size) OVER (
+                            ORDER BY last_used, key ROWS UNBOUNDED PRECEDING
+                        ) AS freed
+                        FROM pages
+                    )
+                    WHERE freed - size < ?
+                )
+                """,
+                (total - self.max_bytes,),
+            ).rowcount
+
+        self.connection.execute("PRAGMA incremental_vacuum")
+        return deleted
+
+    def close(self) -> None:
+        """
+        Flush any buffered writes and close the connection.
+        """
+        self.flush()
+        self.connection.close()
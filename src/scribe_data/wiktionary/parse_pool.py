@@ -0,0 +1,304 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Scheduling of Wiktionary parse tasks over a worker pool with bounded memory use.
+"""
+
+import collections
+import time
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+
+# Tasks kept submitted per worker so that workers never wait on the parent.
+IN_FLIGHT_PER_WORKER = 3
+
+
+@dataclass
+class PoolMetrics:
+    """
+    Counters of a parse run for sizing the number of workers on a host.
+
+    Attributes
+    ----------
+    num_workers : int
+        Number of processes that tasks are run in.
+
+    tasks : int
+        Number of tasks that have finished.
+
+    pages : int
+        Number of pages parsed by the finished tasks.
+
+    input_bytes : int
+        Bytes of page XML or compressed streams sent to the finished tasks.
+
+    worker_seconds : float
+        Time that workers spent running tasks.
+
+    queue_depth : int
+        Number of tasks in flight at the latest submission.
+
+    queue_depth_total : int
+        Sum of the number of tasks in flight at each submission.
+
+    max_queue_depth : int
+        Largest number of tasks in flight at once.
+
+    started : float
+        ``time.perf_counter`` value when the run started.
+    """
+
+    num_workers: int
+    tasks: int = 0
+    pages: int = 0
+    input_bytes: int = 0
+    worker_seconds: float = 0.0
+    queue_depth: int = 0
+    queue_depth_total: int = 0
+    max_queue_depth: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    def record_submit(self, queue_depth: int) -> None:
+        """
+        Record the number of tasks in flight after a submission.
+
+        Parameters
+        ----------
+        queue_depth : int
+            Tasks submitted to the pool whose results have not been collected.
+        """
+        self.queue_depth = queue_depth
+        self.queue_depth_total += queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+    def record_task(self, pages: int, input_bytes: int, seconds: float) -> None:
+        """
+        Record a finished task.
+
+        Parameters
+        ----------
+        pages : int
+            Number of pages the task parsed.
+
+        input_bytes : int
+            Bytes of input that were sent to the task.
+
+        seconds : float
+            Time the worker spent on the task.
+        """
+        self.tasks += 1
+        self.pages += pages
+        self.input_bytes += input_bytes
+        self.worker_seconds += seconds
+
+    @property
+    def worker_utilization(self) -> float:
+        """
+        Fraction of the available worker time that was spent running tasks.
+
+        Returns
+        -------
+        float
+            Busy worker time over elapsed time multiplied by the number of workers.
+        """
+        elapsed = time.perf_counter() - self.started
+        return self.worker_seconds / (elapsed * self.num_workers) if elapsed else 0.0
+
+    def as_dict(self) -> dict:
+        """
+        Return the metrics as a JSON-serializable dict.
+
+        Returns
+        -------
+        dict
+            The counters together with the derived queue depth and utilization.
+        """
+        wall_seconds = time.perf_counter() - self.started
+        submissions = self.tasks or 1
+        return {
+            "num_workers": self.num_workers,
+            "tasks": self.tasks,
+            "pages": self.pages,
+            "input_bytes": self.input_bytes,
+            "wall_seconds": round(wall_seconds, 3),
+            "worker_seconds": round(self.worker_seconds, 3),
+            "worker_utilization": round(self.worker_utilization, 3),
+            "mean_queue_depth": round(self.queue_depth_total / submissions, 2),
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+class AdaptiveBatcher:
+    """
+    Group pages into batches sized from the observed worker time per page.
+
+    Small batches keep workers evenly loaded while large ones amortize the cost of
+    sending tasks, so the batch size is steered towards ``target_seconds`` of work
+    and capped by ``max_bytes`` of page XML.
+
+    Parameters
+    ----------
+    target_seconds : float, default=0.2
+        Worker time that each batch should take.
+
+    initial_pages : int, default=50
+        Batch size used before any timings are observed.
+
+    max_pages : int, default=1000
+        Largest number of pages in a batch.
+
+    max_bytes : int, default=8 * 1024**2
+        Largest amount of page XML in a batch.
+    """
+
+    def __init__(
+        self,
+        target_seconds: float = 0.2,
+        initial_pages: int = 50,
+        max_pages: int = 1000,
+        max_bytes: int = 8 * 1024**2,
+    ) -> None:
+        """
+        Store the batching limits.
+
+        Parameters
+        ----------
+        target_seconds : float, default=0.2
+            Worker time that each batch should take.
+
+        initial_pages : int, default=50
+            Batch size used before any timings are observed.
+
+        max_pages : int, default=1000
+            Largest number of pages in a batch.
+
+        max_bytes : int, default=8 * 1024**2
+            Largest amount of page XML in a batch.
+        """
+        self.target_seconds = target_seconds
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.batch_pages = initial_pages
+        self._seconds_per_page: float | None = None
+
+    def observe(self, pages: int, seconds: float) -> None:
+        """
+        Update the batch size from the worker time of a finished batch.
+
+        Parameters
+        ----------
+        pages : int
+            Number of pages in the batch.
+
+        seconds : float
+            Time the worker spent on the batch.
+        """
+        if not pages:
+            return
+
+        per_page = seconds / pages
+        if self._seconds_per_page is None:
+            self._seconds_per_page = per_page
+
+        else:
+            # Exponential moving average so one slow page doesn't swing the size.
+            self._seconds_per_page += 0.3 * (per_page - self._seconds_per_page)
+
+        ideal = self.target_seconds / max(self._seconds_per_page, 1e-6)
+        self.batch_pages = max(1, min(self.max_pages, int(ideal)))
+
+    def batches(self, pages):
+        """
+        Yield batches of pages using the batch size at the time each batch starts.
+
+        Parameters
+        ----------
+        pages : Iterable[tuple[str, bytes]]
+            ``(word, page_xml)`` for each page to parse.
+
+        Yields
+        ------
+        tuple[tuple[tuple[str, bytes], ...], int]
+            The pages of a batch and their size in bytes.
+        """
+        batch: list[tuple[str, bytes]] = []
+        batch_bytes = 0
+        for page in pages:
+            batch.append(page)
+            batch_bytes += len(page[1])
+            if len(batch) >= self.batch_pages or batch_bytes >= self.max_bytes:
+                yield tuple(batch), batch_bytes
+                batch, batch_bytes = [], 0
+
+        if batch:
+            yield tuple(batch), batch_bytes
+
+
+def iter_bounded_outputs(fn, tasks, executor: Executor | None, metrics: PoolMetrics):
+    """
+    Run tasks and yield their outputs in order while bounding the tasks in flight.
+
+    Unlike ``Executor.map``, tasks are only pulled from ``tasks`` when there is room
+    in the submission window, so a fast reader can't queue the whole dump in memory.
+
+    Parameters
+    ----------
+    fn : Callable
+        Worker function returning ``(results, pages, seconds)``.
+
+    tasks : Iterable[tuple[Any, int]]
+        ``(args, input_bytes)`` for each task.
+
+    executor : Optional[Executor]
+        The pool to run tasks in, or None to run them in this process.
+
+    metrics : PoolMetrics
+        Metrics to record the run in.
+
+    Yields
+    ------
+    tuple[list, int, float, int]
+        ``(results, pages, seconds, input_bytes)`` for each task in submission order.
+    """
+    if executor is None:
+        for args, input_bytes in tasks:
+            results, pages, seconds = fn(args)
+            metrics.record_task(pages, input_bytes, seconds)
+            yield results, pages, seconds, input_bytes
+
+        return
+
+    max_in_flight = metrics.num_workers * IN_FLIGHT_PER_WORKER
+    pending: collections.deque[tuple[Future, int]] = collections.deque()
+    for args, input_bytes in tasks:
+        pending.append((executor.submit(fn, args), input_bytes))
+        metrics.record_submit(len(pending))
+        while pending and (len(pending) >= max_in_flight or pending[0][0].done()):
+            yield _collect_output(pending.popleft(), metrics)
+
+    while pending:
+        yield _collect_output(pending.popleft(), metrics)
+
+
+def _collect_output(
+    submitted: tuple[Future, int], metrics: PoolMetrics
+) -> tuple[list, int, float, int]:
+    """
+    Wait for a submitted task and record it in the metrics.
+
+    Parameters
+    ----------
+    submitted : tuple[Future, int]
+        The task's future and input size.
+
+    metrics : PoolMetrics
+        Metrics to record the task in.
+
+    Returns
+    -------
+    tuple[list, int, float, int]
+        ``(results, pages, seconds, input_bytes)`` of the task.
+    """
+    future, input_bytes = submitted
+    results, pages, seconds = future.result()
+    metrics.record_task(pages, input_bytes, seconds)
+    return results, pages, seconds, input_bytes
@@ -5,27 +5,43 @@ Parse translations for a target language from a Wiktionary pages-articles dump.
 
 import bz2
 import collections
+import contextlib
+import html
 import io
 import os
 import re
-import xml.etree.ElementTree as ET
-from concurrent.futures import ProcessPoolExecutor
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import BinaryIO, cast
+from typing import BinaryIO, Iterator, Mapping, cast
 
 import mwparserfromhell
-import orjson
 from tqdm import tqdm
 
 from scribe_data.utils import (
     DEFAULT_WIKTIONARY_DUMP_EXPORT_DIR,
     DEFAULT_WIKTIONARY_JSON_EXPORT_DIR,
+    LanguageRegistry,
     check_index_exists,
     get_language_from_iso,
     language_metadata,
+    language_registry,
     resolve_lang_iso,
+    write_json,
+)
+from scribe_data.wiktionary.parse_cache import (
+    DEFAULT_PARSE_CACHE_MAX_BYTES,
+    PageParseCache,
+    parse_cache_context,
 )
 from scribe_data.wiktionary.parse_constants import get_wiktionary_config
+from scribe_data.wiktionary.parse_pool import (
+    AdaptiveBatcher,
+    PoolMetrics,
+    iter_bounded_outputs,
+)
+from scribe_data.wiktionary.translations_sqlite import export_translations_to_sqlite
 
 # A single translation entry (e.g., {"description": "...", "translation": "..."}).
 TranslationEntry = dict[str, str]
@@ -50,6 +66,7 @@ def _merge_parsed_into_output(
     output: LanguageToWords,
     word: str,
     parsed: dict[str, PosToSenses],
+    next_sense_idx: dict[tuple[str, str, str], int] | None = None,
 ) -> None:
     """
     Merge a single page's parsed translations into the cumulative output dict.
@@ -64,22 +81,65 @@ def _merge_parsed_into_output(
 
     parsed : dict[str, PosToSenses]
         Translations returned by one of the ``_parse_page_translations_*`` functions.
+
+    next_sense_idx : dict[tuple[str, str, str], int], optional
+        The next free sense index per ``(lang, word, pos)``, kept alongside ``output``
+        so that repeated merges for a word don't rescan its senses.
     """
+    if next_sense_idx is None:
+        next_sense_idx = {}
+
     for code, pos_senses in parsed.items():
         word_map = output.setdefault(code, {})
         pos_map = word_map.setdefault(word, {})
         for pos, senses in pos_senses.items():
             if sense_map := pos_map.setdefault(pos, {}):
-                for src_idx, src_data in senses.items():
-                    target_idx = src_idx
-                    while target_idx in sense_map:
-                        target_idx = str(int(target_idx) + 1)
-                    sense_map[target_idx] = src_data
+                key = (code, word, pos)
+                if (next_idx := next_sense_idx.get(key)) is None:
+                    next_idx = max(map(int, sense_map)) + 1
+
+                next_sense_idx[key] = _merge_senses(sense_map, senses, next_idx)
 
             else:
                 sense_map.update(senses)
 
 
+def _merge_senses(
+    sense_map: SensesToTranslations, senses: SensesToTranslations, next_idx: int
+) -> int:
+    """
+    Add senses to an existing sense map, moving clashing indices to the end.
+
+    Parameters
+    ----------
+    sense_map : SensesToTranslations
+        The senses already merged for a word and part of speech.
+
+    senses : SensesToTranslations
+        The senses from another page for the same word and part of speech.
+
+    next_idx : int
+        An index above every index in ``sense_map``.
+
+    Returns
+    -------
+    int
+        The next free sense index after the merge.
+    """
+    for src_idx, src_data in senses.items():
+        if src_idx in sense_map:
+            target_idx = str(next_idx)
+            next_idx += 1
+
+        else:
+            target_idx = src_idx
+            next_idx = max(next_idx, int(src_idx) + 1)
+
+        sense_map[target_idx] = src_data
+
+    return next_idx
+
+
 def _build_sense_entry(description: str, translation: str) -> dict[str, str]:
     """
     Build a sense entry dict with stable keys for JSON consumers.
@@ -829,19 +889,182 @@ def _parse_page_translations(
     )
 
 
+# MARK: Edition Profiles
+
+
+@dataclass(frozen=True)
+class _EditionProfile:
+    """
+    Tags pages with the source edition settings that workers need to parse them.
+
+    Sending the profile once per batch lets a single worker pool parse several
+    Wiktionary editions at the same time.
+    """
+
+    source_iso: str
+    target_langs: frozenset | None
+    config: dict
+    cache_context: str = ""
+
+
+def _build_edition_profile(
+    source_iso: str, target_lang_codes: list[str] | None, use_cache: bool
+) -> _EditionProfile:
+    """
+    Load the config of a source edition and build the profile for its pages.
+
+    Parameters
+    ----------
+    source_iso : str
+        ISO code of the source Wiktionary edition.
+
+    target_lang_codes : list of str or None
+        ISO codes of languages to extract, or None for all.
+
+    use_cache : bool
+        Whether pages should be looked up in and added to the page cache.
+
+    Returns
+    -------
+    _EditionProfile
+        The profile that is sent to workers with each batch of pages.
+    """
+    target_langs = (
+        frozenset(c.lower() for c in target_lang_codes) if target_lang_codes else None
+    )
+    config = get_wiktionary_config(source_iso=source_iso)
+    cache_context = ""
+    if use_cache:
+        cache_context = parse_cache_context(
+            source_iso, sorted(target_langs or ()), sorted(config.items())
+        )
+
+    return _EditionProfile(source_iso, target_langs, config, cache_context)
+
+
+# MARK: Worker Pool
+
+# The page cache of the current process, opened in each worker by _init_page_cache.
+_page_cache: PageParseCache | None = None
+
+
+def _init_page_cache(cache_path: str | None, run_stamp: int) -> None:
+    """
+    Open the page cache for the current process, or close it if no path is given.
+
+    Parameters
+    ----------
+    cache_path : str | None
+        The SQLite file of the cache, or None to parse without a cache.
+
+    run_stamp : int
+        Marks the entries that are used in the current run.
+    """
+    global _page_cache
+    if _page_cache is not None:
+        _page_cache.close()
+
+    _page_cache = (
+        PageParseCache(cache_path, run_stamp=run_stamp) if cache_path else None
+    )
+
+
+def _create_worker_pool(
+    num_workers: int, cache_path: str | Path | None = None
+) -> ProcessPoolExecutor:
+    """
+    Start a pool of parse workers that can be shared by several dumps.
+
+    Parameters
+    ----------
+    num_workers : int
+        Number of worker processes.
+
+    cache_path : str or Path, optional
+        SQLite file for the per-page parse cache that the workers should open.
+
+    Returns
+    -------
+    ProcessPoolExecutor
+        The pool, with the page cache opened in each worker.
+    """
+    if cache_path:
+        # Create the cache file before any workers open it.
+        PageParseCache(cache_path).close()
+
+    return ProcessPoolExecutor(
+        max_workers=num_workers,
+        initializer=_init_page_cache,
+        initargs=(str(cache_path) if cache_path else None, int(time.time())),
+    )
+
+
+def _evict_page_cache(cache_path: str | Path, max_bytes: int) -> None:
+    """
+    Trim the page cache to its size budget once parsing has finished.
+
+    Parameters
+    ----------
+    cache_path : str or Path
+        SQLite file of the per-page parse cache.
+
+    max_bytes : int
+        The size to trim the cache to.
+    """
+    cache = PageParseCache(cache_path, max_bytes=max_bytes)
+    cache.evict()
+    cache.close()
+
+
+def _page_cache_key(cache: PageParseCache, context: str, page_xml: bytes) -> bytes:
+    """
+    Return the cache key of a raw page from its title and a hash of its wikitext.
+
+    Parameters
+    ----------
+    cache : PageParseCache
+        The cache that the key is for.
+
+    context : str
+        The cache context of the page's edition profile.
+
+    page_xml : bytes
+        The XML of a single page as yielded by ``_iter_dump_page_blobs``.
+
+    Returns
+    -------
+    bytes
+        The key, which changes whenever the page title or wikitext changes.
+    """
+    text = b""
+    match = _TEXT_OPEN_RE.search(page_xml)
+    if match and not match[1]:
+        text = page_xml[match.end() : page_xml.find(b"</text>", match.end())]
+
+    return cache.key(context, _extract_page_title(page_xml), text)
+
+
 # MARK: Parse Dump
 
+# Literal page tags used to split the dump without a full XML parse.
+_PAGE_OPEN = b"<page>"
+_PAGE_CLOSE = b"</page>"
+
+# Matches the revision text opening tag; group 1 is set for a self-closing tag.
+_TEXT_OPEN_RE = re.compile(rb"<text\b[^>]*?(/?)>")
+
 
 def _parse_page_worker(
-    args: tuple[str, str, frozenset | None, dict],
+    args: tuple[str, str | bytes, frozenset | None, dict],
 ) -> tuple[str, dict[str, PosToSenses]] | None:
     """
     Parse a single Wiktionary page, designed to be called from a worker process.
 
     Parameters
     ----------
-    args : tuple[str, str, frozenset | None, dict]
-        Packed tuple of (word, wikitext, target_langs, config).
+    args : tuple[str, str | bytes, frozenset | None, dict]
+        Packed tuple of (word, wikitext, target_langs, config). The wikitext may also
+        be the raw ``<page>`` XML from the dump, which is then decoded in the worker.
 
     Returns
     -------
@@ -849,6 +1072,9 @@ def _parse_page_worker(
         ``(word, parsed)`` or ``None`` if the page has no translations.
     """
     word, wikitext, target_langs, config = args
+    if isinstance(wikitext, bytes):
+        wikitext = _extract_page_text(wikitext)
+
     if not word or not wikitext:
         return None
 
@@ -861,26 +1087,89 @@ def _parse_page_worker(
     return (word, parsed) if parsed else None
 
 
-def _iter_dump_pages(wiktionary_dump_path: Path, pbar=None):
+def _parse_profile_page(
+    profile: _EditionProfile, word: str, page_xml: bytes
+) -> tuple[str, dict[str, PosToSenses]] | None:
     """
-    Yield ``(title, text)`` for each page in the XML dump.
+    Parse a raw page for an edition profile, reusing the page cache when it is open.
 
     Parameters
     ----------
-    wiktionary_dump_path : Path
-        Path to a ``*wiktionary-*-pages-articles.xml.bz2`` dump file.
+    profile : _EditionProfile
+        The edition that the page belongs to.
 
-    pbar : Optional[tqdm]
-        Optional tqdm progress bar to continuously record bytes read.
+    word : str
+        The source word of the page.
+
+    page_xml : bytes
+        The XML of a single page as yielded by ``_iter_dump_page_blobs``.
+
+    Returns
+    -------
+    tuple[str, dict[str, PosToSenses]] | None
+        ``(word, parsed)`` or ``None`` if the page has no translations.
+    """
+    cache = _page_cache if profile.cache_context else None
+    if cache is None:
+        return _parse_page_worker(
+            (word, page_xml, profile.target_langs, profile.config)
+        )
+
+    key = _page_cache_key(cache, profile.cache_context, page_xml)
+    if (cached := cache.get(key)) is not None:
+        return (word, cached) if cached else None
+
+    result = _parse_page_worker((word, page_xml, profile.target_langs, profile.config))
+    cache.put(key, result[1] if result else {})
+    return result
+
+
+def _parse_page_batch_worker(
+    args: tuple[_EditionProfile, tuple[tuple[str, bytes], ...]],
+) -> tuple[list[tuple[str, dict[str, PosToSenses]]], int, float]:
+    """
+    Parse a batch of pages in a worker process and commit their cache entries together.
+
+    Parameters
+    ----------
+    args : tuple[_EditionProfile, tuple[tuple[str, bytes], ...]]
+        Packed tuple of (profile, pages) with ``(word, page_xml)`` for each page.
+
+    Returns
+    -------
+    tuple[list[tuple[str, dict[str, PosToSenses]]], int, float]
+        ``(word, parsed)`` for each page with translations, the number of pages and
+        the seconds spent parsing them.
+    """
+    started = time.perf_counter()
+    profile, pages = args
+    results = [
+        result
+        for word, page_xml in pages
+        if (result := _parse_profile_page(profile, word, page_xml))
+    ]
+    if _page_cache is not None:
+        _page_cache.flush()
+
+    return results, len(pages), time.perf_counter() - started
+
+
+class _ProgressFileWrapper(io.RawIOBase):
+    """
+    File-like wrapper that updates a progress bar on read operations.
+
+    Parameters
+    ----------
+    path : Path | str
+        File path to open in binary mode.
+
+    pbar_ref : Optional[tqdm]
+        Progress bar to update with consumed byte counts.
     """
-    import shutil
-    import subprocess
-    import threading
 
-    # Simple wrapper to update pbar dynamically behind bz2.open.
-    class ProgressFileWrapper(io.RawIOBase):
+    def __init__(self, path, pbar_ref):
         """
-        File-like wrapper that updates a progress bar on read operations.
+        Open the wrapped file and store the progress-bar reference.
 
         Parameters
         ----------
@@ -890,110 +1179,142 @@ def _iter_dump_pages(wiktionary_dump_path: Path, pbar=None):
         pbar_ref : Optional[tqdm]
             Progress bar to update with consumed byte counts.
         """
+        self.f = open(path, "rb")
+        self.pbar_ref = pbar_ref
 
-        def __init__(self, path, pbar_ref):
-            """
-            Open the wrapped file and store the progress-bar reference.
-
-            Parameters
-            ----------
-            path : Path | str
-                File path to open in binary mode.
-
-            pbar_ref : Optional[tqdm]
-                Progress bar to update with consumed byte counts.
-            """
-            self.f = open(path, "rb")
-            self.pbar_ref = pbar_ref
-
-        def read(self, size=-1):
-            """
-            Read bytes and update progress by the number of bytes returned.
-
-            Parameters
-            ----------
-            size : int, default=-1
-                Maximum number of bytes to read. ``-1`` means read until EOF.
-
-            Returns
-            -------
-            bytes
-                Bytes read from the wrapped file object.
-            """
-            data = self.f.read(size)
-            if self.pbar_ref and data:
-                self.pbar_ref.update(len(data))
-            return data
-
-        def readinto(self, b):
-            """
-            Read bytes into ``b`` and increment progress by bytes written.
-
-            Parameters
-            ----------
-            b : writable buffer
-                Destination buffer accepted by ``readinto``.
-
-            Returns
-            -------
-            int
-                Number of bytes read into ``b``.
-            """
-            n = self.f.readinto(b)
-            if self.pbar_ref and n:
-                self.pbar_ref.update(n)
-            return n
-
-        def close(self):
-            """
-            Close the wrapped binary file object.
-            """
-            if hasattr(self, "f"):
-                self.f.close()
+    def read(self, size=-1):
+        """
+        Read bytes and update progress by the number of bytes returned.
 
-    proc = None
-    if str(wiktionary_dump_path).endswith(".bz2") and shutil.which("bzcat"):
-        raw_f = open(wiktionary_dump_path, "rb")
-        proc = subprocess.Popen(["bzcat"], stdin=raw_f, stdout=subprocess.PIPE)
+        Parameters
+        ----------
+        size : int, default=-1
+            Maximum number of bytes to read. ``-1`` means read until EOF.
+
+        Returns
+        -------
+        bytes
+            Bytes read from the wrapped file object.
+        """
+        data = self.f.read(size)
+        if self.pbar_ref and data:
+            self.pbar_ref.update(len(data))
+        return data
+
+    def readinto(self, b):
+        """
+        Read bytes into ``b`` and increment progress by bytes written.
+
+        Parameters
+        ----------
+        b : writable buffer
+            Destination buffer accepted by ``readinto``.
+
+        Returns
+        -------
+        int
+            Number of bytes read into ``b``.
+        """
+        n = self.f.readinto(b)
+        if self.pbar_ref and n:
+            self.pbar_ref.update(n)
+        return n
+
+    def close(self):
+        """
+        Close the wrapped binary file object.
+        """
+        if hasattr(self, "f"):
+            self.f.close()
+
+
+def _catch_up_progress(tracked_f, pbar_ref, complete: bool = False) -> None:
+    """
+    Advance a progress bar to the position of the compressed file being read.
+
+    Parameters
+    ----------
+    tracked_f : BinaryIO
+        The compressed dump that ``bzcat`` reads from.
+
+    pbar_ref : Optional[tqdm]
+        Progress bar to update with consumed byte counts.
+
+    complete : bool, default=False
+        Whether to fill the progress bar as decompression has finished.
+    """
+    if not pbar_ref:
+        return
+
+    try:
+        diff = tracked_f.tell() - pbar_ref.n
+        if diff > 0:
+            pbar_ref.update(diff)
+
+        if complete and pbar_ref.total is not None and pbar_ref.n < pbar_ref.total:
+            pbar_ref.update(pbar_ref.total - pbar_ref.n)
+
+    except (OSError, ValueError):
+        pass
+
+
+def _poll_bzcat_progress(tracked_f, pbar_ref, process) -> None:
+    """
+    Update a progress bar while ``bzcat`` decompresses a dump, then close the dump.
+
+    Parameters
+    ----------
+    tracked_f : BinaryIO
+        The compressed dump that ``bzcat`` reads from.
 
-        def poll_progress(tracked_f, pbar_ref, process):
-            import time
+    pbar_ref : Optional[tqdm]
+        Progress bar to update with consumed byte counts.
 
-            while process.poll() is None:
-                if pbar_ref:
-                    try:
-                        current = tracked_f.tell()
-                        diff = current - pbar_ref.n
-                        if diff > 0:
-                            pbar_ref.update(diff)
+    process : subprocess.Popen
+        The ``bzcat`` process.
+    """
+    while process.poll() is None:
+        _catch_up_progress(tracked_f, pbar_ref)
+        time.sleep(0.5)
 
-                    except (OSError, ValueError):
-                        pass
+    _catch_up_progress(tracked_f, pbar_ref, complete=True)
+    tracked_f.close()
 
-                time.sleep(0.5)
 
-            if pbar_ref:
-                try:
-                    diff = tracked_f.tell() - pbar_ref.n
-                    if diff > 0:
-                        pbar_ref.update(diff)
+@contextlib.contextmanager
+def _open_dump_stream(wiktionary_dump_path: Path, pbar=None):
+    """
+    Open a Wiktionary XML dump as a decompressed binary stream.
 
-                    if pbar_ref.total is not None and pbar_ref.n < pbar_ref.total:
-                        pbar_ref.update(pbar_ref.total - pbar_ref.n)
+    Parameters
+    ----------
+    wiktionary_dump_path : Path
+        Path to a ``*wiktionary-*-pages-articles.xml.bz2`` dump file.
 
-                except (OSError, ValueError):
-                    pass
+    pbar : Optional[tqdm]
+        Optional tqdm progress bar to continuously record bytes read.
 
-            tracked_f.close()
+    Yields
+    ------
+    BinaryIO
+        The decompressed XML stream, closed when the context exits.
+    """
+    import shutil
+    import subprocess
+    import threading
 
+    proc = None
+    if str(wiktionary_dump_path).endswith(".bz2") and shutil.which("bzcat"):
+        raw_f = open(wiktionary_dump_path, "rb")
+        proc = subprocess.Popen(["bzcat"], stdin=raw_f, stdout=subprocess.PIPE)
         t = threading.Thread(
-            target=poll_progress, args=(raw_f, pbar, proc), daemon=True
+            target=_poll_bzcat_progress, args=(raw_f, pbar, proc), daemon=True
         )
         t.start()
         f = proc.stdout
 
     else:
-        raw_f = ProgressFileWrapper(wiktionary_dump_path, pbar)
+        raw_f = _ProgressFileWrapper(wiktionary_dump_path, pbar)
         if str(wiktionary_dump_path).endswith(".bz2"):
             f = bz2.open(raw_f, "rb")
 
@@ -1001,31 +1322,7 @@ def _iter_dump_pages(wiktionary_dump_path: Path, pbar=None):
             f = raw_f
 
     try:
-        context = iter(ET.iterparse(cast(BinaryIO, f), events=("start", "end")))
-        try:
-            _, root = next(context)
-
-        except StopIteration:
-            return
-
-        for event, elem in context:
-            if event != "end":
-                continue
-
-            tag = elem.tag
-            ns = tag[: tag.rfind("}") + 1] if "}" in tag else ""
-            tag_name = tag[tag.rfind("}") + 1 :] if "}" in tag else tag
-
-            if tag_name != "page":
-                continue
-
-            title = elem.findtext(f"{ns}title", default="")
-            text = elem.findtext(f"{ns}revision/{ns}text", default="")
-
-            yield title, text
-
-            elem.clear()
-            root.clear()
+        yield cast(BinaryIO, f)
 
     finally:
         if proc:
@@ -1036,123 +1333,550 @@ def _iter_dump_pages(wiktionary_dump_path: Path, pbar=None):
             f.close()
 
 
-def parse_xml_dump(
-    wiktionary_dump_path: str | Path,
-    target_lang_codes: list[str] | None,
-    *,  # force keyword-only arguments
-    source_iso: str = "en",
-    progress: bool = True,
-    num_workers: int | None = None,
-) -> LanguageToWords:
+def _iter_dump_page_blobs(
+    wiktionary_dump_path: Path, pbar=None, chunk_size: int = 1 << 20
+):
     """
-    Parse a Wiktionary XML dump and return translations for the requested languages.
+    Yield the raw bytes of each ``<page>…</page>`` element in the XML dump.
+
+    Pages are found by scanning for the literal page tags rather than running an XML
+    parser, which is safe as ``<`` is always escaped inside MediaWiki page content.
+    Decoding the title and text is left to the caller so that it can happen in worker
+    processes.
 
     Parameters
     ----------
-    wiktionary_dump_path : str or Path
+    wiktionary_dump_path : Path
         Path to a ``*wiktionary-*-pages-articles.xml.bz2`` dump file.
 
-    target_lang_codes : list of str or None
-        ISO codes of languages to extract (e.g. ``["de", "fr"]``). ``None`` extracts all.
+    pbar : Optional[tqdm]
+        Optional tqdm progress bar to continuously record bytes read.
 
-    source_iso : str, default ``"en"``
-        ISO code of the source Wiktionary edition.
+    chunk_size : int, default=1 << 20
+        Number of decompressed bytes to read from the stream at a time.
 
-    progress : bool, default ``True``
-        Whether to show a progress bar.
+    Yields
+    ------
+    bytes
+        The XML of a single page, including its opening and closing tags.
+    """
+    with _open_dump_stream(wiktionary_dump_path, pbar) as f:
+        buffer = b""
+        while chunk := f.read(chunk_size):
+            buffer += chunk
+            pages, rest = _split_page_blobs(buffer)
+            yield from pages
+            buffer = buffer[rest:]
 
-    num_workers : Optional[int]
-        Number of worker processes. Defaults to cpu_count - 1.
+
+def _split_page_blobs(buffer: bytes) -> tuple[list[bytes], int]:
+    """
+    Split the complete ``<page>`` elements out of a buffer of dump XML.
+
+    Parameters
+    ----------
+    buffer : bytes
+        Decompressed dump XML that may end part way through a page.
 
     Returns
     -------
-    LanguageToWords
-        ``{target_lang_iso: {word: {pos: {sense_idx: {description?, translation}}}}}``.
+    tuple[list[bytes], int]
+        The complete pages and the offset at which the unconsumed remainder starts.
     """
-    path = Path(wiktionary_dump_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Wiktionary dump not found: {path}")
+    pages = []
+    pos = 0
+    while (start := buffer.find(_PAGE_OPEN, pos)) != -1:
+        end = buffer.find(_PAGE_CLOSE, start)
+        if end == -1:
+            return pages, start
 
-    output: LanguageToWords = {}
+        pos = end + len(_PAGE_CLOSE)
+        pages.append(buffer[start:pos])
 
-    if num_workers is None:
-        num_workers = max(1, (os.cpu_count() or 1) - 1)
+    # Keep a tail in case an opening tag is split across chunks.
+    return pages, max(pos, len(buffer) - len(_PAGE_OPEN) + 1)
 
-    try:
-        total_size = path.stat().st_size
 
-    except (OSError, AttributeError):
-        total_size = None
+def _extract_page_title(page_xml: bytes) -> str:
+    """
+    Return the unescaped title of a raw ``<page>`` element.
 
-    pbar = None
-    if progress:
-        pbar = tqdm(
-            total=total_size,
-            desc="Parsing Wiktionary",
-            unit="B",
-            unit_scale=True,
-            unit_divisor=1024,
-        )
+    Parameters
+    ----------
+    page_xml : bytes
+        The XML of a single page as yielded by ``_iter_dump_page_blobs``.
 
-    target_langs_frozenset = (
-        frozenset(c.lower() for c in target_lang_codes) if target_lang_codes else None
+    Returns
+    -------
+    str
+        The page title, or an empty string if the page has none.
+    """
+    start = page_xml.find(b"<title>")
+    if start == -1:
+        return ""
+
+    start += len(b"<title>")
+    end = page_xml.find(b"</title>", start)
+    title = page_xml[start:end].decode("utf-8")
+    return html.unescape(title) if "&" in title else title
+
+
+def _extract_page_text(page_xml: bytes) -> str:
+    """
+    Return the unescaped revision wikitext of a raw ``<page>`` element.
+
+    Parameters
+    ----------
+    page_xml : bytes
+        The XML of a single page as yielded by ``_iter_dump_page_blobs``.
+
+    Returns
+    -------
+    str
+        The page wikitext, or an empty string if the page has none.
+    """
+    match = _TEXT_OPEN_RE.search(page_xml)
+    if not match or match[1]:  # missing or self-closing <text ... />
+        return ""
+
+    end = page_xml.find(b"</text>", match.end())
+    text = page_xml[match.end() : end].decode("utf-8")
+    return html.unescape(text) if "&" in text else text
+
+
+def _iter_dump_pages(wiktionary_dump_path: Path, pbar=None):
+    """
+    Yield ``(title, text)`` for each page in the XML dump.
+
+    Parameters
+    ----------
+    wiktionary_dump_path : Path
+        Path to a ``*wiktionary-*-pages-articles.xml.bz2`` dump file.
+
+    pbar : Optional[tqdm]
+        Optional tqdm progress bar to continuously record bytes read.
+
+    Yields
+    ------
+    tuple[str, str]
+        The title and wikitext of each page.
+    """
+    for page_xml in _iter_dump_page_blobs(wiktionary_dump_path, pbar):
+        yield _extract_page_title(page_xml), _extract_page_text(page_xml)
+
+
+def _encode_prefilters(config: dict) -> list[bytes]:
+    """
+    Return the config prefilters escaped and encoded to match raw page XML.
+
+    Parameters
+    ----------
+    config : dict
+        Wiktionary config for the source language edition.
+
+    Returns
+    -------
+    list[bytes]
+        The prefilter strings as they appear inside a dump's ``<text>`` element.
+    """
+    return [
+        html.escape(p, quote=False).encode("utf-8")
+        for p in config.get("prefilters", [])
+    ]
+
+
+def _filter_page(page_xml: bytes, prefilters: list[bytes]) -> str | None:
+    """
+    Return the word for a raw page that could have translations, or None to skip it.
+
+    Parameters
+    ----------
+    page_xml : bytes
+        The XML of a single page as yielded by ``_iter_dump_page_blobs``.
+
+    prefilters : list[bytes]
+        Encoded prefilters from ``_encode_prefilters``. A page must contain one of them.
+
+    Returns
+    -------
+    str | None
+        The source word with translation subpages normalized to their base word.
+    """
+    title = _extract_page_title(page_xml)
+    if not title:
+        return None
+
+    # Allow translation subpages but skip all other namespaced titles.
+    if ":" in title and not title.startswith("Appendix:"):
+        return None
+
+    word = title.strip()
+    if not word or not word[0].isalnum():
+        return None
+
+    # Quick text scan — skip pages with no translation markers at all.
+    text_start = page_xml.find(b"<text")
+    if text_start == -1:
+        return None
+
+    if prefilters and all(page_xml.find(f, text_start) == -1 for f in prefilters):
+        return None
+
+    # Normalize delegated subpages back to their base word.
+    if word.endswith("/translations") or word.endswith("/übersetzungen"):
+        word = word.split("/")[0]
+
+    return word
+
+
+# MARK: Multistream Dumps
+
+
+def _multistream_index_path(wiktionary_dump_path: Path) -> Path | None:
+    """
+    Return the index paired with a ``*-multistream.xml.bz2`` dump if it exists.
+
+    Parameters
+    ----------
+    wiktionary_dump_path : Path
+        Path to a Wiktionary dump file.
+
+    Returns
+    -------
+    Path | None
+        The ``*-multistream-index.txt.bz2`` path, or None for single-stream dumps.
+    """
+    name = wiktionary_dump_path.name
+    if "multistream" not in name or not name.endswith(".xml.bz2"):
+        return None
+
+    index_path = wiktionary_dump_path.with_name(
+        name.replace(".xml.bz2", "-index.txt.bz2")
     )
+    return index_path if index_path.exists() else None
 
-    config = get_wiktionary_config(source_iso=source_iso)
 
-    def _filtered_iterator():
-        """
-        Yield (word, text, target_langs, config) tuples, skipping pages that can't have translations.
-        """
-        count = 0
-        for title, text in _iter_dump_pages(path, pbar):
-            count += 1
+def _read_multistream_ranges(index_path: Path, dump_size: int) -> list[tuple[int, int]]:
+    """
+    Read the byte ranges of the page streams in a multistream dump from its index.
 
-            if not title or not text:
-                continue
+    Parameters
+    ----------
+    index_path : Path
+        Path to the ``*-multistream-index.txt.bz2`` file with ``offset:page_id:title`` lines.
 
-            # Allow translation subpages but skip all other namespaced titles.
-            if ":" in title and not title.startswith("Appendix:"):
-                continue
+    dump_size : int
+        Size of the multistream dump in bytes, which closes the last range.
 
-            word = title.strip()
-            if not word or not word[0].isalnum():
-                continue
+    Returns
+    -------
+    list[tuple[int, int]]
+        ``(start, end)`` byte offsets of each bz2 stream that holds pages.
+    """
+    offsets: list[int] = []
+    with bz2.open(index_path, "rb") as f:
+        for line in f:
+            offset = int(line[: line.find(b":")])
+            if not offsets or offset != offsets[-1]:
+                offsets.append(offset)
+
+    offsets.sort()
+    return list(zip(offsets, offsets[1:] + [dump_size]))
 
-            # Quick text scan — skip pages with no translation markers at all.
-            prefilters = config.get("prefilters", [])
-            if prefilters and all(f not in text for f in prefilters):
-                continue
 
-            # Normalize delegated subpages back to their base word.
-            if word.endswith("/translations") or word.endswith("/übersetzungen"):
-                word = word.split("/")[0]
+def _parse_stream_worker(
+    args: tuple[str, int, int, _EditionProfile],
+) -> tuple[list[tuple[str, dict[str, PosToSenses]]], int, float]:
+    """
+    Decompress and parse one bz2 stream of a multistream dump in a worker process.
+
+    Parameters
+    ----------
+    args : tuple[str, int, int, _EditionProfile]
+        Packed tuple of (dump_path, start, end, profile).
 
-            yield word, text, target_langs_frozenset, config
+    Returns
+    -------
+    tuple[list[tuple[str, dict[str, PosToSenses]]], int, float]
+        ``(word, parsed)`` for each page in the stream with translations, the number
+        of pages that passed the filters and the seconds spent on the stream.
+    """
+    started = time.perf_counter()
+    dump_path, start, end, profile = args
+    with open(dump_path, "rb") as f:
+        f.seek(start)
+        data = bz2.decompress(f.read(end - start))
+
+    prefilters = _encode_prefilters(profile.config)
+    pages, _ = _split_page_blobs(data)
+    results = []
+    n_pages = 0
+    for page_xml in pages:
+        if word := _filter_page(page_xml, prefilters):
+            n_pages += 1
+            if result := _parse_profile_page(profile, word, page_xml):
+                results.append(result)
+
+    if _page_cache is not None:
+        _page_cache.flush()
+
+    return results, n_pages, time.perf_counter() - started
+
+
+def _iter_multistream_results(
+    path: Path,
+    index_path: Path,
+    profile: _EditionProfile,
+    executor: ProcessPoolExecutor | None,
+    metrics: PoolMetrics,
+    pbar=None,
+) -> Iterator[tuple[str, dict[str, PosToSenses]]]:
+    """
+    Yield parsed pages of a multistream dump, with each stream handled by a worker.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the ``*-multistream.xml.bz2`` dump file.
+
+    index_path : Path
+        Path to the dump's ``*-multistream-index.txt.bz2`` file.
+
+    profile : _EditionProfile
+        The edition that the dump's pages belong to.
+
+    executor : Optional[ProcessPoolExecutor]
+        The pool to run streams in, or None to parse them in this process.
+
+    metrics : PoolMetrics
+        Metrics to record the streams in.
+
+    pbar : Optional[tqdm]
+        Optional tqdm progress bar to record compressed bytes parsed.
 
+    Yields
+    ------
+    tuple[str, dict[str, PosToSenses]]
+        ``(word, parsed)`` in dump order so merges match the single-stream path.
+    """
+    ranges = _read_multistream_ranges(index_path, path.stat().st_size)
+    if pbar and ranges:
+        pbar.update(ranges[0][0])  # the siteinfo header stream
+
+    tasks = (((str(path), start, end, profile), end - start) for start, end in ranges)
+    for results, _, _, input_bytes in iter_bounded_outputs(
+        _parse_stream_worker, tasks, executor, metrics
+    ):
         if pbar:
-            if pbar.total is not None and pbar.n < pbar.total:
-                pbar.update(pbar.total - pbar.n)
-            pbar.refresh()
-            pbar.close()
+            pbar.update(input_bytes)
+            _show_pool_metrics(pbar, metrics)
+
+        yield from results
+
+
+def _show_pool_metrics(pbar, metrics: PoolMetrics) -> None:
+    """
+    Show the queue depth and worker utilization next to a progress bar.
+
+    Parameters
+    ----------
+    pbar : tqdm
+        The progress bar of the dump.
+
+    metrics : PoolMetrics
+        Metrics of the run so far.
+    """
+    pbar.set_postfix(
+        queue=metrics.queue_depth,
+        util=f"{metrics.worker_utilization:.0%}",
+        refresh=False,
+    )
+
+
+def _iter_page_batch_results(
+    tasks,
+    executor: ProcessPoolExecutor | None,
+    batcher: AdaptiveBatcher,
+    metrics: PoolMetrics,
+    pbar=None,
+) -> Iterator[tuple[str, dict[str, PosToSenses]]]:
+    """
+    Yield parsed pages from batches of a single-stream dump while adapting batch sizes.
+
+    Parameters
+    ----------
+    tasks : Iterable[tuple[tuple[_EditionProfile, tuple], int]]
+        ``((profile, pages), input_bytes)`` for each batch from ``batcher``.
+
+    executor : Optional[ProcessPoolExecutor]
+        The pool to run batches in, or None to parse them in this process.
+
+    batcher : AdaptiveBatcher
+        The batcher that ``tasks`` come from, which is told how long each batch took.
+
+    metrics : PoolMetrics
+        Metrics to record the batches in.
+
+    pbar : Optional[tqdm]
+        Optional tqdm progress bar to show the metrics on.
+
+    Yields
+    ------
+    tuple[str, dict[str, PosToSenses]]
+        ``(word, parsed)`` in dump order.
+    """
+    for results, pages, seconds, _ in iter_bounded_outputs(
+        _parse_page_batch_worker, tasks, executor, metrics
+    ):
+        batcher.observe(pages, seconds)
+        if pbar:
+            _show_pool_metrics(pbar, metrics)
+
+        yield from results
+
+
+def parse_xml_dump(
+    wiktionary_dump_path: str | Path,
+    target_lang_codes: list[str] | None,
+    *,  # force keyword-only arguments
+    source_iso: str = "en",
+    progress: bool = True,
+    num_workers: int | None = None,
+    cache_path: str | Path | None = None,
+    cache_max_bytes: int = DEFAULT_PARSE_CACHE_MAX_BYTES,
+    executor: ProcessPoolExecutor | None = None,
+    metrics: dict | None = None,
+) -> LanguageToWords:
+    """
+    Parse a Wiktionary XML dump and return translations for the requested languages.
+
+    When given a ``*-pages-articles-multistream.xml.bz2`` dump whose
+    ``*-multistream-index.txt.bz2`` sits next to it, the bz2 streams are decompressed
+    and parsed independently by the workers.
+
+    With a ``cache_path`` each page's parsed result is stored by title and a hash of
+    its wikitext, so that re-runs on a newer dump only parse the pages that changed.
+
+    Pages are sent to the workers in batches that are sized from the observed parse
+    time per page, with only a few batches per worker in flight at once so that the
+    memory used does not grow with the speed of the dump reader.
+
+    Parameters
+    ----------
+    wiktionary_dump_path : str or Path
+        Path to a ``*wiktionary-*-pages-articles.xml.bz2`` or multistream dump file.
+
+    target_lang_codes : list of str or None
+        ISO codes of languages to extract (e.g. ``["de", "fr"]``). ``None`` extracts all.
+
+    source_iso : str, default ``"en"``
+        ISO code of the source Wiktionary edition.
+
+    progress : bool, default ``True``
+        Whether to show a progress bar.
+
+    num_workers : Optional[int]
+        Number of worker processes. Defaults to cpu_count - 1.
+
+    cache_path : str or Path, optional
+        SQLite file for the per-page parse cache. ``None`` parses every page.
+
+    cache_max_bytes : int, default=DEFAULT_PARSE_CACHE_MAX_BYTES
+        Size the cache is trimmed to after parsing by evicting least recently used pages.
+
+    executor : Optional[ProcessPoolExecutor]
+        A pool from ``_create_worker_pool`` that is shared with other dumps. The pool's
+        owner is then responsible for trimming the cache.
+
+    metrics : dict, optional
+        Updated with the queue depth, worker utilization and throughput of the run,
+        which can be used to size ``num_workers`` for a host.
+
+    Returns
+    -------
+    LanguageToWords
+        ``{target_lang_iso: {word: {pos: {sense_idx: {description?, translation}}}}}``.
+    """
+    path = Path(wiktionary_dump_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Wiktionary dump not found: {path}")
+
+    output: LanguageToWords = {}
+    next_sense_idx: dict[tuple[str, str, str], int] = {}
+
+    if num_workers is None:
+        num_workers = max(1, (os.cpu_count() or 1) - 1)
 
     try:
-        if num_workers == 1:
-            # Single-process path — handy for debugging or low-memory environments.
-            for result in map(_parse_page_worker, _filtered_iterator()):
-                if result:
-                    _merge_parsed_into_output(output, *result)
+        total_size = path.stat().st_size
 
-        else:
-            # Use a process pool for speed on large dumps.
-            # We maintain a bounded set of active futures to avoid OOM memory explosion
-            # while keeping the workers busy and the progress bar updating smoothly.
-            with ProcessPoolExecutor(max_workers=num_workers) as executor:
-                for result in executor.map(
-                    _parse_page_worker, _filtered_iterator(), chunksize=50
-                ):
-                    if result:
-                        _merge_parsed_into_output(output, *result)
+    except (OSError, AttributeError):
+        total_size = None
+
+    pbar = None
+    if progress:
+        pbar = tqdm(
+            total=total_size,
+            desc=f"Parsing {source_iso}wiktionary",
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+        )
+
+    profile = _build_edition_profile(
+        source_iso, target_lang_codes, use_cache=bool(cache_path)
+    )
+
+    prefilters = _encode_prefilters(profile.config)
+    batcher = AdaptiveBatcher()
+    pool_metrics = PoolMetrics(num_workers=num_workers if num_workers > 1 else 1)
+
+    def _filtered_tasks():
+        """
+        Yield ((profile, pages), bytes) batches, skipping pages that can't have translations.
+        """
+        pages = (
+            (word, page_xml)
+            for page_xml in _iter_dump_page_blobs(path, pbar)
+            if (word := _filter_page(page_xml, prefilters))
+        )
+        for batch, batch_bytes in batcher.batches(pages):
+            yield (profile, batch), batch_bytes
+
+    owns_pool = executor is None
+    try:
+        with contextlib.ExitStack() as stack:
+            if executor is None and num_workers > 1:
+                # Use a process pool for speed on large dumps.
+                executor = stack.enter_context(
+                    _create_worker_pool(num_workers, cache_path)
+                )
+
+            elif executor is None:
+                # Single-process path — handy for debugging or low-memory environments.
+                _init_page_cache(
+                    str(cache_path) if cache_path else None, int(time.time())
+                )
+                stack.callback(_init_page_cache, None, 0)
+
+            if index_path := _multistream_index_path(path):
+                # Each worker decompresses and parses its own streams of the dump.
+                results = _iter_multistream_results(
+                    path, index_path, profile, executor, pool_metrics, pbar
+                )
+
+            else:
+                results = _iter_page_batch_results(
+                    _filtered_tasks(), executor, batcher, pool_metrics, pbar
+                )
+
+            for result in results:
+                _merge_parsed_into_output(
+                    output, *result, next_sense_idx=next_sense_idx
+                )
+
+        if pbar and pbar.total is not None and pbar.n < pbar.total:
+            pbar.update(pbar.total - pbar.n)
 
     except KeyboardInterrupt:
         print("\nParsing cleanly interrupted by user. Saving progress...")
@@ -1160,83 +1884,188 @@ def parse_xml_dump(
     except Exception as e:
         print(f"\nParsing encountered an error: {e}. Saving progress...")
 
+    if pbar:
+        pbar.refresh()
+        pbar.close()
+
+    if cache_path and owns_pool:
+        _evict_page_cache(cache_path, cache_max_bytes)
+
+    if metrics is not None:
+        metrics.update(pool_metrics.as_dict())
+
     return output
 
 
+def parse_xml_dumps(
+    wiktionary_dump_paths: Mapping[str, str | Path],
+    target_lang_codes: list[str] | None,
+    *,  # force keyword-only arguments
+    progress: bool = True,
+    num_workers: int | None = None,
+    cache_path: str | Path | None = None,
+    cache_max_bytes: int = DEFAULT_PARSE_CACHE_MAX_BYTES,
+    metrics: dict | None = None,
+) -> dict[str, LanguageToWords]:
+    """
+    Parse several Wiktionary editions at once over a single shared worker pool.
+
+    Each dump is read in its own thread of this process while the pages of every
+    edition are parsed by the same workers, so that the total time is bound by the
+    available CPUs rather than by parsing each edition in turn.
+
+    Parameters
+    ----------
+    wiktionary_dump_paths : Mapping[str, str | Path]
+        Dump paths keyed by the ISO code of their source edition.
+
+    target_lang_codes : list of str or None
+        ISO codes of languages to extract (e.g. ``["de", "fr"]``). ``None`` extracts all.
+
+    progress : bool, default ``True``
+        Whether to show a progress bar for each dump.
+
+    num_workers : Optional[int]
+        Number of worker processes. Defaults to cpu_count - 1.
+
+    cache_path : str or Path, optional
+        SQLite file for the per-page parse cache. ``None`` parses every page.
+
+    cache_max_bytes : int, default=DEFAULT_PARSE_CACHE_MAX_BYTES
+        Size the cache is trimmed to after parsing by evicting least recently used pages.
+
+    metrics : dict, optional
+        Updated with the metrics of ``parse_xml_dump`` for each source edition ISO.
+
+    Returns
+    -------
+    dict[str, LanguageToWords]
+        The output of ``parse_xml_dump`` for each source edition ISO.
+    """
+    if num_workers is None:
+        num_workers = max(1, (os.cpu_count() or 1) - 1)
+
+    with (
+        _create_worker_pool(num_workers, cache_path) as executor,
+        ThreadPoolExecutor(max_workers=len(wiktionary_dump_paths) or 1) as readers,
+    ):
+        futures = {
+            source_iso: readers.submit(
+                parse_xml_dump,
+                dump_path,
+                target_lang_codes,
+                source_iso=source_iso,
+                progress=progress,
+                num_workers=num_workers,
+                cache_path=cache_path,
+                executor=executor,
+                metrics=metrics.setdefault(source_iso, {})
+                if metrics is not None
+                else None,
+            )
+            for source_iso, dump_path in wiktionary_dump_paths.items()
+        }
+        outputs = {source_iso: f.result() for source_iso, f in futures.items()}
+
+    if cache_path:
+        _evict_page_cache(cache_path, cache_max_bytes)
+
+    return outputs
+
+
 # MARK: Exports
 
 
-def parse_wiktionary_translations(
-    target_languages: str | list[str] | None = None,
-    wiktionary_dump_path: str | Path | None = None,
-    output_dir: Path | None = DEFAULT_WIKTIONARY_JSON_EXPORT_DIR,
-    overwrite: bool = False,
-) -> None:
+def _resolve_target_isos(target_languages: str | list[str] | None) -> list[str]:
     """
-    Parse a Wiktionary XML dump and write per-language translation JSON files.
+    Return the ISO codes of the languages that translations should be extracted for.
 
     Parameters
     ----------
     target_languages : str or list of str, optional
-        Language(s) to extract (e.g. ``"de"``, ``"german"``).
-        ``None`` or ``"all"`` extracts every known language.
+        Language(s) to extract. ``None`` or ``"all"`` selects every known language.
 
-    wiktionary_dump_path : str or Path, optional
-        Path to a ``*wiktionary-*-pages-articles.xml.bz2`` dump file.
+    Returns
+    -------
+    list[str]
+        ISO codes of the target languages, empty if none of them are known.
+    """
+    if not target_languages or target_languages == "all" or target_languages == ["all"]:
+        # Collect ISO codes for every language and sub-language we know about.
+        return list(language_registry.iso_to_name)
 
-    output_dir : Path, optional, default=DEFAULT_WIKTIONARY_JSON_EXPORT_DIR
-        Directory where JSON files are saved.
+    target_isos: list[str] = []
+    specs = (
+        [target_languages] if isinstance(target_languages, str) else target_languages
+    )
+    for lang_spec in specs:
+        iso = resolve_lang_iso(language=lang_spec)
+        if not iso:
+            print(f"Warning: Unknown language '{lang_spec}', skipping.")
+            continue
+        target_isos.append(iso)
 
-    overwrite : bool, default ``False``
-        Whether to overwrite existing output files.
+    return target_isos
+
+
+def _split_dump_specs(
+    wiktionary_dump_path: str | Path | list[str | Path] | None,
+) -> list[str | Path | None]:
     """
-    output_dir = output_dir or DEFAULT_WIKTIONARY_JSON_EXPORT_DIR
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    Split the dump argument into one spec per source edition.
 
-    target_isos: list[str] = []
-    if not target_languages or target_languages == "all" or target_languages == ["all"]:
-        # Collect ISO codes for every language and sub-language we know about.
-        for lang_info in language_metadata.values():
-            if iso := lang_info.get("iso"):
-                target_isos.append(iso)
-            for sub_info in lang_info.get("sub_languages", {}).values():
-                if sub_iso := sub_info.get("iso"):
-                    target_isos.append(sub_iso)
+    Parameters
+    ----------
+    wiktionary_dump_path : str, Path, list or None
+        A dump path or edition, a list of them, or a comma-separated string such as
+        ``"enwiktionary,dewiktionary"``.
 
-    else:
-        specs = (
-            [target_languages]
-            if isinstance(target_languages, str)
-            else target_languages
-        )
-        for lang_spec in specs:
-            iso = resolve_lang_iso(language=lang_spec)
-            if not iso:
-                print(f"Warning: Unknown language '{lang_spec}', skipping.")
-                continue
-            target_isos.append(iso)
+    Returns
+    -------
+    list[str | Path | None]
+        The specs to pass to ``_resolve_dump_path`` one at a time.
+    """
+    if isinstance(wiktionary_dump_path, (list, tuple)):
+        return list(wiktionary_dump_path)
 
-        if not target_isos:
-            return
+    if (
+        isinstance(wiktionary_dump_path, str)
+        and "," in wiktionary_dump_path
+        and not Path(wiktionary_dump_path).exists()
+    ):
+        return [s.strip() for s in wiktionary_dump_path.split(",") if s.strip()]
 
-    dump_path, source_iso = _resolve_dump_path(
-        wiktionary_dump_path=wiktionary_dump_path,
-        output_dir=DEFAULT_WIKTIONARY_DUMP_EXPORT_DIR,
-    )
-    if not dump_path:
-        return
+    return [wiktionary_dump_path]
+
+
+def _export_translations(
+    data_by_lang: LanguageToWords,
+    source_iso: str,
+    output_dir: Path,
+    overwrite: bool,
+) -> None:
+    """
+    Write the translations parsed from one source edition to per-language JSON files.
+
+    Parameters
+    ----------
+    data_by_lang : LanguageToWords
+        The output of ``parse_xml_dump`` for the edition.
+
+    source_iso : str
+        ISO code of the source Wiktionary edition.
 
+    output_dir : Path
+        Directory where JSON files are saved.
+
+    overwrite : bool
+        Whether to overwrite existing output files.
+    """
     source_lang_name = get_language_from_iso(source_iso)
     out_subdir = _get_output_subdir(source_lang_name, language_metadata)
     base_out_path = output_dir / out_subdir
     base_out_path.mkdir(parents=True, exist_ok=True)
 
-    data_by_lang = parse_xml_dump(
-        dump_path,
-        target_isos,
-        source_iso=source_iso,
-    )
-
     for iso, data in data_by_lang.items():
         out_path = base_out_path / f"{iso}_translations_from_{source_iso}.json"
 
@@ -1244,19 +2073,101 @@ def parse_wiktionary_translations(
             print(f"Skipping {iso}: '{out_path}' already exists.")
             continue
 
-        with open(out_path, "wb") as f:
-            f.write(
-                orjson.dumps(
-                    data,
-                    option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
-                )
-            )
+        write_json(out_path, data, sort_keys=True)
 
         print(
             f"Exported '{iso}' translations from '{source_iso}' to the file {out_path}"
         )
 
 
+def parse_wiktionary_translations(
+    target_languages: str | list[str] | None = None,
+    wiktionary_dump_path: str | Path | list[str | Path] | None = None,
+    output_dir: Path | None = DEFAULT_WIKTIONARY_JSON_EXPORT_DIR,
+    overwrite: bool = False,
+    parse_cache_path: str | Path | None = None,
+    output_type: str = "json",
+    identifier_case: str = "snake",
+) -> None:
+    """
+    Parse Wiktionary XML dumps and write per-language translation JSON files.
+
+    Several source editions can be given at once, in which case they are parsed
+    together over one shared worker pool and written per edition. With an
+    ``output_type`` of ``"sqlite"`` the translations are written straight to
+    ``TranslationData.sqlite`` in ``output_dir`` instead.
+
+    Parameters
+    ----------
+    target_languages : str or list of str, optional
+        Language(s) to extract (e.g. ``"de"``, ``"german"``).
+        ``None`` or ``"all"`` extracts every known language.
+
+    wiktionary_dump_path : str, Path or list, optional
+        Path to a ``*wiktionary-*-pages-articles.xml.bz2`` dump file or an edition such
+        as ``"enwiktionary"``. A list or comma-separated string selects several editions.
+
+    output_dir : Path, optional, default=DEFAULT_WIKTIONARY_JSON_EXPORT_DIR
+        Directory where JSON files are saved.
+
+    overwrite : bool, default ``False``
+        Whether to overwrite existing output files.
+
+    parse_cache_path : str or Path, optional
+        SQLite file used to reuse parsed pages that are unchanged since a previous run.
+
+    output_type : str, default="json"
+        Either "json" for per-language JSON files or "sqlite" for database tables.
+
+    identifier_case : str, default="snake"
+        Either "camel" or "snake" to determine SQLite column naming.
+    """
+    output_dir = Path(output_dir or DEFAULT_WIKTIONARY_JSON_EXPORT_DIR)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    target_isos = _resolve_target_isos(target_languages)
+    if not target_isos:
+        return
+
+    dump_paths: dict[str, Path] = {}
+    for spec in _split_dump_specs(wiktionary_dump_path):
+        dump_path, source_iso = _resolve_dump_path(
+            wiktionary_dump_path=spec,
+            output_dir=DEFAULT_WIKTIONARY_DUMP_EXPORT_DIR,
+        )
+        if dump_path:
+            dump_paths.setdefault(source_iso, dump_path)
+
+    if not dump_paths:
+        return
+
+    if len(dump_paths) == 1:
+        [(source_iso, dump_path)] = dump_paths.items()
+        outputs = {
+            source_iso: parse_xml_dump(
+                dump_path,
+                target_isos,
+                source_iso=source_iso,
+                cache_path=parse_cache_path,
+            )
+        }
+
+    else:
+        outputs = parse_xml_dumps(dump_paths, target_isos, cache_path=parse_cache_path)
+
+    for source_iso, data_by_lang in outputs.items():
+        if output_type == "sqlite":
+            export_translations_to_sqlite(
+                data_by_lang,
+                source_iso,
+                output_dir / "TranslationData.sqlite",
+                identifier_case,
+            )
+
+        else:
+            _export_translations(data_by_lang, source_iso, output_dir, overwrite)
+
+
 # MARK: Output Resolution
 
 
@@ -1303,8 +2214,9 @@ def _resolve_dump_path(
         )
     ):
         dump_export_path = Path(output_dir)
-        candidates = list(dump_export_path.glob(f"{wiktionary}*pages-articles.xml*"))
-        candidates.extend(Path(".").glob(f"{wiktionary}*pages-articles.xml*"))
+        # Matches both single-stream and multistream pages-articles dumps.
+        candidates = list(dump_export_path.glob(f"{wiktionary}*pages-articles*.xml*"))
+        candidates.extend(Path(".").glob(f"{wiktionary}*pages-articles*.xml*"))
         if candidates:
             return max(candidates, key=lambda p: p.stat().st_mtime), iso
 
@@ -1365,14 +2277,4 @@ def _get_output_subdir(lang_name: str, language_metadata: dict) -> str:
     str
         Subdirectory path where translation JSON files should be saved.
     """
-    lang_lower = lang_name.lower()
-    for main_lang, data in language_metadata.items():
-        if main_lang.lower() == lang_lower:
-            return lang_lower.replace(" ", "_")
-
-        if "sub_languages" in data:
-            for sub in data["sub_languages"]:
-                if sub.lower() == lang_lower:
-                    return f"{main_lang}/{sub}".replace(" ", "_")
-
-    return lang_lower.replace(" ", "_")
+    return LanguageRegistry.for_metadata(language_metadata).output_subdir(lang_name)
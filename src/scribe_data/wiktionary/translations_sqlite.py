@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Write parsed Wiktionary translations to SQLite tables.
+"""
+
+import sqlite3
+from pathlib import Path
+
+
+def translation_table_columns(identifier_case: str = "snake") -> list[str]:
+    """
+    Return the column names of a Wiktionary translation table.
+
+    Parameters
+    ----------
+    identifier_case : str, default="snake"
+        Either "camel" or "snake" to determine column naming.
+
+    Returns
+    -------
+    list[str]
+        The word, word type, sense order, description and translation columns.
+    """
+    if identifier_case == "camel":
+        return ["word", "wordType", "wordOrder", "description", "translation"]
+
+    return ["word", "word_type", "word_order", "description", "translation"]
+
+
+def _iter_translation_rows(words: dict):
+    """
+    Flatten the translations of one target language into table rows.
+
+    Parameters
+    ----------
+    words : dict
+        ``{word: {word_type: {order: {description, translation}}}}``.
+
+    Yields
+    ------
+    tuple[str, str, str, str, str]
+        The word, word type, sense order, description and translation of each sense.
+    """
+    for word, word_types in words.items():
+        for word_type, senses in word_types.items():
+            for order, entry in senses.items():
+                yield (
+                    word,
+                    word_type,
+                    order,
+                    entry.get("description", ""),
+                    entry.get("translation", ""),
+                )
+
+
+def write_translation_table(
+    cursor: sqlite3.Cursor,
+    table_name: str,
+    words: dict,
+    identifier_case: str = "snake",
+) -> int:
+    """
+    Replace a translation table with the given translations.
+
+    The table is created without constraints, filled with a single ``executemany``
+    and only then indexed, which is much faster than maintaining the index per row.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+        A cursor of the translation database.
+
+    table_name : str
+        The table to write, e.g. ``"de_translations_from_en"``.
+
+    words : dict
+        ``{word: {word_type: {order: {description, translation}}}}``.
+
+    identifier_case : str, default="snake"
+        Either "camel" or "snake" to determine column naming.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+    """
+    cols = translation_table_columns(identifier_case)
+    col_defs = ", ".join(f"{c} Text" for c in cols)
+    cursor.execute(f"DROP TABLE IF EXISTS [{table_name}]")
+    cursor.execute(f"CREATE TABLE [{table_name}] ({col_defs})")
+    cursor.executemany(
+        f"INSERT INTO [{table_name}] VALUES ({', '.join(['?'] * len(cols))})",
+        _iter_translation_rows(words),
+    )
+    n_rows = cursor.rowcount
+    cursor.execute(
+        f"CREATE UNIQUE INDEX [{table_name}_word_idx] "
+        f"ON [{table_name}] (word, {cols[1]}, {cols[2]})"
+    )
+    return n_rows
+
+
+def export_translations_to_sqlite(
+    data_by_lang: dict[str, dict],
+    source_iso: str,
+    db_path: str | Path,
+    identifier_case: str = "snake",
+) -> None:
+    """
+    Write the translations parsed from one source edition to a SQLite database.
+
+    All target language tables of the edition are written in a single transaction.
+
+    Parameters
+    ----------
+    data_by_lang : dict[str, dict]
+        The output of ``parse_xml_dump`` for the edition.
+
+    source_iso : str
+        ISO code of the source Wiktionary edition.
+
+    db_path : str | Path
+        The SQLite file to write, e.g. ``TranslationData.sqlite``.
+
+    identifier_case : str, default="snake"
+        Either "camel" or "snake" to determine column naming.
+    """
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    try:
+        with connection:
+            cursor = connection.cursor()
+            # Statements that change the schema don't start a transaction, so the old
+            # tables are only dropped if the new ones are committed.
+            cursor.execute("BEGIN")
+            for iso, words in data_by_lang.items():
+                table_name = f"{iso}_translations_from_{source_iso}"
+                n_rows = write_translation_table(
+                    cursor, table_name, words, identifier_case
+                )
+                print(f"Exported {n_rows} '{iso}' translations to {table_name}")
+
+    finally:
+        connection.close()
+
+    print(f"Translations from '{source_iso}' saved in {db_path}")
@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests functionality from check_missing_forms.py
+"""
+
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from scribe_data.check.check_missing_forms.check_missing_forms import (
+    get_forms_from_sparql_service_all_languages,
+)
+from scribe_data.utils import LanguageRegistry
+
+
+class TestCheckMissingForms(unittest.TestCase):
+    def test_get_forms_from_sparql_service_all_languages_shared_qids(self) -> None:
+        """
+        Tests that languages sharing a QID are queried once under the last name.
+        """
+        registry = LanguageRegistry.from_metadata(
+            {
+                "german": {"iso": "de", "qid": "Q188"},
+                "punjabi": {
+                    "qid": "Q58635",
+                    "sub_languages": {
+                        "gurmukhi": {"iso": "pa", "qid": "Q58635"},
+                        "shahmukhi": {"iso": "pnb", "qid": "Q58635"},
+                    },
+                },
+            }
+        )
+
+        with (
+            patch("sys.stdout", new=StringIO()),
+            patch(
+                "scribe_data.check.check_missing_forms.check_missing_forms.language_registry",
+                registry,
+            ),
+            patch(
+                "scribe_data.check.check_missing_forms.check_missing_forms.data_type_metadata",
+                {"nouns": "Q1084"},
+            ),
+            patch(
+                "scribe_data.check.check_missing_forms.check_missing_forms.get_forms_from_sparql_service",
+                return_value=[["Q110786"]],
+            ) as mock_get_forms,
+            patch(
+                "scribe_data.check.check_missing_forms.check_missing_forms.time.sleep"
+            ),
+        ):
+            result = get_forms_from_sparql_service_all_languages()
+
+        self.assertEqual(
+            [call.args[4] for call in mock_get_forms.call_args_list],
+            ["german", "shahmukhi"],
+        )
+        self.assertEqual(set(result), {"Q188", "Q58635"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -251,12 +251,10 @@ class TestExportContracts:
     @patch("os.listdir")
     @patch("pathlib.Path.mkdir")
     @patch("pathlib.Path.exists")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("json.dump")
+    @patch("scribe_data.cli.contracts.filter.write_json")
     def test_cli_contracts_export_data_filtered(
         self,
-        mock_json_dump: MagicMock,
-        mock_file_open: MagicMock,
+        mock_write_json: MagicMock,
         mock_exists: MagicMock,
         mock_mkdir: MagicMock,
         mock_listdir: MagicMock,
@@ -337,7 +335,7 @@ class TestExportContracts:
         assert mock_filter_metadata.call_count == 2  # one for each language
         assert mock_filter_data.call_count == 4  # two languages × two data types
         assert (
-            mock_json_dump.call_count == 4
+            mock_write_json.call_count == 4
         )  # saving filtered data for 2 langs × 2 types
 
         # Check filter_exported_data calls.
@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the index profiles of language databases.
+"""
+
+import sqlite3
+
+import pytest
+
+from scribe_data.cli.convert.sqlite_indexes import (
+    apply_index_profile,
+    detect_index_profile,
+    lemma_column,
+)
+from scribe_data.cli.convert.to_sqlite import lexeme_table_to_sqlite
+from scribe_data.wikidata.lexeme_table import LexemeTable
+
+
+@pytest.fixture
+def language_db() -> sqlite3.Cursor:
+    """
+    Create a language database with nouns and verbs tables.
+    """
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    nouns = {
+        "L1": {"lastModified": "t", "noun": "Haus", "plural": "Häuser"},
+        "L2": {"lastModified": "t", "noun": "Hund", "plural": "Hunde"},
+        "L3": {"lastModified": "t", "noun": "Bank | Bänke", "plural": ""},
+    }
+    verbs = {"L4": {"lastModified": "t", "infinitive": "hausen"}}
+    lexeme_table_to_sqlite(
+        cursor, LexemeTable.from_entries(nouns), "nouns", add_scribe_row=True
+    )
+    lexeme_table_to_sqlite(cursor, LexemeTable.from_entries(verbs), "verbs")
+    yield cursor
+    conn.close()
+
+
+def query_plan(cursor: sqlite3.Cursor, sql: str, *params: str) -> str:
+    """
+    Return the query plan of a statement.
+    """
+    return " ".join(
+        row[-1] for row in cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+    )
+
+
+def test_lemma_column() -> None:
+    assert lemma_column("proper_nouns", ["wdLexemeId", "properNoun"]) == "properNoun"
+    assert lemma_column("nouns", ["wd_lexeme_id", "last_modified", "noun"]) == "noun"
+    assert lemma_column("verbs", ["wdLexemeId", "lastModified", "infinitive"]) == (
+        "infinitive"
+    )
+    assert lemma_column("articles", ["wdLexemeId", "lastModified", "definite"]) == (
+        "definite"
+    )
+    assert lemma_column("articles", ["wdLexemeId", "lastModified"]) is None
+
+
+def test_lookup_profile_indexes_lemma_and_forms(language_db: sqlite3.Cursor) -> None:
+    apply_index_profile(language_db, "lookup")
+
+    assert "nouns_plural_idx" in query_plan(
+        language_db, "SELECT noun FROM nouns WHERE plural = ?", "Hunde"
+    )
+    assert "nouns_noun_idx" in query_plan(
+        language_db, "SELECT * FROM nouns WHERE noun = ?", "Hund"
+    )
+    assert "nouns_noun_nocase_idx" in query_plan(
+        language_db, "SELECT * FROM nouns WHERE noun LIKE ?", "hu%"
+    )
+    assert "verbs_infinitive_idx" in query_plan(
+        language_db, "SELECT * FROM verbs WHERE infinitive = ?", "hausen"
+    )
+    tables = {row[0] for row in language_db.execute("SELECT name FROM sqlite_master")}
+    assert "autocomplete_lexicon" not in tables
+
+
+def test_autocomplete_profile_lexicon(language_db: sqlite3.Cursor) -> None:
+    apply_index_profile(language_db, "autocomplete")
+
+    words = language_db.execute(
+        "SELECT word FROM autocomplete_lexicon WHERE word LIKE ? ORDER BY word",
+        ("ha%",),
+    ).fetchall()
+    assert words == [("Haus",), ("hausen",)]
+    assert (
+        language_db.execute("SELECT count(*) FROM autocomplete_lexicon").fetchone()[0]
+        == 3
+    )
+
+    matches = language_db.execute(
+        "SELECT word FROM autocomplete_lexicon_fts WHERE autocomplete_lexicon_fts "
+        "MATCH ? ORDER BY word",
+        ("aus",),
+    ).fetchall()
+    assert matches == [("Haus",), ("hausen",)]
+
+
+def test_detect_index_profile(language_db: sqlite3.Cursor) -> None:
+    assert detect_index_profile(language_db) is None
+
+    apply_index_profile(language_db, "lookup")
+    assert detect_index_profile(language_db) == "lookup"
+
+    apply_index_profile(language_db, "autocomplete")
+    assert detect_index_profile(language_db) == "autocomplete"
+
+
+def test_unsupported_index_profile(language_db: sqlite3.Cursor) -> None:
+    with pytest.raises(ValueError, match="Unsupported index profile 'fts'"):
+        apply_index_profile(language_db, "fts")
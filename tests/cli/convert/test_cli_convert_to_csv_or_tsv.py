@@ -7,7 +7,11 @@ import unittest
 
 import pytest
 
-from scribe_data.cli.convert.to_csv_or_tsv import convert_to_csv_or_tsv
+from scribe_data.cli.convert.to_csv_or_tsv import (
+    convert_to_csv_or_tsv,
+    lexeme_table_to_csv_or_tsv,
+)
+from scribe_data.wikidata.lexeme_table import LexemeTable
 
 # MARK: CSV or TSV
 
@@ -105,6 +109,44 @@ class TestCLIConvertToCSVorTSV(unittest.TestCase):
         actual_content = output_file.read_text(encoding="utf-8")
         assert actual_content == expected_csv_output
 
+    def test_cli_convert_to_csv_or_tsv_nested_dict_with_differing_forms(self) -> None:
+        json_data = '{"a": {"singular": "1"}, "b": {"plural": "y", "singular": "2"}}'
+        expected_csv_output = "noun,plural,singular\na,,1\nb,y,2\n"
+
+        input_file = self.tmp_path / "test.json"
+        input_file.write_text(json_data, encoding="utf-8")
+        output_dir = self.tmp_path / "output"
+
+        convert_to_csv_or_tsv(
+            language="English",
+            data_types="nouns",
+            input_file=input_file,
+            output_dir=output_dir,
+            output_type="csv",
+            overwrite=True,
+        )
+
+        output_file = output_dir / "English" / "nouns.csv"
+        assert output_file.read_text(encoding="utf-8") == expected_csv_output
+
+    def test_cli_convert_to_csv_or_tsv_lexeme_table_to_tsv(self) -> None:
+        table = LexemeTable.from_entries(
+            {"a": {"singular": "1"}, "b": {"pluralForm": "y", "singular": "2"}}
+        )
+        expected_tsv_output = "noun\tplural_form\tsingular\na\t\t1\nb\ty\t2\n"
+
+        lexeme_table_to_csv_or_tsv(
+            language="English",
+            data_type="nouns",
+            table=table,
+            output_dir=self.tmp_path,
+            output_type="tsv",
+            identifier_case="snake",
+        )
+
+        output_file = self.tmp_path / "English" / "nouns.tsv"
+        assert output_file.read_text(encoding="utf-8") == expected_tsv_output
+
     def test_cli_convert_to_csv_or_tsv_nested_dict_to_tsv(self) -> None:
         json_data = (
             '{"a": {"value1": "1", "value2": "x"}, "b": {"value1": "2", "value2": "y"}}'
@@ -12,12 +12,19 @@ from unittest import mock
 import pytest
 
 from scribe_data.cli.convert.to_sqlite import (
+    bulk_load,
     convert_to_sqlite,
     create_table,
+    incremental_sync,
+    lexeme_table_to_sqlite,
+    lexeme_table_to_sqlite_file,
+    sync_lexeme_table,
     table_insert,
+    table_insert_many,
     translations_to_sqlite,
     wiktionary_translations_to_sqlite,
 )
+from scribe_data.wikidata.lexeme_table import LexemeTable
 
 
 @pytest.fixture
@@ -104,6 +111,54 @@ def test_cli_convert_to_sqlite_table_insert(temp_db: Any) -> None:
     assert result == ("1", "test_name")
 
 
+def test_cli_convert_to_sqlite_table_insert_many(temp_db: Any) -> None:
+    """
+    Test inserting rows in batches, ignoring rows with a duplicate first column.
+    """
+    cursor, conn = temp_db
+    create_table(cursor, "snake", "test_table", ["id", "name"])
+
+    rows = ((str(i % 5), f"name{i}") for i in range(7))
+    inserted = table_insert_many(cursor, "test_table", rows, n_cols=2, batch_size=2)
+
+    assert inserted == 5
+    cursor.execute("SELECT * FROM [test_table] ORDER BY id")
+    assert cursor.fetchall() == [(str(i), f"name{i}") for i in range(5)]
+
+
+def test_cli_convert_to_sqlite_bulk_load_restores_settings(tmp_path: Path) -> None:
+    """
+    Test that a bulk load restores the journal and syncing and analyzes the tables.
+    """
+    conn = sqlite3.connect(tmp_path / "test.sqlite")
+    with bulk_load(conn):
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("off",)
+        assert conn.execute("PRAGMA synchronous").fetchone() == (0,)
+        create_table(conn.cursor(), "camel", "nouns", ["wdLexemeId", "singular"])
+        table_insert_many(conn.cursor(), "nouns", [("L1", "a"), ("L2", "b")], 2)
+        conn.commit()
+
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+    assert conn.execute("PRAGMA synchronous").fetchone() == (2,)
+    assert conn.execute("SELECT tbl FROM sqlite_stat1").fetchall() == [("nouns",)]
+    conn.close()
+
+
+def test_cli_convert_to_sqlite_bulk_load_rolls_back_on_error(tmp_path: Path) -> None:
+    """
+    Test that rows of a failed bulk load that weren't committed are rolled back.
+    """
+    conn = sqlite3.connect(tmp_path / "test.sqlite")
+    create_table(conn.cursor(), "camel", "nouns", ["wdLexemeId", "singular"])
+    with pytest.raises(ValueError), bulk_load(conn, journal_mode="WAL"):
+        table_insert_many(conn.cursor(), "nouns", [("L1", "a")], 2)
+        raise ValueError("failed load")
+
+    assert conn.execute("SELECT * FROM nouns").fetchall() == []
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+    conn.close()
+
+
 @pytest.fixture
 def translations_setup(tmp_path: Path) -> dict[str, Any]:
     """
@@ -395,6 +450,159 @@ def test_cli_convert_to_sqlite_skips_missing_json(tmp_path: Path) -> None:
     assert not mock_table_insert.called
 
 
+def test_cli_convert_to_sqlite_lexeme_table_keeps_other_tables(tmp_path: Path) -> None:
+    nouns = LexemeTable.from_entries(
+        {"L1": {"lastModified": "2023-01-01", "singular": "cat"}}
+    )
+    verbs = LexemeTable.from_entries(
+        {
+            "L2": {"lastModified": "2023-01-02", "infinitive": "run"},
+            "L3": {"lastModified": "2023-01-03", "infinitive": "walk"},
+        }
+    )
+
+    lexeme_table_to_sqlite_file("English", "nouns", nouns, output_dir=tmp_path)
+    lexeme_table_to_sqlite_file("English", "verbs", verbs, output_dir=tmp_path)
+
+    conn = sqlite3.connect(tmp_path / "ENLanguageData.sqlite")
+    cursor = conn.cursor()
+    assert cursor.execute("SELECT * FROM nouns ORDER BY wdLexemeId").fetchall() == [
+        ("L0", "Scribe", ""),
+        ("L1", "2023-01-01", "cat"),
+    ]
+    assert cursor.execute("SELECT * FROM verbs").fetchall() == [
+        ("L2", "2023-01-02", "run"),
+        ("L3", "2023-01-03", "walk"),
+    ]
+    conn.close()
+
+
+def test_cli_convert_to_sqlite_lexeme_table_user_declines_overwrite(
+    tmp_path: Path,
+) -> None:
+    verbs = LexemeTable.from_entries({"L2": {"infinitive": "run"}})
+    lexeme_table_to_sqlite_file("English", "verbs", verbs, output_dir=tmp_path)
+
+    with mock.patch("scribe_data.cli.convert.to_sqlite.questionary.confirm") as confirm:
+        confirm.return_value.ask.return_value = False
+        lexeme_table_to_sqlite_file(
+            "English",
+            "verbs",
+            LexemeTable.from_entries({"L3": {"infinitive": "walk"}}),
+            output_dir=tmp_path,
+        )
+
+    conn = sqlite3.connect(tmp_path / "ENLanguageData.sqlite")
+    assert conn.execute("SELECT * FROM verbs").fetchall() == [("L2", "run")]
+    conn.close()
+
+
+def test_cli_convert_to_sqlite_lexeme_table_kept_if_load_fails(
+    tmp_path: Path,
+) -> None:
+    verbs = LexemeTable.from_entries({"L2": {"infinitive": "run"}})
+    lexeme_table_to_sqlite_file("English", "verbs", verbs, output_dir=tmp_path)
+
+    with (
+        mock.patch(
+            "scribe_data.cli.convert.to_sqlite.table_insert_many",
+            side_effect=sqlite3.OperationalError("disk I/O error"),
+        ),
+        pytest.raises(sqlite3.OperationalError),
+    ):
+        lexeme_table_to_sqlite_file(
+            "English",
+            "verbs",
+            LexemeTable.from_entries({"L3": {"infinitive": "walk"}}),
+            output_dir=tmp_path,
+            overwrite=True,
+        )
+
+    conn = sqlite3.connect(tmp_path / "ENLanguageData.sqlite")
+    assert conn.execute("SELECT * FROM verbs").fetchall() == [("L2", "run")]
+    conn.close()
+
+
+def test_cli_convert_to_sqlite_lexeme_table_with_reader_connected(
+    tmp_path: Path,
+) -> None:
+    verbs = LexemeTable.from_entries({"L2": {"infinitive": "run"}})
+    lexeme_table_to_sqlite_file("English", "verbs", verbs, output_dir=tmp_path)
+    reader = sqlite3.connect(tmp_path / "ENLanguageData.sqlite")
+    reader.execute("PRAGMA journal_mode = WAL")
+    assert reader.execute("SELECT count(*) FROM verbs").fetchone() == (1,)
+
+    lexeme_table_to_sqlite_file(
+        "English",
+        "nouns",
+        LexemeTable.from_entries({"L1": {"singular": "cat"}}),
+        output_dir=tmp_path,
+    )
+
+    assert reader.execute("SELECT count(*) FROM nouns").fetchone() == (2,)
+    reader.close()
+
+
+def test_cli_convert_to_sqlite_workers_build_each_language(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    for lang, noun in [("english", "cat"), ("french", "chat")]:
+        (input_dir / lang).mkdir(parents=True)
+        (input_dir / lang / "nouns.json").write_text(
+            json.dumps({"L1": {"lastModified": "2023-01-01", "singular": noun}})
+        )
+
+    timings = convert_to_sqlite(
+        languages=["english", "french"],
+        specific_tables=["nouns"],
+        input_file=str(input_dir),
+        output_file=str(output_dir),
+        overwrite=True,
+        workers=2,
+    )
+
+    assert set(timings) == {"english", "french"}
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        "ENLanguageData.sqlite",
+        "FRLanguageData.sqlite",
+    ]
+    conn = sqlite3.connect(output_dir / "FRLanguageData.sqlite")
+    assert conn.execute(
+        "SELECT singular FROM nouns WHERE wdLexemeId = 'L1'"
+    ).fetchone() == ("chat",)
+    conn.close()
+
+
+def test_cli_convert_to_sqlite_failed_build_keeps_database(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    (input_dir / "english").mkdir(parents=True)
+    (input_dir / "english" / "nouns.json").write_text(
+        json.dumps({"L1": {"lastModified": "2023-01-01", "singular": "cat"}})
+    )
+    output_dir.mkdir()
+    db_file = output_dir / "ENLanguageData.sqlite"
+    db_file.write_bytes(b"previous database")
+
+    with (
+        mock.patch(
+            "scribe_data.cli.convert.to_sqlite.lexeme_table_to_sqlite",
+            side_effect=sqlite3.OperationalError("disk I/O error"),
+        ),
+        pytest.raises(sqlite3.OperationalError),
+    ):
+        convert_to_sqlite(
+            languages=["english"],
+            specific_tables=["nouns"],
+            input_file=str(input_dir),
+            output_file=str(output_dir),
+            overwrite=True,
+        )
+
+    assert db_file.read_bytes() == b"previous database"
+    assert [path.name for path in output_dir.iterdir()] == ["ENLanguageData.sqlite"]
+
+
 # MARK: Wiktionary translations to SQLite
 
 
@@ -619,3 +827,317 @@ def test_cli_convert_to_sqlite_wiktionary_translations_multiple_files(tmp_path):
     assert cursor.fetchone()[0] == "Bonjour"
 
     conn.close()
+
+
+def test_cli_convert_to_sqlite_wiktionary_translations_keeps_table_on_error(
+    tmp_path, capsys
+):
+    """
+    Test that a translation table that can't be written keeps its old rows.
+    """
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    lang_dir = input_dir / "english"
+    lang_dir.mkdir(parents=True)
+
+    def write_translations(de_translation, fr_translation):
+        for iso, translation in [("de", de_translation), ("fr", fr_translation)]:
+            (lang_dir / f"{iso}_translations_from_en.json").write_text(
+                json.dumps({"hello": {"noun": {"1": {"translation": translation}}}})
+            )
+
+        wiktionary_translations_to_sqlite(
+            language="english",
+            input_file=str(input_dir),
+            output_file=str(output_dir),
+            overwrite=True,
+        )
+
+    write_translations("Hallo", "Bonjour")
+    # SQLite can't store an object, so the German table fails after it's dropped.
+    write_translations({"text": "Servus"}, "Salut")
+    assert "Error creating/updating de_translations_from_en table" in (
+        capsys.readouterr().out
+    )
+
+    with sqlite3.connect(output_dir / "TranslationData.sqlite") as conn:
+        assert conn.execute(
+            "SELECT translation FROM [de_translations_from_en]"
+        ).fetchall() == [("Hallo",)]
+        assert conn.execute(
+            "SELECT translation FROM [fr_translations_from_en]"
+        ).fetchall() == [("Salut",)]
+
+    conn.close()
+
+
+def test_cli_convert_to_sqlite_index_profile(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    (input_dir / "english").mkdir(parents=True)
+    (input_dir / "english" / "nouns.json").write_text(
+        json.dumps(
+            {
+                "L1": {
+                    "lastModified": "2023-01-01",
+                    "singular": "cat",
+                    "plural": "cats",
+                },
+                "L2": {
+                    "lastModified": "2023-01-01",
+                    "singular": "Cow",
+                    "plural": "cows",
+                },
+            }
+        )
+    )
+
+    convert_to_sqlite(
+        languages=["english"],
+        specific_tables=["nouns"],
+        input_file=str(input_dir),
+        output_file=str(output_dir),
+        overwrite=True,
+        index_profile="autocomplete",
+    )
+
+    conn = sqlite3.connect(output_dir / "ENLanguageData.sqlite")
+    indexes = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    }
+    assert {
+        "nouns_singular_idx",
+        "nouns_plural_idx",
+        "nouns_singular_nocase_idx",
+    } <= indexes
+    assert conn.execute(
+        "SELECT word FROM autocomplete_lexicon WHERE word LIKE 'c%' ORDER BY word"
+    ).fetchall() == [("cat",), ("Cow",)]
+    conn.close()
+
+
+def test_cli_convert_to_sqlite_autocomplete_lexicon_table(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    (input_dir / "english").mkdir(parents=True)
+    for data_type, lemma, word in [
+        ("nouns", "singular", "cat"),
+        ("verbs", "infinitive", "run"),
+    ]:
+        (input_dir / "english" / f"{data_type}.json").write_text(
+            json.dumps({"L1": {"lastModified": "2023-01-01", lemma: word}})
+        )
+
+    # Only requesting the lexicon builds it from the tables of all data types.
+    convert_to_sqlite(
+        languages=["english"],
+        specific_tables=["autocomplete_lexicon"],
+        input_file=str(input_dir),
+        output_file=str(output_dir),
+        overwrite=True,
+    )
+
+    conn = sqlite3.connect(output_dir / "ENLanguageData.sqlite")
+    assert conn.execute(
+        "SELECT word FROM autocomplete_lexicon ORDER BY word"
+    ).fetchall() == [("cat",), ("run",)]
+    assert conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'nouns_singular_idx'"
+    ).fetchone()
+    conn.close()
+
+
+def test_cli_convert_to_sqlite_unsupported_index_profile(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Unsupported index profile"):
+        convert_to_sqlite(
+            languages=["english"],
+            input_file=str(tmp_path),
+            output_file=str(tmp_path),
+            index_profile="fulltext",
+        )
+
+
+def test_sync_lexeme_table_applies_changes(tmp_path: Path) -> None:
+    db_path = tmp_path / "ENLanguageData.sqlite"
+    before = {
+        "L1": {"lastModified": "2023-01-01", "singular": "cat", "plural": "cats"},
+        "L2": {"lastModified": "2023-01-01", "singular": "dog", "plural": "dogs"},
+        "L3": {"lastModified": "2023-01-01", "singular": "cow", "plural": "cows"},
+    }
+    after = {
+        "L1": {"lastModified": "2023-01-01", "singular": "cat", "plural": "cats"},
+        "L2": {"lastModified": "2024-06-01", "singular": "dog", "plural": "doggos"},
+        "L4": {"lastModified": "2024-06-01", "singular": "ox", "plural": "oxen"},
+    }
+    conn = sqlite3.connect(db_path)
+    lexeme_table_to_sqlite(
+        conn.cursor(), LexemeTable.from_entries(before), "nouns", add_scribe_row=True
+    )
+    conn.commit()
+    reader = sqlite3.connect(db_path)
+
+    with incremental_sync(conn):
+        conn.execute("BEGIN IMMEDIATE")
+        sync = sync_lexeme_table(conn.cursor(), after, "nouns", add_scribe_row=True)
+        # Readers see the previous rows until the changes are committed.
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert reader.execute("SELECT count(*) FROM nouns").fetchone() == (4,)
+        assert reader.execute(
+            "SELECT plural FROM nouns WHERE wdLexemeId = 'L2'"
+        ).fetchone() == ("dogs",)
+        conn.commit()
+
+    assert (sync.inserted, sync.updated, sync.deleted, sync.unchanged) == (1, 1, 1, 1)
+    assert not sync.rebuilt
+    assert reader.execute("SELECT * FROM nouns ORDER BY wdLexemeId").fetchall() == [
+        ("L0", "Scribe", "", ""),
+        ("L1", "2023-01-01", "cat", "cats"),
+        ("L2", "2024-06-01", "dog", "doggos"),
+        ("L4", "2024-06-01", "ox", "oxen"),
+    ]
+    reader.close()
+    conn.close()
+
+
+def test_sync_lexeme_table_matches_columns_by_name() -> None:
+    conn = sqlite3.connect(":memory:")
+    cursor = conn.cursor()
+    lexeme_table_to_sqlite(
+        cursor,
+        LexemeTable.from_entries(
+            {"L1": {"lastModified": "2023-01-01", "singular": "cat", "plural": "cats"}}
+        ),
+        "nouns",
+        identifier_case="snake",
+    )
+
+    # The same forms in a different order are upserted into the existing columns.
+    reordered = {
+        "L1": {"plural": "kitties", "singular": "cat", "lastModified": "2024-06-01"}
+    }
+    sync = sync_lexeme_table(cursor, reordered, "nouns", identifier_case="snake")
+    assert (sync.updated, sync.rebuilt) == (1, False)
+    assert cursor.execute("SELECT * FROM nouns").fetchall() == [
+        ("L1", "2024-06-01", "cat", "kitties")
+    ]
+
+    # New forms change the columns, so the table is rewritten.
+    extended = {"L1": {"lastModified": "2024-06-01", "singular": "cat", "gender": "n"}}
+    sync = sync_lexeme_table(cursor, extended, "nouns", identifier_case="snake")
+    assert sync.rebuilt
+    assert [info[1] for info in cursor.execute("PRAGMA table_info(nouns)")] == [
+        "wd_lexeme_id",
+        "last_modified",
+        "singular",
+        "gender",
+    ]
+    conn.close()
+
+
+def test_cli_convert_to_sqlite_incremental(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    nouns_json = input_dir / "english" / "nouns.json"
+    nouns_json.parent.mkdir(parents=True)
+    nouns_json.write_text(
+        json.dumps(
+            {
+                "L1": {"lastModified": "2023-01-01", "singular": "cat"},
+                "L2": {"lastModified": "2023-01-01", "singular": "dog"},
+            }
+        )
+    )
+    convert_to_sqlite(
+        languages=["english"],
+        specific_tables=["nouns"],
+        input_file=str(input_dir),
+        output_file=str(output_dir),
+        overwrite=True,
+        index_profile="autocomplete",
+    )
+
+    nouns_json.write_text(
+        json.dumps(
+            {
+                "L1": {"lastModified": "2023-01-01", "singular": "cat"},
+                "L3": {"lastModified": "2024-06-01", "singular": "cow"},
+            }
+        )
+    )
+    with mock.patch("scribe_data.cli.convert.to_sqlite.questionary.confirm") as confirm:
+        convert_to_sqlite(
+            languages=["english"],
+            specific_tables=["nouns"],
+            input_file=str(input_dir),
+            output_file=str(output_dir),
+            incremental=True,
+        )
+
+    confirm.assert_not_called()
+    conn = sqlite3.connect(output_dir / "ENLanguageData.sqlite")
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+    assert conn.execute(
+        "SELECT wdLexemeId, singular FROM nouns ORDER BY wdLexemeId"
+    ).fetchall() == [("L0", ""), ("L1", "cat"), ("L3", "cow")]
+    # The autocomplete lexicon is rebuilt from the changed nouns.
+    assert conn.execute(
+        "SELECT word FROM autocomplete_lexicon ORDER BY word"
+    ).fetchall() == [("cat",), ("cow",)]
+    conn.close()
+
+
+def test_cli_convert_to_sqlite_incremental_keeps_index_profile(tmp_path: Path) -> None:
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    nouns_json = input_dir / "english" / "nouns.json"
+    nouns_json.parent.mkdir(parents=True)
+    nouns_json.write_text(
+        json.dumps({"L1": {"lastModified": "2023-01-01", "singular": "cat"}})
+    )
+    convert_to_sqlite(
+        languages=["english"],
+        specific_tables=["nouns"],
+        input_file=str(input_dir),
+        output_file=str(output_dir),
+        overwrite=True,
+        index_profile="lookup",
+    )
+
+    # A new form rewrites the table, which gets the indexes of the database again.
+    nouns_json.write_text(
+        json.dumps(
+            {"L1": {"lastModified": "2024-06-01", "singular": "cat", "plural": "cats"}}
+        )
+    )
+    convert_to_sqlite(
+        languages=["english"],
+        specific_tables=["nouns"],
+        input_file=str(input_dir),
+        output_file=str(output_dir),
+        incremental=True,
+    )
+
+    conn = sqlite3.connect(output_dir / "ENLanguageData.sqlite")
+    indexes = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    }
+    assert {"nouns_singular_idx", "nouns_plural_idx"} <= indexes
+    conn.close()
+
+    # A passed profile is added even if no lexemes changed.
+    convert_to_sqlite(
+        languages=["english"],
+        specific_tables=["nouns"],
+        input_file=str(input_dir),
+        output_file=str(output_dir),
+        incremental=True,
+        index_profile="autocomplete",
+    )
+
+    conn = sqlite3.connect(output_dir / "ENLanguageData.sqlite")
+    assert conn.execute("SELECT word FROM autocomplete_lexicon").fetchall() == [
+        ("cat",)
+    ]
+    conn.close()
@@ -9,7 +9,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from scribe_data.cli.convert.wrapper import convert_wrapper
+from scribe_data.cli.convert.wrapper import convert_wrapper, lexeme_table_writer
 
 # MARK: Wrapper
 
@@ -47,6 +47,9 @@ class TestCLIConvertWrapper(unittest.TestCase):
             input_file=Path("file"),
             output_file=Path("/output"),
             overwrite=True,
+            workers=1,
+            index_profile=None,
+            incremental=False,
         )
 
     @patch("scribe_data.cli.convert.wrapper.Path", autospec=True)
@@ -80,6 +83,9 @@ class TestCLIConvertWrapper(unittest.TestCase):
             input_file=Path(mock_input_file),
             output_file=Path("scribe_data_sqlite_export"),
             overwrite=True,
+            workers=1,
+            index_profile=None,
+            incremental=False,
         )
 
     @patch("scribe_data.cli.convert.wrapper.convert_to_sqlite", autospec=True)
@@ -103,6 +109,9 @@ class TestCLIConvertWrapper(unittest.TestCase):
             input_file=Path("/input"),
             output_file=Path("/output"),
             overwrite=False,
+            workers=1,
+            index_profile=None,
+            incremental=False,
         )
 
     @patch(
@@ -129,6 +138,9 @@ class TestCLIConvertWrapper(unittest.TestCase):
             input_file=Path("/mock_wiktionary_dir"),
             output_file=Path("/output"),
             overwrite=False,
+            workers=1,
+            index_profile=None,
+            incremental=False,
         )
 
     def test_convert_wrapper(self) -> None:
@@ -146,3 +158,29 @@ class TestCLIConvertWrapper(unittest.TestCase):
             str(context.exception),
             "Unsupported output type 'parquet'. Must be 'json', 'csv', 'tsv' or 'sqlite'.",
         )
+
+    @patch("scribe_data.cli.convert.wrapper.lexeme_table_to_sqlite_file")
+    def test_lexeme_table_writer_to_sqlite(self, mock_to_sqlite: MagicMock) -> None:
+        write = lexeme_table_writer(
+            output_type="sqlite", output_dir=Path("/output"), overwrite=True
+        )
+        table = MagicMock()
+        write("English", "nouns", table)
+
+        mock_to_sqlite.assert_called_once_with(
+            "English",
+            "nouns",
+            table,
+            output_dir=Path("/output"),
+            overwrite=True,
+            identifier_case="camel",
+        )
+
+    def test_lexeme_table_writer_unsupported_type(self) -> None:
+        with self.assertRaises(ValueError) as context:
+            lexeme_table_writer(output_type="json", output_dir=Path("/output"))
+
+        self.assertEqual(
+            str(context.exception),
+            "Unsupported output type 'json'. Must be 'csv', 'tsv' or 'sqlite'.",
+        )
@@ -7,7 +7,7 @@ import json
 import unittest
 import urllib.error
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from SPARQLWrapper.SPARQLExceptions import EndPointInternalError
@@ -85,6 +85,7 @@ class TestGetData(unittest.TestCase):
             output_dir=DEFAULT_JSON_EXPORT_DIR,
             wikidata_dump_path=None,  # explicitly set to None
             overwrite_all=False,
+            write_output=None,
         )
         mock_query_data.assert_not_called()
 
@@ -104,6 +105,7 @@ class TestGetData(unittest.TestCase):
             output_dir=DEFAULT_JSON_EXPORT_DIR,
             wikidata_dump_path=None,
             overwrite_all=False,
+            write_output=None,
         )
 
     # MARK: Language and Data Type
@@ -126,6 +128,9 @@ class TestGetData(unittest.TestCase):
             output_dir=Path("./test_output"),
             overwrite=False,
             interactive=False,
+            max_concurrency=1,
+            result_format="json",
+            write_output=None,
         )
 
     # MARK: Capitalized Language
@@ -152,6 +157,9 @@ class TestGetData(unittest.TestCase):
             output_dir=DEFAULT_JSON_EXPORT_DIR,
             overwrite=False,
             interactive=False,
+            max_concurrency=1,
+            result_format="json",
+            write_output=None,
         )
 
     # MARK: Lowercase Language
@@ -177,6 +185,9 @@ class TestGetData(unittest.TestCase):
             output_dir=DEFAULT_JSON_EXPORT_DIR,
             overwrite=False,
             interactive=False,
+            max_concurrency=1,
+            result_format="json",
+            write_output=None,
         )
 
     # MARK: Output Directory
@@ -201,6 +212,9 @@ class TestGetData(unittest.TestCase):
             output_dir=Path("./custom_output_test"),
             overwrite=False,
             interactive=False,
+            max_concurrency=1,
+            result_format="json",
+            write_output=None,
         )
 
     # MARK: Overwrite is True
@@ -222,6 +236,9 @@ class TestGetData(unittest.TestCase):
             output_dir=DEFAULT_JSON_EXPORT_DIR,
             overwrite=True,
             interactive=False,
+            max_concurrency=1,
+            result_format="json",
+            write_output=None,
         )
 
     # MARK: Overwrite is False
@@ -243,6 +260,9 @@ class TestGetData(unittest.TestCase):
             output_dir=Path("./custom_output_test"),
             overwrite=False,
             interactive=False,
+            max_concurrency=1,
+            result_format="json",
+            write_output=None,
         )
 
     # MARK: User Chooses Skip
@@ -310,6 +330,9 @@ class TestGetData(unittest.TestCase):
             output_dir=Path("./test_output"),
             overwrite=False,
             interactive=False,
+            max_concurrency=1,
+            result_format="json",
+            write_output=None,
         )
 
     # MARK: Translations
@@ -322,6 +345,9 @@ class TestGetData(unittest.TestCase):
             wiktionary_dump_path=None,
             output_dir=DEFAULT_WIKTIONARY_JSON_EXPORT_DIR,
             overwrite=False,
+            parse_cache_path=None,
+            output_type="json",
+            identifier_case="camel",
         )
 
     @patch("scribe_data.wiktionary.parse_translations.parse_wiktionary_translations")
@@ -336,6 +362,9 @@ class TestGetData(unittest.TestCase):
             wiktionary_dump_path=None,
             output_dir=Path("./test_output"),
             overwrite=False,
+            parse_cache_path=None,
+            output_type="json",
+            identifier_case="camel",
         )
 
     @patch("scribe_data.wiktionary.parse_translations.parse_wiktionary_translations")
@@ -350,6 +379,9 @@ class TestGetData(unittest.TestCase):
             wiktionary_dump_path=Path("./wikidump.json"),
             output_dir=DEFAULT_WIKTIONARY_JSON_EXPORT_DIR,
             overwrite=False,
+            parse_cache_path=None,
+            output_type="json",
+            identifier_case="camel",
         )
 
     # MARK: Use QID as language
@@ -381,6 +413,7 @@ class TestGetData(unittest.TestCase):
             output_dir=Path("exported_json"),
             wikidata_dump_path=Path("scribe"),
             overwrite_all=False,
+            write_output=None,
         )
 
     @patch("scribe_data.cli.get.parse_wd_lexeme_dump")
@@ -406,6 +439,7 @@ class TestGetData(unittest.TestCase):
             output_dir=Path("exported_json"),
             wikidata_dump_path=Path("scribe"),
             overwrite_all=False,
+            write_output=None,
         )
 
     # MARK: All Languages for Data Type
@@ -431,6 +465,7 @@ class TestGetData(unittest.TestCase):
             output_dir=Path("test"),
             wikidata_dump_path=None,
             overwrite_all=False,
+            write_output=None,
         )
 
     @patch("scribe_data.cli.get.query_data")
@@ -453,6 +488,7 @@ class TestGetData(unittest.TestCase):
             data_types=["verbs"],
             output_dir=Path("test"),
             overwrite=False,
+            write_output=None,
         )
 
     # MARK: Error Handling
@@ -501,24 +537,17 @@ class TestGetData(unittest.TestCase):
     # MARK: Output Type Handling
 
     @patch("scribe_data.cli.get.query_data")
-    @patch("scribe_data.cli.get.convert_wrapper")
-    @patch("scribe_data.cli.get.Path.exists")
-    @patch("scribe_data.cli.get.os.remove")
+    @patch("scribe_data.cli.get.lexeme_table_writer")
     @patch("scribe_data.cli.get.check_index_exists")
     def test_output_type_conversion(
         self,
         mock_check_index: MagicMock,
-        mock_remove: MagicMock,
-        mock_exists: MagicMock,
-        mock_convert: MagicMock,
+        mock_writer: MagicMock,
         mock_query_data: MagicMock,
     ) -> None:
         """
-        Test conversion of output to different file types.
+        Test that other output types are written by query_data without JSON files.
         """
-        mock_exists.return_value = True
-        mock_check_index.return_value = False
-
         get_data(
             languages=["German"],
             data_types=["verbs"],
@@ -527,19 +556,24 @@ class TestGetData(unittest.TestCase):
             identifier_case="snake",
         )
 
-        # Use Path to create platform-appropriate path.
-        expected_input_file = Path("test_dir/German/verbs.json")
-
-        mock_convert.assert_called_once_with(
+        mock_writer.assert_called_once_with(
+            output_type="csv",
+            output_dir=Path("test_dir"),
+            overwrite=False,
+            identifier_case="snake",
+        )
+        mock_query_data.assert_called_once_with(
             languages=["German"],
             data_types=["verbs"],
-            input_path=expected_input_file,
             output_dir=Path("test_dir"),
-            output_type="csv",
             overwrite=False,
-            identifier_case="snake",
+            interactive=False,
+            max_concurrency=1,
+            result_format="json",
+            write_output=mock_writer.return_value,
         )
-        mock_remove.assert_called_once()
+        # The writer checks for existing data rather than the JSON export.
+        mock_check_index.assert_not_called()
 
     # MARK: Default Output Directory
 
@@ -569,6 +603,9 @@ class TestGetData(unittest.TestCase):
                     output_dir=expected_dir,
                     overwrite=False,
                     interactive=False,
+                    max_concurrency=1,
+                    result_format="json",
+                    write_output=ANY,
                 )
 
     @patch("scribe_data.cli.get.query_data")
@@ -588,6 +625,9 @@ class TestGetData(unittest.TestCase):
             output_dir=DEFAULT_JSON_EXPORT_DIR,
             overwrite=False,
             interactive=True,
+            max_concurrency=1,
+            result_format="json",
+            write_output=None,
         )
 
     @patch("scribe_data.cli.get.parse_wd_lexeme_dump")
@@ -606,6 +646,7 @@ class TestGetData(unittest.TestCase):
             output_dir=DEFAULT_JSON_EXPORT_DIR,
             wikidata_dump_path=custom_path,
             overwrite_all=False,
+            write_output=None,
         )
 
     @patch("scribe_data.cli.get.query_data")
@@ -631,6 +672,9 @@ class TestGetData(unittest.TestCase):
             output_dir=DEFAULT_JSON_EXPORT_DIR,
             overwrite=False,
             interactive=False,
+            max_concurrency=1,
+            result_format="json",
+            write_output=None,
         )
 
     @patch("scribe_data.cli.get.query_data")
@@ -661,6 +705,7 @@ class TestGetData(unittest.TestCase):
             output_dir=DEFAULT_JSON_EXPORT_DIR,
             wikidata_dump_path=None,
             overwrite_all=False,
+            write_output=None,
         )
 
     @patch("scribe_data.cli.get.query_data")
@@ -680,6 +725,9 @@ class TestGetData(unittest.TestCase):
             output_dir=DEFAULT_JSON_EXPORT_DIR,
             overwrite=False,
             interactive=False,
+            max_concurrency=1,
+            result_format="json",
+            write_output=None,
         )
 
 
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the CLI entry point.
+"""
+
+import subprocess
+import sys
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from scribe_data.cli.main import main
+
+
+class TestCLIMain(unittest.TestCase):
+    def test_cli_main_does_not_import_subcommand_dependencies(self):
+        modules = ["mwparserfromhell", "questionary", "requests", "tqdm"]
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, scribe_data.cli.main; "
+                f"print([m for m in {modules!r} if m in sys.modules])",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "[]")
+
+    @patch("scribe_data.cli.main.list_wrapper")
+    @patch("scribe_data.cli.version.get_version_message")
+    def test_cli_main_version_is_fetched_only_when_asked(self, mock_version, mock_list):
+        mock_version.return_value = "Scribe-Data v1.0.0"
+
+        with patch("sys.argv", ["scribe-data", "list", "-a"]):
+            main()
+
+        mock_version.assert_not_called()
+        mock_list.assert_called_once()
+
+        with (
+            patch("sys.argv", ["scribe-data", "-v"]),
+            patch("sys.stdout", new=StringIO()) as out,
+            self.assertRaises(SystemExit),
+        ):
+            main()
+
+        mock_version.assert_called_once()
+        self.assertEqual(out.getvalue(), "Scribe-Data v1.0.0\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,19 +3,25 @@
 Tests for the update_utils file functions.
 """
 
+import json
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 sys.path.append(Path(__file__).parent.parent)
 
 from scribe_data.utils import (
+    LanguageRegistry,
     format_sublanguage_name,
     get_language_from_iso,
     get_language_iso,
     get_language_qid,
+    language_registry,
     list_all_languages,
+    load_metadata,
+    write_json,
 )
 
 
@@ -181,3 +187,127 @@ def test_list_all_languages() -> None:
     ]
 
     assert list_all_languages() == expected_languages
+
+
+def test_language_registry_lookups() -> None:
+    assert language_registry.entries["nynorsk"]["iso"] == "nn"
+    assert language_registry.parents["nynorsk"] == "norwegian"
+    assert language_registry.sub_languages["norwegian"] == ("bokmål", "nynorsk")
+    assert language_registry.iso_to_name["zh"] == "mandarin"
+    assert language_registry.qid_to_name["Q188"] == "german"
+    assert language_registry.output_subdir("Mandarin") == "chinese/mandarin"
+    assert language_registry.output_subdir("Klingon") == "klingon"
+
+    with pytest.raises(TypeError):
+        language_registry.parents["klingon"] = "english"
+
+
+def test_language_registry_for_other_metadata() -> None:
+    metadata = {
+        "english": {"iso": "en"},
+        "chinese": {"sub_languages": {"mandarin": {}}},
+    }
+    registry = LanguageRegistry.for_metadata(metadata)
+
+    assert registry is not language_registry
+    assert registry.parents == {"mandarin": "chinese"}
+    assert format_sublanguage_name("mandarin", metadata) == "mandarin chinese"
+
+
+def test_load_metadata_is_cached_until_a_file_changes(tmp_path: Path, capsys) -> None:
+    metadata_file = tmp_path / "languages.yaml"
+    metadata_file.write_text("english:\n  iso: en\n", encoding="utf-8")
+    cache_path = tmp_path / "cache" / "metadata.json"
+    paths = {metadata_file: "language metadata"}
+
+    assert load_metadata(paths, cache_path) == {
+        "languages.yaml": {"english": {"iso": "en"}}
+    }
+    assert cache_path.exists()
+
+    with patch("scribe_data.utils._parse_yaml_metadata") as mock_parse:
+        assert (
+            load_metadata(paths, cache_path)["languages.yaml"]["english"]["iso"] == "en"
+        )
+        mock_parse.assert_not_called()
+
+    metadata_file.write_text(
+        "english:\n  iso: en\ngerman:\n  iso: de\n", encoding="utf-8"
+    )
+    assert "german" in load_metadata(paths, cache_path)["languages.yaml"]
+
+    metadata_file.write_text("english: [", encoding="utf-8")
+    assert load_metadata(paths, cache_path) == {}
+    assert "Error reading language metadata" in capsys.readouterr().out
+
+
+def test_load_metadata_cache_keeps_keys_and_recovers(tmp_path: Path) -> None:
+    metadata_file = tmp_path / "lexeme_form_metadata.yaml"
+    metadata_file.write_text("1_case:\n  1:\n    label: Nominative\n", encoding="utf-8")
+    cache_path = tmp_path / "cache" / "metadata.json"
+    paths = {metadata_file: "lexeme form metadata"}
+    expected = {"lexeme_form_metadata.yaml": {"1_case": {1: {"label": "Nominative"}}}}
+
+    assert load_metadata(paths, cache_path) == expected
+    with patch("scribe_data.utils._parse_yaml_metadata") as mock_parse:
+        assert load_metadata(paths, cache_path) == expected
+        mock_parse.assert_not_called()
+
+    # A corrupt cache is replaced.
+    cache_path.write_text("{", encoding="utf-8")
+    assert load_metadata(paths, cache_path) == expected
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["metadata"]
+
+    # A cache that can't be written leaves no temporary file behind.
+    cache_path.unlink()
+    with patch("scribe_data.utils.json.dump", side_effect=TypeError("not JSON")):
+        assert load_metadata(paths, cache_path) == expected
+
+    assert list(cache_path.parent.iterdir()) == []
+
+
+JSON_SAMPLE = {
+    "L1": {
+        "lemma": '\u00e9t\u00e9 \U0001f600 "quoted" back\\slash \u2028 \x7f \x01',
+        "forms": ["  leading spaces", "line\nbreak", "tab\t"],
+        "empty": {},
+        "none": [],
+        "count": 3,
+        "flags": [True, False, None],
+    },
+    "L2": {"lemma": "zebra", "nested": {"deep": [{"a": "b"}, []]}},
+    "L3": "plain",
+}
+
+
+@pytest.mark.parametrize("indent", [0, 2])
+@pytest.mark.parametrize("sort_keys", [False, True])
+@pytest.mark.parametrize("batch_size", [1, 2, 100])
+def test_write_json_matches_json_dump(
+    tmp_path: Path, indent: int, sort_keys: bool, batch_size: int
+) -> None:
+    path = tmp_path / "data.json"
+    write_json(path, JSON_SAMPLE, indent, sort_keys, batch_size=batch_size)
+
+    assert path.read_bytes() == json.dumps(
+        JSON_SAMPLE, ensure_ascii=False, indent=indent, sort_keys=sort_keys
+    ).encode("utf-8")
+
+
+@pytest.mark.parametrize("data", [{}, [], "text", [JSON_SAMPLE], {"key": 2**70}])
+def test_write_json_matches_json_dump_for_other_data(tmp_path: Path, data) -> None:
+    path = tmp_path / "data.json"
+    write_json(path, data, indent=0, trailing_newline=True)
+
+    expected = json.dumps(data, ensure_ascii=False, indent=0) + "\n"
+    assert path.read_bytes() == expected.encode("utf-8")
+
+
+def test_write_json_without_orjson(tmp_path: Path) -> None:
+    path = tmp_path / "data.json"
+    with patch("scribe_data.utils._orjson", return_value=None):
+        write_json(path, JSON_SAMPLE, indent=4)
+
+    assert path.read_text(encoding="utf-8") == json.dumps(
+        JSON_SAMPLE, ensure_ascii=False, indent=4
+    )
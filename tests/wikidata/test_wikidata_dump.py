@@ -102,6 +102,33 @@ def test_wikidata_process_file(
     assert pbar.n == compressed_size
 
 
+def test_wikidata_export_forms_write_output(
+    lexeme_processor: LexemeProcessor, tmp_path
+) -> None:
+    """
+    Test that forms are passed to a writer in place of being exported to JSON.
+    """
+    lexeme_processor.forms_index[("en", "nouns")].add(
+        "L1", "2023-01-01T00:00:00Z", [("plural", "tests")]
+    )
+    write_output = MagicMock()
+
+    lexeme_processor.export_forms_json(
+        filepath=str(tmp_path / "nouns.json"),
+        language_iso="en",
+        data_type="nouns",
+        write_output=write_output,
+    )
+
+    write_output.assert_called_once()
+    language, data_type, table = write_output.call_args.args
+    assert (language, data_type) == ("english", "nouns")
+    assert table.entries() == {
+        "L1": {"lastModified": "2023-01-01T00:00:00Z", "plural": "tests"}
+    }
+    assert not any(tmp_path.iterdir())
+
+
 @patch("scribe_data.wikidata.parse_dump.LexemeProcessor")
 def test_wikidata_parse_dump(mock_processor: MagicMock) -> None:
     """
@@ -116,6 +143,30 @@ def test_wikidata_parse_dump(mock_processor: MagicMock) -> None:
     mock_processor.assert_called_once()
 
 
+@patch("scribe_data.wikidata.parse_dump.LexemeProcessor")
+@patch(
+    "scribe_data.wikidata.parse_dump.check_index_exists",
+    side_effect=lambda path, _: path.name == "nouns.json",
+)
+def test_wikidata_parse_dump_forms_of_one_language(
+    mock_check: MagicMock, mock_processor: MagicMock, tmp_path
+) -> None:
+    """
+    Test that a single language passed as a string is checked for existing exports.
+    """
+    parse_dump(
+        languages="english",
+        parse_type=["form"],
+        data_types=["nouns", "verbs"],
+        file_path="test.json.bz2",
+        output_dir=tmp_path,
+    )
+
+    assert mock_check.call_args.args[0] == tmp_path / "english" / "verbs.json"
+    assert mock_processor.call_args.kwargs["target_lang"] == ["english"]
+    assert mock_processor.call_args.kwargs["data_types"] == ["verbs"]
+
+
 @patch("scribe_data.wikidata.wikidata_utils.Path")
 @patch("scribe_data.wikidata.wikidata_utils.wd_lexeme_dump_download_wrapper")
 @patch("scribe_data.wikidata.wikidata_utils.parse_dump")
@@ -150,6 +201,7 @@ def test_wikidata_parse_wd_lexeme_dump(
         file_path=str(test_file_path),
         output_dir=DEFAULT_WIKIDATA_DUMP_EXPORT_DIR,
         overwrite_all=False,
+        write_output=None,
     )
 
     # Test with "all" languages.
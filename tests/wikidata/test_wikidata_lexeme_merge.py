@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for merging the forms of each lexeme.
+"""
+
+from scribe_data.wikidata.format_data import merge_lexeme_rows
+from scribe_data.wikidata.lexeme_merge import LexemeMerger
+from scribe_data.wikidata.parse_dump import LexemeProcessor
+
+
+def test_lexeme_merger_merges_rows_in_one_pass() -> None:
+    rows = [
+        {"lexemeID": "L2", "lastModified": "t2", "noun": "Haus", "plural": ""},
+        {"lexemeID": "L10", "lastModified": "t10", "noun": "Buch", "plural": "B"},
+        {"lexemeID": "L10", "lastModified": "t11", "noun": "Buch", "plural": "A"},
+        {"lexemeID": "L10", "lastModified": "t10", "noun": "Buch", "plural": "B"},
+        {"lexemeID": "L2", "lastModified": "t2", "noun": "Haus", "plural": "Häuser"},
+    ]
+    merged = merge_lexeme_rows(iter(rows))
+
+    assert merged.has_multiple_forms
+    assert merged.entries() == {
+        "L10": {"lastModified": "t10", "noun": "Buch", "plural": "A | B"},
+        "L2": {"lastModified": "t2", "noun": "Haus", "plural": "Häuser"},
+    }
+    assert list(merged.entries()) == ["L10", "L2"]
+
+
+def test_lexeme_merger_keeps_empty_fields_of_first_row() -> None:
+    merged = merge_lexeme_rows(
+        [
+            {"lexemeID": "L1", "lastModified": "t1", "noun": "chat", "plural": ""},
+            {"lexemeID": "L1", "lastModified": "t1", "noun": "", "gender": ""},
+        ]
+    )
+
+    assert merged["L1"] == {"lastModified": "t1", "noun": "chat", "plural": ""}
+    assert not merged.has_multiple_forms
+
+
+def test_lexeme_merger_resumes_from_exported_entries() -> None:
+    merged = LexemeMerger({"L1": {"lastModified": "t1", "plural": "B | C"}})
+    assert merged.has_multiple_forms
+
+    merged.add("L1", "t2", [("plural", "A"), ("plural", "C"), ("singular", "")])
+    merged.add("L2", "t2")
+
+    assert dict(merged) == {
+        "L1": {"lastModified": "t1", "plural": "A | B | C"},
+        "L2": {"lastModified": "t2"},
+    }
+
+
+def test_lexeme_processor_merges_forms_like_query_results() -> None:
+    processor = LexemeProcessor(
+        target_lang="english", parse_type=["form"], data_types=["nouns"]
+    )
+    processor._form_label_cache = {("Q110786",): "singular", ("Q146786",): "plural"}
+    form = {"representations": {"en": {"value": "person"}}}
+    lexeme = {
+        "id": "L1",
+        "language": "Q1860",
+        "lexicalCategory": "Q1084",
+        "modified": "t1",
+        "forms": [
+            {**form, "grammaticalFeatures": ["Q110786"]},
+            {
+                "representations": {"en": {"value": "people"}},
+                "grammaticalFeatures": ["Q146786"],
+            },
+            {
+                "representations": {"en": {"value": "persons"}},
+                "grammaticalFeatures": ["Q146786"],
+            },
+            {
+                "representations": {"en": {"value": "people"}},
+                "grammaticalFeatures": ["Q146786"],
+            },
+        ],
+    }
+    processor._process_forms(lexeme, "en", "nouns")
+
+    rows = [
+        {"lexemeID": "L1", "lastModified": "t1", "singular": "person", "plural": p}
+        for p in ("people", "persons", "people")
+    ]
+    merged = processor.forms_index[("en", "nouns")]
+    assert merged == merge_lexeme_rows(rows)
+    assert merged["L1"]["plural"] == "people | persons"
+    assert merged.has_multiple_forms
+    assert processor.forms_counts["en"]["nouns"] == 1
@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the columnar lexeme table.
+"""
+
+import json
+from pathlib import Path
+
+from scribe_data.wikidata.format_data import merge_lexeme_rows
+from scribe_data.wikidata.lexeme_table import LexemeTable
+
+ENTRIES = {
+    "L1": {"lastModified": "2025-01-01", "singular": "cat", "plural": "cats"},
+    "L2": {"lastModified": "2025-01-01", "singular": "sheep"},
+    "L3": {"lastModified": "2025-01-02", "gender": "masculine", "plural": "oxen"},
+}
+
+
+def test_lexeme_table_columns_are_aligned() -> None:
+    table = LexemeTable.from_entries(ENTRIES)
+
+    assert len(table) == 3
+    assert table.lexeme_ids == ["L1", "L2", "L3"]
+    assert table.columns == {
+        "lastModified": ["2025-01-01", "2025-01-01", "2025-01-02"],
+        "singular": ["cat", "sheep", None],
+        "plural": ["cats", None, "oxen"],
+        "gender": [None, None, "masculine"],
+    }
+    assert list(table.rows(["plural", "missing"])) == [
+        ("L1", "cats", None),
+        ("L2", None, None),
+        ("L3", "oxen", None),
+    ]
+    assert table.entries() == ENTRIES
+
+
+def test_lexeme_table_interns_values_across_tables(tmp_path: Path) -> None:
+    path = tmp_path / "nouns.json"
+    path.write_text(json.dumps(ENTRIES), encoding="utf-8")
+
+    strings: dict[str, str] = {}
+    nouns = LexemeTable.read_json(path, strings)
+    verbs = LexemeTable.from_entries(
+        {"L4": {"lastModified": "2025-01-01", "infinitive": "go"}}, strings
+    )
+
+    first, second = nouns.columns["lastModified"][:2]
+    assert first is second
+    assert verbs.columns["lastModified"][0] is first
+
+
+def test_lexeme_merger_table_is_sorted_by_lexeme_id() -> None:
+    merged = merge_lexeme_rows(
+        [
+            {"lexemeID": "L2", "lastModified": "t", "noun": "b", "plural": "x"},
+            {"lexemeID": "L10", "lastModified": "t", "noun": "a", "plural": ""},
+            {"lexemeID": "L2", "lastModified": "t", "noun": "b", "plural": "y"},
+        ]
+    )
+    table = merged.table()
+
+    assert table.lexeme_ids == ["L10", "L2"]
+    assert table.columns["plural"] == ["", "x | y"]
+    assert table.entries() == merged.entries()
@@ -7,12 +7,31 @@ import json
 import subprocess
 import tempfile
 import unittest
-from io import StringIO
+from io import BytesIO, StringIO
 from pathlib import Path
 from unittest.mock import MagicMock, call, patch
 from urllib.error import HTTPError
 
 
+def sparql_response(*rows: dict) -> MagicMock:
+    """
+    Mock a WDQS response whose JSON body binds the given values.
+    """
+    bindings = [
+        {var: {"type": "literal", "value": value} for var, value in row.items()}
+        for row in rows
+    ]
+    body = {"head": {"vars": []}, "results": {"bindings": bindings}}
+    return MagicMock(response=BytesIO(json.dumps(body).encode()))
+
+
+def empty_response() -> MagicMock:
+    """
+    Mock a WDQS response without a results document.
+    """
+    return MagicMock(response=BytesIO(b""))
+
+
 class TestQueryData(unittest.TestCase):
     @patch("subprocess.run")
     @patch("sys.executable", return_value="python")
@@ -55,6 +74,62 @@ class TestQueryData(unittest.TestCase):
                 "/output/dir", "German", "nouns"
             )  # should print error but not raise exceptions
 
+    def test_wikidata_format_data_in_process(self) -> None:
+        """
+        Test that format_data exports entries merged directly from query_data.
+        """
+        from scribe_data.wikidata.format_data import format_data, merge_lexeme_rows
+
+        rows = [
+            {"lexemeID": "L2", "lastModified": "t2", "noun": "Haus", "plural": ""},
+            {"lexemeID": "L1", "lastModified": "t1", "noun": "Buch", "plural": "B"},
+            {"lexemeID": "L1", "lastModified": "t1", "noun": "Buch", "plural": "A"},
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir, patch("sys.stdout"):
+            output_dir = Path(temp_dir)
+            queried_file = output_dir / "german" / "nouns_queried.json"
+            queried_file.parent.mkdir()
+            queried_file.write_text(json.dumps(rows))
+
+            merged = merge_lexeme_rows(iter(rows[:2]))
+            merge_lexeme_rows(iter(rows[2:]), merged)
+            format_data(output_dir, "German", "nouns", data_formatted=merged)
+
+            data = json.loads((output_dir / "german" / "nouns.json").read_text())
+            self.assertEqual(list(data), ["L1", "L2"])
+            self.assertEqual(
+                data["L1"], {"lastModified": "t1", "noun": "Buch", "plural": "A | B"}
+            )
+            self.assertFalse(queried_file.exists())
+
+    def test_wikidata_format_data_write_output(self) -> None:
+        """
+        Test that format_data passes a table to a writer in place of exporting JSON.
+        """
+        from scribe_data.wikidata.format_data import format_data, merge_lexeme_rows
+
+        rows = [
+            {"lexemeID": "L2", "lastModified": "t2", "noun": "Haus"},
+            {"lexemeID": "L1", "lastModified": "t1", "noun": "Buch"},
+        ]
+        write_output = MagicMock()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            format_data(
+                output_dir,
+                "German",
+                "nouns",
+                data_formatted=merge_lexeme_rows(iter(rows)),
+                write_output=write_output,
+            )
+
+            write_output.assert_called_once()
+            language, data_type, table = write_output.call_args.args
+            self.assertEqual((language, data_type), ("German", "nouns"))
+            self.assertEqual(table.lexeme_ids, ["L1", "L2"])
+            self.assertEqual(table.columns["noun"], ["Buch", "Haus"])
+            self.assertFalse((output_dir / "german" / "nouns.json").exists())
+
     def test_wikidata_query_data_multiple_intervals(self) -> None:
         """
         Test query_data with multiple query intervals.
@@ -90,34 +165,19 @@ class TestQueryData(unittest.TestCase):
                         "scribe_data.wikidata.query_data.sparql.setQuery"
                     ) as mock_setQuery,
                     patch("scribe_data.wikidata.query_data.sparql.query") as mock_query,
-                    patch(
-                        "scribe_data.wikidata.query_data.execute_formatting_script"
-                    ) as mock_exec,
+                    patch("scribe_data.wikidata.query_data.format_data") as mock_exec,
                 ):
                     # Simulate query responses.
                     mock_query.side_effect = [
-                        MagicMock(
-                            convert=lambda: {
-                                "results": {
-                                    "bindings": [
-                                        {
-                                            "item": {"value": "Q1"},
-                                            "label": {"value": "test1"},
-                                        }
-                                    ]
-                                }
-                            }
+                        sparql_response(
+                            {"lexemeID": "L1", "lastModified": "t1", "verb": "gehen"},
+                            {"lexemeID": "L2", "lastModified": "t2", "verb": "sein"},
                         ),
-                        MagicMock(
-                            convert=lambda: {
-                                "results": {
-                                    "bindings": [
-                                        {
-                                            "item": {"value": "Q2"},
-                                            "label": {"value": "test2"},
-                                        }
-                                    ]
-                                }
+                        sparql_response(
+                            {
+                                "lexemeID": "L1",
+                                "lastModified": "t1",
+                                "pastTense": "ging",
                             }
                         ),
                     ]
@@ -125,36 +185,35 @@ class TestQueryData(unittest.TestCase):
                     output_dir = Path(temp_dir) / "output"
 
                     # Call query_data.
-                    query_data(["German"], ["verbs"], output_dir)
+                    query_data(["German"], ["verbs"], output_dir, shard_concurrency=1)
 
                     # Check setQuery is called correctly.
                     mock_setQuery.assert_has_calls(
                         [call("test query\n1"), call("test query\n2")], any_order=True
                     )
 
-                    # Check the results JSON file exists.
-                    result_file = output_dir / "German" / "verbs.json"
-                    self.assertTrue(result_file.exists())
-
-                    # Check the results.
-                    data = json.loads(result_file.read_text())
-                    self.assertEqual(len(data), 2)
-                    self.assertEqual(data[0]["item"], "Q1")
-                    self.assertEqual(data[0]["label"], "test1")
-                    self.assertEqual(data[1]["item"], "Q2")
-                    self.assertEqual(data[1]["label"], "test2")
-                    self.assertEqual(data[1]["auxiliaryVerb"], "")
-
-                    # Check that verbs_queried.json exists.
-                    queried_file = output_dir / "German" / "verbs_queried.json"
-                    self.assertTrue(queried_file.exists())
-
-                    # Check the results of verbs_queried.json match verbs.json.
-                    self.assertEqual(queried_file.read_text(), result_file.read_text())
-
-                    # Check execute_formatting_script is called once with the correct arguments.
-                    mock_exec.assert_called_once_with(
-                        language="German", data_type="verbs", output_dir=output_dir
+                    # Check format_data is called once with the merged rows.
+                    mock_exec.assert_called_once()
+                    self.assertEqual(mock_exec.call_args.kwargs["dir_path"], output_dir)
+                    self.assertEqual(mock_exec.call_args.kwargs["language"], "German")
+                    self.assertEqual(mock_exec.call_args.kwargs["data_type"], "verbs")
+
+                    data = mock_exec.call_args.kwargs["data_formatted"]
+                    self.assertEqual(
+                        data,
+                        {
+                            "L1": {
+                                "lastModified": "t1",
+                                "verb": "gehen",
+                                "pastTense": "ging",
+                            },
+                            "L2": {"lastModified": "t2", "verb": "sein"},
+                        },
+                    )
+
+                    # Check that the raw rows are no longer saved.
+                    self.assertFalse(
+                        (output_dir / "German" / "verbs_queried.json").exists()
                     )
 
                     # Check the expected messages are printed to sys.stdout.
@@ -166,6 +225,51 @@ class TestQueryData(unittest.TestCase):
                         out.getvalue(),
                     )
 
+    def test_wikidata_query_data_tsv_results(self) -> None:
+        """
+        Test that query_data requests and parses TSV results when asked to.
+        """
+        from scribe_data.wikidata.query_data import query_data, sparql
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            queries_dir = Path(temp_dir) / "queries"
+            (queries_dir / "french" / "nouns").mkdir(parents=True)
+            (queries_dir / "french" / "nouns" / "query.sparql").write_text(
+                "SELECT * WHERE { }"
+            )
+
+            body = (
+                "?lexemeID\t?lastModified\t?noun\t?plural\n"
+                '"L1"\t"t1"\t"chat"@fr\t"chats"@fr\n'
+                '"L2"\t"t2"\t"eau"@fr\t\n'
+            ).encode()
+            formats = []
+
+            def query(refresh=False):
+                formats.append(sparql.returnFormat)
+                return MagicMock(response=BytesIO(body))
+
+            with (
+                patch("sys.stdout", new=StringIO()),
+                patch(
+                    "scribe_data.wikidata.query_data.WIKIDATA_QUERIES_ALL_DATA_DIR",
+                    queries_dir,
+                ),
+                patch("scribe_data.wikidata.query_data.sparql.query", new=query),
+                patch("scribe_data.wikidata.query_data.format_data") as mock_format,
+            ):
+                query_data(["french"], ["nouns"], Path(temp_dir), result_format="tsv")
+
+            self.assertEqual(formats, ["tsv"])
+            self.assertEqual(sparql.returnFormat, "json")
+            self.assertEqual(
+                mock_format.call_args.kwargs["data_formatted"],
+                {
+                    "L1": {"lastModified": "t1", "noun": "chat", "plural": "chats"},
+                    "L2": {"lastModified": "t2", "noun": "eau"},
+                },
+            )
+
     def test_wikidata_query_data_single_query_error(self) -> None:
         """
         Test that query_data handles a single query returning None.
@@ -199,12 +303,10 @@ class TestQueryData(unittest.TestCase):
                     ),
                     patch("scribe_data.wikidata.query_data.sparql.setQuery"),
                     patch("scribe_data.wikidata.query_data.sparql.query") as mock_query,
-                    patch(
-                        "scribe_data.wikidata.query_data.execute_formatting_script"
-                    ) as mock_exec,
+                    patch("scribe_data.wikidata.query_data.format_data") as mock_exec,
                 ):
-                    # Simulate query with response of None.
-                    mock_query.return_value = MagicMock(convert=lambda: None)
+                    # Simulate query with an empty response.
+                    mock_query.side_effect = lambda refresh=False: empty_response()
 
                     output_dir = Path(temp_dir) / "output"
 
@@ -213,6 +315,7 @@ class TestQueryData(unittest.TestCase):
                         languages=["German"],
                         data_types=["verbs"],
                         output_dir=output_dir,
+                        retry_backoff_seconds=0,
                     )
 
                     # Check the error return values are returned.
@@ -221,7 +324,7 @@ class TestQueryData(unittest.TestCase):
 
                     # Check the expected messages are printed to sys.stdout.
                     self.assertEqual(
-                        out.getvalue().count("Querying and formatting German verbs"), 3
+                        out.getvalue().count("Querying and formatting German verbs"), 1
                     )
                     self.assertEqual(
                         out.getvalue().count(
@@ -239,7 +342,7 @@ class TestQueryData(unittest.TestCase):
                     # Check the results file is not created.
                     self.assertFalse((output_dir / "German" / "verbs.json").exists())
 
-                    # Check that execute_formatting_script is not called.
+                    # Check that format_data is not called.
                     mock_exec.assert_not_called()
 
     def test_wikidata_query_data_multiple_intervals_error(self) -> None:
@@ -278,54 +381,42 @@ class TestQueryData(unittest.TestCase):
                     ),
                     patch("scribe_data.wikidata.query_data.sparql.setQuery"),
                     patch("scribe_data.wikidata.query_data.sparql.query") as mock_query,
-                    patch("scribe_data.wikidata.query_data.execute_formatting_script"),
+                    patch("scribe_data.wikidata.query_data.format_data") as mock_format,
                 ):
                     # Simulate query responses.
-                    mock_http = MagicMock()
-                    mock_http.convert.side_effect = HTTPError(
-                        "url", 404, "error", None, None
-                    )
                     mock_query.side_effect = [
-                        MagicMock(
-                            convert=lambda: {
-                                "results": {
-                                    "bindings": [
-                                        {
-                                            "item": {"value": "Q1"},
-                                            "label": {"value": "test1"},
-                                        }
-                                    ]
-                                }
-                            }
+                        sparql_response(
+                            {"lexemeID": "L1", "lastModified": "t1", "verb": "gehen"}
                         ),
-                        mock_http,
-                        MagicMock(convert=lambda: None),
-                        MagicMock(convert=lambda: None),
-                        MagicMock(convert=lambda: None),
+                        HTTPError("url", 404, "error", None, None),
+                        empty_response(),
+                        empty_response(),
                     ]
 
                     output_dir = Path(temp_dir) / "output"
 
                     # Call query_data.
-                    error = query_data(["German"], ["verbs"], output_dir)
+                    error = query_data(
+                        ["German"],
+                        ["verbs"],
+                        output_dir,
+                        retry_backoff_seconds=0,
+                        shard_concurrency=1,
+                    )
 
                     # Check the error return values are returned.
                     self.assertFalse(error["success"])
                     self.assertFalse(error["skipped"])
 
-                    # Check the results JSON file exists.
-                    result_file = output_dir / "German" / "verbs.json"
-                    self.assertTrue(result_file.exists())
-
-                    # Check the results for the first query.
-                    data = json.loads(result_file.read_text())
-                    self.assertEqual(len(data), 1)
-                    self.assertEqual(data[0]["item"], "Q1")
-                    self.assertEqual(data[0]["label"], "test1")
+                    # Check only the results for the first query are formatted.
+                    data = mock_format.call_args.kwargs["data_formatted"]
+                    self.assertEqual(
+                        data, {"L1": {"lastModified": "t1", "verb": "gehen"}}
+                    )
 
                     # Check the expected messages are printed to sys.stdout.
                     self.assertEqual(
-                        out.getvalue().count("Querying and formatting German verbs"), 4
+                        out.getvalue().count("Querying and formatting German verbs"), 1
                     )
                     self.assertEqual(
                         out.getvalue().count(
@@ -337,7 +428,7 @@ class TestQueryData(unittest.TestCase):
                         out.getvalue().count(
                             f"Nothing returned by the WDQS server for {query_file_2}"
                         ),
-                        4,
+                        2,
                     )
                     self.assertEqual(
                         out.getvalue().count(
@@ -354,3 +445,280 @@ class TestQueryData(unittest.TestCase):
                         ),
                         1,
                     )
+
+    def test_wikidata_query_data_resumes_partial_results(self) -> None:
+        """
+        Test that a rerun only runs the query files that failed in an earlier run.
+        """
+        from scribe_data.wikidata.query_data import query_data
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            queries_dir = Path(temp_dir) / "queries"
+            german_verbs = queries_dir / "German" / "verbs"
+            german_verbs.mkdir(parents=True)
+            (german_verbs / "query_1.sparql").write_text("test query\n1")
+            (german_verbs / "query_2.sparql").write_text("test query\n2")
+
+            output_dir = Path(temp_dir) / "output"
+            partial_path = output_dir / "German" / "verbs_partial.json"
+
+            with (
+                patch("sys.stdout", new=StringIO()) as out,
+                patch(
+                    "scribe_data.wikidata.query_data.WIKIDATA_QUERIES_ALL_DATA_DIR",
+                    queries_dir,
+                ),
+                patch(
+                    "scribe_data.wikidata.query_data.format_sublanguage_name",
+                    return_value="German",
+                ),
+                patch(
+                    "scribe_data.wikidata.query_data.sparql.setQuery"
+                ) as mock_setQuery,
+                patch("scribe_data.wikidata.query_data.sparql.query") as mock_query,
+                patch("scribe_data.wikidata.query_data.format_data") as mock_format,
+            ):
+                mock_query.side_effect = [
+                    sparql_response(
+                        {"lexemeID": "L1", "lastModified": "t1", "verb": "gehen"}
+                    ),
+                    empty_response(),
+                    empty_response(),
+                    empty_response(),
+                ]
+                query_data(
+                    ["German"],
+                    ["verbs"],
+                    output_dir,
+                    retry_backoff_seconds=0,
+                    shard_concurrency=1,
+                )
+                self.assertTrue(partial_path.exists())
+
+                mock_setQuery.reset_mock()
+                mock_query.side_effect = [
+                    sparql_response(
+                        {"lexemeID": "L1", "lastModified": "t1", "pastTense": "ging"}
+                    )
+                ]
+                self.assertIsNone(
+                    query_data(["German"], ["verbs"], output_dir, shard_concurrency=1)
+                )
+
+                mock_setQuery.assert_called_once_with("test query\n2")
+                self.assertEqual(
+                    mock_format.call_args.kwargs["data_formatted"],
+                    {
+                        "L1": {
+                            "lastModified": "t1",
+                            "verb": "gehen",
+                            "pastTense": "ging",
+                        }
+                    },
+                )
+                self.assertFalse(partial_path.exists())
+                self.assertIn(
+                    "Resuming German verbs with the results of 1 of 2 queries",
+                    out.getvalue(),
+                )
+
+    def test_wikidata_query_data_keeps_partial_results_with_json_exports(
+        self,
+    ) -> None:
+        """
+        Test that other output types don't get partial results in their directory.
+        """
+        from scribe_data.wikidata.query_data import query_data
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            queries_dir = Path(temp_dir) / "queries"
+            german_verbs = queries_dir / "German" / "verbs"
+            german_verbs.mkdir(parents=True)
+            (german_verbs / "query_1.sparql").write_text("test query\n1")
+            (german_verbs / "query_2.sparql").write_text("test query\n2")
+
+            json_dir = Path(temp_dir) / "json"
+            sqlite_dir = Path(temp_dir) / "sqlite"
+            write_output = MagicMock()
+
+            with (
+                patch("sys.stdout", new=StringIO()),
+                patch(
+                    "scribe_data.wikidata.query_data.WIKIDATA_QUERIES_ALL_DATA_DIR",
+                    queries_dir,
+                ),
+                patch(
+                    "scribe_data.wikidata.query_data.DEFAULT_JSON_EXPORT_DIR", json_dir
+                ),
+                patch(
+                    "scribe_data.wikidata.query_data.format_sublanguage_name",
+                    return_value="German",
+                ),
+                patch("scribe_data.wikidata.query_data.sparql.setQuery"),
+                patch("scribe_data.wikidata.query_data.sparql.query") as mock_query,
+            ):
+                mock_query.side_effect = [
+                    sparql_response(
+                        {"lexemeID": "L1", "lastModified": "t1", "verb": "gehen"}
+                    ),
+                    empty_response(),
+                    empty_response(),
+                    empty_response(),
+                ]
+                query_data(
+                    ["German"],
+                    ["verbs"],
+                    sqlite_dir,
+                    retry_backoff_seconds=0,
+                    shard_concurrency=1,
+                    write_output=write_output,
+                )
+
+            self.assertTrue((json_dir / "German" / "verbs_partial.json").exists())
+            self.assertFalse(sqlite_dir.exists())
+            write_output.assert_called_once()
+
+    def test_wikidata_query_data_fans_out_split_query(self) -> None:
+        """
+        Test that the parts of a split query are run together and merged in order.
+        """
+        from scribe_data.wikidata.query_data import query_data
+        from scribe_data.wikidata.query_scheduler import QueryGroup
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            queries_dir = Path(temp_dir) / "queries"
+            german_verbs = queries_dir / "German" / "verbs"
+            german_verbs.mkdir(parents=True)
+            for i in range(1, 4):
+                (german_verbs / f"query_{i}.sparql").write_text(f"test query\n{i}")
+
+            executor = MagicMock()
+            executor.run.return_value = {
+                german_verbs / "query_1.sparql": [
+                    {"lexemeID": "L1", "lastModified": "t1", "plural": "A"}
+                ],
+                german_verbs / "query_2.sparql": HTTPError(
+                    "url", 500, "error", None, None
+                ),
+                german_verbs / "query_3.sparql": [
+                    {"lexemeID": "L1", "lastModified": "t1", "plural": "C"}
+                ],
+            }
+
+            with (
+                patch("sys.stdout", new=StringIO()),
+                patch(
+                    "scribe_data.wikidata.query_data.WIKIDATA_QUERIES_ALL_DATA_DIR",
+                    queries_dir,
+                ),
+                patch(
+                    "scribe_data.wikidata.query_data.format_sublanguage_name",
+                    return_value="German",
+                ),
+                patch(
+                    "scribe_data.wikidata.query_data.WDQSExecutor",
+                    return_value=executor,
+                ) as mock_executor,
+                patch(
+                    "scribe_data.wikidata.query_data.sparql.setQuery"
+                ) as mock_setQuery,
+                patch("scribe_data.wikidata.query_data.sparql.query") as mock_query,
+                patch("scribe_data.wikidata.query_data.format_data") as mock_format,
+                patch.object(QueryGroup, "save_partial") as mock_save_partial,
+            ):
+                # The failed part is retried on its own.
+                mock_query.return_value = sparql_response(
+                    {"lexemeID": "L1", "lastModified": "t1", "plural": "B"}
+                )
+                query_data(
+                    ["German"], ["verbs"], Path(temp_dir), retry_backoff_seconds=0
+                )
+
+            self.assertEqual(mock_executor.call_args.kwargs["max_concurrency"], 3)
+            executor.run.assert_called_once_with(
+                {
+                    german_verbs / f"query_{i}.sparql": f"test query\n{i}"
+                    for i in range(1, 4)
+                }
+            )
+            mock_setQuery.assert_called_once_with("test query\n2")
+            # The retry doesn't use a cached response to the failed part.
+            mock_query.assert_called_once_with(refresh=True)
+            # The merged rows aren't saved as each part finishes.
+            mock_save_partial.assert_not_called()
+            self.assertEqual(
+                mock_format.call_args.kwargs["data_formatted"],
+                {"L1": {"lastModified": "t1", "plural": "A | B | C"}},
+            )
+
+    def test_wikidata_query_data_prefetch_skips_finished_queries(self) -> None:
+        """
+        Test that prefetching only runs unfinished query files a few at a time.
+        """
+        from scribe_data.wikidata.query_data import query_data
+        from scribe_data.wikidata.query_scheduler import QueryGroup, ShardJob
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            queries_dir = Path(temp_dir) / "queries"
+            paths = {}
+            for lang in ["French", "German"]:
+                verbs = queries_dir / lang / "verbs"
+                verbs.mkdir(parents=True)
+                for i in [1, 2]:
+                    paths[lang, i] = verbs / f"query_{i}.sparql"
+                    paths[lang, i].write_text(f"{lang} query {i}")
+
+            output_dir = Path(temp_dir) / "output"
+            finished = QueryGroup(
+                language="French",
+                data_type="verbs",
+                export_dir=output_dir / "French",
+                shards=[ShardJob(paths["French", 1]), ShardJob(paths["French", 2])],
+            )
+            finished.shards[0].state = "done"
+            finished.save_partial()
+
+            executor = MagicMock()
+            executor.run.side_effect = lambda queries: {
+                path: [{"lexemeID": "L1", "lastModified": "t1", "verb": path.stem}]
+                for path in queries
+            }
+
+            with (
+                patch("sys.stdout", new=StringIO()),
+                patch(
+                    "scribe_data.wikidata.query_data.WIKIDATA_QUERIES_ALL_DATA_DIR",
+                    queries_dir,
+                ),
+                patch(
+                    "scribe_data.wikidata.query_data.format_sublanguage_name",
+                    side_effect=lambda lang, _: lang,
+                ),
+                patch(
+                    "scribe_data.wikidata.query_data.WDQSExecutor",
+                    return_value=executor,
+                ),
+                patch("scribe_data.wikidata.query_data.sparql.query") as mock_query,
+                patch("scribe_data.wikidata.query_data.format_data"),
+            ):
+                query_data(
+                    ["French", "German"],
+                    ["verbs"],
+                    output_dir,
+                    max_concurrency=2,
+                    shard_concurrency=1,
+                )
+
+            mock_query.assert_not_called()
+            self.assertEqual(
+                executor.run.call_args_list,
+                [
+                    call(
+                        {
+                            paths["French", 2]: "French query 2",
+                            paths["German", 1]: "German query 1",
+                        }
+                    ),
+                    call({paths["German", 2]: "German query 2"}),
+                ],
+            )
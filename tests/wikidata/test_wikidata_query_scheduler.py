@@ -0,0 +1,160 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for scheduling query files as retryable jobs.
+"""
+
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+from urllib.error import HTTPError
+
+from scribe_data.wikidata.query_scheduler import QueryGroup, QueryScheduler, ShardJob
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestQueryScheduler(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.clock = FakeClock()
+        self.ran = []
+        self.finished = []
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def group(self, name: str, n_shards: int = 1) -> QueryGroup:
+        shards = []
+        for i in range(1, n_shards + 1):
+            path = self.root / name / f"query_{i}.sparql"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"{name} {i}")
+            shards.append(ShardJob(path))
+
+        return QueryGroup(name, "verbs", self.root / "out" / name, shards)
+
+    def scheduler(self, outcomes: dict) -> QueryScheduler:
+        def run_shard(group, job):
+            self.ran.append((group.language, job.path.name))
+            outcome = outcomes.get((group.language, job.path.name), [True])
+            result = outcome.pop(0) if len(outcome) > 1 else outcome[0]
+            if isinstance(result, BaseException):
+                raise result
+
+            if result:
+                group.data_formatted[job.path.name] = {}
+
+            return result
+
+        return QueryScheduler(
+            run_shard=run_shard,
+            finish_group=lambda group: self.finished.append(group.language),
+            backoff_seconds=10,
+            clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+
+    def test_query_scheduler_other_groups_run_during_backoff(self):
+        groups = [self.group("german"), self.group("french"), self.group("spanish")]
+        scheduler = self.scheduler(
+            {
+                ("german", "query_1.sparql"): [
+                    False,
+                    HTTPError("u", 429, "x", None, None),
+                    True,
+                ]
+            }
+        )
+
+        with patch("sys.stdout", new=StringIO()) as out:
+            failed = scheduler.run(groups)
+
+        self.assertEqual(failed, [])
+        self.assertEqual(
+            self.ran,
+            [
+                ("german", "query_1.sparql"),
+                ("french", "query_1.sparql"),
+                ("spanish", "query_1.sparql"),
+                ("german", "query_1.sparql"),
+                ("german", "query_1.sparql"),
+            ],
+        )
+        self.assertEqual(self.finished, ["french", "spanish", "german"])
+        # Exponential backoff: 10 seconds after the first failure, 20 after the second.
+        self.assertEqual(self.clock.sleeps, [10, 20])
+        self.assertIn("HTTPError with", out.getvalue())
+        self.assertEqual(groups[0].shards[0].attempts, 3)
+
+    def test_query_scheduler_failed_shard_is_skipped(self):
+        german = self.group("german", n_shards=3)
+        scheduler = self.scheduler({("german", "query_2.sparql"): [False]})
+
+        with patch("sys.stdout", new=StringIO()) as out:
+            failed = scheduler.run([german])
+
+        self.assertEqual(failed, [german])
+        self.assertEqual(
+            [job.state for job in german.shards], ["done", "failed", "done"]
+        )
+        self.assertEqual(self.finished, ["german"])
+        self.assertEqual(out.getvalue().count("The query will be retried."), 2)
+
+        # The partial results of the finished shards can be resumed from.
+        resumed = self.group("german", n_shards=3)
+        self.assertEqual(resumed.load_partial(), 2)
+        self.assertEqual(resumed.next_shard().path.name, "query_2.sparql")
+        self.assertEqual(
+            set(resumed.data_formatted), {"query_1.sparql", "query_3.sparql"}
+        )
+
+    def test_query_scheduler_saves_partial_results_when_interrupted(self):
+        german = self.group("german", n_shards=3)
+        french = self.group("french", n_shards=2)
+        scheduler = self.scheduler(
+            {("german", "query_3.sparql"): [KeyboardInterrupt()]}
+        )
+
+        def run_shard(group, job, run_shard=scheduler.run_shard):
+            # Results are only saved once a shard fails or the run is interrupted.
+            self.assertFalse(group.partial_path.exists())
+            return run_shard(group, job)
+
+        scheduler.run_shard = run_shard
+        with patch("sys.stdout", new=StringIO()), self.assertRaises(KeyboardInterrupt):
+            scheduler.run([german, french])
+
+        self.assertEqual(self.finished, [])
+        self.assertFalse(french.partial_path.exists())
+
+        resumed = self.group("german", n_shards=3)
+        self.assertEqual(resumed.load_partial(), 2)
+        self.assertEqual(resumed.next_shard().path.name, "query_3.sparql")
+
+    def test_query_scheduler_changed_query_is_not_resumed(self):
+        german = self.group("german", n_shards=2)
+        german.shards[0].state = "done"
+        german.save_partial()
+
+        resumed = self.group("german", n_shards=2)
+        resumed.shards[0].path.write_text("changed query")
+        self.assertEqual(resumed.load_partial(), 0)
+        self.assertEqual(resumed.next_shard(), resumed.shards[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
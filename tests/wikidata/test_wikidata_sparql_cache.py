@@ -0,0 +1,211 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the on-disk SPARQL response cache.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+
+from scribe_data.wikidata.sparql_cache import (
+    CachingSPARQLWrapper,
+    SparqlCache,
+    cache_key,
+    configure_sparql_cache,
+    get_sparql_cache,
+    normalize_query,
+)
+from scribe_data.wikidata.sparql_options import (
+    add_sparql_cache_arguments,
+    configure_sparql_cache_from_args,
+)
+from scribe_data.wikidata.wdqs_executor import WDQSExecutor
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    """
+    Answer every query with a JSON result and count the requests.
+
+    The bodies of the first ``server.truncated`` responses are cut short.
+    """
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests += 1
+        body = json.dumps(
+            {
+                "head": {"vars": ["n"]},
+                "results": {
+                    "bindings": [
+                        {"n": {"type": "literal", "value": str(self.server.requests)}}
+                    ]
+                },
+            }
+        ).encode()
+        if self.server.requests <= self.server.truncated:
+            body = body[: len(body) // 2]
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/sparql-results+json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSparqlCache(unittest.TestCase):
+    def setUp(self):
+        configure_sparql_cache(None)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.addCleanup(configure_sparql_cache, None)
+        self.cache_dir = Path(self.temp_dir.name) / "cache"
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), CountingHandler)
+        self.server.requests = 0
+        self.server.truncated = 0
+        self.endpoint = f"http://127.0.0.1:{self.server.server_port}/sparql"
+        thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.01,), daemon=True
+        )
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def run_query(self, query: str = "SELECT ?n WHERE { }") -> dict:
+        client = CachingSPARQLWrapper(self.endpoint)
+        client.setMethod("POST")
+        client.setReturnFormat("json")
+        client.setQuery(query)
+        return client.queryAndConvert()
+
+    def test_sparql_cache_normalize_query(self):
+        self.assertEqual(
+            normalize_query("  # Comment.\nSELECT ?n\n\n  WHERE { }  \n"),
+            "SELECT ?n\nWHERE { }",
+        )
+        key = cache_key("e", "SELECT ?n WHERE { }", "json", "POST")
+        self.assertEqual(key, cache_key("e", "\nSELECT ?n WHERE { }\n", "json", "POST"))
+        self.assertNotEqual(key, cache_key("e", "SELECT ?n WHERE { }", "tsv", "POST"))
+        self.assertNotEqual(key, cache_key("f", "SELECT ?n WHERE { }", "json", "POST"))
+
+    def test_sparql_cache_caching_wrapper(self):
+        # Without a configured cache every query is sent.
+        self.assertIsNone(get_sparql_cache())
+        self.run_query()
+        self.run_query()
+        self.assertEqual(self.server.requests, 2)
+
+        configure_sparql_cache(self.cache_dir)
+        first = self.run_query()
+        self.assertEqual(
+            self.run_query("# Same query.\n" + "SELECT ?n WHERE { }"), first
+        )
+        self.assertEqual(first["results"]["bindings"][0]["n"]["value"], "3")
+        self.assertEqual(self.server.requests, 3)
+
+        # Refreshing replaces the cached response.
+        configure_sparql_cache(self.cache_dir, refresh=True)
+        self.assertEqual(self.run_query()["results"]["bindings"][0]["n"]["value"], "4")
+
+        configure_sparql_cache(self.cache_dir)
+        self.assertEqual(self.run_query()["results"]["bindings"][0]["n"]["value"], "4")
+        self.assertEqual(self.server.requests, 4)
+
+    def test_sparql_cache_executor_skips_rate_limit_on_hits(self):
+        configure_sparql_cache(self.cache_dir)
+        executor = WDQSExecutor(
+            self.endpoint, max_concurrency=2, queries_per_second=1000
+        )
+        queries = {i: f"SELECT ?n WHERE {{ }} LIMIT {i}" for i in range(3)}
+        executor.run(queries)
+
+        executor.bucket.acquire = lambda: self.fail("Cached queries are rate limited.")
+        results = executor.run(queries)
+        self.assertEqual(self.server.requests, 3)
+        self.assertEqual(len(results), 3)
+
+    def test_sparql_cache_discards_truncated_responses(self):
+        configure_sparql_cache(self.cache_dir)
+        self.server.truncated = 1
+        executor = WDQSExecutor(self.endpoint, queries_per_second=1000)
+        query = "SELECT ?n WHERE { }"
+
+        self.assertIsInstance(executor.run({0: query})[0], json.JSONDecodeError)
+        self.assertFalse(executor._client(query).has_cached_response())
+
+        self.assertEqual(
+            executor.query(query)["results"]["bindings"][0]["n"]["value"], "2"
+        )
+        self.assertTrue(executor._client(query).has_cached_response())
+
+    def test_sparql_cache_refresh_skips_cached_response(self):
+        configure_sparql_cache(self.cache_dir)
+        self.server.truncated = 1
+        client = CachingSPARQLWrapper(self.endpoint)
+        client.setMethod("POST")
+        client.setReturnFormat("json")
+        client.setQuery("SELECT ?n WHERE { }")
+
+        with self.assertRaises(json.JSONDecodeError):
+            client.query().convert()
+
+        # A retry replaces the truncated response rather than reading it again.
+        result = client.query(refresh=True).convert()
+        self.assertEqual(result["results"]["bindings"][0]["n"]["value"], "2")
+        self.assertEqual(client.query().convert(), result)
+        self.assertEqual(self.server.requests, 2)
+
+    def test_sparql_cache_ttl_and_lru_eviction(self):
+        now = [1000.0]
+        cache = SparqlCache(self.cache_dir, ttl_seconds=60, clock=lambda: now[0])
+
+        class Response(BytesIO):
+            headers = {"Content-Type": "text/csv"}
+
+        for i in range(3):
+            cache.put(str(i) * 64, Response(b"x" * 100)).close()
+            path = cache._path(str(i) * 64)
+            os.utime(path, (now[0] + i, now[0]))
+
+        # Only two responses fit, so the least recently used one is deleted.
+        cache.max_bytes = 250
+        self.assertEqual(cache.evict(), 1)
+        self.assertFalse(cache.has("0" * 64))
+
+        with cache.get("1" * 64) as response:
+            self.assertEqual(response.info(), {"Content-Type": "text/csv"})
+            self.assertEqual(response.read(), b"x" * 100)
+
+        now[0] += 61
+        self.assertIsNone(cache.get("1" * 64))
+        self.assertEqual(cache.evict(), 2)
+
+    def test_sparql_cache_configure_from_args(self):
+        parser = argparse.ArgumentParser()
+        add_sparql_cache_arguments(parser)
+
+        cache = configure_sparql_cache_from_args(
+            parser.parse_args(["--refresh", "--cache-ttl", "2"])
+        )
+        self.assertTrue(cache.refresh)
+        self.assertEqual(cache.ttl_seconds, 7200)
+        self.assertIsNone(configure_sparql_cache_from_args(parser.parse_args(["-nc"])))
+
+        # Commands without the cache options leave the cache as it is.
+        configure_sparql_cache(self.cache_dir)
+        self.assertIsNone(configure_sparql_cache_from_args(argparse.Namespace()))
+        self.assertIsNotNone(get_sparql_cache())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for streaming SPARQL results.
+"""
+
+import json
+import unittest
+from io import BytesIO
+
+from scribe_data.wikidata.sparql_results import (
+    iter_json_bindings,
+    iter_json_rows,
+    iter_result_rows,
+    tsv_term_value,
+)
+
+
+def results_body(rows: list[dict]) -> bytes:
+    bindings = [
+        {var: {"type": "literal", "value": value} for var, value in row.items()}
+        for row in rows
+    ]
+    return json.dumps(
+        {"head": {"vars": ["lexemeID", "noun"]}, "results": {"bindings": bindings}},
+        ensure_ascii=False,
+        indent=1,
+    ).encode()
+
+
+class TestSparqlResults(unittest.TestCase):
+    rows = [{"lexemeID": f"L{i}", "noun": f"Mädchen {i} {{[,]}}"} for i in range(50)]
+
+    def test_sparql_results_iter_result_rows_across_chunks(self):
+        body = results_body(self.rows)
+        for chunk_size in [1, 7, 64, len(body)]:
+            rows = iter_json_rows(BytesIO(body), chunk_size=chunk_size)
+            self.assertEqual(list(rows), self.rows)
+
+    def test_sparql_results_iter_json_bindings_is_lazy(self):
+        stream = BytesIO(results_body(self.rows))
+        bindings = iter_json_bindings(stream, chunk_size=64)
+
+        self.assertEqual(next(bindings)["lexemeID"]["value"], "L0")
+        self.assertLess(stream.tell(), len(stream.getvalue()))
+
+    def test_sparql_results_empty_and_missing_bindings(self):
+        self.assertEqual(list(iter_result_rows(BytesIO(results_body([])))), [])
+        self.assertIsNone(iter_result_rows(BytesIO(b"")))
+        self.assertIsNone(iter_result_rows(BytesIO(b'{"head": {"vars": []}}')))
+
+    def test_sparql_results_truncated_response(self):
+        body = results_body(self.rows)
+        rows = iter_json_rows(BytesIO(body[: len(body) // 2]), chunk_size=16)
+
+        with self.assertRaises(json.JSONDecodeError):
+            list(rows)
+
+    def test_sparql_results_formats_give_the_same_rows(self):
+        json_body = json.dumps(
+            {
+                "head": {"vars": ["lexemeID", "verb", "date", "note"]},
+                "results": {
+                    "bindings": [
+                        {
+                            "lexemeID": {
+                                "type": "uri",
+                                "value": "http://www.wikidata.org/entity/L1",
+                            },
+                            "verb": {
+                                "type": "literal",
+                                "xml:lang": "de",
+                                "value": 'gehen\t"ä", b',
+                            },
+                            "date": {
+                                "type": "literal",
+                                "datatype": "http://www.w3.org/2001/XMLSchema#dateTime",
+                                "value": "2024-01-01T00:00:00Z",
+                            },
+                        },
+                        {
+                            "lexemeID": {
+                                "type": "uri",
+                                "value": "http://www.wikidata.org/entity/L2",
+                            },
+                            "note": {"type": "literal", "value": "x\\y"},
+                        },
+                    ]
+                },
+            }
+        ).encode()
+        tsv_body = (
+            "?lexemeID\t?verb\t?date\t?note\n"
+            '<http://www.wikidata.org/entity/L1>\t"gehen\\t\\"\\u00e4\\", b"@de\t'
+            '"2024-01-01T00:00:00Z"^^<http://www.w3.org/2001/XMLSchema#dateTime>\t\n'
+            '<http://www.wikidata.org/entity/L2>\t\t\t"x\\\\y"\n'
+        ).encode()
+        csv_body = (
+            "lexemeID,verb,date,note\r\n"
+            'http://www.wikidata.org/entity/L1,"gehen\t""ä"", b",'
+            "2024-01-01T00:00:00Z,\r\n"
+            "http://www.wikidata.org/entity/L2,,,x\\y\r\n"
+        ).encode()
+
+        expected = list(iter_result_rows(BytesIO(json_body), "json"))
+        self.assertEqual(
+            expected[1], {"lexemeID": expected[1]["lexemeID"], "note": "x\\y"}
+        )
+        self.assertEqual(list(iter_result_rows(BytesIO(tsv_body), "tsv")), expected)
+        self.assertEqual(list(iter_result_rows(BytesIO(csv_body), "csv")), expected)
+
+        self.assertIsNone(iter_result_rows(BytesIO(b""), "tsv"))
+        self.assertIsNone(iter_result_rows(BytesIO(b""), "csv"))
+
+    def test_sparql_results_tsv_term_value(self):
+        self.assertEqual(tsv_term_value('"a\\nb\\U0001F600"'), "a\nb\U0001f600")
+        self.assertEqual(tsv_term_value('""@en'), "")
+        self.assertEqual(tsv_term_value("42"), "42")
+        self.assertEqual(tsv_term_value("_:b0"), "b0")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the concurrent WDQS executor against a local stub SPARQL server.
+"""
+
+import json
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+from urllib.error import HTTPError
+from urllib.parse import parse_qs
+
+from scribe_data.wikidata.sparql_cache import configure_sparql_cache
+from scribe_data.wikidata.wdqs_executor import TokenBucket, WDQSExecutor
+
+
+def select(label: str) -> str:
+    return f"SELECT * WHERE {{ }} # {label}"
+
+
+class StubSparqlHandler(BaseHTTPRequestHandler):
+    """
+    Answer each query with its own text as a binding, throttling on request.
+    """
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        query = parse_qs(self.rfile.read(length).decode())["query"][0]
+        server = self.server
+        with server.lock:
+            server.requests.append(query)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            throttle = server.throttle.get(query, 0)
+            if throttle:
+                server.throttle[query] = throttle - 1
+
+        time.sleep(server.delay)
+        with server.lock:
+            server.in_flight -= 1
+
+        if query == select("bad"):
+            self.send_response(403)
+            self.end_headers()
+            return
+
+        if throttle:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+
+        binding = {
+            var: {"type": "literal", "value": query}
+            for var in ["lexemeID", "lastModified", "query"]
+        }
+        body = json.dumps({"results": {"bindings": [binding]}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/sparql-results+json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestWDQSExecutor(unittest.TestCase):
+    def setUp(self):
+        configure_sparql_cache(None)
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubSparqlHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.throttle = {}
+        self.server.delay = 0.05
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.endpoint = f"http://127.0.0.1:{self.server.server_port}/sparql"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def test_wdqs_executor_run_concurrently(self):
+        executor = WDQSExecutor(
+            self.endpoint, max_concurrency=3, queries_per_second=1000
+        )
+        queries = {f"q{i}": select(f"query {i}") for i in range(9)}
+        results = executor.run(queries)
+
+        self.assertEqual(list(results), list(queries))
+        for key, query in queries.items():
+            self.assertEqual(
+                results[key]["results"]["bindings"][0]["query"]["value"], query
+            )
+
+        self.assertLessEqual(self.server.max_in_flight, 3)
+        self.assertGreater(self.server.max_in_flight, 1)
+
+    def test_wdqs_executor_retry_after(self):
+        self.server.throttle = {select("query 1"): 2}
+        executor = WDQSExecutor(
+            self.endpoint, max_concurrency=2, queries_per_second=1000
+        )
+        results = executor.run(
+            {"a": select("query 1"), "b": select("query 2"), "c": select("bad")}
+        )
+
+        self.assertEqual(
+            results["a"]["results"]["bindings"][0]["query"]["value"],
+            select("query 1"),
+        )
+        self.assertEqual(self.server.requests.count(select("query 1")), 3)
+        self.assertIsInstance(results["c"], HTTPError)
+        self.assertEqual(results["c"].code, 403)
+
+        # Throttling that outlasts the retries is returned as the error.
+        self.server.throttle = {select("query 3"): 5}
+        executor.max_retries = 1
+        self.assertEqual(executor.run({"d": select("query 3")})["d"].code, 429)
+
+    def test_wdqs_executor_query_data_prefetch(self):
+        from scribe_data.wikidata.query_data import query_data
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            queries_dir = Path(temp_dir) / "queries"
+            for lang in ["german", "french"]:
+                verbs = queries_dir / lang / "verbs"
+                verbs.mkdir(parents=True)
+                for i in [1, 2]:
+                    (verbs / f"query_verbs_{i}.sparql").write_text(
+                        select(f"{lang} verbs {i}")
+                    )
+
+            output_dir = Path(temp_dir) / "output"
+            with (
+                patch("sys.stdout", new=StringIO()),
+                patch(
+                    "scribe_data.wikidata.query_data.WIKIDATA_QUERIES_ALL_DATA_DIR",
+                    queries_dir,
+                ),
+                patch("scribe_data.wikidata.query_data.sparql.endpoint", self.endpoint),
+                patch("scribe_data.wikidata.query_data.format_data") as mock_format,
+            ):
+                query_data(
+                    ["german", "french"], ["verbs"], output_dir, max_concurrency=4
+                )
+
+            self.assertEqual(len(self.server.requests), 4)
+            self.assertGreater(self.server.max_in_flight, 1)
+            # Queries run in path order so French is formatted first.
+            data = mock_format.call_args_list[0].kwargs["data_formatted"]
+            self.assertEqual(
+                [entry["query"] for entry in data.values()],
+                [select("french verbs 1"), select("french verbs 2")],
+            )
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_token_bucket_spaces_out_acquires(self):
+        now = [0.0]
+        waits = []
+
+        def sleep(seconds):
+            waits.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=lambda: now[0], sleep=sleep)
+        for _ in range(4):
+            bucket.acquire()
+
+        # Two saved tokens are used immediately and the rest come every half second.
+        self.assertEqual(waits, [0.5, 0.5])
+
+        now[0] += 10
+        bucket.acquire()
+        self.assertEqual(waits, [0.5, 0.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the Wiktionary page parse cache in Scribe-Data.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import orjson
+
+from scribe_data.wiktionary.parse_cache import PageParseCache, parse_cache_context
+
+
+class TestScribeWiktionaryParseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.tmp_dir.name) / "parse_cache.sqlite"
+        self.context = parse_cache_context("en", ["de"])
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_parse_cache_round_trip(self):
+        parsed = {"de": {"noun": {"1": {"description": "", "translation": "Buch"}}}}
+        cache = PageParseCache(self.cache_path)
+        key = cache.key(self.context, "book", b"wikitext")
+        self.assertIsNone(cache.get(key))
+
+        cache.put(key, parsed)
+        cache.put(cache.key(self.context, "empty", b"wikitext"), {})
+        cache.close()
+
+        cache = PageParseCache(self.cache_path)
+        self.assertEqual(cache.get(key), parsed)
+        self.assertEqual(cache.get(cache.key(self.context, "empty", b"wikitext")), {})
+        self.assertIsNone(
+            cache.get(cache.key(self.context, "book", b"changed wikitext"))
+        )
+        cache.close()
+
+    def test_parse_cache_keys_depend_on_context(self):
+        cache = PageParseCache(self.cache_path)
+        other_context = parse_cache_context("en", ["fr"])
+        self.assertNotEqual(
+            cache.key(self.context, "book", b"text"),
+            cache.key(other_context, "book", b"text"),
+        )
+        cache.close()
+
+    def test_parse_cache_evicts_least_recently_used(self):
+        cache = PageParseCache(self.cache_path, run_stamp=1)
+        keys = [cache.key(self.context, f"word{i}", b"text") for i in range(4)]
+        parsed = {"de": {"noun": {"1": {"translation": "x" * 100}}}}
+        for key in keys:
+            cache.put(key, parsed)
+        cache.close()
+
+        # Reading the last two pages in a later run marks them as recently used.
+        cache = PageParseCache(self.cache_path, run_stamp=2)
+        cache.get(keys[2])
+        cache.get(keys[3])
+        cache.max_bytes = 2 * (len(keys[0]) + len(orjson.dumps(parsed)))
+        self.assertEqual(cache.evict(), 2)
+
+        self.assertIsNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[2]))
+        self.assertIsNotNone(cache.get(keys[3]))
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
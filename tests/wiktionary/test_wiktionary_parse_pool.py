@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the scheduling of Wiktionary parse tasks in Scribe-Data.
+"""
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from scribe_data.wiktionary.parse_pool import (
+    IN_FLIGHT_PER_WORKER,
+    AdaptiveBatcher,
+    PoolMetrics,
+    iter_bounded_outputs,
+)
+
+
+def _echo_task(args):
+    return [args], 1, 0.01
+
+
+class TestScribeWiktionaryParsePool(unittest.TestCase):
+    def test_adaptive_batcher_sizes_batches_from_timings(self):
+        batcher = AdaptiveBatcher(target_seconds=0.2, initial_pages=10)
+        pages = [(f"word{i}", b"x" * 10) for i in range(25)]
+        self.assertEqual(
+            [len(batch) for batch, _ in batcher.batches(pages)], [10, 10, 5]
+        )
+
+        batcher.observe(pages=10, seconds=1.0)  # 0.1 s per page
+        self.assertEqual(batcher.batch_pages, 2)
+
+        for _ in range(20):  # faster pages grow batches up to the cap
+            batcher.observe(pages=10, seconds=0.001)
+        self.assertEqual(batcher.batch_pages, batcher.max_pages)
+        batcher.observe(pages=0, seconds=1.0)  # ignored
+
+    def test_adaptive_batcher_caps_batch_bytes(self):
+        batcher = AdaptiveBatcher(initial_pages=100, max_bytes=25)
+        pages = [(f"word{i}", b"x" * 10) for i in range(5)]
+        self.assertEqual(
+            [(len(batch), n_bytes) for batch, n_bytes in batcher.batches(pages)],
+            [(3, 30), (2, 20)],
+        )
+
+    def test_iter_bounded_outputs_limits_tasks_in_flight(self):
+        metrics = PoolMetrics(num_workers=2)
+        max_in_flight = metrics.num_workers * IN_FLIGHT_PER_WORKER
+        pulled = 0
+        collected = 0
+        release = threading.Event()
+
+        def tasks():
+            nonlocal pulled
+            for i in range(50):
+                pulled += 1
+                # Tasks are only pulled while the window has room.
+                self.assertLessEqual(pulled - collected, max_in_flight)
+                yield i, 100
+
+        def blocking_task(args):
+            release.wait()
+            return _echo_task(args)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            release.set()
+            outputs = []
+            for output in iter_bounded_outputs(
+                blocking_task, tasks(), executor, metrics
+            ):
+                collected += 1
+                outputs.append(output)
+
+        self.assertEqual([results[0] for results, *_ in outputs], list(range(50)))
+        self.assertEqual(metrics.tasks, 50)
+        self.assertEqual(metrics.input_bytes, 5000)
+        self.assertLessEqual(metrics.max_queue_depth, max_in_flight)
+
+        summary = metrics.as_dict()
+        self.assertEqual(summary["pages"], 50)
+        self.assertGreater(summary["worker_utilization"], 0)
+
+    def test_iter_bounded_outputs_without_executor(self):
+        metrics = PoolMetrics(num_workers=1)
+        outputs = list(
+            iter_bounded_outputs(_echo_task, ((i, 1) for i in range(3)), None, metrics)
+        )
+        self.assertEqual(outputs, [([i], 1, 0.01, 1) for i in range(3)])
+        self.assertEqual(metrics.max_queue_depth, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
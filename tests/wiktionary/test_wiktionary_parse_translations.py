@@ -3,20 +3,27 @@
 Tests for the Wiktionary translation parsing functions in Scribe-Data.
 """
 
+import sqlite3
 import unittest
 
 import mwparserfromhell
 
 from scribe_data.wiktionary.parse_constants import get_wiktionary_config
 from scribe_data.wiktionary.parse_translations import (
+    _extract_page_text,
+    _extract_page_title,
     _extract_source_lang_section,
     _extract_translation_word,
     _get_output_subdir,
+    _iter_dump_page_blobs,
+    _merge_parsed_into_output,
     _parse_page_translations,
     _parse_page_worker,
     _resolve_dump_path,
+    _split_dump_specs,
     parse_wiktionary_translations,
     parse_xml_dump,
+    parse_xml_dumps,
 )
 
 
@@ -373,18 +380,276 @@ english side
             )
 
             # Multi-process mode.
+            metrics = {}
             res_multi = parse_xml_dump(
                 tmp_path,
                 ["de"],
                 num_workers=2,
                 progress=False,
+                metrics=metrics,
             )
             self.assertEqual(
                 res_multi["de"]["test"]["noun"]["1"]["translation"], "Mädchen"
             )
+            self.assertEqual(metrics["num_workers"], 2)
+            self.assertEqual(metrics["pages"], 1)
+            self.assertGreaterEqual(metrics["max_queue_depth"], 1)
         finally:
             Path(tmp_path).unlink()
 
+    def test_wiktionary_iter_dump_page_blobs_chunk_boundaries(self):
+        """
+        Pages split across read chunks are reassembled and decoded with entities unescaped.
+        """
+        import tempfile
+        from pathlib import Path
+
+        dummy_xml = """<mediawiki xmlns="http://www.mediawiki.org/xml/export-0.11/">
+  <siteinfo><sitename>Wiktionary</sitename></siteinfo>
+  <page>
+    <title>rock &amp; roll</title>
+    <revision>
+      <text bytes="25" xml:space="preserve">{{t|de|a &lt;b&gt;}} Mädchen</text>
+    </revision>
+  </page>
+  <page>
+    <title>empty</title>
+    <revision>
+      <text bytes="0" />
+    </revision>
+  </page>
+</mediawiki>"""
+        with tempfile.NamedTemporaryFile(
+            suffix=".xml", delete=False, mode="w", encoding="utf-8"
+        ) as tmp:
+            tmp.write(dummy_xml)
+            tmp_path = tmp.name
+
+        try:
+            # A tiny chunk size forces tags and multi-byte characters across reads.
+            blobs = list(_iter_dump_page_blobs(Path(tmp_path), chunk_size=3))
+            self.assertEqual(len(blobs), 2)
+            self.assertEqual(_extract_page_title(blobs[0]), "rock & roll")
+            self.assertEqual(_extract_page_text(blobs[0]), "{{t|de|a <b>}} Mädchen")
+            self.assertEqual(_extract_page_title(blobs[1]), "empty")
+            self.assertEqual(_extract_page_text(blobs[1]), "")
+
+        finally:
+            Path(tmp_path).unlink()
+
+    def test_wiktionary_parse_xml_dump_multistream(self):
+        """
+        Multistream dumps with an index are parsed per stream and merged in dump order.
+        """
+        import bz2
+        import tempfile
+        from pathlib import Path
+
+        def page(title: str, translation: str) -> str:
+            return f"""  <page>
+    <title>{title}</title>
+    <revision>
+      <text xml:space="preserve">==English==
+===Noun===
+====Translations====
+{{{{trans-top|{title}}}}}
+* German: {{{{t|de|{translation}}}}}
+{{{{trans-bottom}}}}
+      </text>
+    </revision>
+  </page>
+"""
+
+        streams = [
+            "<mediawiki>\n  <siteinfo></siteinfo>\n",
+            page("test", "Test") + page("other", "Andere"),
+            page("test/translations", "Prüfung"),
+            "</mediawiki>\n",
+        ]
+        compressed = [bz2.compress(stream.encode("utf-8")) for stream in streams]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dump_path = (
+                Path(tmp_dir) / "enwiktionary-pages-articles-multistream.xml.bz2"
+            )
+            dump_path.write_bytes(b"".join(compressed))
+
+            first = len(compressed[0])
+            second = first + len(compressed[1])
+            index = f"{first}:1:test\n{first}:2:other\n{second}:3:test/translations\n"
+            (
+                Path(tmp_dir) / "enwiktionary-pages-articles-multistream-index.txt.bz2"
+            ).write_bytes(bz2.compress(index.encode("utf-8")))
+
+            for num_workers in (1, 2):
+                res = parse_xml_dump(
+                    dump_path, ["de"], num_workers=num_workers, progress=False
+                )
+                self.assertEqual(
+                    res["de"]["other"]["noun"]["1"]["translation"], "Andere"
+                )
+                self.assertEqual(res["de"]["test"]["noun"]["1"]["translation"], "Test")
+                self.assertEqual(
+                    res["de"]["test"]["noun"]["2"]["translation"], "Prüfung"
+                )
+
+    def test_wiktionary_parse_xml_dump_cache(self):
+        """
+        A cached re-run only parses pages whose wikitext changed.
+        """
+        import tempfile
+        from pathlib import Path
+        from unittest.mock import patch
+
+        from scribe_data.wiktionary import parse_translations
+
+        page = """  <page>
+    <title>{title}</title>
+    <revision>
+      <text xml:space="preserve">==English==
+===Noun===
+{{{{trans-top|a gloss}}}}
+* German: {{{{t+|de|{de_word}|n}}}}
+{{{{trans-bottom}}}}
+</text>
+    </revision>
+  </page>
+"""
+
+        def write_dump(path, de_word):
+            pages = page.format(title="test", de_word="Test") + page.format(
+                title="book", de_word=de_word
+            )
+            path.write_text(f"<mediawiki>\n{pages}</mediawiki>", encoding="utf-8")
+
+        parse_fn = parse_translations._parse_page_translations
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dump_path = Path(tmp_dir) / "enwiktionary-latest-pages-articles.xml"
+            cache_path = Path(tmp_dir) / "parse_cache.sqlite"
+            kwargs = {"num_workers": 1, "progress": False, "cache_path": cache_path}
+
+            write_dump(dump_path, "Buch")
+            first = parse_xml_dump(dump_path, ["de"], **kwargs)
+
+            write_dump(dump_path, "Heft")
+            with patch.object(
+                parse_translations, "_parse_page_translations", side_effect=parse_fn
+            ) as mock_parse:
+                second = parse_xml_dump(dump_path, ["de"], **kwargs)
+
+        self.assertEqual(mock_parse.call_count, 1)
+        self.assertEqual(mock_parse.call_args.kwargs["word"], "book")
+        self.assertEqual(second["de"]["test"], first["de"]["test"])
+        self.assertEqual(first["de"]["book"]["noun"]["1"]["translation"], "Buch")
+        self.assertEqual(second["de"]["book"]["noun"]["1"]["translation"], "Heft")
+
+    def test_wiktionary_parse_xml_dumps_shared_pool(self):
+        """
+        Several editions parsed over one worker pool match parsing them one at a time.
+        """
+        import tempfile
+        from pathlib import Path
+
+        en_page = """<page>
+    <title>test</title>
+    <revision>
+      <text xml:space="preserve">==English==
+===Noun===
+{{trans-top|a subject of a test}}
+* German: {{t+|de|Test|m}}
+{{trans-bottom}}
+</text>
+    </revision>
+  </page>"""
+        de_page = """<page>
+    <title>Wort</title>
+    <revision>
+      <text xml:space="preserve">== Wort ({{Sprache|Deutsch}}) ==
+=== {{Wortart|Substantiv|Deutsch}} ===
+{{Ü-Tabelle|Ü-Liste=
+*Englisch: [1] {{ü|en|word}}
+}}
+</text>
+    </revision>
+  </page>"""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dump_paths = {
+                "en": Path(tmp_dir) / "enwiktionary-latest-pages-articles.xml",
+                "de": Path(tmp_dir) / "dewiktionary-latest-pages-articles.xml",
+            }
+            dump_paths["en"].write_text(f"<mediawiki>{en_page}</mediawiki>")
+            dump_paths["de"].write_text(f"<mediawiki>{de_page}</mediawiki>")
+            cache_path = Path(tmp_dir) / "parse_cache.sqlite"
+
+            for _ in range(2):  # the second run is served from the shared cache
+                outputs = parse_xml_dumps(
+                    dump_paths,
+                    ["de", "en"],
+                    progress=False,
+                    num_workers=2,
+                    cache_path=cache_path,
+                )
+                self.assertEqual(
+                    outputs["en"]["de"]["test"]["noun"]["1"]["translation"], "Test"
+                )
+                self.assertEqual(
+                    outputs["de"]["en"]["Wort"]["noun"]["1"]["translation"], "word"
+                )
+
+            for source_iso, dump_path in dump_paths.items():
+                self.assertEqual(
+                    outputs[source_iso],
+                    parse_xml_dump(
+                        dump_path,
+                        ["de", "en"],
+                        source_iso=source_iso,
+                        progress=False,
+                        num_workers=1,
+                    ),
+                )
+
+    def test_wiktionary_split_dump_specs(self):
+        self.assertEqual(_split_dump_specs(None), [None])
+        self.assertEqual(_split_dump_specs("enwiktionary"), ["enwiktionary"])
+        self.assertEqual(
+            _split_dump_specs("enwiktionary, dewiktionary"),
+            ["enwiktionary", "dewiktionary"],
+        )
+        self.assertEqual(
+            _split_dump_specs(["enwiktionary", "dewiktionary"]),
+            ["enwiktionary", "dewiktionary"],
+        )
+
+    def test_wiktionary_merge_parsed_into_output(self):
+        def senses(*indices):
+            return {i: {"description": "", "translation": f"t{i}"} for i in indices}
+
+        output = {}
+        next_sense_idx = {}
+        _merge_parsed_into_output(
+            output, "book", {"de": {"noun": senses("1", "3")}}, next_sense_idx
+        )
+        # A translations subpage numbers its senses from 1 again.
+        _merge_parsed_into_output(
+            output, "book", {"de": {"noun": senses("1", "2")}}, next_sense_idx
+        )
+        _merge_parsed_into_output(
+            output, "book", {"de": {"noun": senses("1")}}, next_sense_idx
+        )
+
+        merged = output["de"]["book"]["noun"]
+        self.assertEqual(list(merged), ["1", "3", "4", "2", "5"])
+        self.assertEqual(
+            [sense["translation"] for sense in merged.values()],
+            ["t1", "t3", "t1", "t2", "t1"],
+        )
+        self.assertEqual(next_sense_idx[("de", "book", "noun")], 6)
+
+        # Without a shared counter the next index is recovered from the senses.
+        _merge_parsed_into_output(output, "book", {"de": {"noun": senses("1")}})
+        self.assertIn("6", output["de"]["book"]["noun"])
+
     def test_wiktionary_parse_xml_dump_not_found(self):
         with self.assertRaises(FileNotFoundError):
             parse_xml_dump(
@@ -502,6 +767,21 @@ english side
             de_file = output_dir / "english" / "de_translations_from_en.json"
             self.assertTrue(de_file.exists())
 
+            parse_wiktionary_translations(
+                target_languages=["de"],
+                wiktionary_dump_path=tmp_path,
+                output_dir=output_dir,
+                output_type="sqlite",
+            )
+            connection = sqlite3.connect(output_dir / "TranslationData.sqlite")
+            self.assertEqual(
+                connection.execute(
+                    "SELECT word, translation FROM [de_translations_from_en]"
+                ).fetchall(),
+                [("test", "Mädchen")],
+            )
+            connection.close()
+
         finally:
             shutil.rmtree(output_dir)
             Path(tmp_path).unlink()
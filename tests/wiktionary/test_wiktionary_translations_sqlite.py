@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for writing Wiktionary translations to SQLite in Scribe-Data.
+"""
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from scribe_data.wiktionary.translations_sqlite import (
+    export_translations_to_sqlite,
+    translation_table_columns,
+)
+
+
+class TestScribeWiktionaryTranslationsSqlite(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp_dir.name) / "TranslationData.sqlite"
+        self.data_by_lang = {
+            "de": {
+                "book": {
+                    "noun": {
+                        "1": {"description": "pages", "translation": "Buch"},
+                        "2": {"description": "bets", "translation": "Wettliste"},
+                    },
+                    "verb": {"1": {"description": "reserve", "translation": "buchen"}},
+                },
+            },
+            "fr": {"book": {"noun": {"1": {"translation": "livre"}}}},
+        }
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_translations_sqlite_export(self):
+        export_translations_to_sqlite(self.data_by_lang, "en", self.db_path)
+
+        with sqlite3.connect(self.db_path) as connection:
+            columns = [
+                info[1]
+                for info in connection.execute(
+                    "PRAGMA table_info([de_translations_from_en])"
+                )
+            ]
+            self.assertEqual(columns, translation_table_columns("snake"))
+            self.assertEqual(
+                connection.execute(
+                    "SELECT * FROM [de_translations_from_en] ORDER BY word_type, word_order"
+                ).fetchall(),
+                [
+                    ("book", "noun", "1", "pages", "Buch"),
+                    ("book", "noun", "2", "bets", "Wettliste"),
+                    ("book", "verb", "1", "reserve", "buchen"),
+                ],
+            )
+            self.assertEqual(
+                connection.execute(
+                    "SELECT * FROM [fr_translations_from_en]"
+                ).fetchall(),
+                [("book", "noun", "1", "", "livre")],
+            )
+            # The unique index is built after the rows are loaded.
+            self.assertEqual(
+                connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' "
+                    "AND tbl_name = 'de_translations_from_en'"
+                ).fetchall(),
+                [("de_translations_from_en_word_idx",)],
+            )
+
+        connection.close()
+
+    def test_translations_sqlite_export_replaces_tables(self):
+        export_translations_to_sqlite(self.data_by_lang, "en", self.db_path)
+        self.data_by_lang["de"] = {"cat": {"noun": {"1": {"translation": "Katze"}}}}
+        export_translations_to_sqlite(
+            self.data_by_lang, "en", self.db_path, identifier_case="camel"
+        )
+
+        with sqlite3.connect(self.db_path) as connection:
+            self.assertEqual(
+                connection.execute(
+                    "SELECT word, wordType, wordOrder FROM [de_translations_from_en]"
+                ).fetchall(),
+                [("cat", "noun", "1")],
+            )
+
+        connection.close()
+
+    def test_translations_sqlite_export_rolls_back_on_error(self):
+        export_translations_to_sqlite(self.data_by_lang, "en", self.db_path)
+        # The French translations can't be read after the German table is replaced.
+        self.data_by_lang["de"] = {"cat": {"noun": {"1": {"translation": "Katze"}}}}
+        self.data_by_lang["fr"] = {"book": None}
+
+        with self.assertRaises(AttributeError):
+            export_translations_to_sqlite(self.data_by_lang, "en", self.db_path)
+
+        with sqlite3.connect(self.db_path) as connection:
+            self.assertEqual(
+                connection.execute(
+                    "SELECT translation FROM [de_translations_from_en] "
+                    "ORDER BY word_type, word_order"
+                ).fetchall(),
+                [("Buch",), ("Wettliste",), ("buchen",)],
+            )
+
+        connection.close()
+
+
+if __name__ == "__main__":
+    unittest.main()